@@ -0,0 +1,315 @@
+"""End-to-end load run: many bots against the local Twitch stand-in.
+
+Usage:
+    python -m benchmarks.bench_e2e [--users 500] [--channels 3]
+        [--duration 20] [--rate 1000] [--own-ratio 0.02] [--url URL]
+        [--latency-ms MS] [--error-rate R] [--throttle-rate R]
+        [--rate-limit N] [--ws-rate N] [--outage] [--outage-ws-rate N]
+        [--warm-restart] [--json PATH] [--verbose]
+
+Starts ``benchmarks.fake_twitch`` in this process (or uses the standalone
+one at ``--url``), registers ``--users`` accounts, and runs that many real
+bots through ``BotManager`` with every endpoint pointed at the stand-in.
+Once every bot is live, the chat firehose sends ``--rate`` messages per
+second into the subscribed channels for ``--duration`` seconds; about
+``--own-ratio`` of them come from the bots' own users and trigger color
+changes. Reports startup timing, delivered notifications per second, color
+changes per second, chat-to-color latency percentiles, the HTTP status
+mix seen by the stand-in and how long stopping every bot took. With
+``--outage`` every socket is then dropped at once and the report adds how
+long the fleet took to have all its subscriptions enabled again. With
+``--warm-restart`` the fleet is started once more from the saved config and
+state snapshot, as a restarted process would, and the report adds that
+startup's timing and requests.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from benchmarks.fake_twitch import FakeTwitch, add_fault_arguments, faults_from_args
+from benchmarks.harness import environment
+from src.api.endpoints import TwitchEndpoints, set_endpoints
+from src.utils import json_codec
+
+# Streamers whose channels are shared between bots
+SHARED_CHANNELS = 50
+CLIENT_SECRET = "fakeclientsecret0000"
+DRAIN_SECONDS = 2.0
+OUTAGE_POLL_SECONDS = 0.25
+
+
+class Control:
+    """Client for the stand-in's ``/_fake`` control routes."""
+
+    def __init__(self, session: aiohttp.ClientSession, base_url: str) -> None:
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+
+    async def call(self, method: str, path: str, body: Any = None, timeout: float = 60) -> Any:
+        """Send one control request and return its JSON answer."""
+        async with self.session.request(
+            method,
+            f"{self.base_url}/_fake/{path}",
+            json=body,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as resp:
+            resp.raise_for_status()
+            return await resp.json(loads=json_codec.loads)
+
+
+def build_users(
+    credentials: list[dict[str, Any]], streamers: list[str], channels: int, seed: int | None
+) -> list[dict[str, Any]]:
+    """Bot config entries: own channel plus ``channels - 1`` shared ones."""
+    rng = random.Random(seed)  # noqa: S311 - test traffic
+    users = []
+    for cred in credentials:
+        extra = rng.sample(streamers, min(max(channels - 1, 0), len(streamers)))
+        users.append(
+            {
+                "username": cred["username"],
+                "client_id": cred["client_id"],
+                "client_secret": CLIENT_SECRET,
+                "access_token": cred["access_token"],
+                "refresh_token": cred["refresh_token"],
+                "channels": [cred["username"], *extra],
+                "is_prime_or_turbo": True,
+                "enabled": True,
+            }
+        )
+    return users
+
+
+async def run_load(args: argparse.Namespace, base_url: str) -> dict[str, Any]:
+    """Start the bots, drive chat at them and collect the results."""
+    set_endpoints(TwitchEndpoints.local(base_url))
+    with tempfile.TemporaryDirectory(prefix="tcc-e2e-", ignore_cleanup_errors=True) as tmpdir:
+        os.environ["TWITCH_BROADCASTER_CACHE"] = str(Path(tmpdir) / "broadcaster_ids.cache.json")
+        try:
+            return await _drive(args, base_url, Path(tmpdir) / "users.conf")
+        finally:
+            set_endpoints()
+
+
+async def _drive(args: argparse.Namespace, base_url: str, config_file: Path) -> dict[str, Any]:
+    from src.application_context import ApplicationContext
+    from src.bot.manager import BotManager
+
+    async with aiohttp.ClientSession() as session:
+        control = Control(session, base_url)
+        streamers = [f"streamer{i}" for i in range(SHARED_CHANNELS)]
+        await control.call("POST", "users", {"logins": streamers})
+        logins = [f"loadbot{i}" for i in range(args.users)]
+        registered = await control.call("POST", "users", {"logins": logins})
+        users = build_users(registered["data"], streamers, args.channels, args.seed)
+        config_file.write_text(json_codec.dumps({"users": users}), encoding="utf-8")
+
+        context = await ApplicationContext.create(expected_users=len(users))
+        await context.start()
+        manager = BotManager(users, str(config_file), context=context)
+        try:
+            started = time.perf_counter()
+            async with manager._manager_lock:
+                await manager._start_all_bots()
+            startup = manager.lifecycle.startup
+            if startup is not None:
+                await startup.wait()
+            startup_seconds = time.perf_counter() - started
+            startup_lines = startup.report_lines() if startup else []
+            live = len(startup.live) if startup else 0
+            startup_metrics = await control.call("GET", "metrics")
+
+            await control.call("POST", "metrics/reset")
+            firehose = await control.call(
+                "POST",
+                "firehose",
+                {"rate": args.rate, "duration": args.duration, "own_ratio": args.own_ratio},
+                timeout=args.duration + 60,
+            )
+            await asyncio.sleep(DRAIN_SECONDS)
+            steady = await control.call("GET", "metrics")
+            outage = await _outage(control, steady, args) if args.outage else None
+        finally:
+            stopping = time.perf_counter()
+            async with manager._manager_lock:
+                await manager._stop_all_bots()
+            stop_seconds = time.perf_counter() - stopping
+            await context.shutdown()
+        warm = await _warm_restart(control, config_file) if args.warm_restart else None
+
+    return {
+        "users": args.users,
+        "live": live,
+        "startup_seconds": round(startup_seconds, 3),
+        "startup_report": startup_lines,
+        "startup_requests": startup_metrics["requests"],
+        "firehose": firehose,
+        "color_changes_per_second": round(
+            steady["color_changes"] / max(firehose["seconds"], 1e-9), 1
+        ),
+        "steady": steady,
+        "stop_seconds": round(stop_seconds, 3),
+        "outage": outage,
+        "warm_restart": warm,
+    }
+
+
+async def _warm_restart(control: Control, config_file: Path) -> dict[str, Any]:
+    """Start the fleet again from the saved config and state snapshot."""
+    from src.application_context import ApplicationContext
+    from src.bot.manager import BotManager
+    from src.chat.login_resolver import get_login_resolver
+
+    # A new process starts without the in-memory channel IDs
+    get_login_resolver().clear()
+    users = json_codec.loads(config_file.read_bytes())["users"]
+    await control.call("POST", "metrics/reset")
+    context = await ApplicationContext.create(expected_users=len(users))
+    await context.start()
+    manager = BotManager(users, str(config_file), context=context)
+    try:
+        started = time.perf_counter()
+        async with manager._manager_lock:
+            await manager._start_all_bots()
+        startup = manager.lifecycle.startup
+        if startup is not None:
+            await startup.wait()
+        startup_seconds = time.perf_counter() - started
+        metrics = await control.call("GET", "metrics")
+    finally:
+        async with manager._manager_lock:
+            await manager._stop_all_bots()
+        await context.shutdown()
+    return {
+        "live": len(startup.live) if startup else 0,
+        "startup_seconds": round(startup_seconds, 3),
+        "startup_report": startup.report_lines() if startup else [],
+        "startup_requests": metrics["requests"],
+    }
+
+
+async def _outage(
+    control: Control, steady: dict[str, Any], args: argparse.Namespace
+) -> dict[str, Any]:
+    """Drop every socket and time until all subscriptions are enabled again."""
+    target = steady["enabled_subscriptions"]
+    await control.call("POST", "metrics/reset")
+    started = time.perf_counter()
+    dropped = (await control.call("POST", "drop", {"ws_rate": args.outage_ws_rate}))["dropped"]
+    recovered = False
+    while time.perf_counter() - started < args.outage_timeout:
+        await asyncio.sleep(OUTAGE_POLL_SECONDS)
+        metrics = await control.call("GET", "metrics")
+        if metrics["enabled_subscriptions"] >= target:
+            recovered = True
+            break
+    metrics = await control.call("GET", "metrics")
+    return {
+        "dropped": dropped,
+        "recovered": recovered,
+        "seconds": round(time.perf_counter() - started, 3),
+        "enabled_subscriptions": metrics["enabled_subscriptions"],
+        "target_subscriptions": target,
+        "sessions_opened": metrics["sessions_opened"],
+        "statuses": metrics["statuses"],
+    }
+
+
+def format_report(result: dict[str, Any]) -> list[str]:
+    """Render the run as text."""
+    fire = result["firehose"]
+    steady = result["steady"]
+    latency = steady["chat_to_color"]
+    lines = [
+        f"bots live: {result['live']}/{result['users']} in {result['startup_seconds']:.2f}s",
+        *(f"  {line}" for line in result["startup_report"]),
+        f"firehose: {fire['sent']} messages ({fire['sent_per_second']}/s), "
+        f"{fire['delivered']} deliveries ({fire['delivered_per_second']}/s), "
+        f"{fire['own']} from bot users",
+        f"color changes: {steady['color_changes']} "
+        f"({result['color_changes_per_second']}/s)",
+    ]
+    if latency.get("count"):
+        lines.append(
+            f"chat->color latency ms: p50={latency['p50_ms']:.1f} "
+            f"p95={latency['p95_ms']:.1f} p99={latency['p99_ms']:.1f} "
+            f"max={latency['max_ms']:.1f} (n={latency['count']})"
+        )
+    lines.append(f"http statuses: {steady['statuses']}")
+    lines.append(f"sessions: {steady['sessions']} subscriptions: {steady['subscriptions']}")
+    outage = result.get("outage")
+    if outage:
+        state = "recovered" if outage["recovered"] else "NOT recovered"
+        lines.append(
+            f"outage: {outage['dropped']} sockets dropped, {state} in {outage['seconds']:.2f}s "
+            f"({outage['enabled_subscriptions']}/{outage['target_subscriptions']} subscriptions, "
+            f"statuses {outage['statuses']})"
+        )
+    lines.append(f"graceful stop: {result['stop_seconds']:.2f}s")
+    warm = result.get("warm_restart")
+    if warm:
+        lines.append(
+            f"warm restart: {warm['live']}/{result['users']} live in "
+            f"{warm['startup_seconds']:.2f}s"
+        )
+        lines.extend(f"  {line}" for line in warm["startup_report"])
+        lines.append(f"  startup requests: {warm['startup_requests']}")
+    return lines
+
+
+async def main_async(args: argparse.Namespace) -> dict[str, Any]:
+    """Run against ``--url`` or a stand-in started in this process."""
+    if args.url:
+        return await run_load(args, args.url)
+    async with FakeTwitch(faults_from_args(args)) as twitch:
+        return await run_load(args, twitch.base_url)
+
+
+def main() -> None:
+    """Parse options, run the load and print (and optionally save) results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=500, help="simulated bot users")
+    parser.add_argument("--channels", type=int, default=3, help="channels per user")
+    parser.add_argument("--duration", type=float, default=20.0, help="firehose seconds")
+    parser.add_argument("--rate", type=float, default=1000.0, help="chat messages per second")
+    parser.add_argument("--own-ratio", type=float, default=0.02, help="share sent by bot users")
+    parser.add_argument("--outage", action="store_true", help="drop every socket and time recovery")
+    parser.add_argument(
+        "--outage-timeout", type=float, default=180.0, help="give up on recovery after this long"
+    )
+    parser.add_argument(
+        "--outage-ws-rate", type=float, help="handshakes/second the stand-in accepts after the drop"
+    )
+    parser.add_argument(
+        "--warm-restart", action="store_true", help="start again from the state snapshot"
+    )
+    parser.add_argument("--url", help="use a standalone fake_twitch at this origin")
+    parser.add_argument("--json", dest="json_path", help="save results to this file")
+    parser.add_argument("--verbose", action="store_true", help="keep the bots' info logs")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+    result = asyncio.run(main_async(args))
+    print("\n".join(format_report(result)))
+    if args.json_path:
+        document = {"meta": environment(json_backend=json_codec.BACKEND), "result": result}
+        text = json_codec.dumps(document, indent=True) + "\n"
+        Path(args.json_path).write_text(text, encoding="utf-8")
+        print(f"saved results to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
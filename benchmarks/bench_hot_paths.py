@@ -0,0 +1,207 @@
+"""Micro-benchmarks for the bot's hot functions, with JSON results.
+
+Usage:
+    python -m benchmarks.bench_hot_paths [--only TEXT] [--repeat N]
+        [--min-time SECONDS] [--json PATH] [--compare BASELINE.json]
+
+Cases use fixed inputs so runs are comparable:
+
+- ``eventsub.*``: a chat frame through ``MessageCoordinator.handle_message``
+  and the chat ``MessageProcessor`` (own message), and the pre-decode drop
+  of another chatter's message
+- ``bot.normalize_color_arg[*]``: preset, hex and shorthand hex arguments
+- ``color.random_hex`` / ``color.random_preset``: with the last color excluded
+- ``cache.get`` / ``cache.set``: ``CacheManager`` over a temporary file
+- ``config.save_users[N]``: ``ConfigRepository.save_users`` for 10/100/1000
+  users; every call writes, since consecutive calls alternate two configs
+- ``twitch.dedupe_logins`` / ``twitch.chunk``: 1000 logins
+- ``circuit_breaker.call``: one no-op coroutine through a closed breaker,
+  next to ``baseline.await`` for the bare call
+
+Save a baseline with ``--json before.json``; after a change run with
+``--compare before.json`` to print the change per case.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+from benchmarks.bench_json_codec import CHAT_FRAME
+from benchmarks.harness import (
+    CaseResult,
+    environment,
+    format_table,
+    load_results,
+    time_async,
+    time_sync,
+    write_results,
+)
+from src.api.twitch import TwitchAPI
+from src.bot.message_processor import MessageProcessor as BotMessageProcessor
+from src.chat.cache_manager import CacheManager
+from src.chat.message_coordinator import MessageCoordinator
+from src.chat.message_processor import MessageProcessor
+from src.color.utils import get_random_hex, get_random_preset
+from src.config.repository import ConfigRepository
+from src.utils import json_codec
+from src.utils.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+
+# Chatter in CHAT_FRAME, and some other user for the pre-decode drop
+OWN_USER_ID = "4145994"
+OTHER_USER_ID = "2914196"
+
+LOGINS = [f"User{i % 800}" for i in range(1000)]
+USER_COUNTS = (10, 100, 1000)
+
+
+def make_users(count: int, variant: int) -> list[dict[str, object]]:
+    """Build ``count`` realistic user entries; ``variant`` changes one field."""
+    return [
+        {
+            "username": f"user{i}",
+            "client_id": "a" * 30,
+            "client_secret": "b" * 30,
+            "access_token": "c" * 30,
+            "refresh_token": "d" * 50,
+            "token_expiry": "2024-01-01T00:00:00+00:00",
+            "channels": [f"user{i}", "sharedchannel"],
+            "is_prime_or_turbo": i % 2 == 0,
+            "enabled": (i + variant) % 7 != 0,
+        }
+        for i in range(count)
+    ]
+
+
+def make_coordinator(user_id: str) -> MessageCoordinator:
+    """A coordinator over the minimum backend state its hot path reads."""
+
+    async def on_message(username: str, channel: str, message: str) -> None:
+        return None
+
+    backend = SimpleNamespace(
+        _last_activity=0.0,
+        _username="viewer32",
+        _user_id=user_id,
+        _reconnection_coordinator=None,
+        _msg_processor=MessageProcessor(on_message, on_message),
+    )
+    return MessageCoordinator(backend)  # type: ignore[arg-type]
+
+
+def _selected(name: str, only: str | None) -> bool:
+    return not only or only in name
+
+
+def run_sync_cases(
+    repeat: int, min_time: float, tmp: Path, only: str | None = None
+) -> list[CaseResult]:
+    """Time the synchronous cases."""
+    normalize = BotMessageProcessor._normalize_color_arg
+    cases = {
+        "bot.normalize_color_arg[preset]": lambda: normalize("BlueViolet"),
+        "bot.normalize_color_arg[hex]": lambda: normalize("#1A2b3C"),
+        "bot.normalize_color_arg[short]": lambda: normalize("abc"),
+        "color.random_hex": lambda: get_random_hex(exclude="#1a2b3c"),
+        "color.random_preset": lambda: get_random_preset(exclude="blue"),
+        "twitch.dedupe_logins": lambda: TwitchAPI._dedupe_logins(LOGINS),
+        "twitch.chunk": lambda: list(TwitchAPI._chunk(LOGINS, 100)),
+    }
+    results = [
+        time_sync(name, func, repeat=repeat, min_time=min_time)
+        for name, func in cases.items()
+        if _selected(name, only)
+    ]
+    for count in USER_COUNTS:
+        name = f"config.save_users[{count}]"
+        if not _selected(name, only):
+            continue
+        repo = ConfigRepository(tmp / f"users{count}.conf")
+        configs = (make_users(count, 0), make_users(count, 1))
+        state = {"i": 0}
+
+        def save(repo=repo, configs=configs, state=state) -> None:
+            state["i"] ^= 1
+            repo.save_users(configs[state["i"]])
+
+        results.append(time_sync(name, save, repeat=repeat, min_time=min_time))
+    return results
+
+
+async def run_async_cases(
+    repeat: int, min_time: float, tmp: Path, only: str | None = None
+) -> list[CaseResult]:
+    """Time the coroutine cases on one event loop."""
+    own = make_coordinator(OWN_USER_ID)
+    other = make_coordinator(OTHER_USER_ID)
+    frame = SimpleNamespace(type="text", data=CHAT_FRAME)
+    cache = CacheManager(str(tmp / "cache.json"))
+    await cache.set_many({f"user{i}": str(i) for i in range(500)})
+    breaker = CircuitBreaker(CircuitBreakerConfig(name="bench"))
+    counter = {"i": 0}
+
+    async def noop() -> int:
+        return 1
+
+    async def cache_set() -> None:
+        counter["i"] = (counter["i"] + 1) % 500
+        await cache.set(f"user{counter['i']}", str(counter["i"]))
+
+    cases = {
+        "eventsub.decode_dispatch": lambda: own.handle_message(frame),
+        "eventsub.skip_foreign": lambda: other.handle_message(frame),
+        "cache.get": lambda: cache.get("user250"),
+        "cache.set": cache_set,
+        "baseline.await": noop,
+        "circuit_breaker.call": lambda: breaker.call(noop),
+    }
+    results = []
+    try:
+        for name, func in cases.items():
+            if _selected(name, only):
+                results.append(
+                    await time_async(name, func, repeat=repeat, min_time=min_time)
+                )
+    finally:
+        await cache.close()
+    return results
+
+
+def run(repeat: int, min_time: float, only: str | None = None) -> list[CaseResult]:
+    """Run every case (or those whose name contains ``only``)."""
+    with tempfile.TemporaryDirectory(prefix="tcc-bench-") as tmpdir:
+        tmp = Path(tmpdir)
+        results = run_sync_cases(repeat, min_time, tmp, only)
+        results += asyncio.run(run_async_cases(repeat, min_time, tmp, only))
+    return results
+
+
+def main() -> None:
+    """Run the suite, print a table and optionally save or compare JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", help="run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per case")
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per sample")
+    parser.add_argument("--json", dest="json_path", help="save results to this file")
+    parser.add_argument("--compare", help="baseline results file to compare against")
+    args = parser.parse_args()
+
+    # save_users logs every write; keep the output to the table
+    logging.disable(logging.INFO)
+    results = run(args.repeat, args.min_time, args.only)
+    baseline = load_results(args.compare) if args.compare else None
+    print("\n".join(format_table(results, baseline)))
+    if args.json_path:
+        meta = environment(
+            json_backend=json_codec.BACKEND, repeat=args.repeat, min_time=args.min_time
+        )
+        write_results(args.json_path, results, meta)
+        print(f"saved {len(results)} results to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Compare the JSON codec backends on the payloads the bot actually handles.
+
+Usage:
+    python -m benchmarks.bench_json_codec [--number N]
+
+Reports microseconds per operation for every available backend: decoding an
+EventSub chat frame (as str and as bytes), encoding a subscription request,
+and the sorted-key encode used for the config checksum.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from src.utils.json_codec import StdlibCodec, available_codecs
+
+CHAT_FRAME = StdlibCodec().dumps(
+    {
+        "metadata": {
+            "message_id": "befa7b53-d79d-478f-86b9-120f112b044e",
+            "message_type": "notification",
+            "message_timestamp": "2024-01-01T00:00:00.123456789Z",
+            "subscription_type": "channel.chat.message",
+            "subscription_version": "1",
+        },
+        "payload": {
+            "subscription": {
+                "id": "f1c2a387-161a-49f9-a165-0f21d7a4e1c4",
+                "status": "enabled",
+                "type": "channel.chat.message",
+                "version": "1",
+                "condition": {"broadcaster_user_id": "1971641", "user_id": "2914196"},
+                "transport": {"method": "websocket", "session_id": "AgoQHR3s6Mb4T8GFB1l3DlPfiRIGY2VsbC1h"},
+                "created_at": "2024-01-01T00:00:00.000000000Z",
+                "cost": 0,
+            },
+            "event": {
+                "broadcaster_user_id": "1971641",
+                "broadcaster_user_login": "streamer",
+                "broadcaster_user_name": "streamer",
+                "chatter_user_id": "4145994",
+                "chatter_user_login": "viewer32",
+                "chatter_user_name": "viewer32",
+                "message_id": "cc106a89-1814-919d-454c-f4f2f970aae7",
+                "message": {
+                    "text": "Hi chat, how is everyone doing today? 🎉",
+                    "fragments": [
+                        {"type": "text", "text": "Hi chat, how is everyone doing today? 🎉"}
+                    ],
+                },
+                "color": "#00FF7F",
+                "badges": [{"set_id": "subscriber", "id": "12", "info": "16"}],
+                "message_type": "text",
+            },
+        },
+    }
+)
+
+SUBSCRIBE_REQUEST = {
+    "type": "channel.chat.message",
+    "version": "1",
+    "condition": {"broadcaster_user_id": "1971641", "user_id": "2914196"},
+    "transport": {"method": "websocket", "session_id": "AgoQHR3s6Mb4T8GFB1l3DlPfiRIGY2VsbC1h"},
+}
+
+CONFIG_USERS = {
+    "users": [
+        {
+            "username": f"user{i}",
+            "client_id": "a" * 30,
+            "client_secret": "b" * 30,
+            "access_token": "c" * 30,
+            "refresh_token": "d" * 50,
+            "token_expiry": "2024-01-01T00:00:00+00:00",
+            "channels": [f"user{i}", "sharedchannel"],
+            "is_prime_or_turbo": i % 2 == 0,
+            "enabled": True,
+        }
+        for i in range(100)
+    ]
+}
+
+
+def run(number: int) -> list[tuple[str, str, float]]:
+    """Time every case for every backend.
+
+    Returns:
+        list[tuple[str, str, float]]: (backend, case, microseconds per op).
+    """
+    frame_bytes = CHAT_FRAME.encode()
+    results = []
+    for name, codec in available_codecs().items():
+        cases = {
+            "decode chat frame (str)": lambda c=codec: c.loads(CHAT_FRAME),
+            "decode chat frame (bytes)": lambda c=codec: c.loads(frame_bytes),
+            "encode subscribe request": lambda c=codec: c.dumps(SUBSCRIBE_REQUEST),
+            "config checksum payload (100 users)": lambda c=codec: c.dumpb(
+                CONFIG_USERS, sort_keys=True, default=str
+            ),
+        }
+        for case, func in cases.items():
+            elapsed = min(timeit.repeat(func, number=number, repeat=5))
+            results.append((name, case, elapsed / number * 1e6))
+    return results
+
+
+def main() -> None:
+    """Print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="calls per sample")
+    args = parser.parse_args()
+    results = run(args.number)
+    baseline = {case: us for name, case, us in results if name == "json"}
+    print(f"{'backend':<8} {'case':<38} {'us/op':>9} {'speedup':>8}")
+    for name, case, us in results:
+        print(f"{name:<8} {case:<38} {us:>9.2f} {baseline[case] / us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
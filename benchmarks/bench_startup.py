@@ -0,0 +1,90 @@
+"""Measure what importing the entry point costs, and check it against budget.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs N] [--top K] [--module NAME]
+
+Each run imports the module in a fresh interpreter with ``-X importtime``
+and keeps the fastest run. Reports the total, the heaviest imports, and
+whether any deferred third-party package was loaded. Exits non-zero when
+``src.main`` exceeds ``IMPORT_BUDGET_MS`` or loads a deferred package.
+Measure ``--module src.bot.manager`` to see the cost that is now paid on a
+worker thread during token setup instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from src.main import DEFERRED_PACKAGES, IMPORT_BUDGET_MS
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def measure(module: str) -> tuple[dict[str, tuple[int, int]], list[str]]:
+    """Import ``module`` in a fresh interpreter.
+
+    Returns:
+        tuple: ({module: (self_us, cumulative_us)}, deferred packages loaded).
+    """
+    probe = (
+        f"import sys; import {module}; "
+        f"print(','.join(p for p in {DEFERRED_PACKAGES!r} if p in sys.modules))"
+    )
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    loaded = [p for p in proc.stdout.strip().split(",") if p]
+    return times, loaded
+
+
+def best_of(module: str, runs: int) -> tuple[dict[str, tuple[int, int]], list[str]]:
+    """Return the run with the lowest total for ``module``."""
+    results = [measure(module) for _ in range(runs)]
+    return min(results, key=lambda r: r[0].get(module, (0, 0))[1])
+
+
+def main() -> None:
+    """Print the import report and enforce the entry-point budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to try")
+    parser.add_argument("--top", type=int, default=10, help="heaviest imports to list")
+    parser.add_argument("--module", default="src.main", help="module to import")
+    args = parser.parse_args()
+
+    times, loaded = best_of(args.module, args.runs)
+    total_ms = times.get(args.module, (0, 0))[1] / 1000
+    print(f"{args.module}: {total_ms:.1f} ms (best of {args.runs})")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    heaviest = sorted(times.items(), key=lambda kv: kv[1][0], reverse=True)
+    for name, (self_us, cum_us) in heaviest[: args.top]:
+        print(f"{self_us / 1000:>9.1f} {cum_us / 1000:>9.1f}  {name}")
+    print(f"deferred packages loaded: {', '.join(loaded) or 'none'}")
+
+    if args.module != "src.main":
+        return
+    over = total_ms > IMPORT_BUDGET_MS
+    print(f"budget: {IMPORT_BUDGET_MS} ms -> {'OVER' if over or loaded else 'ok'}")
+    if over or loaded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
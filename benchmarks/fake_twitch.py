@@ -0,0 +1,1060 @@
+"""Local stand-in for the parts of Twitch the bot uses.
+
+One ``aiohttp`` application serves every service from a single origin:
+
+- ``/ws``: EventSub WebSocket with welcome, keepalive, notification,
+  session_reconnect and revocation messages
+- ``/helix/users``, ``/helix/chat/color`` (GET/PUT) and
+  ``/helix/eventsub/subscriptions`` (GET/POST/DELETE, paginated)
+- ``/oauth2/validate``, ``/oauth2/token`` (refresh and device code grants)
+  and ``/oauth2/device`` (codes are approved on first poll)
+
+``FaultProfile`` adds latency, random 5xx errors, random 429s and a Helix
+points bucket per client and user that answers with ``Ratelimit-*``
+headers. ``FakeTwitch.firehose`` generates chat traffic into every
+subscribed channel. The server records per-route counts and statuses, and
+the time from a bot user's chat message to that user's next color change.
+
+In-process::
+
+    async with FakeTwitch() as twitch:
+        user = twitch.add_user("alice")
+        set_endpoints(twitch.endpoints)
+        ...
+
+Standalone (the ``/_fake/*`` control routes register users, send chat,
+run the firehose, force reconnects, outages and revocations, and report
+metrics)::
+
+    python -m benchmarks.fake_twitch [--port 8080] [--latency-ms 20]
+        [--error-rate 0.01] [--throttle-rate 0.01] [--rate-limit 800]
+
+then run the bot with ``TWITCH_HELIX_URL=http://127.0.0.1:8080/helix``,
+``TWITCH_AUTH_URL=http://127.0.0.1:8080/oauth2`` and
+``EVENTSUB_WS_URL=ws://127.0.0.1:8080/ws``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import logging
+import random
+import re
+import secrets
+import statistics
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from aiohttp import WSCloseCode, WSMsgType, web
+
+from src.api.endpoints import TwitchEndpoints
+from src.utils import json_codec
+
+REQUIRED_SCOPES = ("chat:read", "user:read:chat", "user:manage:chat_color")
+NAMED_COLORS = frozenset(
+    {
+        "blue",
+        "blue_violet",
+        "cadet_blue",
+        "chocolate",
+        "coral",
+        "dodger_blue",
+        "firebrick",
+        "golden_rod",
+        "green",
+        "hot_pink",
+        "orange_red",
+        "red",
+        "sea_green",
+        "spring_green",
+        "yellow_green",
+    }
+)
+HEX_COLOR = re.compile(r"^#[0-9a-fA-F]{6}$")
+DEVICE_GRANT = "urn:ietf:params:oauth:grant-type:device_code"
+TOKEN_LIFETIME_SECONDS = 14400
+MAX_SUBSCRIPTIONS_PER_SESSION = 300
+PAGE_SIZE = 100
+REASONS = {
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    409: "Conflict",
+    429: "Too Many Requests",
+    503: "Service Unavailable",
+}
+
+
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+
+def _token(length: int = 30) -> str:
+    return secrets.token_hex(length // 2 + 1)[:length]
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": pick(0.50) * 1000,
+        "p95_ms": pick(0.95) * 1000,
+        "p99_ms": pick(0.99) * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+@dataclass
+class FaultProfile:
+    """Latency, error and rate-limit behaviour of the HTTP routes.
+
+    Attributes:
+        latency_ms: Delay added to every Helix and OAuth response.
+        jitter_ms: Uniform random delay added on top of ``latency_ms``.
+        error_rate: Share of Helix and OAuth requests answered with 503.
+        throttle_rate: Share of Helix requests answered with 429 regardless
+            of the bucket.
+        rate_limit: Helix points per client and user per minute; 0 disables
+            the bucket (headers are still sent).
+        keepalive_seconds: Default EventSub keepalive interval.
+        ws_rate: WebSocket handshakes accepted per second across all
+            clients; more are refused with 429 (an edge shedding load).
+            0 disables the limit.
+        seed: Seed for the fault and firehose random generator.
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    rate_limit: int = 800
+    keepalive_seconds: int = 10
+    ws_rate: float = 0.0
+    seed: int | None = None
+
+
+@dataclass
+class FakeUser:
+    """A Twitch account known to the stand-in."""
+
+    user_id: str
+    login: str
+    client_id: str
+    access_token: str
+    refresh_token: str
+    prime: bool = True
+    color: str = ""
+    scopes: tuple[str, ...] = REQUIRED_SCOPES
+
+    def to_helix(self) -> dict[str, Any]:
+        """Entry as returned by ``GET /helix/users``."""
+        return {
+            "id": self.user_id,
+            "login": self.login,
+            "display_name": self.login,
+            "type": "",
+            "broadcaster_type": "",
+            "description": "",
+            "created_at": "2020-01-01T00:00:00Z",
+        }
+
+    def credentials(self) -> dict[str, Any]:
+        """Fields a bot config entry needs for this user."""
+        return {
+            "username": self.login,
+            "user_id": self.user_id,
+            "client_id": self.client_id,
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+        }
+
+
+@dataclass
+class FakeSubscription:
+    """An EventSub subscription on a WebSocket session."""
+
+    id: str
+    type: str
+    version: str
+    condition: dict[str, str]
+    session_id: str
+    client_id: str
+    status: str = "enabled"
+    created_at: str = field(default_factory=_now_iso)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Subscription object as returned by Helix and in notifications."""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "type": self.type,
+            "version": self.version,
+            "condition": dict(self.condition),
+            "transport": {"method": "websocket", "session_id": self.session_id},
+            "created_at": self.created_at,
+            "cost": 0,
+        }
+
+
+class _Session:
+    """One EventSub WebSocket session."""
+
+    def __init__(self, session_id: str, keepalive: int) -> None:
+        self.id = session_id
+        self.keepalive = keepalive
+        self.ws: web.WebSocketResponse | None = None
+        self.subscriptions: dict[str, FakeSubscription] = {}
+        self.connected_at = _now_iso()
+        self.last_sent = time.monotonic()
+        self.reconnecting = False
+
+    @property
+    def enabled(self) -> int:
+        return sum(1 for s in self.subscriptions.values() if s.status == "enabled")
+
+    async def send(self, message: dict[str, Any]) -> bool:
+        ws = self.ws
+        if ws is None or ws.closed:
+            return False
+        try:
+            await ws.send_str(json_codec.dumps(message))
+        except (ConnectionError, RuntimeError):
+            return False
+        self.last_sent = time.monotonic()
+        return True
+
+
+class _Bucket:
+    """Helix points bucket refilled continuously over a minute."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.tokens = float(limit)
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.limit, self.tokens + (now - self.updated) * self.limit / 60)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def headers(self) -> dict[str, str]:
+        missing = self.limit - self.tokens
+        reset = time.time() + missing * 60 / self.limit if self.limit else time.time()
+        return {
+            "Ratelimit-Limit": str(self.limit),
+            "Ratelimit-Remaining": str(int(self.tokens)),
+            "Ratelimit-Reset": str(int(reset) + 1),
+        }
+
+
+@dataclass
+class FirehoseStats:
+    """Outcome of one firehose run."""
+
+    sent: int = 0
+    own: int = 0
+    delivered: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable form, with the achieved rates."""
+        elapsed = self.seconds or 1.0
+        return {
+            "sent": self.sent,
+            "own": self.own,
+            "delivered": self.delivered,
+            "seconds": round(self.seconds, 3),
+            "sent_per_second": round(self.sent / elapsed, 1),
+            "delivered_per_second": round(self.delivered / elapsed, 1),
+        }
+
+
+class Metrics:
+    """Counters and latencies collected by the stand-in."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear every counter (e.g. between startup and steady state)."""
+        self.requests: Counter[str] = Counter()
+        self.statuses: Counter[str] = Counter()
+        self.ws_messages: Counter[str] = Counter()
+        self.color_changes = 0
+        self.chat_to_color: list[float] = []
+        self.sessions_opened = 0
+        self.started = time.monotonic()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current counters and the chat-to-color latency distribution."""
+        return {
+            "uptime_seconds": round(time.monotonic() - self.started, 3),
+            "requests": dict(self.requests),
+            "statuses": dict(self.statuses),
+            "ws_messages": dict(self.ws_messages),
+            "sessions_opened": self.sessions_opened,
+            "color_changes": self.color_changes,
+            "chat_to_color": _percentiles(self.chat_to_color),
+        }
+
+
+class FakeTwitch:
+    """In-process Twitch stand-in; see the module docstring."""
+
+    def __init__(
+        self,
+        faults: FaultProfile | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.faults = faults or FaultProfile()
+        self.host = host
+        self.port = port
+        self.metrics = Metrics()
+        self.users: dict[str, FakeUser] = {}
+        self.sessions: dict[str, _Session] = {}
+        self.subscriptions: dict[str, FakeSubscription] = {}
+        self._by_id: dict[str, FakeUser] = {}
+        self._by_token: dict[str, FakeUser] = {}
+        self._by_refresh: dict[str, FakeUser] = {}
+        self._by_broadcaster: dict[str, set[str]] = {}
+        self._buckets: dict[tuple[str, str], _Bucket] = {}
+        self._ws_tokens = self.faults.ws_rate
+        self._ws_updated = time.monotonic()
+        self._devices: dict[str, dict[str, Any]] = {}
+        self._pending_chat: dict[str, float] = {}
+        self._ids = itertools.count(100000)
+        self._rng = random.Random(self.faults.seed)  # noqa: S311 - test traffic
+        self._runner: web.AppRunner | None = None
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self.app = self._build_app()
+
+    # ---- Lifecycle ----
+    async def start(self) -> FakeTwitch:
+        """Start serving; with ``port=0`` a free port is picked."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        server = site._server
+        if self.port == 0 and server is not None and server.sockets:
+            self.port = server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        """Close every socket and stop serving."""
+        for task in list(self._tasks):
+            task.cancel()
+        for session in list(self.sessions.values()):
+            if session.ws is not None and not session.ws.closed:
+                await session.ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> FakeTwitch:
+        return await self.start()
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.stop()
+
+    @property
+    def base_url(self) -> str:
+        """HTTP origin the stand-in listens on."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def endpoints(self) -> TwitchEndpoints:
+        """Endpoints pointing every client at this stand-in."""
+        return TwitchEndpoints.local(self.base_url)
+
+    # ---- Accounts ----
+    def add_user(
+        self, login: str, *, client_id: str = "fakeclientid000000", prime: bool = True
+    ) -> FakeUser:
+        """Register an account with fresh tokens (existing logins are returned)."""
+        login = login.lower()
+        if login in self.users:
+            return self.users[login]
+        user = FakeUser(
+            user_id=str(next(self._ids)),
+            login=login,
+            client_id=client_id,
+            access_token=_token(),
+            refresh_token=_token(50),
+            prime=prime,
+        )
+        self.users[login] = user
+        self._by_id[user.user_id] = user
+        self._by_token[user.access_token] = user
+        self._by_refresh[user.refresh_token] = user
+        return user
+
+    def expire_token(self, login: str) -> None:
+        """Invalidate a user's access token so the next use answers 401."""
+        user = self.users[login.lower()]
+        self._by_token.pop(user.access_token, None)
+        user.access_token = ""
+
+    def _rotate_tokens(self, user: FakeUser) -> None:
+        self._by_token.pop(user.access_token, None)
+        self._by_refresh.pop(user.refresh_token, None)
+        user.access_token = _token()
+        user.refresh_token = _token(50)
+        self._by_token[user.access_token] = user
+        self._by_refresh[user.refresh_token] = user
+
+    # ---- EventSub ----
+    def _envelope(
+        self, message_type: str, payload: dict[str, Any], sub: FakeSubscription | None = None
+    ) -> dict[str, Any]:
+        metadata: dict[str, Any] = {
+            "message_id": str(uuid.uuid4()),
+            "message_type": message_type,
+            "message_timestamp": _now_iso(),
+        }
+        if sub is not None:
+            metadata["subscription_type"] = sub.type
+            metadata["subscription_version"] = sub.version
+        self.metrics.ws_messages[message_type] += 1
+        return {"metadata": metadata, "payload": payload}
+
+    def _session_payload(
+        self, session: _Session, status: str, reconnect_url: str | None
+    ) -> dict[str, Any]:
+        return {
+            "session": {
+                "id": session.id,
+                "status": status,
+                "connected_at": session.connected_at,
+                "keepalive_timeout_seconds": None if reconnect_url else session.keepalive,
+                "reconnect_url": reconnect_url,
+                "recovery_url": None,
+            }
+        }
+
+    async def send_chat(self, broadcaster: str, chatter: str, text: str) -> int:
+        """Deliver a ``channel.chat.message`` to every subscribed session.
+
+        Args:
+            broadcaster: Channel login.
+            chatter: Login of the sender; need not be registered.
+            text: Message text.
+
+        Returns:
+            int: Sessions the message was delivered to.
+        """
+        channel = self.users.get(broadcaster.lower())
+        if channel is None:
+            return 0
+        sender = self.users.get(chatter.lower())
+        if sender is not None:
+            self._pending_chat.setdefault(sender.user_id, time.perf_counter())
+        event = {
+            "broadcaster_user_id": channel.user_id,
+            "broadcaster_user_login": channel.login,
+            "broadcaster_user_name": channel.login,
+            "chatter_user_id": sender.user_id if sender else f"9{abs(hash(chatter)) % 10**8}",
+            "chatter_user_login": chatter.lower(),
+            "chatter_user_name": chatter,
+            "message_id": str(uuid.uuid4()),
+            "message": {"text": text, "fragments": [{"type": "text", "text": text}]},
+            "color": sender.color if sender else "",
+            "badges": [],
+            "message_type": "text",
+        }
+        delivered = 0
+        for sub_id in list(self._by_broadcaster.get(channel.user_id, ())):
+            sub = self.subscriptions.get(sub_id)
+            session = self.sessions.get(sub.session_id) if sub else None
+            if sub is None or session is None:
+                continue
+            message = self._envelope(
+                "notification", {"subscription": sub.to_dict(), "event": event}, sub
+            )
+            if await session.send(message):
+                delivered += 1
+        return delivered
+
+    async def reconnect_session(self, session_id: str) -> bool:
+        """Send ``session_reconnect``; subscriptions move to the new socket."""
+        session = self.sessions.get(session_id)
+        if session is None or session.ws is None:
+            return False
+        session.reconnecting = True
+        url = f"ws://{self.host}:{self.port}/ws?reconnect={session.id}"
+        payload = self._session_payload(session, "reconnecting", url)
+        return await session.send(self._envelope("session_reconnect", payload))
+
+    async def reconnect_all(self) -> int:
+        """Ask every connected session to reconnect (a Twitch edge restart)."""
+        results = await asyncio.gather(
+            *(self.reconnect_session(sid) for sid in list(self.sessions))
+        )
+        return sum(results)
+
+    async def drop_all(self, ws_rate: float | None = None) -> int:
+        """Close every socket without warning (a network outage).
+
+        Args:
+            ws_rate: New handshake limit while the fleet reconnects, as
+                ``FaultProfile.ws_rate``; None keeps the current one.
+        """
+        if ws_rate is not None:
+            self.faults.ws_rate = ws_rate
+            self._ws_tokens = ws_rate
+            self._ws_updated = time.monotonic()
+        sockets = [s.ws for s in self.sessions.values() if s.ws is not None]
+        await asyncio.gather(
+            *(ws.close(code=WSCloseCode.GOING_AWAY) for ws in sockets), return_exceptions=True
+        )
+        return len(sockets)
+
+    async def revoke(self, subscription_id: str, status: str = "authorization_revoked") -> bool:
+        """Revoke a subscription and notify its session."""
+        sub = self.subscriptions.get(subscription_id)
+        if sub is None:
+            return False
+        sub.status = status
+        self._drop_subscription(sub)
+        session = self.sessions.get(sub.session_id)
+        if session is None:
+            return True
+        await session.send(self._envelope("revocation", {"subscription": sub.to_dict()}, sub))
+        return True
+
+    def _drop_subscription(self, sub: FakeSubscription) -> None:
+        self.subscriptions.pop(sub.id, None)
+        session = self.sessions.get(sub.session_id)
+        if session is not None:
+            session.subscriptions.pop(sub.id, None)
+        watchers = self._by_broadcaster.get(sub.condition.get("broadcaster_user_id", ""))
+        if watchers is not None:
+            watchers.discard(sub.id)
+
+    async def firehose(
+        self,
+        rate: float,
+        duration: float,
+        *,
+        own_ratio: float = 0.02,
+        tick: float = 0.01,
+    ) -> FirehoseStats:
+        """Generate chat into every channel with an enabled subscription.
+
+        Args:
+            rate: Messages per second across all channels.
+            duration: Seconds to run.
+            own_ratio: Share of messages sent by a bot user subscribed to
+                the channel (these trigger color changes).
+            tick: Scheduling interval.
+
+        Returns:
+            FirehoseStats: Messages sent, bot-user messages and deliveries.
+        """
+        stats = FirehoseStats()
+        start = time.perf_counter()
+        owed = 0.0
+        while (elapsed := time.perf_counter() - start) < duration:
+            targets = self._chat_targets()
+            owed = rate * elapsed - stats.sent
+            for _ in range(int(owed)):
+                if not targets:
+                    break
+                channel, readers = self._rng.choice(targets)
+                if readers and self._rng.random() < own_ratio:
+                    chatter = self._by_id[self._rng.choice(readers)].login
+                    stats.own += 1
+                else:
+                    chatter = f"viewer{self._rng.randrange(100000)}"
+                stats.delivered += await self.send_chat(channel, chatter, "Kappa hello chat")
+                stats.sent += 1
+            await asyncio.sleep(tick)
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def _chat_targets(self) -> list[tuple[str, list[str]]]:
+        targets = []
+        for broadcaster_id, sub_ids in self._by_broadcaster.items():
+            channel = self._by_id.get(broadcaster_id)
+            readers = [
+                self.subscriptions[s].condition.get("user_id", "")
+                for s in sub_ids
+                if s in self.subscriptions
+            ]
+            readers = [r for r in readers if r in self._by_id]
+            if channel is not None and readers:
+                targets.append((channel.login, readers))
+        return targets
+
+    async def _keepalive(self, session: _Session) -> None:
+        while session.ws is not None and not session.ws.closed:
+            idle = time.monotonic() - session.last_sent
+            if idle >= session.keepalive:
+                await session.send(self._envelope("session_keepalive", {}))
+                idle = 0.0
+            await asyncio.sleep(max(session.keepalive - idle, 0.05))
+
+    def _admit_handshake(self) -> bool:
+        rate = self.faults.ws_rate
+        if rate <= 0:
+            return True
+        now = time.monotonic()
+        self._ws_tokens = min(rate, self._ws_tokens + (now - self._ws_updated) * rate)
+        self._ws_updated = now
+        if self._ws_tokens < 1.0:
+            return False
+        self._ws_tokens -= 1.0
+        return True
+
+    async def _ws(self, request: web.Request) -> web.StreamResponse:
+        if not self._admit_handshake():
+            self.metrics.statuses["ws 429"] += 1
+            return self._error(429, "too many connection attempts")
+        ws = web.WebSocketResponse(protocols=("twitch-eventsub-ws",), heartbeat=None)
+        await ws.prepare(request)
+        self.metrics.requests["GET /ws"] += 1
+        previous = self.sessions.get(request.query.get("reconnect", ""))
+        if previous is not None and previous.reconnecting:
+            session = previous
+            old_ws, session.ws = session.ws, ws
+            session.reconnecting = False
+        else:
+            keepalive = int(
+                request.query.get("keepalive_timeout_seconds", self.faults.keepalive_seconds)
+            )
+            session = _Session(_token(32), keepalive)
+            session.ws = ws
+            old_ws = None
+            self.sessions[session.id] = session
+            self.metrics.sessions_opened += 1
+        await session.send(
+            self._envelope("session_welcome", self._session_payload(session, "connected", None))
+        )
+        if old_ws is not None and not old_ws.closed:
+            await old_ws.close()
+        keepalive_task = asyncio.create_task(self._keepalive(session))
+        self._tasks.add(keepalive_task)
+        try:
+            async for msg in ws:
+                if msg.type in (WSMsgType.CLOSE, WSMsgType.ERROR):
+                    break
+        finally:
+            keepalive_task.cancel()
+            self._tasks.discard(keepalive_task)
+            if session.ws is ws:
+                self._close_session(session)
+        return ws
+
+    def _close_session(self, session: _Session) -> None:
+        session.ws = None
+        self.sessions.pop(session.id, None)
+        for sub in list(session.subscriptions.values()):
+            watchers = self._by_broadcaster.get(sub.condition.get("broadcaster_user_id", ""))
+            if watchers is not None:
+                watchers.discard(sub.id)
+            # Twitch keeps disabled subscriptions listed for a while
+            sub.status = "websocket_disconnected"
+
+    # ---- HTTP plumbing ----
+    def _build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._faults_middleware])
+        app.router.add_get("/ws", self._ws)
+        app.router.add_get("/helix/users", self._helix(self._users))
+        app.router.add_get("/helix/chat/color", self._helix(self._get_color))
+        app.router.add_put("/helix/chat/color", self._helix(self._put_color))
+        app.router.add_get("/helix/eventsub/subscriptions", self._helix(self._list_subs))
+        app.router.add_post("/helix/eventsub/subscriptions", self._helix(self._create_sub))
+        app.router.add_delete("/helix/eventsub/subscriptions", self._helix(self._delete_sub))
+        app.router.add_route("*", "/helix/", self._helix_root)
+        app.router.add_route("*", "/oauth2/validate", self._validate)
+        app.router.add_post("/oauth2/token", self._oauth_token)
+        app.router.add_post("/oauth2/device", self._device)
+        app.router.add_post("/_fake/users", self._control_users)
+        app.router.add_post("/_fake/chat", self._control_chat)
+        app.router.add_post("/_fake/firehose", self._control_firehose)
+        app.router.add_post("/_fake/reconnect", self._control_reconnect)
+        app.router.add_post("/_fake/drop", self._control_drop)
+        app.router.add_post("/_fake/revoke", self._control_revoke)
+        app.router.add_get("/_fake/metrics", self._control_metrics)
+        app.router.add_post("/_fake/metrics/reset", self._control_reset)
+        return app
+
+    @staticmethod
+    def _error(status: int, message: str, headers: dict[str, str] | None = None) -> web.Response:
+        body = {"error": REASONS.get(status, "Error"), "status": status, "message": message}
+        return web.json_response(body, status=status, headers=headers, dumps=json_codec.dumps)
+
+    @staticmethod
+    def _json(data: Any, status: int = 200, headers: dict[str, str] | None = None) -> web.Response:
+        return web.json_response(data, status=status, headers=headers, dumps=json_codec.dumps)
+
+    @web.middleware
+    async def _faults_middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        path = request.path
+        simulated = path.startswith(("/helix", "/oauth2"))
+        if simulated:
+            self.metrics.requests[f"{request.method} {path}"] += 1
+            faults = self.faults
+            delay = faults.latency_ms + self._rng.uniform(0, faults.jitter_ms)
+            if delay > 0:
+                await asyncio.sleep(delay / 1000)
+            if faults.error_rate and self._rng.random() < faults.error_rate:
+                response: web.StreamResponse = self._error(503, "injected error")
+                self.metrics.statuses["503"] += 1
+                return response
+        response = await handler(request)
+        if simulated:
+            self.metrics.statuses[str(response.status)] += 1
+        return response
+
+    def _helix(self, handler: Any) -> Any:
+        async def wrapped(request: web.Request) -> web.Response:
+            auth = request.headers.get("Authorization", "")
+            user = self._by_token.get(auth.removeprefix("Bearer ").strip())
+            if user is None or request.headers.get("Client-Id") != user.client_id:
+                return self._error(401, "Invalid OAuth token")
+            bucket = self._buckets.get((user.client_id, user.user_id))
+            if bucket is None:
+                bucket = _Bucket(self.faults.rate_limit or 800)
+                self._buckets[(user.client_id, user.user_id)] = bucket
+            throttled = bool(self.faults.throttle_rate) and (
+                self._rng.random() < self.faults.throttle_rate
+            )
+            if throttled or (self.faults.rate_limit and not bucket.take()):
+                return self._error(429, "Too Many Requests", bucket.headers())
+            response = await handler(request, user)
+            response.headers.update(bucket.headers())
+            return response
+
+        return wrapped
+
+    async def _helix_root(self, request: web.Request) -> web.Response:
+        # Pre-warm target: any answer keeps the connection pooled
+        return self._error(404, "Not Found")
+
+    # ---- Helix ----
+    async def _users(self, request: web.Request, user: FakeUser) -> web.Response:
+        logins = request.query.getall("login", [])
+        ids = request.query.getall("id", [])
+        if len(logins) + len(ids) > PAGE_SIZE:
+            return self._error(400, "too many logins/ids")
+        if not logins and not ids:
+            found = [user]
+        else:
+            found = [self.users[x.lower()] for x in logins if x.lower() in self.users]
+            found += [self._by_id[x] for x in ids if x in self._by_id]
+        return self._json({"data": [u.to_helix() for u in found]})
+
+    async def _get_color(self, request: web.Request, user: FakeUser) -> web.Response:
+        data = []
+        for uid in request.query.getall("user_id", []):
+            target = self._by_id.get(uid)
+            if target is not None:
+                data.append(
+                    {
+                        "user_id": uid,
+                        "user_login": target.login,
+                        "user_name": target.login,
+                        "color": target.color,
+                    }
+                )
+        return self._json({"data": data})
+
+    async def _put_color(self, request: web.Request, user: FakeUser) -> web.Response:
+        if request.query.get("user_id") != user.user_id:
+            return self._error(401, "user_id must match the token")
+        color = request.query.get("color", "")
+        if HEX_COLOR.match(color):
+            if not user.prime:
+                return self._error(400, "Turbo or Prime required for hex colors")
+        elif color.lower() not in NAMED_COLORS:
+            return self._error(400, f"invalid color {color!r}")
+        user.color = color
+        self.metrics.color_changes += 1
+        sent = self._pending_chat.pop(user.user_id, None)
+        if sent is not None:
+            self.metrics.chat_to_color.append(time.perf_counter() - sent)
+        return web.Response(status=204)
+
+    def _visible_subs(self, user: FakeUser) -> list[FakeSubscription]:
+        return [s for s in self.subscriptions.values() if s.client_id == user.client_id]
+
+    async def _list_subs(self, request: web.Request, user: FakeUser) -> web.Response:
+        subs = self._visible_subs(user)
+        query = request.query
+        if "status" in query:
+            subs = [s for s in subs if s.status == query["status"]]
+        if "type" in query:
+            subs = [s for s in subs if s.type == query["type"]]
+        if "user_id" in query:
+            uid = query["user_id"]
+            subs = [s for s in subs if uid in s.condition.values()]
+        if "subscription_id" in query:
+            subs = [s for s in subs if s.id == query["subscription_id"]]
+        try:
+            first = min(max(int(query.get("first", PAGE_SIZE)), 1), PAGE_SIZE)
+            offset = int(query.get("after", "0") or 0)
+        except ValueError:
+            return self._error(400, "invalid pagination")
+        page = subs[offset : offset + first]
+        pagination = {"cursor": str(offset + first)} if offset + first < len(subs) else {}
+        enabled = sum(1 for s in self._visible_subs(user) if s.status == "enabled")
+        return self._json(
+            {
+                "data": [s.to_dict() for s in page],
+                "total": enabled,
+                "total_cost": 0,
+                "max_total_cost": 10,
+                "pagination": pagination,
+            }
+        )
+
+    async def _create_sub(self, request: web.Request, user: FakeUser) -> web.Response:
+        try:
+            body = await request.json(loads=json_codec.loads)
+        except ValueError:
+            return self._error(400, "invalid JSON body")
+        transport = body.get("transport") or {}
+        condition = body.get("condition") or {}
+        if not body.get("type") or not isinstance(condition, dict):
+            return self._error(400, "missing type or condition")
+        if transport.get("method") != "websocket":
+            return self._error(400, "only websocket transport is supported")
+        session = self.sessions.get(transport.get("session_id", ""))
+        if session is None or session.ws is None:
+            return self._error(400, "websocket transport session does not exist")
+        if condition.get("user_id") not in (None, user.user_id):
+            return self._error(403, "condition user_id must match the token")
+        for existing in session.subscriptions.values():
+            if (
+                existing.status == "enabled"
+                and existing.type == body["type"]
+                and existing.condition == condition
+            ):
+                return self._error(409, "subscription already exists")
+        if session.enabled >= MAX_SUBSCRIPTIONS_PER_SESSION:
+            return self._error(429, "websocket transport session subscription limit exceeded")
+        sub = FakeSubscription(
+            id=str(uuid.uuid4()),
+            type=body["type"],
+            version=str(body.get("version", "1")),
+            condition={k: str(v) for k, v in condition.items()},
+            session_id=session.id,
+            client_id=user.client_id,
+        )
+        self.subscriptions[sub.id] = sub
+        session.subscriptions[sub.id] = sub
+        broadcaster = sub.condition.get("broadcaster_user_id")
+        if broadcaster:
+            self._by_broadcaster.setdefault(broadcaster, set()).add(sub.id)
+        enabled = sum(1 for s in self._visible_subs(user) if s.status == "enabled")
+        return self._json(
+            {"data": [sub.to_dict()], "total": enabled, "total_cost": 0, "max_total_cost": 10},
+            status=202,
+        )
+
+    async def _delete_sub(self, request: web.Request, user: FakeUser) -> web.Response:
+        sub = self.subscriptions.get(request.query.get("id", ""))
+        if sub is None or sub.client_id != user.client_id:
+            return self._error(404, "subscription not found")
+        self._drop_subscription(sub)
+        return web.Response(status=204)
+
+    # ---- OAuth ----
+    async def _validate(self, request: web.Request) -> web.Response:
+        auth = request.headers.get("Authorization", "")
+        token = auth.split(" ", 1)[1].strip() if " " in auth else ""
+        user = self._by_token.get(token)
+        if user is None:
+            return self._error(401, "invalid access token")
+        return self._json(
+            {
+                "client_id": user.client_id,
+                "login": user.login,
+                "scopes": list(user.scopes),
+                "user_id": user.user_id,
+                "expires_in": TOKEN_LIFETIME_SECONDS,
+            }
+        )
+
+    def _token_response(self, user: FakeUser) -> web.Response:
+        return self._json(
+            {
+                "access_token": user.access_token,
+                "refresh_token": user.refresh_token,
+                "expires_in": TOKEN_LIFETIME_SECONDS,
+                "scope": list(user.scopes),
+                "token_type": "bearer",
+            }
+        )
+
+    async def _oauth_token(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        grant = form.get("grant_type")
+        if grant == "refresh_token":
+            user = self._by_refresh.get(str(form.get("refresh_token", "")))
+            if user is None or form.get("client_id") != user.client_id:
+                return self._error(400, "Invalid refresh token")
+            self._rotate_tokens(user)
+            return self._token_response(user)
+        if grant == DEVICE_GRANT:
+            device = self._devices.get(str(form.get("device_code", "")))
+            if device is None:
+                return self._error(400, "invalid device code")
+            if device.get("login") is None:
+                # Approved on first poll, as if the user entered the code at once
+                device["login"] = f"device{next(self._ids)}"
+            user = self.add_user(device["login"], client_id=device["client_id"])
+            del self._devices[str(form.get("device_code"))]
+            return self._token_response(user)
+        return self._error(400, f"unsupported grant_type {grant!r}")
+
+    async def _device(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        client_id = str(form.get("client_id", ""))
+        if not client_id:
+            return self._error(400, "missing client_id")
+        device_code = _token(40)
+        user_code = secrets.token_hex(4).upper()
+        self._devices[device_code] = {"client_id": client_id, "login": None}
+        return self._json(
+            {
+                "device_code": device_code,
+                "expires_in": 1800,
+                "interval": 1,
+                "user_code": user_code,
+                "verification_uri": f"{self.base_url}/activate?device-code={user_code}",
+            }
+        )
+
+    def approve_device(self, device_code: str, login: str) -> None:
+        """Bind a pending device code to ``login`` instead of a generated account."""
+        self._devices[device_code]["login"] = login.lower()
+
+    # ---- Control API (standalone use) ----
+    async def _control_users(self, request: web.Request) -> web.Response:
+        body = await request.json(loads=json_codec.loads)
+        client_id = body.get("client_id", "fakeclientid000000")
+        users = [
+            self.add_user(login, client_id=client_id, prime=body.get("prime", True))
+            for login in body.get("logins", [])
+        ]
+        return self._json({"data": [u.credentials() for u in users]})
+
+    async def _control_chat(self, request: web.Request) -> web.Response:
+        body = await request.json(loads=json_codec.loads)
+        delivered = await self.send_chat(body["channel"], body["chatter"], body.get("text", "hi"))
+        return self._json({"delivered": delivered})
+
+    async def _control_firehose(self, request: web.Request) -> web.Response:
+        body = await request.json(loads=json_codec.loads)
+        stats = await self.firehose(
+            float(body.get("rate", 100)),
+            float(body.get("duration", 10)),
+            own_ratio=float(body.get("own_ratio", 0.02)),
+        )
+        return self._json(stats.to_dict())
+
+    async def _control_reconnect(self, request: web.Request) -> web.Response:
+        return self._json({"reconnecting": await self.reconnect_all()})
+
+    async def _control_drop(self, request: web.Request) -> web.Response:
+        body = await request.json(loads=json_codec.loads) if request.can_read_body else {}
+        return self._json({"dropped": await self.drop_all(body.get("ws_rate"))})
+
+    async def _control_revoke(self, request: web.Request) -> web.Response:
+        body = await request.json(loads=json_codec.loads)
+        ok = await self.revoke(body["id"], body.get("status", "authorization_revoked"))
+        return self._json({"revoked": ok}, status=200 if ok else 404)
+
+    async def _control_metrics(self, request: web.Request) -> web.Response:
+        snapshot = self.metrics.snapshot()
+        snapshot["sessions"] = len(self.sessions)
+        snapshot["subscriptions"] = len(self.subscriptions)
+        snapshot["enabled_subscriptions"] = sum(
+            1 for s in self.subscriptions.values() if s.status == "enabled"
+        )
+        return self._json(snapshot)
+
+    async def _control_reset(self, request: web.Request) -> web.Response:
+        self.metrics.reset()
+        return self._json({"reset": True})
+
+
+async def serve(faults: FaultProfile, host: str, port: int) -> None:
+    """Run the stand-in until cancelled."""
+    twitch = FakeTwitch(faults, host=host, port=port)
+    await twitch.start()
+    endpoints = twitch.endpoints
+    print(f"fake Twitch listening on {twitch.base_url}")
+    print(f"  TWITCH_HELIX_URL={endpoints.helix_url}")
+    print(f"  TWITCH_AUTH_URL={endpoints.auth_url}")
+    print(f"  EVENTSUB_WS_URL={endpoints.eventsub_ws_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await twitch.stop()
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``FaultProfile`` options to a command line parser."""
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay per HTTP response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="random extra delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 answers")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of 429 answers")
+    parser.add_argument("--rate-limit", type=int, default=800, help="Helix points/minute (0 = off)")
+    parser.add_argument("--keepalive", type=int, default=10, help="EventSub keepalive seconds")
+    parser.add_argument("--ws-rate", type=float, default=0.0, help="handshakes/second (0 = off)")
+    parser.add_argument("--seed", type=int, help="random seed for faults and chat")
+
+
+def faults_from_args(args: argparse.Namespace) -> FaultProfile:
+    """Build a ``FaultProfile`` from parsed ``add_fault_arguments`` options."""
+    return FaultProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        keepalive_seconds=args.keepalive,
+        ws_rate=args.ws_rate,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    """Serve the stand-in from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind")
+    parser.add_argument("--port", type=int, default=8080, help="port to bind")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    try:
+        asyncio.run(serve(faults_from_args(args), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Timing, JSON result files and baseline comparison shared by the benchmarks.
+
+Every case is calibrated like ``timeit.autorange`` (calls per sample grow
+until one sample takes at least ``min_time``), then sampled ``repeat`` times.
+The best and median microseconds per call are reported; the best is the
+figure to compare, the median shows how noisy the run was.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    """Timing of one benchmark case."""
+
+    name: str
+    number: int
+    samples_us: tuple[float, ...]
+
+    @property
+    def best_us(self) -> float:
+        """Fastest sample, in microseconds per call."""
+        return min(self.samples_us)
+
+    @property
+    def median_us(self) -> float:
+        """Median sample, in microseconds per call."""
+        return statistics.median(self.samples_us)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable form stored in result files."""
+        data = asdict(self)
+        data["samples_us"] = list(self.samples_us)
+        data["best_us"] = self.best_us
+        data["median_us"] = self.median_us
+        return data
+
+
+def _calibrate(sample: Callable[[int], float], min_time: float) -> int:
+    number = 1
+    while True:
+        if sample(number) >= min_time:
+            return number
+        number *= 2 if number < 10 else 5
+
+
+def time_sync(
+    name: str, func: Callable[[], Any], *, repeat: int = 5, min_time: float = 0.05
+) -> CaseResult:
+    """Time a synchronous callable."""
+
+    def sample(number: int) -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        return time.perf_counter() - start
+
+    number = _calibrate(sample, min_time)
+    samples = tuple(sample(number) / number * 1e6 for _ in range(repeat))
+    return CaseResult(name, number, samples)
+
+
+async def time_async(
+    name: str,
+    func: Callable[[], Awaitable[Any]],
+    *,
+    repeat: int = 5,
+    min_time: float = 0.05,
+) -> CaseResult:
+    """Time a coroutine function on the running event loop."""
+
+    async def sample(number: int) -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            await func()
+        return time.perf_counter() - start
+
+    number = 1
+    while await sample(number) < min_time:
+        number *= 2 if number < 10 else 5
+    samples = []
+    for _ in range(repeat):
+        samples.append(await sample(number) / number * 1e6)
+    return CaseResult(name, number, tuple(samples))
+
+
+def environment(**extra: Any) -> dict[str, Any]:
+    """Describe the machine and interpreter a run was made on."""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        **extra,
+    }
+
+
+def write_results(path: str | Path, results: list[CaseResult], meta: dict[str, Any]) -> None:
+    """Save a run as JSON."""
+    document = {
+        "schema": SCHEMA_VERSION,
+        "meta": meta,
+        "results": {r.name: r.to_dict() for r in results},
+    }
+    Path(path).write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: str | Path) -> dict[str, dict[str, Any]]:
+    """Load the per-case results of a saved run."""
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    return document.get("results", {})
+
+
+def format_table(
+    results: list[CaseResult], baseline: dict[str, dict[str, Any]] | None = None
+) -> list[str]:
+    """Render results, with the change against a baseline when one is given."""
+    width = max([len(r.name) for r in results] + [4])
+    header = f"{'case':<{width}} {'best us':>10} {'median us':>10} {'calls':>8}"
+    if baseline is not None:
+        header += f" {'baseline':>10} {'change':>8}"
+    lines = [header]
+    for r in results:
+        line = f"{r.name:<{width}} {r.best_us:>10.3f} {r.median_us:>10.3f} {r.number:>8}"
+        if baseline is not None:
+            before = baseline.get(r.name, {}).get("best_us")
+            if before:
+                change = (r.best_us - before) / before * 100
+                line += f" {before:>10.3f} {change:>+7.1f}%"
+            else:
+                line += f" {'-':>10} {'new':>8}"
+        lines.append(line)
+    return lines
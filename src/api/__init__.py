@@ -1,5 +1,13 @@
 """API client package."""
 
+from .endpoints import TwitchEndpoints, get_endpoints, set_endpoints  # noqa: F401
+from .rate_limit import RequestPriority  # noqa: F401
 from .twitch import TwitchAPI  # noqa: F401
 
-__all__ = ["TwitchAPI"]
+__all__ = [
+    "RequestPriority",
+    "TwitchAPI",
+    "TwitchEndpoints",
+    "get_endpoints",
+    "set_endpoints",
+]
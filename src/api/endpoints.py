@@ -0,0 +1,89 @@
+"""Base URLs of the Twitch services the bot talks to.
+
+Helix, OAuth and EventSub clients look their URLs up here when they send a
+request or open a socket, so the whole process can be pointed at another
+host, such as the local stand-in in ``benchmarks.fake_twitch``. Defaults
+come from the ``TWITCH_HELIX_URL``, ``TWITCH_AUTH_URL`` and
+``EVENTSUB_WS_URL`` environment variables; ``set_endpoints()`` overrides
+them at runtime.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from ..constants import EVENTSUB_WS_URL, TWITCH_AUTH_URL, TWITCH_HELIX_URL
+
+
+@dataclass(frozen=True)
+class TwitchEndpoints:
+    """Base URLs for Helix, OAuth and EventSub.
+
+    Attributes:
+        helix_url (str): Helix API base, without a trailing slash.
+        auth_url (str): OAuth base (``.../oauth2``), without a trailing slash.
+        eventsub_ws_url (str): EventSub WebSocket URL for new sessions.
+    """
+
+    helix_url: str = TWITCH_HELIX_URL
+    auth_url: str = TWITCH_AUTH_URL
+    eventsub_ws_url: str = EVENTSUB_WS_URL
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "helix_url", self.helix_url.rstrip("/"))
+        object.__setattr__(self, "auth_url", self.auth_url.rstrip("/"))
+
+    @property
+    def validate_url(self) -> str:
+        """OAuth token validation endpoint."""
+        return f"{self.auth_url}/validate"
+
+    @property
+    def token_url(self) -> str:
+        """OAuth token endpoint (refresh and device code grants)."""
+        return f"{self.auth_url}/token"
+
+    @property
+    def device_url(self) -> str:
+        """OAuth device authorization endpoint."""
+        return f"{self.auth_url}/device"
+
+    @classmethod
+    def local(cls, base_url: str) -> TwitchEndpoints:
+        """Endpoints for a stand-in serving every service from one origin.
+
+        Args:
+            base_url: Origin such as ``http://127.0.0.1:8080``.
+
+        Returns:
+            TwitchEndpoints: ``/helix``, ``/oauth2`` and ``/ws`` under the origin.
+        """
+        base = base_url.rstrip("/")
+        ws_base = "ws" + base[len("http") :] if base.startswith("http") else base
+        return cls(f"{base}/helix", f"{base}/oauth2", f"{ws_base}/ws")
+
+
+_endpoints = TwitchEndpoints()
+
+
+def get_endpoints() -> TwitchEndpoints:
+    """Get the endpoints currently in use."""
+    return _endpoints
+
+
+def set_endpoints(endpoints: TwitchEndpoints | None = None) -> TwitchEndpoints:
+    """Point every client at new endpoints.
+
+    Takes effect for the next request or connection; open sockets keep
+    their URL.
+
+    Args:
+        endpoints: Endpoints to use, or None to restore the defaults.
+
+    Returns:
+        TwitchEndpoints: The endpoints previously in use.
+    """
+    global _endpoints
+    previous = _endpoints
+    _endpoints = endpoints or TwitchEndpoints()
+    return previous
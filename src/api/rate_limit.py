@@ -0,0 +1,263 @@
+"""Client-side Helix rate limiting driven by ``Ratelimit-*`` response headers.
+
+Twitch meters Helix requests with a token bucket per (client ID, user token)
+and reports its state on every response through ``Ratelimit-Limit``,
+``Ratelimit-Remaining`` and ``Ratelimit-Reset``. :class:`HelixRateLimiter`
+mirrors those buckets locally, refilling them between responses, and admits
+queued requests in priority order only when a point is available, so bursts
+from many bots are paced instead of discovered through 429s.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Any
+
+from ..constants import (
+    HELIX_BACKGROUND_RESERVE_RATIO,
+    HELIX_DEFAULT_RATE_LIMIT,
+)
+from ..utils.admission import PriorityAdmission
+
+# Helix buckets refill completely once per minute
+_REFILL_WINDOW_SECONDS = 60.0
+
+# An unused bucket is full again after one window; drop it after two
+_IDLE_EVICT_SECONDS = 2 * _REFILL_WINDOW_SECONDS
+
+
+class RequestPriority(IntEnum):
+    """Admission priority of a Helix request (lower is served first)."""
+
+    COLOR = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    value = headers.get(name)
+    if value is None:
+        lowered = name.lower()
+        for key, candidate in headers.items():
+            if key.lower() == lowered:
+                return candidate
+    return value
+
+
+class RateLimitBucket:
+    """Local mirror of one Helix token bucket.
+
+    Attributes:
+        limit (int): Bucket capacity in points.
+        tokens (float): Estimated points available now.
+        reset_at (float | None): Epoch time Twitch reports the bucket full.
+        blocked_until (float): Monotonic time before which nothing is admitted.
+        in_flight (int): Admitted requests without a response yet.
+        admitted (int): Requests admitted so far.
+        delayed (int): Requests that had to wait for a point.
+        rate_limited (int): 429 responses seen despite pacing.
+        queue (PriorityAdmission): Requests waiting for a point.
+        last_used (float): Monotonic time of the last admission or release.
+    """
+
+    def __init__(self, limit: int = HELIX_DEFAULT_RATE_LIMIT) -> None:
+        self.limit = limit
+        self.tokens = float(limit)
+        self.reset_at: float | None = None
+        self.blocked_until = 0.0
+        self.in_flight = 0
+        self.admitted = 0
+        self.delayed = 0
+        self.rate_limited = 0
+        self._updated = time.monotonic()
+        self.queue = PriorityAdmission()
+        self.last_used = self._updated
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Recreate the wait queue if the bucket is used from a new event loop."""
+        if self.queue.loop is not loop:
+            self.queue.bind()
+            self.in_flight = 0
+
+    def idle(self, now: float) -> bool:
+        """Whether the bucket is unused and no longer holds back any request."""
+        return (
+            not self.in_flight
+            and not len(self.queue)
+            and now >= self.blocked_until
+            and now - self.last_used > _IDLE_EVICT_SECONDS
+        )
+
+    @property
+    def refill_rate(self) -> float:
+        """Points regained per second."""
+        return self.limit / _REFILL_WINDOW_SECONDS
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(float(self.limit), self.tokens + elapsed * self.refill_rate)
+            self._updated = now
+
+    def delay(self, priority: RequestPriority, now: float) -> float:
+        """Seconds until a request of this priority may be admitted.
+
+        Background requests leave a reserve untouched so color changes are
+        not starved by audits.
+        """
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._refill(now)
+        needed = 1.0
+        if priority >= RequestPriority.BACKGROUND:
+            needed += self.limit * HELIX_BACKGROUND_RESERVE_RATIO
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) / self.refill_rate
+
+    def update(self, headers: Mapping[str, str] | None, status: int) -> None:
+        """Resynchronise the bucket from a response.
+
+        Args:
+            headers: Response headers, or None if no response was received.
+            status: HTTP status code of the response.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        if headers:
+            limit = _header(headers, "Ratelimit-Limit")
+            remaining = _header(headers, "Ratelimit-Remaining")
+            reset = _header(headers, "Ratelimit-Reset")
+            try:
+                if limit is not None:
+                    self.limit = max(int(limit), 1)
+                if remaining is not None:
+                    # Requests still in flight were admitted after this count
+                    self.tokens = max(float(remaining) - self.in_flight, 0.0)
+                if reset is not None:
+                    self.reset_at = float(reset)
+            except ValueError:
+                logging.debug(f"Ignoring malformed Ratelimit headers: {headers}")
+        if status == 429:
+            self.rate_limited += 1
+            self.tokens = 0.0
+            wait = 1.0
+            if self.reset_at is not None:
+                wait = max(self.reset_at - time.time(), wait)
+            self.blocked_until = now + wait
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the bucket state for monitoring."""
+        self._refill(time.monotonic())
+        return {
+            "limit": self.limit,
+            "tokens": round(self.tokens, 2),
+            "reset_at": self.reset_at,
+            "blocked_for": round(max(self.blocked_until - time.monotonic(), 0.0), 2),
+            "in_flight": self.in_flight,
+            "queued": len(self.queue),
+            "admitted": self.admitted,
+            "delayed": self.delayed,
+            "rate_limited": self.rate_limited,
+        }
+
+
+class HelixRateLimiter:
+    """Priority admission control over per (client ID, token) buckets."""
+
+    def __init__(self) -> None:
+        self.buckets: dict[str, RateLimitBucket] = {}
+        self._seq = itertools.count()
+
+    @staticmethod
+    def bucket_key(client_id: str, access_token: str) -> str:
+        """Key a bucket without keeping the raw token around."""
+        digest = hashlib.sha256(access_token.encode()).hexdigest()[:12]
+        return f"{client_id}:{digest}"
+
+    def _bucket(self, key: str) -> RateLimitBucket:
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            # Refreshed tokens get new keys; forget the ones nobody uses
+            self._evict_idle(time.monotonic())
+            bucket = self.buckets[key] = RateLimitBucket()
+        bucket.bind(asyncio.get_running_loop())
+        return bucket
+
+    def _evict_idle(self, now: float) -> None:
+        for key in [k for k, b in self.buckets.items() if b.idle(now)]:
+            del self.buckets[key]
+
+    async def acquire(self, key: str, priority: RequestPriority) -> None:
+        """Wait until the bucket admits a request of the given priority.
+
+        Waiters are served strictly by priority, then arrival order.
+
+        Args:
+            key: Bucket key from :meth:`bucket_key`.
+            priority: Request priority.
+        """
+        bucket = self._bucket(key)
+
+        def admit(waited: bool) -> None:
+            bucket.tokens -= 1.0
+            bucket.in_flight += 1
+            bucket.admitted += 1
+            bucket.last_used = time.monotonic()
+            if waited:
+                bucket.delayed += 1
+
+        await bucket.queue.wait(
+            (int(priority), next(self._seq)),
+            lambda: bucket.delay(priority, time.monotonic()),
+            admit,
+        )
+
+    async def release(
+        self, key: str, headers: Mapping[str, str] | None, status: int
+    ) -> None:
+        """Return an admitted request's slot and apply its response headers."""
+        bucket = self._bucket(key)
+        async with bucket.queue.update():
+            bucket.in_flight = max(bucket.in_flight - 1, 0)
+            bucket.last_used = time.monotonic()
+            bucket.update(headers, status)
+
+    @asynccontextmanager
+    async def slot(
+        self, key: str, priority: RequestPriority
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Hold a bucket slot for one request.
+
+        Yields a dict the caller fills with ``headers`` and ``status`` so the
+        bucket can be resynchronised on exit.
+        """
+        await self.acquire(key, priority)
+        response: dict[str, Any] = {"headers": None, "status": 0}
+        try:
+            yield response
+        finally:
+            await self.release(key, response["headers"], response["status"])
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return the state of every bucket keyed by ``client_id:token-hash``."""
+        return {key: bucket.snapshot() for key, bucket in self.buckets.items()}
+
+
+# Global rate limiter instance shared by every TwitchAPI client
+_rate_limiter: HelixRateLimiter | None = None
+
+
+def get_rate_limiter() -> HelixRateLimiter:
+    """Get the global Helix rate limiter instance."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = HelixRateLimiter()
+    return _rate_limiter
@@ -0,0 +1,160 @@
+"""Shared, tuned HTTP transport for every Twitch client in the process.
+
+All Helix, OAuth and token-setup traffic goes to two hosts, so one
+``aiohttp.ClientSession`` with a sized keep-alive pool, a TTL DNS cache and
+explicit timeouts serves everything. Connections to the Helix and OAuth
+hosts (``api.twitch.tv`` and ``id.twitch.tv`` unless overridden through
+``get_endpoints()``) can be opened ahead of the first request so color
+changes do not pay the TCP and TLS handshake.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import aiohttp
+
+from ..constants import (
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_CONNECTIONS_PER_USER,
+    HTTP_DNS_CACHE_TTL_SECONDS,
+    HTTP_KEEPALIVE_SECONDS,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_MIN_CONNECTIONS_PER_HOST,
+    HTTP_PREWARM_CONNECTIONS,
+    HTTP_REQUEST_TIMEOUT_SECONDS,
+    HTTP_SOCK_READ_TIMEOUT_SECONDS,
+)
+from .endpoints import get_endpoints
+
+# Hosts the shared session talks to (Helix and OAuth)
+TWITCH_HOST_COUNT = 2
+
+
+def prewarm_urls() -> tuple[str, ...]:
+    """Lightweight endpoints used to open pooled connections; the status is ignored."""
+    endpoints = get_endpoints()
+    return (f"{endpoints.helix_url}/", endpoints.validate_url)
+
+
+def connection_limits(expected_users: int) -> tuple[int, int]:
+    """Size the connection pool for the number of configured users.
+
+    Args:
+        expected_users: Number of bots sharing the session.
+
+    Returns:
+        tuple[int, int]: (total limit, per-host limit).
+    """
+    per_host = max(
+        HTTP_MIN_CONNECTIONS_PER_HOST,
+        min(max(expected_users, 1) * HTTP_CONNECTIONS_PER_USER, HTTP_MAX_CONNECTIONS_PER_HOST),
+    )
+    return per_host * TWITCH_HOST_COUNT, per_host
+
+
+def _resolver() -> aiohttp.abc.AbstractResolver | None:
+    """Use the c-ares resolver when ``aiodns`` is installed."""
+    try:
+        import aiodns  # noqa: F401
+    except ImportError:
+        return None
+    return aiohttp.AsyncResolver()
+
+
+def create_http_session(expected_users: int = 1) -> aiohttp.ClientSession:
+    """Build a ClientSession tuned for Twitch traffic.
+
+    Must be called from a running event loop.
+
+    Args:
+        expected_users: Number of bots sharing the session.
+
+    Returns:
+        aiohttp.ClientSession: A new session owned by the caller.
+    """
+    limit, per_host = connection_limits(expected_users)
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=per_host,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL_SECONDS,
+        keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+        resolver=_resolver(),
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=HTTP_REQUEST_TIMEOUT_SECONDS,
+        connect=HTTP_CONNECT_TIMEOUT_SECONDS,
+        sock_connect=HTTP_CONNECT_TIMEOUT_SECONDS,
+        sock_read=HTTP_SOCK_READ_TIMEOUT_SECONDS,
+    )
+    logging.debug(f"🔗 HTTP transport created limit={limit} per_host={per_host}")
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+async def prewarm_connections(
+    session: aiohttp.ClientSession,
+    urls: tuple[str, ...] | None = None,
+    per_host: int = HTTP_PREWARM_CONNECTIONS,
+) -> int:
+    """Open keep-alive connections to the Twitch hosts ahead of use.
+
+    Issues concurrent ``HEAD`` requests and returns the connections to the
+    pool. Failures are logged and ignored; the first real request simply
+    connects on its own.
+
+    Args:
+        session: Session whose pool should be warmed.
+        urls: One URL per host to connect to; defaults to ``prewarm_urls()``.
+        per_host: Concurrent connections to open per host.
+
+    Returns:
+        int: Number of connections successfully opened.
+    """
+    if per_host <= 0:
+        return 0
+
+    async def _open(url: str) -> bool:
+        try:
+            async with session.head(url, allow_redirects=False):
+                return True
+        except (aiohttp.ClientError, TimeoutError, OSError) as e:
+            logging.debug(f"HTTP pre-warm failed url={url}: {type(e).__name__}")
+            return False
+
+    targets = urls if urls is not None else prewarm_urls()
+    results = await asyncio.gather(
+        *(_open(url) for url in targets for _ in range(per_host))
+    )
+    opened = sum(results)
+    logging.debug(f"🔥 Pre-warmed {opened}/{len(results)} HTTP connections")
+    return opened
+
+
+# Process-wide session shared by every subsystem
+_http_session: aiohttp.ClientSession | None = None
+_http_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_session(expected_users: int = 1) -> aiohttp.ClientSession:
+    """Get the shared HTTP session, creating it on first use.
+
+    A session closed or created on another event loop is replaced.
+
+    Args:
+        expected_users: Number of bots, used to size the pool on creation.
+    """
+    global _http_session, _http_session_loop
+    loop = asyncio.get_running_loop()
+    if _http_session is None or _http_session.closed or _http_session_loop is not loop:
+        _http_session = create_http_session(expected_users)
+        _http_session_loop = loop
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session if one is open."""
+    global _http_session, _http_session_loop
+    session, _http_session, _http_session_loop = _http_session, None, None
+    if session is not None and not session.closed:
+        await session.close()
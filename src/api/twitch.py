@@ -8,6 +8,7 @@ sprinkling raw request logic across modules.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 from collections.abc import Iterable
 from typing import Any, cast
@@ -16,11 +17,86 @@ import aiohttp
 
 from ..errors.handling import handle_api_error
 from ..errors.internal import InternalError
+from ..utils import json_codec
 from ..utils.circuit_breaker import (
     CircuitBreakerConfig,
     CircuitBreakerOpenException,
-    get_circuit_breaker,
+    FailureScope,
+    KeyedCircuitBreaker,
+    get_keyed_circuit_breaker,
 )
+from .endpoints import get_endpoints
+from .rate_limit import RequestPriority, get_rate_limiter
+
+HELIX_BREAKER_NAMESPACE = "helix"
+# Breaker family of the OAuth token validation endpoint
+VALIDATE_ENDPOINT = "oauth2/validate"
+
+
+def classify_helix_status(
+    response: tuple[dict[str, Any], int, dict[str, str]],
+) -> FailureScope:
+    """Classify a Helix response for the breaker hierarchy.
+
+    Auth failures belong to the user; server errors to the endpoint. Other
+    client errors and rate limits say nothing about service health.
+
+    Args:
+        response: The ``(data, status, headers)`` tuple of a request.
+
+    Returns:
+        FailureScope: How far up the hierarchy the outcome counts.
+    """
+    status = response[1]
+    if status < 400:
+        return FailureScope.NONE
+    if status in (401, 403):
+        return FailureScope.USER
+    if status >= 500:
+        return FailureScope.ENDPOINT
+    return FailureScope.IGNORED
+
+
+def classify_validation_status(
+    response: tuple[dict[str, Any] | None, int, dict[str, str]],
+) -> FailureScope:
+    """Classify a token validation response for the breaker hierarchy.
+
+    A 401 only means the token is invalid, which callers handle by
+    refreshing it; it is not a failure of the validation service.
+
+    Args:
+        response: The ``(data, status, headers)`` tuple of a validation.
+
+    Returns:
+        FailureScope: How far up the hierarchy the outcome counts.
+    """
+    if response[1] == 401:
+        return FailureScope.IGNORED
+    return classify_helix_status((response[0] or {}, response[1], response[2]))
+
+
+def _request_user_id(
+    params: dict[str, Any] | list[tuple[str, str]] | None,
+    json_body: dict[str, Any] | None,
+) -> str | None:
+    """Infer the acting user ID from request parameters or an EventSub body."""
+    if isinstance(params, dict) and params.get("user_id"):
+        return str(params["user_id"])
+    condition = json_body.get("condition") if json_body else None
+    if isinstance(condition, dict) and condition.get("user_id"):
+        return str(condition["user_id"])
+    return None
+
+
+def _infer_priority(method: str, endpoint: str) -> RequestPriority:
+    """Default priority: color changes first, subscription audits last."""
+    family = endpoint.split("?", 1)[0].strip("/")
+    if family == "chat/color" and method.upper() == "PUT":
+        return RequestPriority.COLOR
+    if family == "eventsub/subscriptions" and method.upper() in ("GET", "DELETE"):
+        return RequestPriority.BACKGROUND
+    return RequestPriority.NORMAL
 
 
 class TwitchAPI:
@@ -29,16 +105,17 @@ class TwitchAPI:
     Provides methods to interact with Twitch API for user validation, user ID resolution, and raw requests.
 
     Attributes:
-        BASE_URL (str): The base URL for Twitch Helix API.
+        base_url (str): The base URL for Twitch Helix API.
     """
 
-    BASE_URL = "https://api.twitch.tv/helix"
-
-    def __init__(self, session: aiohttp.ClientSession):
+    def __init__(
+        self, session: aiohttp.ClientSession, base_url: str | None = None
+    ):
         """Initialize the TwitchAPI client.
 
         Args:
             session (aiohttp.ClientSession): The aiohttp session to use for requests.
+            base_url (str | None): Helix base URL; None follows ``get_endpoints()``.
 
         Raises:
             ValueError: If session is not provided.
@@ -46,15 +123,48 @@ class TwitchAPI:
         if not session:
             raise ValueError("aiohttp session required")
         self._session = session
+        self._base_url = base_url.rstrip("/") if base_url else None
 
-        # Circuit breaker for API requests
-        cb_config = CircuitBreakerConfig(
-            name="twitch_api",
+        # Shared pacing of Helix requests per (client_id, token) bucket
+        self._rate_limiter = get_rate_limiter()
+
+        # Circuit breakers for API requests, keyed per user and endpoint
+        self._breaker_config = CircuitBreakerConfig(
+            name=f"{HELIX_BREAKER_NAMESPACE}:global",
             failure_threshold=5,
             recovery_timeout=60.0,
             success_threshold=3,
         )
-        self.circuit_breaker = get_circuit_breaker("twitch_api", cb_config)
+
+    @property
+    def base_url(self) -> str:
+        """Helix base URL requests are sent to."""
+        return self._base_url or get_endpoints().helix_url
+
+    def circuit_breaker_for(
+        self, endpoint: str, *, user_id: str | None = None, access_token: str = ""
+    ) -> KeyedCircuitBreaker:
+        """Return the breaker hierarchy ``helix:<user>:<endpoint>``.
+
+        Requests without a known user ID are keyed by a fingerprint of their
+        access token so they still stay isolated from other bots.
+
+        Args:
+            endpoint (str): API endpoint path.
+            user_id (str | None): Twitch user ID the request acts for.
+            access_token (str): OAuth token, used when user_id is unknown.
+
+        Returns:
+            KeyedCircuitBreaker: Breakers for the endpoint, user and global levels.
+        """
+        if user_id:
+            owner = user_id
+        else:
+            owner = "token-" + hashlib.sha256(access_token.encode()).hexdigest()[:12]
+        family = endpoint.split("?", 1)[0].strip("/")
+        return get_keyed_circuit_breaker(
+            f"{HELIX_BREAKER_NAMESPACE}:{owner}:{family}", self._breaker_config
+        )
 
     async def request(
         self,
@@ -63,10 +173,12 @@ class TwitchAPI:
         *,
         access_token: str,
         client_id: str,
-        params: dict[str, Any] | None = None,
+        params: dict[str, Any] | list[tuple[str, str]] | None = None,
         json_body: dict[str, Any] | None = None,
         allow_on_open: bool = False,
         suppress_warnings: bool = False,
+        user_id: str | None = None,
+        priority: RequestPriority | None = None,
     ) -> tuple[dict[str, Any], int, dict[str, str]]:
         """Perform a raw HTTP request to the Twitch Helix API.
 
@@ -75,9 +187,15 @@ class TwitchAPI:
             endpoint (str): API endpoint path (without base URL).
             access_token (str): OAuth access token for authorization.
             client_id (str): Twitch application client ID.
-            params (dict[str, Any] | None): Query parameters for the request.
+            params (dict[str, Any] | list[tuple[str, str]] | None): Query
+                parameters for the request; a list allows repeated keys.
             json_body (dict[str, Any] | None): JSON body for the request.
             allow_on_open (bool): If True, allow request even when circuit breaker is open.
+            user_id (str | None): User the request acts for; selects its circuit
+                breakers. Defaults to ``params["user_id"]`` or the subscription
+                condition's ``user_id``.
+            priority (RequestPriority | None): Admission priority in the rate
+                limit queue; inferred from the method and endpoint when None.
 
         Returns:
             tuple[dict[str, Any], int, dict[str, str]]: A tuple containing the JSON response data, HTTP status code, and response headers.
@@ -88,6 +206,11 @@ class TwitchAPI:
             ValueError: If response parsing fails.
             CircuitBreakerOpenException: If circuit breaker is open and allow_on_open is False.
         """
+        bucket_key = self._rate_limiter.bucket_key(client_id, access_token)
+        request_priority = (
+            priority if priority is not None else _infer_priority(method, endpoint)
+        )
+
         async def _perform_request() -> tuple[dict[str, Any], int, dict[str, str]]:
             """Internal request logic wrapped by circuit breaker."""
             headers = {
@@ -95,17 +218,21 @@ class TwitchAPI:
                 "Client-Id": client_id,
                 "Content-Type": "application/json",
             }
-            url = f"{self.BASE_URL}/{endpoint}"
-            async with self._session.request(
+            url = f"{self.base_url}/{endpoint}"
+            async with self._rate_limiter.slot(
+                bucket_key, request_priority
+            ) as slot, self._session.request(
                 method, url, headers=headers, params=params, json=json_body
             ) as resp:
+                slot["headers"] = resp.headers
+                slot["status"] = resp.status
                 logging.debug(
                     f"Twitch API response: status={resp.status}, content-type={resp.headers.get('content-type', 'none')}, "
                     f"content-length={resp.headers.get('content-length', 'unknown')}, url={url}"
                 )
 
                 async def operation():
-                    return await resp.json()
+                    return await resp.json(loads=json_codec.loads)
 
                 try:
                     if resp.status == 204:
@@ -126,14 +253,33 @@ class TwitchAPI:
                     data = {}
                 return data, resp.status, dict(resp.headers)
 
+        breaker = self.circuit_breaker_for(
+            endpoint,
+            user_id=user_id or _request_user_id(params, json_body),
+            access_token=access_token,
+        )
         try:
-            return await self.circuit_breaker.call(_perform_request, allow_on_open=allow_on_open, suppress_warnings=suppress_warnings)
+            return await breaker.call(
+                _perform_request,
+                classify=classify_helix_status,
+                allow_on_open=allow_on_open,
+                suppress_warnings=suppress_warnings,
+            )
         except CircuitBreakerOpenException:
             if not suppress_warnings:
                 logging.error(f"🚨 Twitch API request blocked by circuit breaker: {method} {endpoint}")
             # Return a failed response tuple when circuit breaker is open
             return {}, 503, {"X-Circuit-Breaker": "OPEN"}
 
+    def rate_limit_state(self) -> dict[str, dict[str, Any]]:
+        """Return every Helix rate limit bucket's state for monitoring.
+
+        Returns:
+            dict[str, dict[str, Any]]: Bucket snapshots keyed by
+            ``client_id:token-hash``.
+        """
+        return self._rate_limiter.snapshot()
+
     # ---- High level helpers ----
     async def validate_token(self, access_token: str) -> dict[str, Any] | None:
         """Validate an OAuth access token using Twitch's validation endpoint.
@@ -150,16 +296,35 @@ class TwitchAPI:
             ValueError: If response parsing fails.
         """
 
-        async def operation():
-            url = "https://id.twitch.tv/oauth2/validate"
+        # Validation is metered apart from Helix, so it gets its own bucket
+        bucket_key = self._rate_limiter.bucket_key("oauth2", access_token)
+
+        async def _perform_validation() -> tuple[dict[str, Any] | None, int, dict[str, str]]:
+            url = get_endpoints().validate_url
             headers = {"Authorization": f"OAuth {access_token}"}
-            async with self._session.get(url, headers=headers) as resp:
+            async with self._rate_limiter.slot(
+                bucket_key, RequestPriority.NORMAL
+            ) as slot, self._session.get(url, headers=headers) as resp:
+                slot["headers"] = resp.headers
+                slot["status"] = resp.status
                 if resp.status == 200:
-                    return await resp.json()
-                return None
+                    data = await resp.json(loads=json_codec.loads)
+                    return data, resp.status, dict(resp.headers)
+                return None, resp.status, dict(resp.headers)
+
+        breaker = self.circuit_breaker_for(VALIDATE_ENDPOINT, access_token=access_token)
+
+        async def operation():
+            data, _, _ = await breaker.call(
+                _perform_validation, classify=classify_validation_status
+            )
+            return data
 
         try:
             return await handle_api_error(operation, "Twitch token validation")
+        except CircuitBreakerOpenException:
+            logging.error("🚨 Twitch token validation blocked by circuit breaker")
+            return None
         except (
             aiohttp.ClientError,
             TimeoutError,
@@ -201,26 +366,27 @@ class TwitchAPI:
         if not logins:
             return {}
         deduped = self._dedupe_logins(logins)
-        headers = self._auth_headers(access_token, client_id)
         out: dict[str, str] = {}
-        url = f"{self.BASE_URL}/users"
         # Semaphore for rate limiting to 5 concurrent requests
         semaphore = asyncio.Semaphore(5)
 
         async def fetch_chunk(part):
             async with semaphore:
-                params_list = [("login", c) for c in part]
-                async with self._session.get(
-                    url, headers=headers, params=params_list
-                ) as resp:
-                    logging.debug(
-                        f"🔍 Twitch API get_users status={resp.status} logins={part}"
-                    )
-                    rows = await self._safe_rows(resp)
-                    logging.debug(
-                        f"📋 Twitch API get_users rows={len(rows)} for logins={part}"
-                    )
-                    return rows
+                data, status, _ = await self.request(
+                    "GET",
+                    "users",
+                    access_token=access_token,
+                    client_id=client_id,
+                    params=[("login", c) for c in part],
+                )
+                logging.debug(
+                    f"🔍 Twitch API get_users status={status} logins={part}"
+                )
+                rows = self._rows(data, status)
+                logging.debug(
+                    f"📋 Twitch API get_users rows={len(rows)} for logins={part}"
+                )
+                return rows
 
         # Collect chunks
         parts = list(self._chunk(deduped, 100))
@@ -277,49 +443,18 @@ class TwitchAPI:
             yield seq[i : i + size]
 
     @staticmethod
-    def _auth_headers(access_token: str, client_id: str) -> dict[str, str]:
-        """Generate authorization headers for Twitch API requests.
+    def _rows(data: dict[str, Any], status: int) -> list[dict[str, Any]]:
+        """Extract the data rows of a Helix list response.
 
         Args:
-            access_token (str): OAuth access token.
-            client_id (str): Twitch application client ID.
-
-        Returns:
-            dict[str, str]: Dictionary of HTTP headers.
-        """
-        return {
-            "Authorization": f"Bearer {access_token}",
-            "Client-Id": client_id,
-            "Content-Type": "application/json",
-        }
-
-    async def _safe_rows(self, resp: aiohttp.ClientResponse) -> list[dict[str, Any]]:
-        """Safely extract data rows from an aiohttp response.
-
-        Args:
-            resp (aiohttp.ClientResponse): The response object.
+            data (dict[str, Any]): Decoded response body.
+            status (int): HTTP status code of the response.
 
         Returns:
             list[dict[str, Any]]: List of data dictionaries, or empty list on error.
         """
-
-        async def operation():
-            return await resp.json()
-
-        try:
-            data = await handle_api_error(operation, "Twitch API response parsing")
-        except (
-            aiohttp.ClientError,
-            TimeoutError,
-            ConnectionError,
-            ValueError,
-            RuntimeError,
-            InternalError,
-        ) as e:
-            logging.debug(f"Failed to parse Twitch API response JSON: {e}")
-            return []
-        if resp.status != 200:
-            logging.debug(f"Twitch API response status {resp.status} != 200, returning empty rows")
+        if status != 200:
+            logging.debug(f"Twitch API response status {status} != 200, returning empty rows")
             return []
         if not isinstance(data, dict):
             logging.debug(f"Twitch API response data is not a dict: {type(data)}, returning empty rows")
@@ -8,8 +8,10 @@ import logging
 
 import aiohttp
 
+from .api.transport import close_http_session, get_http_session, prewarm_connections
 from .auth_token.manager import TokenManager
 from .config.async_persistence import cancel_pending_flush
+from .utils.latency import get_latency_recorder
 from .utils.resource_monitor import get_resource_monitor, log_resource_usage
 
 # Global reference for emergency cleanup if normal shutdown is interrupted
@@ -35,11 +37,16 @@ class ApplicationContext:
 
     # ------------------------- Construction ------------------------- #
     @classmethod
-    async def create(cls) -> ApplicationContext:
+    async def create(cls, expected_users: int = 1) -> ApplicationContext:
         """Create and initialize a new ApplicationContext instance.
 
         This factory method sets up the HTTP session and token manager,
-        and registers the context globally for emergency cleanup.
+        and registers the context globally for emergency cleanup. The
+        session is the process-wide shared transport, sized for
+        ``expected_users`` if it does not exist yet.
+
+        Args:
+            expected_users: Number of bots that will share the session.
 
         Returns:
             A fully initialized ApplicationContext instance.
@@ -50,8 +57,8 @@ class ApplicationContext:
         """
         ctx = cls()
         logging.debug("🧪 Creating application context")
-        ctx.session = aiohttp.ClientSession()
-        logging.debug("🔗 HTTP session created")
+        ctx.session = get_http_session(expected_users)
+        logging.debug("🔗 HTTP session ready")
         ctx.token_manager = TokenManager(ctx.session)
         # Register globally for atexit fallback
         global GLOBAL_CONTEXT  # noqa: PLW0603
@@ -73,6 +80,11 @@ class ApplicationContext:
                 return
             if self.token_manager:
                 await self.token_manager.start()
+            if self.session:
+                try:
+                    await prewarm_connections(self.session)
+                except Exception as e:
+                    logging.debug(f"HTTP pre-warm error: {str(e)}")
             self._started = True
             logging.debug("🚀 Application context started")
 
@@ -84,6 +96,11 @@ class ApplicationContext:
             except Exception as e:
                 logging.warning(f"Failed to start resource monitoring: {e}")
 
+            try:
+                await get_latency_recorder().start_reporting()
+            except Exception as e:
+                logging.warning(f"Failed to start latency reporting: {e}")
+
     async def shutdown(self) -> None:
         """Shutdown the application context and clean up resources.
 
@@ -95,6 +112,7 @@ class ApplicationContext:
             logging.info("🔻 Application context shutdown initiated")
             await self._stop_token_manager()
             await cancel_pending_flush()
+            await self._close_session_pools()
             await self._close_http_session()
 
             # Stop resource monitoring
@@ -106,6 +124,13 @@ class ApplicationContext:
             except Exception as e:
                 logging.warning(f"Failed to stop resource monitoring: {e}")
 
+            try:
+                latency_recorder = get_latency_recorder()
+                await latency_recorder.stop_reporting()
+                latency_recorder.log_summary()
+            except Exception as e:
+                logging.warning(f"Failed to stop latency reporting: {e}")
+
             self._started = False
             logging.info("✅ Application context shutdown complete")
             # After clean shutdown remove global reference so atexit won't re-run
@@ -128,6 +153,14 @@ class ApplicationContext:
         finally:
             self.token_manager = None
 
+    async def _close_session_pools(self) -> None:
+        """Close shared EventSub sessions left open by pooled bots."""
+        from .chat.eventsub_session_pool import close_session_pools
+
+        try:
+            await close_session_pools()
+        except (RuntimeError, OSError, ValueError) as e:
+            logging.error(f"💥 Error closing shared EventSub sessions: {str(e)}")
 
     async def _close_http_session(self) -> None:
         """Close the HTTP session gracefully.
@@ -139,6 +172,7 @@ class ApplicationContext:
             return
         try:
             await self.session.close()
+            await close_http_session()
         except (aiohttp.ClientError, OSError, ValueError) as e:
             logging.error(f"💥 Error closing HTTP session: {str(e)}")
         finally:
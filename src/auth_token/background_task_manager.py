@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
 from ..constants import (
     TOKEN_MANAGER_BACKGROUND_BASE_SLEEP,
+    TOKEN_MANAGER_MAX_CONCURRENCY,
     TOKEN_MANAGER_PERIODIC_VALIDATION_INTERVAL,
+    TOKEN_MANAGER_REFRESH_JITTER_SECONDS,
     TOKEN_REFRESH_THRESHOLD_SECONDS,
 )
 from ..utils import format_duration
@@ -22,6 +27,40 @@ if TYPE_CHECKING:
     from .manager import TokenInfo, TokenManager
 
 
+async def gather_per_user(
+    users: list[tuple[str, TokenInfo]],
+    worker: Callable[[str, TokenInfo], Awaitable[None]],
+    limit: int = TOKEN_MANAGER_MAX_CONCURRENCY,
+) -> dict[str, Exception]:
+    """Run a worker for every user concurrently with bounded parallelism.
+
+    Args:
+        users: (username, TokenInfo) pairs to process.
+        worker: Coroutine function invoked once per user.
+        limit: Maximum number of workers in flight.
+
+    Returns:
+        Mapping of username to the exception its worker raised.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(username: str, info: TokenInfo) -> None:
+        async with semaphore:
+            await worker(username, info)
+
+    results = await asyncio.gather(
+        *(_run(username, info) for username, info in users),
+        return_exceptions=True,
+    )
+    failures: dict[str, Exception] = {}
+    for (username, _), result in zip(users, results, strict=True):
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, Exception):
+            failures[username] = result
+    return failures
+
+
 class TaskHealthStatus:
     """Health status information for background tasks."""
 
@@ -43,6 +82,14 @@ class BackgroundTaskManager:
         self.running = False
         self.health = TaskHealthStatus()
         self._health_lock = asyncio.Lock()
+        # Deadline scheduler state: (deadline, seq, username) min-heap with
+        # the current deadline per user for lazy invalidation of old entries.
+        self._heap: list[tuple[float, int, str]] = []
+        self._deadlines: dict[str, float] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._workers = asyncio.Semaphore(TOKEN_MANAGER_MAX_CONCURRENCY)
+        self._inflight: dict[str, asyncio.Task[None]] = {}
 
     async def start(self) -> None:
         """Start the background refresh loop."""
@@ -80,6 +127,13 @@ class BackgroundTaskManager:
                 logging.debug(f"Expected error during background task cancellation: {e}")
             finally:
                 self.task = None
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self._inflight:
+            await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+        self._inflight.clear()
+        self._heap.clear()
+        self._deadlines.clear()
 
     def get_health_status(self) -> TaskHealthStatus:
         """Get current health status of background tasks."""
@@ -115,103 +169,180 @@ class BackgroundTaskManager:
                 )
 
     async def _background_refresh_loop(self) -> None:
-        """Background loop for periodic token validation and refresh.
+        """Deadline-driven loop for token validation and refresh.
 
-        Runs continuously while the manager is running, checking all tokens
-        and refreshing as needed. Includes drift correction to maintain
-        reliable timing for unattended operation.
+        Each user has a single deadline in a min-heap: the earlier of its
+        (jittered) proactive refresh point and its next periodic validation.
+        The loop sleeps until the earliest deadline, capped at
+        TOKEN_MANAGER_BACKGROUND_BASE_SLEEP so suspends and clock jumps are
+        noticed, or until reschedule() signals a change. Due users are handed
+        to a bounded worker pool, so wake-ups and remote calls scale with
+        refresh events rather than users x ticks.
 
         Raises:
             RuntimeError: If background processing fails.
             OSError: If system-level errors occur.
             ValueError: If invalid data is encountered.
-            aiohttp.ClientError: If network requests fail.
         """
         base = TOKEN_MANAGER_BACKGROUND_BASE_SLEEP
-        last_loop = time.time()
-        consecutive_drift = 0
-        drift_correction_applied = False
+        for username in list(self.manager.tokens):
+            self._schedule(username)
 
         while self.running:
             try:
                 now = time.time()
-                drift = now - last_loop
-                drifted = drift > (base * 3)
-
-                # Enhanced drift detection and correction
-                if drifted:
-                    consecutive_drift += 1
-                    logging.warning(
-                        f"⏱️ Token manager loop drift detected drift={int(drift)}s base={base}s consecutive={consecutive_drift}"
-                    )
-
-                    # Apply drift correction after multiple consecutive drifts
-                    if consecutive_drift >= 3 and not drift_correction_applied:
-                        # Reduce sleep time to compensate for drift
-                        corrected_sleep = max(base * 0.3, base - (drift * 0.5))
-                        logging.info(
-                            f"🔧 Applied drift correction: sleep={corrected_sleep:.1f}s (was {base}s) drift={int(drift)}s"
-                        )
-                        drift_correction_applied = True
-                        sleep_duration = corrected_sleep
-                    else:
-                        sleep_duration = base
-                else:
-                    # Reset drift tracking on successful timing
-                    consecutive_drift = 0
-                    drift_correction_applied = False
-                    sleep_duration = base
-
-                async with self.manager._tokens_lock:
-                    users = list(self.manager.tokens.items())
-                    users = [(u, info) for u, info in users if u not in self.manager._paused_users]
-
-                # Enhanced proactive refresh with drift compensation
-                loop_success = True
-                for username, info in users:
-                    try:
-                        await self._process_single_background(
-                            username, info, force_proactive=drifted, drift_compensation=drift
-                        )
-                    except Exception as e:
-                        logging.error(
-                            f"💥 Error processing background refresh for user={username}: {str(e)} type={type(e).__name__}"
-                        )
-                        # Continue with other users even if one fails, but mark loop as failed
-                        loop_success = False
-                        continue
-
-                # Record success or failure for this loop iteration
-                if loop_success:
-                    await self._record_success()
-                else:
-                    await self._record_failure(Exception("One or more user background refreshes failed"))
-
-                last_loop = now
-                # Apply jitter to corrected sleep duration
-                jittered_sleep = sleep_duration * _jitter_rng.uniform(0.5, 1.5)
-
-                # Use cancellable sleep to allow immediate shutdown
+                for username, lateness in self._pop_due(now):
+                    self._dispatch(username, lateness)
+                delay = self._seconds_until_next(now)
+                self._wakeup.clear()
                 try:
-                    await asyncio.wait_for(asyncio.sleep(jittered_sleep), timeout=None)
-                except asyncio.CancelledError:
-                    # Re-raise to allow proper cancellation
-                    raise
-
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except TimeoutError:
+                    pass
             except asyncio.CancelledError:
                 # Handle cancellation gracefully
                 logging.debug("Background token refresh loop cancelled")
                 raise
-            except (RuntimeError, OSError, ValueError, aiohttp.ClientError) as e:
+            except (RuntimeError, OSError, ValueError) as e:
                 logging.error(f"💥 Background token manager loop error: {str(e)}")
                 await self._record_failure(e)
-                # Reset drift correction on error
-                consecutive_drift = 0
-                drift_correction_applied = False
-                try:
-                    await asyncio.wait_for(asyncio.sleep(base * 2), timeout=None)
-                except asyncio.CancelledError:
-                    raise
+                await asyncio.sleep(base * 2)
+
+    def reschedule(self, username: str, min_delay: float = 0.0) -> None:
+        """Recompute a user's refresh deadline and wake the scheduler.
+
+        Call after a token is added, refreshed or resumed so the new expiry
+        takes effect without waiting for the current sleep to end.
+
+        Args:
+            username: Username whose deadline changed.
+            min_delay: Minimum seconds from now before the user is due.
+        """
+        if not self.running:
+            return
+        self._schedule(username, min_delay)
+        self._wakeup.set()
+
+    def _schedule(self, username: str, min_delay: float = 0.0) -> None:
+        """Push a user's next deadline onto the heap.
+
+        Older heap entries for the user become stale and are skipped when
+        popped.
+
+        Args:
+            username: Username to schedule.
+            min_delay: Minimum seconds from now before the user is due.
+        """
+        info = self.manager.tokens.get(username)
+        if info is None:
+            self._deadlines.pop(username, None)
+            return
+        deadline = max(self._next_deadline(info), time.time() + min_delay)
+        self._deadlines[username] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._seq), username))
+
+    def _next_deadline(self, info: TokenInfo) -> float:
+        """Compute when a token next needs background work.
+
+        Args:
+            info: TokenInfo to schedule.
+
+        Returns:
+            Wall-clock timestamp of the next refresh or validation.
+        """
+        now = time.time()
+        if info.expiry is None:
+            # Unknown expiry keeps the legacy polling cadence
+            return now + TOKEN_MANAGER_BACKGROUND_BASE_SLEEP * _jitter_rng.uniform(0.5, 1.5)
+        # Jitter only delays the refresh within the threshold window, so the
+        # token is inside the refresh trigger when its deadline fires.
+        jitter = _jitter_rng.uniform(
+            0, min(TOKEN_MANAGER_REFRESH_JITTER_SECONDS, TOKEN_REFRESH_THRESHOLD_SECONDS / 2)
+        )
+        refresh_at = info.expiry.timestamp() - TOKEN_REFRESH_THRESHOLD_SECONDS + jitter
+        validate_at = info.last_validation + TOKEN_MANAGER_PERIODIC_VALIDATION_INTERVAL
+        return min(refresh_at, validate_at)
+
+    def _pop_due(self, now: float) -> list[tuple[str, float]]:
+        """Pop every user whose deadline has passed.
+
+        Args:
+            now: Current wall-clock time.
+
+        Returns:
+            (username, seconds past deadline) for each due user.
+        """
+        due: list[tuple[str, float]] = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, _, username = heapq.heappop(self._heap)
+            if self._deadlines.get(username) != deadline:
+                continue  # superseded by a later reschedule
+            del self._deadlines[username]
+            due.append((username, now - deadline))
+        return due
+
+    def _seconds_until_next(self, now: float) -> float:
+        """Seconds to sleep before the next deadline, capped at the base sleep."""
+        cap = float(TOKEN_MANAGER_BACKGROUND_BASE_SLEEP)
+        if not self._heap:
+            return cap
+        return max(0.0, min(self._heap[0][0] - now, cap))
+
+    def _dispatch(self, username: str, lateness: float) -> None:
+        """Start background work for a due user on the worker pool.
+
+        Args:
+            username: Due username.
+            lateness: Seconds the deadline was overrun by.
+        """
+        if username in self._inflight or username in self.manager._paused_users:
+            # In-flight work reschedules on completion; resume reschedules paused users
+            return
+        info = self.manager.tokens.get(username)
+        if info is None:
+            return
+        self._inflight[username] = asyncio.create_task(
+            self._run_due(username, info, lateness)
+        )
+
+    async def _run_due(self, username: str, info: TokenInfo, lateness: float) -> None:
+        """Process one due user under the worker limit and reschedule it.
+
+        A deadline overrun of more than three base sleeps (event loop stall
+        or system suspend) is treated as drift and triggers the proactive
+        refresh path.
+
+        Args:
+            username: Username to process.
+            info: TokenInfo for the user.
+            lateness: Seconds the deadline was overrun by.
+        """
+        drifted = lateness > TOKEN_MANAGER_BACKGROUND_BASE_SLEEP * 3
+        if drifted:
+            logging.warning(
+                f"⏱️ Token refresh deadline overrun user={username} late={int(lateness)}s"
+            )
+        try:
+            async with self._workers:
+                await self._process_single_background(
+                    username,
+                    info,
+                    force_proactive=drifted,
+                    drift_compensation=lateness if drifted else 0.0,
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(
+                f"💥 Error processing background refresh for user={username}: {str(e)} type={type(e).__name__}"
+            )
+            await self._record_failure(e)
+        else:
+            await self._record_success()
+        finally:
+            self._inflight.pop(username, None)
+            # Back off one base interval so a failing user cannot spin
+            self.reschedule(username, min_delay=TOKEN_MANAGER_BACKGROUND_BASE_SLEEP)
 
     async def _process_single_background(
         self, username: str, info: TokenInfo, *, force_proactive: bool = False, drift_compensation: float = 0.0
@@ -9,12 +9,13 @@ from enum import Enum
 
 import aiohttp
 
+from ..api.endpoints import get_endpoints
 from ..constants import (
     TOKEN_REFRESH_SAFETY_BUFFER_SECONDS,
     TOKEN_REFRESH_THRESHOLD_SECONDS,
 )
 from ..errors.internal import NetworkError, OAuthError, ParsingError, RateLimitError
-from ..utils import format_duration
+from ..utils import format_duration, json_codec
 
 
 class TokenOutcome(str, Enum):
@@ -192,11 +193,11 @@ class TokenClient:
                 "client_id": self.client_id,
                 "client_secret": self.client_secret,
             }
-            url = "https://id.twitch.tv/oauth2/token"
+            url = get_endpoints().token_url
             timeout = aiohttp.ClientTimeout(total=30)
             async with self.session.post(url, data=data, timeout=timeout) as resp:
                 if resp.status == 200:
-                    js = await resp.json()
+                    js = await resp.json(loads=json_codec.loads)
                     new_access = js.get("access_token")
                     new_refresh = js.get("refresh_token", refresh_token)
                     expires_in = js.get("expires_in")
@@ -272,12 +273,12 @@ class TokenClient:
             Tuple of (is_valid, expiry_datetime).
         """
         try:
-            url = "https://id.twitch.tv/oauth2/validate"
+            url = get_endpoints().validate_url
             timeout = aiohttp.ClientTimeout(total=30)
             headers = {"Authorization": f"OAuth {access_token}"}
             async with self.session.get(url, headers=headers, timeout=timeout) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await resp.json(loads=json_codec.loads)
                     # Check required scopes for helix endpoints
                     required_scopes = {
                         "chat:read",
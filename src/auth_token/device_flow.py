@@ -3,38 +3,54 @@
 import asyncio
 import logging
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, cast
 
 import aiohttp
 
+from ..api.endpoints import get_endpoints
 from ..constants import (
     DEVICE_FLOW_POLL_ADJUSTMENT,
     DEVICE_FLOW_POLL_INTERVAL_SECONDS,
 )
-from ..utils import format_duration
+from ..utils import format_duration, json_codec
 
 
 class DeviceCodeFlow:
     """Handles OAuth Device Authorization Grant flow for automatic token generation"""
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        session: aiohttp.ClientSession | None = None,
+    ):
         """Initialize the device code flow handler.
 
         Args:
             client_id: Twitch application client ID.
             client_secret: Twitch application client secret.
+            session: Shared HTTP session; a short-lived one is used if omitted.
         """
         self.client_id = client_id
         self.client_secret = client_secret
-        # Public OAuth endpoint constants (well-known; not secrets or passwords)
-        # These are standard Twitch OAuth endpoints, not credentials or secrets.
-        self.device_code_url = "https://id.twitch.tv/oauth2/device"
-        # Standard public Twitch OAuth token endpoint (well-known; not a secret).
-        # Security linters (Bandit/Ruff S105) flag this as a potential hardcoded password/secret,
-        # but it's a fixed public endpoint URL, not credentials.
-        self.token_url = "https://id.twitch.tv/oauth2/token"  # nosec B105  # noqa: S105
+        self.session = session
+        # Public OAuth endpoints (overridable through get_endpoints())
+        endpoints = get_endpoints()
+        self.device_code_url = endpoints.device_url
+        self.token_url = endpoints.token_url
         self.poll_interval = DEVICE_FLOW_POLL_INTERVAL_SECONDS  # seconds
 
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the shared session, or a temporary one closed afterwards."""
+        if self.session is not None:
+            yield self.session
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+
     async def request_device_code(self, user: str) -> dict[str, Any] | None:
         """Request a device code from Twitch for OAuth flow.
 
@@ -50,16 +66,20 @@ class DeviceCodeFlow:
             "scopes": "chat:read user:read:chat user:manage:chat_color",
         }
 
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             try:
                 async with session.post(self.device_code_url, data=data) as response:
                     if response.status == 200:
-                        result = cast(dict[str, Any], await response.json())
+                        result = cast(
+                            dict[str, Any], await response.json(loads=json_codec.loads)
+                        )
                         logging.info(
                             f"🔑 Device code retrieved successfully user={user} client_id={self.client_id} interval={self.poll_interval}"
                         )
                         return result
-                    error_data = cast(dict[str, Any], await response.json())
+                    error_data = cast(
+                        dict[str, Any], await response.json(loads=json_codec.loads)
+                    )
                     logging.error(
                         f"💥 Failed to obtain device code user={user} (status={response.status}) client_id={self.client_id} error_data={str(error_data)}"
                     )
@@ -97,14 +117,16 @@ class DeviceCodeFlow:
         poll_count = 0
         last_log_elapsed = 0
 
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             while time.time() - start_time < expires_in:
                 poll_count += 1
                 elapsed = int(time.time() - start_time)
 
                 try:
                     async with session.post(self.token_url, data=data) as response:
-                        result = cast(dict[str, Any], await response.json())
+                        result = cast(
+                            dict[str, Any], await response.json(loads=json_codec.loads)
+                        )
 
                         if response.status == 200:
                             logging.info(
@@ -14,7 +14,7 @@ import aiohttp
 from ..constants import (
     TOKEN_REFRESH_THRESHOLD_SECONDS,
 )
-from .background_task_manager import BackgroundTaskManager
+from .background_task_manager import BackgroundTaskManager, gather_per_user
 from .client import TokenOutcome
 from .client_cache import ClientCache
 from .hook_manager import HookManager
@@ -136,12 +136,20 @@ class TokenManager:
         - If expiry unknown: record skipped (handled later by unknown-expiry logic).
         - Else validate remotely; if remaining < proactive threshold (1h) refresh.
         - If validation fails: force refresh.
+
+        Users are validated concurrently (bounded by
+        TOKEN_MANAGER_MAX_CONCURRENCY) so the pass takes about as long as the
+        slowest user rather than the sum of all users.
         """
         if not self.tokens:
             return
         async with self._tokens_lock:
-            for username, info in self.tokens.items():
-                await self._initial_validate_user(username, info)
+            users = list(self.tokens.items())
+        failures = await gather_per_user(users, self._initial_validate_user)
+        for username, error in failures.items():
+            logging.error(
+                f"💥 Startup validation crashed user={username} type={type(error).__name__} error={str(error)}"
+            )
 
     async def _initial_validate_user(self, username: str, info: TokenInfo) -> None:
         """Validate a user's token during initial startup validation.
@@ -235,6 +243,7 @@ class TokenManager:
         async with self._tokens_lock:
             self._paused_users.discard(username)
             logging.debug(f"▶️ Resumed background refresh for user={username}")
+        self.background_task_manager.reschedule(username)
 
     async def register_update_hook(
         self, username: str, hook: Callable[[], Coroutine[Any, Any, None]]
@@ -299,8 +308,13 @@ class TokenManager:
         client_id: str,
         client_secret: str,
         expiry: datetime | None,
+        last_validation: float | None = None,
     ) -> TokenInfo:
-        """Internal helper to insert/update token state (called by TwitchColorBot)."""
+        """Internal helper to insert/update token state (called by TwitchColorBot).
+
+        ``last_validation`` carries a validation made by a previous run (see
+        the warm-restart state snapshot) so the next one is scheduled from it.
+        """
         async with self._tokens_lock:
             info = self.tokens.get(username)
             if info is None:
@@ -328,16 +342,19 @@ class TokenManager:
                     remaining = int((expiry - datetime.now(UTC)).total_seconds())
                     if remaining > 0:
                         info.original_lifetime = remaining
-            return info
+            if last_validation is not None:
+                info.last_validation = max(info.last_validation, last_validation)
+        self.background_task_manager.reschedule(username)
+        return info
 
     async def remove(self, username: str) -> bool:
         """Remove a user from token tracking (e.g., config removal)."""
         async with self._tokens_lock:
-            if username in self.tokens:
-                del self.tokens[username]
-                logging.debug(f"🗑️ Removed token entry user={username}")
-                return True
-        return False
+            removed = self.tokens.pop(username, None) is not None
+        if removed:
+            self.background_task_manager.reschedule(username)
+            logging.debug(f"🗑️ Removed token entry user={username}")
+        return removed
 
     async def prune(self, active_usernames: set[str]) -> int:
         """Prune tokens not in active set; return count removed."""
@@ -354,10 +371,11 @@ class TokenManager:
     async def get_info(self, username: str) -> TokenInfo | None:
         async with self._tokens_lock:
             info = self.tokens.get(username)
-            if info:
-                async with info.refresh_lock:
-                    return info
-            return None
+        if info:
+            # Wait for an in-flight refresh of this user only
+            async with info.refresh_lock:
+                return info
+        return None
 
 
     async def ensure_fresh(
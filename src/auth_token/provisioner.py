@@ -69,7 +69,7 @@ class TokenProvisioner:
         Returns:
             Tuple of (access_token, refresh_token, expiry) on success, None otherwise.
         """
-        flow = DeviceCodeFlow(client_id, client_secret)
+        flow = DeviceCodeFlow(client_id, client_secret, self.session)
         try:
             device_data = await flow.request_device_code(username)
             if not device_data:
@@ -36,19 +36,21 @@ class TokenRefresher:
             ValueError: If token data is invalid.
             RuntimeError: If refresh process fails.
         """
+        # Only the lookup is guarded by the shared lock; the network round
+        # trip is serialised per user by info.refresh_lock.
         async with self.manager._tokens_lock:
             info = self.manager.tokens.get(username)
-            if not info:
-                return TokenOutcome.FAILED
+        if not info:
+            return TokenOutcome.FAILED
 
-            if self._should_skip_refresh(info, force_refresh):
-                return TokenOutcome.VALID
+        if self._should_skip_refresh(info, force_refresh):
+            return TokenOutcome.VALID
 
-            client = await self.manager.client_cache.get_client(info.client_id, info.client_secret)
-            result, _ = await self._refresh_with_lock(
-                client, info, username, force_refresh
-            )
-            return result.outcome
+        client = await self.manager.client_cache.get_client(info.client_id, info.client_secret)
+        result, _ = await self._refresh_with_lock(
+            client, info, username, force_refresh
+        )
+        return result.outcome
 
     def _should_skip_refresh(self, info: TokenInfo, force_refresh: bool) -> bool:
         """Determine if token refresh should be skipped.
@@ -111,6 +113,8 @@ class TokenRefresher:
                 # Propagate token immediately to minimize delays
                 if token_changed and info.access_token:
                     self.manager._propagate_token_immediately(username, info.access_token)
+                # New expiry moves the user's background refresh deadline
+                self.manager.background_task_manager.reschedule(username)
             elif result.outcome == TokenOutcome.FAILED:
                 if result.error_type == RefreshErrorType.NON_RECOVERABLE:
                     info.state = TokenState.EXPIRED
@@ -17,6 +17,7 @@ from ..color import ColorChangeService
 from ..color.models import ColorRequestResult, ColorRequestStatus
 from ..config.async_persistence import queue_user_update
 from ..errors.handling import handle_retryable_error
+from ..utils.latency import get_latency_recorder
 
 CHAT_COLOR_ENDPOINT = "chat/color"
 
@@ -382,6 +383,8 @@ class ColorChanger:
         """
         color = params.get("color")
         logging.debug(f"Performing color request action={action} user={self.username}")
+        latency = get_latency_recorder()
+        attempt_ends: list[float] = []
 
         async def operation(attempt):
             await self._cleanup_expired_cache_entries()
@@ -389,13 +392,15 @@ class ColorChanger:
                 return ColorRequestResult(
                     ColorRequestStatus.UNAUTHORIZED, error="No access token"
                 ), False
-            data, status_code, _ = await self.api.request(
-                "PUT",
-                CHAT_COLOR_ENDPOINT,
-                access_token=self.access_token,
-                client_id=self.client_id,
-                params=params,
-            )
+            with latency.measure(self.username, "http"):
+                data, status_code, _ = await self.api.request(
+                    "PUT",
+                    CHAT_COLOR_ENDPOINT,
+                    access_token=self.access_token,
+                    client_id=self.client_id,
+                    params=params,
+                )
+            attempt_ends.append(time.perf_counter())
             self._last_color_change_payload = data if isinstance(data, dict) else None
 
             result = self._handle_color_response(status_code, attempt)
@@ -407,9 +412,15 @@ class ColorChanger:
                 ), True
 
         try:
-            result: ColorRequestResult = await handle_retryable_error(
-                operation, f"Color change {action}", max_attempts=6
-            )
+            try:
+                result: ColorRequestResult = await handle_retryable_error(
+                    operation, f"Color change {action}", max_attempts=6
+                )
+            finally:
+                if len(attempt_ends) > 1:
+                    latency.record(
+                        self.username, "retry", attempt_ends[-1] - attempt_ends[0]
+                    )
             # Update current color cache since we just set it
             if result.status == ColorRequestStatus.SUCCESS and color and self.user_id:
                 async with self._cache_lock:
@@ -0,0 +1,127 @@
+"""ColorChangeWorker for TwitchColorBot - runs color changes off the receive loop."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from ..utils.latency import FrameTiming, current_frame, get_latency_recorder
+
+
+@dataclass(slots=True)
+class _PendingChange:
+    """A queued color change.
+
+    Attributes:
+        color (str | None): Requested color, or None for a random one.
+        frame (FrameTiming | None): Latency frame of the triggering message.
+        merged (int): Requests this one superseded while waiting.
+    """
+
+    color: str | None
+    frame: FrameTiming | None
+    merged: int = 0
+
+
+class ColorChangeWorker:
+    """Single-slot, latest-wins color change queue with one worker task.
+
+    Chat handlers call :meth:`submit` and return immediately. At most one
+    change runs at a time; requests arriving meanwhile replace each other in
+    a single pending slot, so a burst of messages during a slow or retried
+    PUT collapses into one follow-up change.
+
+    Attributes:
+        submitted (int): Requests received via :meth:`submit`.
+        coalesced (int): Requests dropped because a newer one replaced them.
+        completed (int): Changes that ran to completion (successful or not).
+    """
+
+    def __init__(
+        self, username: str, change: Callable[[str | None], Awaitable[Any]]
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            username: Bot username, used for logging and latency stages.
+            change: Coroutine function performing one color change.
+        """
+        self.username = username
+        self._change = change
+        self._pending: _PendingChange | None = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._in_flight = False
+        self._closed = False
+        self.submitted = 0
+        self.coalesced = 0
+        self.completed = 0
+
+    @property
+    def busy(self) -> bool:
+        """Whether a change is running or waiting."""
+        return self._pending is not None or self._in_flight
+
+    def submit(self, color: str | None = None) -> None:
+        """Queue a color change, replacing any change still waiting.
+
+        Does nothing once the worker has been stopped.
+
+        Args:
+            color: Specific color to set, or None for a random one.
+        """
+        if self._closed:
+            return
+        self.submitted += 1
+        merged = 0
+        if self._pending is not None:
+            merged = self._pending.merged + 1
+            self.coalesced += 1
+        self._pending = _PendingChange(color, current_frame(), merged)
+        self._wakeup.set()
+        self._ensure_running()
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        latency = get_latency_recorder()
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            pending, self._pending = self._pending, None
+            if pending is None:
+                continue
+            if pending.merged:
+                logging.debug(
+                    f"🧮 Coalesced {pending.merged} color change request(s) user={self.username}"
+                )
+            self._in_flight = True
+            try:
+                with latency.resume(pending.frame):
+                    await self._change(pending.color)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"💥 Color change worker error user={self.username}: {str(e)}")
+            finally:
+                self._in_flight = False
+                self.completed += 1
+
+    async def stop(self) -> None:
+        """Cancel the worker, drop any pending change and refuse new ones."""
+        self._closed = True
+        self._pending = None
+        self._wakeup.clear()
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
@@ -17,6 +17,7 @@ from ..constants import (
     RECONNECT_MAX_ATTEMPTS,
 )
 from ..errors.internal import BotRestartException
+from .state_snapshot import trusted_scopes, warm_state_of
 
 if TYPE_CHECKING:
     from .core import TwitchColorBot
@@ -35,6 +36,7 @@ class ConnectionManager:
         self.chat_backend: EventSubChatBackend | None = None
         self.listener_task: asyncio.Task[None] | None = None
         self._normalized_channels_cache: list[str] | None = None
+        self._channels_joined = False
         self._total_reconnect_attempts = 0
 
     async def initialize_connection(self) -> bool:
@@ -44,6 +46,16 @@ class ConnectionManager:
         await self._prime_color_state()
         logging.debug(f"🔀 Using EventSub chat backend user={self.bot.username}")
         await self._log_scopes_if_possible()
+        return await self.open_connection()
+
+    async def open_connection(self) -> bool:
+        """Normalize channels, connect the backend and join the primary channel.
+
+        Requires the user ID to be known already.
+
+        Returns:
+            True if the backend connected, False otherwise.
+        """
         normalized_channels = await self._normalize_channels_if_needed()
 
         if not await self._init_and_connect_backend(normalized_channels):
@@ -52,6 +64,30 @@ class ConnectionManager:
         # Schedule first cleanup 3 minutes after startup instead of immediately
         asyncio.create_task(self._schedule_delayed_first_cleanup())
         self._normalized_channels_cache = normalized_channels
+        self._channels_joined = False
+        return True
+
+    async def subscribe_channels(self) -> bool:
+        """Start listening and join the channels beyond the primary one.
+
+        Idempotent per connection: once the channels are joined, later calls
+        (such as from ``run_chat_loop`` after a staged startup) do nothing.
+
+        Returns:
+            True if the backend is connected, False otherwise.
+        """
+        backend = self.chat_backend
+        if backend is None:
+            logging.error(f"⚠️ Chat backend not initialized user={self.bot.username}")
+            return False
+        if self._channels_joined:
+            return True
+        self._channels_joined = True
+        self._create_and_monitor_listener(backend)
+        normalized_channels: list[str] = getattr(
+            self, "_normalized_channels_cache", self.bot.channels
+        )
+        await self._join_additional_channels(backend, normalized_channels)
         return True
 
     async def _ensure_user_id(self) -> bool:
@@ -75,8 +111,16 @@ class ConnectionManager:
     async def _prime_color_state(self) -> None:
         """Initialize last_color with the user's current chat color.
 
-        Fetches the current color from Twitch API and sets it as the last known color.
+        Fetches the current color from Twitch API and sets it as the last known color,
+        unless the state snapshot recorded it.
         """
+        state = warm_state_of(self.bot)
+        if state is not None and state.last_color:
+            self.bot.last_color = state.last_color  # type: ignore
+            logging.debug(
+                f"🎨 Initialized with snapshot color {state.last_color} user={self.bot.username}"
+            )
+            return
         current_color = await self.bot._get_current_color()
         if current_color:
             self.bot.last_color = current_color  # type: ignore
@@ -87,9 +131,15 @@ class ConnectionManager:
     async def _log_scopes_if_possible(self) -> None:
         """Log the scopes of the current access token if possible.
 
-        Validates the token with Twitch API and logs the associated scopes.
-        Silently handles validation failures.
+        Validates the token with Twitch API and logs the associated scopes,
+        unless they were validated already. Silently handles validation failures.
         """
+        scopes = trusted_scopes(self.bot)
+        if scopes is not None:
+            logging.info(
+                f"🧪 Token scopes user={self.bot.username} scopes={';'.join(sorted(scopes)) or '<none>'} (cached)"
+            )
+            return
         if not self.bot.context.session:
             return
         from ..api.twitch import TwitchAPI
@@ -170,6 +220,7 @@ class ConnectionManager:
             return False
         self.chat_backend = EventSubChatBackend(
             http_session=self.bot.context.session,
+            expected_channels=len(normalized_channels),
         )
         backend = self.chat_backend
         # Route all messages through the message processor
@@ -188,6 +239,7 @@ class ConnectionManager:
             self.bot.user_id,
             self.bot.client_id,
             self.bot.client_secret,
+            scopes=trusted_scopes(self.bot),
         )
         if not connected:
             logging.error(f"❌ Failed to connect user={self.bot.username}")
@@ -204,15 +256,8 @@ class ConnectionManager:
 
     async def run_chat_loop(self) -> None:
         """Run primary EventSub chat backend listen task."""
-        backend = self.chat_backend
-        if backend is None:
-            logging.error(f"⚠️ Chat backend not initialized user={self.bot.username}")
+        if not await self.subscribe_channels():
             return
-        self._create_and_monitor_listener(backend)
-        normalized_channels: list[str] = getattr(
-            self, "_normalized_channels_cache", self.bot.channels
-        )
-        await self._join_additional_channels(backend, normalized_channels)
 
         try:
             task = self.listener_task
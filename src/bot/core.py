@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..auth_token.manager import TokenManager
+    from .state_snapshot import UserState, ValidatedToken
 
 import aiohttp
 
@@ -25,6 +26,7 @@ from ..constants import (
 )
 from ..errors.internal import BotRestartException
 from .color_changer import ColorChanger
+from .color_worker import ColorChangeWorker
 from .connection_manager import ConnectionManager
 from .message_processor import MessageProcessor
 from .token_handler import TokenHandler
@@ -51,6 +53,8 @@ class TwitchColorBot:  # pylint: disable=too-many-instance-attributes
         enabled: Whether automatic color changes are enabled.
         running: Runtime state flag.
         last_color: Last set color.
+        warm_state: State snapshot entry the bot was started from, if any.
+        validated_token: Scopes and time of the last validation of a token.
     """
 
     OAUTH_PREFIX = "oauth:"
@@ -129,6 +133,8 @@ class TwitchColorBot:  # pylint: disable=too-many-instance-attributes
         self._state_lock = asyncio.Lock()
         self.listener_task: asyncio.Task[None] | None = None
         self.last_color: str | None = None
+        self.warm_state: UserState | None = None
+        self.validated_token: ValidatedToken | None = None
 
         # Periodic cleanup task
         self._cleanup_task: asyncio.Task[None] | None = None
@@ -144,36 +150,34 @@ class TwitchColorBot:  # pylint: disable=too-many-instance-attributes
         self.color_changer: ColorChanger = ColorChanger(self, None)  # type: ignore
         color_service = ColorChangeService(self.color_changer)
         self.color_changer._color_service = color_service
+        self.color_worker: ColorChangeWorker = ColorChangeWorker(
+            self.username, self.color_changer._change_color
+        )
         self.token_handler: TokenHandler = TokenHandler(self)
 
-    async def start(self) -> None:
+    async def start(self, *, prepared: bool = False) -> None:
         """Start the bot's main execution loop.
 
         Initializes token management, establishes chat connection, and begins
         listening for messages. Handles setup failures gracefully by stopping
         early if critical components cannot be initialized. Restarts on BotRestartException.
 
+        Args:
+            prepared: The startup stages already ran (see ``StartupPipeline``);
+                go straight to the chat loop. Restarts run the full sequence.
+
         Raises:
             Exception: If token setup or connection initialization fails.
         """
         while True:
-            logging.info(f"▶️ Starting bot user={self.username}")
-            async with self._state_lock:
-                self.running = True
-
-            # Start periodic cleanup task
-            await self._start_periodic_cleanup()
+            if not prepared:
+                await self.begin_startup()
 
             try:
-                if not await self.token_handler.setup_token_manager():
-                    async with self._state_lock:
-                        self.running = False
-                    return
-                await self.token_handler.handle_initial_token_refresh()
-                if not await self.connection_manager.initialize_connection():
-                    async with self._state_lock:
-                        self.running = False
+                if not prepared and not await self._run_startup_sequence():
+                    await self.abort_startup()
                     return
+                prepared = False
                 await self.connection_manager.run_chat_loop()
                 # Normal exit
                 break
@@ -182,11 +186,35 @@ class TwitchColorBot:  # pylint: disable=too-many-instance-attributes
                 await self.stop()
                 # Continue the loop to restart
 
+    async def begin_startup(self) -> None:
+        """Mark the bot running and start its periodic cleanup task."""
+        logging.info(f"▶️ Starting bot user={self.username}")
+        async with self._state_lock:
+            self.running = True
+        await self._start_periodic_cleanup()
+
+    async def abort_startup(self) -> None:
+        """Mark the bot stopped after a startup step failed."""
+        async with self._state_lock:
+            self.running = False
+
+    async def _run_startup_sequence(self) -> bool:
+        """Run every startup step for this bot alone, in order.
+
+        Returns:
+            True if the bot is connected and ready for the chat loop.
+        """
+        if not await self.token_handler.setup_token_manager():
+            return False
+        await self.token_handler.handle_initial_token_refresh()
+        return await self.connection_manager.initialize_connection()
+
     async def stop(self) -> None:
         """Stop the bot and clean up resources.
 
-        Disconnects chat backend, waits for listener task to finish, flushes
-        pending config updates, and sets running flag to False.
+        Disconnects chat backend, waits for listener task to finish, cancels
+        the color change worker, flushes pending config updates, and sets
+        running flag to False.
         """
         logging.warning(f"🛑 Stopping bot user={self.username}")
         async with self._state_lock:
@@ -197,6 +225,8 @@ class TwitchColorBot:  # pylint: disable=too-many-instance-attributes
 
         await self.connection_manager.disconnect_chat_backend()
         await self.connection_manager.wait_for_listener_task()
+        # Only now: messages read while disconnecting may still submit changes.
+        await self.color_worker.stop()
         if self.config_file:
             try:
                 await flush_pending_updates(self.config_file)
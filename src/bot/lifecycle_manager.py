@@ -4,15 +4,25 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from secrets import SystemRandom
 from typing import Any
 
 import aiohttp
 
+from ..api.twitch import TwitchAPI
 from ..application_context import ApplicationContext
+from ..chat.subscription_reaper import set_cleanup_deadline
 from ..config.model import UserConfig
-from ..constants import BOT_STARTUP_DELAY_SECONDS
+from ..constants import (
+    BOT_STARTUP_DELAY_SECONDS,
+    SHUTDOWN_CLEANUP_DEADLINE_SECONDS,
+    SHUTDOWN_STOP_CONCURRENCY,
+    STATE_SNAPSHOT_INTERVAL_SECONDS,
+)
 from .core import TwitchColorBot
+from .startup_pipeline import StartupPipeline
+from .state_snapshot import StateSnapshot
 
 _jitter_rng = SystemRandom()
 
@@ -49,12 +59,29 @@ class BotLifecycleManager:  # pylint: disable=too-many-instance-attributes
         self.new_config: list[dict[str, Any]] | None = None
         self.context = context
         self.http_session: aiohttp.ClientSession | None = None
+        self.startup: StartupPipeline | None = None
+        self.snapshot = self._open_snapshot(config_file)
         self._manager_lock = asyncio.Lock()
 
+    @staticmethod
+    def _open_snapshot(config_file: str | None) -> StateSnapshot | None:
+        """Create the warm-restart snapshot kept next to the config file.
+
+        ``TWITCH_STATE_SNAPSHOT`` overrides the path. Without a config file
+        (and no override) there is nothing to restart from, so none is kept.
+        """
+        path = os.getenv("TWITCH_STATE_SNAPSHOT")
+        if not path:
+            if not config_file:
+                return None
+            path = f"{config_file}.state.json"
+        return StateSnapshot(path)
+
     async def _start_all_bots(self) -> bool:
         """Start all bots from the user configuration.
 
-        Creates bot instances, launches their tasks, and sets running state.
+        Creates bot instances, launches them through the staged startup
+        pipeline, and sets running state.
 
         Returns:
             True if all bots started successfully, False otherwise.
@@ -63,6 +90,9 @@ class BotLifecycleManager:  # pylint: disable=too-many-instance-attributes
         if not self.context:
             raise RuntimeError("ApplicationContext required")
         self.http_session = self.context.session
+        if self.snapshot is not None:
+            self.snapshot.load()
+        warm = 0
         for user_config in self.users_config:
             try:
                 bot = self._create_bot(user_config)
@@ -71,12 +101,26 @@ class BotLifecycleManager:  # pylint: disable=too-many-instance-attributes
                 logging.error(
                     f"💥 Failed to create bot: {str(e)} user={user_config.username}"
                 )
+                continue
+            if self.snapshot is not None and self.snapshot.apply(bot):
+                warm += 1
         if not self.bots:
             logging.error("⚠️ No bots created - aborting start")
             return False
+        if warm:
+            logging.info(f"♻️ Warm start from state snapshot bots={warm}/{len(self.bots)}")
         logging.debug(f"🚀 Launching bot tasks (count={len(self.bots)})")
-        for bot in self.bots:
-            self.tasks.append(asyncio.create_task(bot.start()))
+        # Bots go live as they clear the staged pipeline; no need to wait for all
+        self.startup = StartupPipeline(self.bots, TwitchAPI(self.http_session))
+        self.tasks.extend(self.startup.launch())
+        if self.snapshot is not None and STATE_SNAPSHOT_INTERVAL_SECONDS > 0:
+            self.tasks.append(
+                asyncio.create_task(
+                    self.snapshot.run_periodic(
+                        lambda: self.bots, STATE_SNAPSHOT_INTERVAL_SECONDS
+                    )
+                )
+            )
         await asyncio.sleep(BOT_STARTUP_DELAY_SECONDS)
         self.running = True
         logging.debug("✅ All bots started successfully")
@@ -118,6 +162,8 @@ class BotLifecycleManager:  # pylint: disable=too-many-instance-attributes
             return
         logging.warning("🛑 Stopping all bots")
         self._cancel_all_tasks()
+        if self.snapshot is not None:
+            await self.snapshot.save(self.bots)
         await self._close_all_bots()  # Now async with proper cleanup
         await self._wait_for_task_completion()
         self.running = False
@@ -134,15 +180,29 @@ class BotLifecycleManager:  # pylint: disable=too-many-instance-attributes
                 logging.warning(f"💥 Error cancelling task index={i}: {str(e)}")
 
     async def _close_all_bots(self) -> None:
-        """Close all bot instances with proper async cleanup."""
-        for i, bot in enumerate(self.bots):
-            try:
-                await bot.stop()  # Use stop() instead of close() for proper cleanup
-                logging.info(f"🔻 Stopped bot for user {bot.username}")
-            except (OSError, ValueError, RuntimeError) as e:
-                logging.warning(
-                    f"💥 Error stopping bot index={i}: {str(e)} user={getattr(bot, 'username', None)}"
-                )
+        """Close all bot instances with proper async cleanup.
+
+        Bots stop ``SHUTDOWN_STOP_CONCURRENCY`` at a time, and their
+        subscription cleanup shares one deadline of
+        ``SHUTDOWN_CLEANUP_DEADLINE_SECONDS``.
+        """
+        limit = asyncio.Semaphore(max(1, SHUTDOWN_STOP_CONCURRENCY))
+
+        async def _stop(i: int, bot: TwitchColorBot) -> None:
+            async with limit:
+                try:
+                    await bot.stop()  # Use stop() instead of close() for proper cleanup
+                    logging.info(f"🔻 Stopped bot for user {bot.username}")
+                except (OSError, ValueError, RuntimeError) as e:
+                    logging.warning(
+                        f"💥 Error stopping bot index={i}: {str(e)} user={getattr(bot, 'username', None)}"
+                    )
+
+        set_cleanup_deadline(SHUTDOWN_CLEANUP_DEADLINE_SECONDS)
+        try:
+            await asyncio.gather(*(_stop(i, bot) for i, bot in enumerate(self.bots)))
+        finally:
+            set_cleanup_deadline(None)
 
     async def _wait_for_task_completion(self) -> None:
         """Wait for all bot tasks to complete and log any exceptions."""
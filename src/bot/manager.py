@@ -194,7 +194,7 @@ async def run_bots(
     """
     from ..application_context import ApplicationContext  # local import
 
-    context = await ApplicationContext.create()
+    context = await ApplicationContext.create(expected_users=len(users_config))
     await context.start()
     manager = BotManager(users_config, config_file, context=context)
     manager.setup_signal_handlers()
@@ -38,6 +38,8 @@ class MessageProcessor:
 
         Processes messages sent by the bot user, handling toggle commands,
         color change commands, and triggering automatic color changes.
+        Color changes are handed to the bot's color worker so the receive
+        loop never waits on the Helix request.
 
         Args:
             sender: Username of the message sender.
@@ -58,7 +60,7 @@ class MessageProcessor:
             if await self._maybe_handle_ccc(raw, msg_lower):
                 return
             if self._is_color_change_allowed():
-                await self.bot.color_changer._change_color()  # type: ignore
+                self.bot.color_worker.submit()
         except Exception as e:
             logging.error(f"Error handling message from {sender}: {e}")
 
@@ -99,7 +101,7 @@ class MessageProcessor:
                 f"ℹ️ Ignoring hex via ccc for non-Prime user={self.bot.username} color={desired}"
             )
             return True
-        await self.bot.color_changer._change_color(desired)  # type: ignore
+        self.bot.color_worker.submit(desired)
         return True
 
     @staticmethod
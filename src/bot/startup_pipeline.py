@@ -0,0 +1,314 @@
+"""Staged, pipelined startup for all configured bots.
+
+Startup is split into four stages that each run across users with their own
+concurrency limit:
+
+1. ``validate``  - register with the token manager, refresh, log scopes.
+2. ``resolve``   - look up user IDs in bulk (one Helix call per batch of
+   users instead of one per user), then prime the current color.
+3. ``connect``   - open the EventSub socket and join the primary channel.
+4. ``subscribe`` - start listening and join the remaining channels.
+
+Every user moves through the stages independently, so early users go live
+while later ones are still validating. When the last user finishes (or
+drops out), a per-stage timing report is logged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from ..api.twitch import TwitchAPI
+from ..chat.login_resolver import get_login_resolver
+from ..constants import (
+    STARTUP_CONNECT_CONCURRENCY,
+    STARTUP_ID_BATCH_WINDOW_SECONDS,
+    STARTUP_RESOLVE_CONCURRENCY,
+    STARTUP_SUBSCRIBE_CONCURRENCY,
+    STARTUP_VALIDATE_CONCURRENCY,
+)
+from ..errors.internal import BotRestartException
+
+if TYPE_CHECKING:
+    from .core import TwitchColorBot
+
+STAGES = ("validate", "resolve", "connect", "subscribe")
+
+DEFAULT_LIMITS = {
+    "validate": STARTUP_VALIDATE_CONCURRENCY,
+    "resolve": STARTUP_RESOLVE_CONCURRENCY,
+    "connect": STARTUP_CONNECT_CONCURRENCY,
+    "subscribe": STARTUP_SUBSCRIBE_CONCURRENCY,
+}
+
+# Helix accepts up to 100 logins per /users request
+_MAX_ID_BATCH = 100
+
+
+@dataclass
+class StageReport:
+    """Timing of one startup stage across all users."""
+
+    name: str
+    limit: int
+    succeeded: int = 0
+    failed: int = 0
+    durations: list[float] = field(default_factory=list)
+    first_start: float | None = None
+    last_end: float | None = None
+
+    def record(self, started: float, ended: float, ok: bool) -> None:
+        """Record one user passing through the stage."""
+        self.durations.append(ended - started)
+        if ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        if self.first_start is None or started < self.first_start:
+            self.first_start = started
+        if self.last_end is None or ended > self.last_end:
+            self.last_end = ended
+
+    @property
+    def span(self) -> float:
+        """Seconds from the first user entering to the last user leaving."""
+        if self.first_start is None or self.last_end is None:
+            return 0.0
+        return self.last_end - self.first_start
+
+    def format(self) -> str:
+        """One report line for this stage."""
+        if not self.durations:
+            return f"stage={self.name} limit={self.limit} users=0"
+        avg_ms = sum(self.durations) / len(self.durations) * 1000
+        max_ms = max(self.durations) * 1000
+        return (
+            f"stage={self.name} limit={self.limit} ok={self.succeeded} "
+            f"failed={self.failed} avg={avg_ms:.0f}ms max={max_ms:.0f}ms "
+            f"span={self.span:.2f}s"
+        )
+
+
+class _UserIdBatcher:
+    """Collect users arriving within a short window into one ``/users`` lookup."""
+
+    def __init__(self, api: TwitchAPI, window: float) -> None:
+        self._api = api
+        self._window = window
+        self._pending: list[tuple[TwitchColorBot, asyncio.Future[str | None]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.lookups = 0
+
+    async def resolve(self, bot: TwitchColorBot) -> str | None:
+        """Return the user ID for ``bot`` or None if the bulk lookup missed it."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str | None] = loop.create_future()
+        self._pending.append((bot, future))
+        if len(self._pending) >= _MAX_ID_BATCH:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._lookup(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _lookup(
+        self, batch: list[tuple[TwitchColorBot, asyncio.Future[str | None]]]
+    ) -> None:
+        ids: dict[str, str] = {}
+        # Any user token may look up any login; use the first one available
+        caller = next((bot for bot, _ in batch if bot.access_token), None)
+        try:
+            if caller is not None:
+                self.lookups += 1
+                ids = await self._api.get_users_by_login(
+                    access_token=caller.access_token or "",
+                    client_id=caller.client_id,
+                    logins=[bot.username for bot, _ in batch],
+                )
+            # Bots usually join their own channel; share the IDs with channel lookups
+            get_login_resolver().remember(ids)
+        except (aiohttp.ClientError, TimeoutError, ValueError) as e:
+            logging.debug(f"Bulk user ID lookup failed users={len(batch)}: {str(e)}")
+        finally:
+            for bot, future in batch:
+                if not future.done():
+                    future.set_result(ids.get(bot.username.lower()))
+
+
+class StartupPipeline:  # pylint: disable=too-many-instance-attributes
+    """Drive a set of bots through the startup stages concurrently.
+
+    Args:
+        bots: Bots to start.
+        api: Twitch API client used for the bulk user-ID lookup.
+        limits: Per-stage concurrency overrides keyed by stage name.
+        batch_window: Seconds to gather users into one user-ID lookup.
+    """
+
+    def __init__(
+        self,
+        bots: list[TwitchColorBot],
+        api: TwitchAPI,
+        *,
+        limits: dict[str, int] | None = None,
+        batch_window: float = STARTUP_ID_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        self.bots = list(bots)
+        merged = {**DEFAULT_LIMITS, **(limits or {})}
+        self.reports = {name: StageReport(name, max(1, merged[name])) for name in STAGES}
+        self._gates = {
+            name: asyncio.Semaphore(report.limit)
+            for name, report in self.reports.items()
+        }
+        self._ids = _UserIdBatcher(api, batch_window)
+        self._stage_funcs: dict[str, Callable[[TwitchColorBot], Awaitable[bool]]] = {
+            "validate": self._validate,
+            "resolve": self._resolve,
+            "connect": self._connect,
+            "subscribe": self._subscribe,
+        }
+        self._remaining = len(self.bots)
+        self._finished = asyncio.Event()
+        self._started_at = 0.0
+        self.first_live: float | None = None
+        self.all_settled: float | None = None
+        self.live: list[str] = []
+
+    def launch(self) -> list[asyncio.Task[None]]:
+        """Start every bot and return one long-running task per bot.
+
+        Each task runs the bot through the stages and then its chat loop.
+        """
+        self._started_at = time.monotonic()
+        if not self.bots:
+            self._settle_all()
+        return [asyncio.create_task(self._drive(bot)) for bot in self.bots]
+
+    async def wait(self) -> None:
+        """Wait until every bot is live or has dropped out of startup."""
+        await self._finished.wait()
+
+    async def _drive(self, bot: TwitchColorBot) -> None:
+        ready = False
+        try:
+            ready = await self._advance(bot)
+        except BotRestartException:
+            logging.warning(f"🔄 Bot restart requested, restarting user={bot.username}")
+            self._settle(bot, False)
+            await bot.stop()
+            await bot.start()
+            return
+        except BaseException:
+            self._settle(bot, False)
+            raise
+        self._settle(bot, ready)
+        if ready:
+            await bot.start(prepared=True)
+
+    async def _advance(self, bot: TwitchColorBot) -> bool:
+        await bot.begin_startup()
+        for name in STAGES:
+            if not await self._run_stage(name, bot):
+                await bot.abort_startup()
+                return False
+        return True
+
+    async def _run_stage(self, name: str, bot: TwitchColorBot) -> bool:
+        started = time.monotonic()
+        ok = False
+        try:
+            ok = await self._stage_funcs[name](bot)
+        finally:
+            self.reports[name].record(started, time.monotonic(), ok)
+        if not ok:
+            logging.warning(f"⚠️ Startup stage {name} failed user={bot.username}")
+        return ok
+
+    # ---- stages ----
+
+    async def _validate(self, bot: TwitchColorBot) -> bool:
+        async with self._gates["validate"]:
+            if not await bot.token_handler.setup_token_manager():
+                return False
+            await bot.token_handler.handle_initial_token_refresh()
+            if bot.access_token is None:
+                logging.error(f"❌ Access token not available user={bot.username}")
+                return False
+            await bot.connection_manager._log_scopes_if_possible()
+            return True
+
+    async def _resolve(self, bot: TwitchColorBot) -> bool:
+        # The bulk lookup is one request per batch, so it is not gated per user
+        if not bot.user_id:
+            user_id = await self._ids.resolve(bot)
+            if user_id:
+                bot.user_id = user_id
+                logging.debug(f"🆔 Retrieved user_id {user_id} user={bot.username}")
+        async with self._gates["resolve"]:
+            # Falls back to a per-user lookup if the bulk one missed
+            if not await bot.connection_manager._ensure_user_id():
+                return False
+            await bot.connection_manager._prime_color_state()
+            return True
+
+    async def _connect(self, bot: TwitchColorBot) -> bool:
+        async with self._gates["connect"]:
+            return await bot.connection_manager.open_connection()
+
+    async def _subscribe(self, bot: TwitchColorBot) -> bool:
+        async with self._gates["subscribe"]:
+            return await bot.connection_manager.subscribe_channels()
+
+    # ---- reporting ----
+
+    def _settle(self, bot: TwitchColorBot, live: bool) -> None:
+        now = time.monotonic()
+        # The snapshot only describes startup; later reconnects ask Twitch
+        bot.warm_state = None
+        if live:
+            self.live.append(bot.username)
+            if self.first_live is None:
+                self.first_live = now - self._started_at
+        self._remaining -= 1
+        if self._remaining == 0:
+            self._settle_all()
+
+    def _settle_all(self) -> None:
+        self.all_settled = time.monotonic() - self._started_at
+        self._finished.set()
+        self.log_report()
+
+    def report_lines(self) -> list[str]:
+        """Return the per-stage timing report."""
+        lines = [report.format() for report in self.reports.values()]
+        first = f"{self.first_live:.2f}s" if self.first_live is not None else "n/a"
+        total = f"{self.all_settled:.2f}s" if self.all_settled is not None else "n/a"
+        lines.append(
+            f"live={len(self.live)}/{len(self.bots)} first_live={first} "
+            f"total={total} id_lookups={self._ids.lookups}"
+        )
+        return lines
+
+    def log_report(self) -> None:
+        """Log the per-stage timing report."""
+        logging.info("⏱️ Startup timing report")
+        for line in self.report_lines():
+            logging.info(f"⏱️ {line}")
@@ -0,0 +1,384 @@
+"""Warm-restart state snapshot.
+
+Every start used to repeat the same lookups for each user: the user ID, the
+current chat color, channel IDs, and two or three token validations for
+expiry and scopes. The answers rarely change between restarts.
+
+:class:`StateSnapshot` keeps them in one small JSON file written on shutdown
+and every ``STATE_SNAPSHOT_INTERVAL_SECONDS``. On the next start, entries
+younger than ``STATE_SNAPSHOT_MAX_AGE_SECONDS`` seed user IDs, channel IDs and
+the last color. Scopes and expiry are trusted only for the same access token
+and only if it was validated within ``STATE_SNAPSHOT_VALIDATION_MAX_AGE_SECONDS``.
+The token manager then validates it again when its periodic validation falls
+due, instead of at startup.
+
+Each entry carries a checksum; entries that fail it are ignored, and a
+snapshot of another version is ignored as a whole. Tokens themselves are
+never written, only a short hash identifying them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..chat.login_resolver import get_login_resolver
+from ..constants import (
+    STATE_SNAPSHOT_MAX_AGE_SECONDS,
+    STATE_SNAPSHOT_VALIDATION_MAX_AGE_SECONDS,
+)
+from ..utils import json_codec
+
+if TYPE_CHECKING:
+    from .core import TwitchColorBot
+
+SNAPSHOT_VERSION = 1
+
+
+def token_fingerprint(access_token: str | None) -> str | None:
+    """Short hash that identifies a token without storing it."""
+    if not access_token:
+        return None
+    return hashlib.sha256(access_token.encode()).hexdigest()[:16]
+
+
+@dataclass(slots=True)
+class ValidatedToken:
+    """What Twitch last reported about one access token.
+
+    Attributes:
+        fingerprint (str): ``token_fingerprint`` of the token.
+        scopes (frozenset[str]): Lowercase scopes granted to the token.
+        validated_at (float): ``time.time()`` of the validation.
+        expiry (datetime | None): Token expiry, if known.
+    """
+
+    fingerprint: str
+    scopes: frozenset[str]
+    validated_at: float
+    expiry: datetime | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "scopes": sorted(self.scopes),
+            "validated_at": self.validated_at,
+            "expiry": self.expiry.isoformat() if self.expiry else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ValidatedToken:
+        expiry = data.get("expiry")
+        return cls(
+            fingerprint=str(data["fingerprint"]),
+            scopes=frozenset(str(s) for s in data["scopes"]),
+            validated_at=float(data["validated_at"]),
+            expiry=datetime.fromisoformat(expiry) if expiry else None,
+        )
+
+
+@dataclass(slots=True)
+class UserState:
+    """Snapshot entry for one user.
+
+    Attributes:
+        username (str): Lowercase login.
+        client_id (str): Application the entry was recorded for.
+        saved_at (float): ``time.time()`` when the entry was captured.
+        user_id (str | None): Twitch user ID.
+        last_color (str | None): Last chat color set or seen.
+        token (ValidatedToken | None): Last validation of the user's token.
+        channel_ids (dict[str, str]): Channel login to broadcaster ID.
+    """
+
+    username: str
+    client_id: str
+    saved_at: float
+    user_id: str | None = None
+    last_color: str | None = None
+    token: ValidatedToken | None = None
+    channel_ids: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "username": self.username,
+            "client_id": self.client_id,
+            "saved_at": self.saved_at,
+            "user_id": self.user_id,
+            "last_color": self.last_color,
+            "token": self.token.to_dict() if self.token else None,
+            "channel_ids": dict(sorted(self.channel_ids.items())),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> UserState:
+        token = data.get("token")
+        return cls(
+            username=str(data["username"]),
+            client_id=str(data["client_id"]),
+            saved_at=float(data["saved_at"]),
+            user_id=data.get("user_id"),
+            last_color=data.get("last_color"),
+            token=ValidatedToken.from_dict(token) if token else None,
+            channel_ids={str(k): str(v) for k, v in data.get("channel_ids", {}).items()},
+        )
+
+    def trusted_token(self, access_token: str | None) -> ValidatedToken | None:
+        """The recorded validation, if it was made for ``access_token``."""
+        if self.token is None or self.token.fingerprint != token_fingerprint(access_token):
+            return None
+        return self.token
+
+
+def _checksum(entry: dict[str, Any]) -> str:
+    return hashlib.sha256(json_codec.dumpb(entry, sort_keys=True)).hexdigest()[:16]
+
+
+def warm_state_of(bot: Any) -> UserState | None:
+    """The snapshot entry a bot was started from, if any."""
+    state = getattr(bot, "warm_state", None)
+    return state if isinstance(state, UserState) else None
+
+
+def trusted_scopes(bot: Any) -> frozenset[str] | None:
+    """Scopes validated for the bot's current token, by this run or the last.
+
+    The validation is only trusted while the token is unchanged; a refresh
+    makes it stale.
+    """
+    check = getattr(bot, "validated_token", None)
+    token = getattr(bot, "access_token", None)
+    if not isinstance(check, ValidatedToken) or not isinstance(token, str):
+        return None
+    return check.scopes if check.fingerprint == token_fingerprint(token) else None
+
+
+class StateSnapshot:
+    """Loads, applies and writes the warm-restart snapshot."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_age: float = STATE_SNAPSHOT_MAX_AGE_SECONDS,
+        validation_max_age: float = STATE_SNAPSHOT_VALIDATION_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty snapshot bound to a file.
+
+        Args:
+            path (str): Snapshot file path.
+            max_age (float): Seconds an entry is trusted at all.
+            validation_max_age (float): Seconds a token validation is trusted.
+            clock (Callable[[], float]): Wall-clock time source.
+        """
+        self.path = path
+        self._max_age = max_age
+        self._validation_max_age = validation_max_age
+        self._clock = clock
+        self._entries: dict[str, UserState] = {}
+        self._write_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self) -> int:
+        """Read the snapshot file, keeping entries that pass their checksum.
+
+        Returns:
+            int: Number of entries loaded.
+        """
+        self._entries = {}
+        try:
+            document = json_codec.loads(Path(self.path).read_bytes())
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠️ State snapshot unreadable, starting cold: {str(e)}")
+            return 0
+        if not isinstance(document, dict) or document.get("version") != SNAPSHOT_VERSION:
+            logging.info("♻️ State snapshot version changed, starting cold")
+            return 0
+        rejected = 0
+        for row in document.get("users") or []:
+            try:
+                entry = row["entry"]
+                if row["checksum"] != _checksum(entry):
+                    raise ValueError("checksum mismatch")
+                state = UserState.from_dict(entry)
+            except (KeyError, TypeError, ValueError, AttributeError):
+                rejected += 1
+                continue
+            self._entries[state.username] = state
+        if rejected:
+            logging.warning(f"⚠️ State snapshot: ignored {rejected} damaged entries")
+        return len(self._entries)
+
+    def entry_for(self, username: str, client_id: str) -> UserState | None:
+        """The user's entry, with anything past its age limit dropped.
+
+        Args:
+            username (str): Login of the user.
+            client_id (str): Application the user runs under.
+
+        Returns:
+            UserState | None: Trusted entry, or None if there is none.
+        """
+        state = self._entries.get(username.lower())
+        if state is None or state.client_id != client_id:
+            return None
+        now = self._clock()
+        if self._max_age <= 0 or now - state.saved_at > self._max_age:
+            return None
+        token = state.token
+        if token is not None and now - token.validated_at > self._validation_max_age:
+            token = None
+        return UserState(
+            username=state.username,
+            client_id=state.client_id,
+            saved_at=state.saved_at,
+            user_id=state.user_id,
+            last_color=state.last_color,
+            token=token,
+            channel_ids=dict(state.channel_ids),
+        )
+
+    def apply(self, bot: TwitchColorBot) -> bool:
+        """Seed a new bot with its trusted entry.
+
+        Sets the user ID, token expiry (when the config lacks it) and the
+        entry used by the startup steps, and shares the channel IDs with the
+        login resolver.
+
+        Returns:
+            bool: True if the bot had a trusted entry.
+        """
+        state = self.entry_for(bot.username, bot.client_id)
+        if state is None:
+            return False
+        bot.warm_state = state
+        if state.user_id and not bot.user_id:
+            bot.user_id = state.user_id
+        token = state.trusted_token(bot.access_token)
+        if token is not None:
+            bot.validated_token = token
+            if bot.token_expiry is None:
+                bot.token_expiry = token.expiry
+        if state.channel_ids:
+            get_login_resolver().remember(state.channel_ids)
+        return True
+
+    def capture(self, bots: Iterable[TwitchColorBot]) -> int:
+        """Record the current state of every bot that knows its user ID.
+
+        Bots that do not (for example because startup failed) keep their
+        previous entry.
+
+        Returns:
+            int: Number of bots captured.
+        """
+        now = self._clock()
+        resolver = get_login_resolver()
+        captured = 0
+        for bot in bots:
+            if not bot.user_id:
+                continue
+            username = bot.username.lower()
+            logins = [ch.lstrip("#").lower() for ch in bot.channels]
+            channel_ids = resolver.known(logins)
+            if username in logins:
+                channel_ids[username] = bot.user_id
+            self._entries[username] = UserState(
+                username=username,
+                client_id=bot.client_id,
+                saved_at=now,
+                user_id=bot.user_id,
+                last_color=bot.last_color,
+                token=self._token_of(bot),
+                channel_ids=channel_ids,
+            )
+            captured += 1
+        return captured
+
+    @staticmethod
+    def _token_of(bot: TwitchColorBot) -> ValidatedToken | None:
+        """Latest validation of the bot's current token, if any."""
+        check = bot.validated_token
+        if check is None or check.fingerprint != token_fingerprint(bot.access_token):
+            return None
+        validated_at = check.validated_at
+        # The token manager's periodic validations keep the record current
+        info = bot.token_manager.tokens.get(bot.username) if bot.token_manager else None
+        if info is not None and info.access_token == bot.access_token:
+            validated_at = max(validated_at, info.last_validation)
+        return ValidatedToken(check.fingerprint, check.scopes, validated_at, bot.token_expiry)
+
+    async def save(self, bots: Iterable[TwitchColorBot]) -> bool:
+        """Capture the bots and write the snapshot atomically.
+
+        Returns:
+            bool: True if the file was written.
+        """
+        self.capture(bots)
+        users = []
+        for state in self._entries.values():
+            entry = state.to_dict()
+            users.append({"entry": entry, "checksum": _checksum(entry)})
+        document = {
+            "version": SNAPSHOT_VERSION,
+            "written_at": self._clock(),
+            "users": users,
+        }
+        async with self._write_lock:
+            try:
+                await asyncio.to_thread(self._write, json_codec.dumpb(document))
+            except OSError as e:
+                logging.warning(f"⚠️ State snapshot write failed: {str(e)}")
+                return False
+        logging.debug(f"💾 State snapshot saved users={len(users)}")
+        return True
+
+    def _write(self, payload: bytes) -> None:
+        target = Path(self.path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: str | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="wb",
+                dir=target.parent,
+                prefix=f".{target.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                temp_path = tmp.name
+                tmp.write(payload)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, target)
+        except OSError:
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    async def run_periodic(
+        self, bots: Callable[[], Iterable[TwitchColorBot]], interval: float
+    ) -> None:
+        """Save the snapshot every ``interval`` seconds until cancelled.
+
+        Args:
+            bots (Callable[[], Iterable[TwitchColorBot]]): Current bots.
+            interval (float): Seconds between writes.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await self.save(bots())
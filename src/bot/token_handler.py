@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -17,6 +18,9 @@ from ..config.async_persistence import async_update_user_in_config, queue_user_u
 from ..config.model import normalize_channels_list
 from ..errors.handling import handle_api_error
 from ..utils.retry import RetryExhaustedError, retry_async
+from .state_snapshot import ValidatedToken, token_fingerprint, trusted_scopes
+
+REQUIRED_SCOPES = frozenset({"chat:read", "user:read:chat", "user:manage:chat_color"})
 
 
 class TokenHandler:
@@ -42,6 +46,14 @@ class TokenHandler:
         if self.bot.access_token is None or self.bot.refresh_token is None:
             logging.error(f"❌ Tokens not available user={self.bot.username}")
             return False
+        # A validation from the previous run (state snapshot) postpones the next one
+        validated = self.bot.validated_token
+        last_validation = (
+            validated.validated_at
+            if isinstance(validated, ValidatedToken)
+            and trusted_scopes(self.bot) is not None
+            else None
+        )
         # Register credentials with the token manager
         await self.bot.token_manager._upsert_token_info(  # noqa: SLF001
             username=self.bot.username,
@@ -50,6 +62,7 @@ class TokenHandler:
             client_id=self.bot.client_id,
             client_secret=self.bot.client_secret,
             expiry=self.bot.token_expiry,
+            last_validation=last_validation,
         )
         logging.debug(f"📝 Token manager: registered user={self.bot.username}")
         await self.bot.token_manager.register_update_hook(
@@ -86,9 +99,7 @@ class TokenHandler:
             except OSError as e:
                 logging.debug(f"Token persistence error: {str(e)}")
         # Check required scopes on initial load
-        if info.access_token and not await self._validate_required_scopes(
-            info.access_token
-        ):
+        if info.access_token and not await self._initial_scopes_ok(info.access_token):
             logging.warning(
                 f"🚫 Insufficient scopes detected on initial load user={self.bot.username}, invalidating and triggering re-auth"
             )
@@ -99,6 +110,20 @@ class TokenHandler:
                 reason="insufficient scopes on initial load"
             )
 
+    async def _initial_scopes_ok(self, access_token: str) -> bool:
+        """Check required scopes, trusting the state snapshot for an unchanged token.
+
+        Args:
+            access_token: The access token to check.
+
+        Returns:
+            True if all required scopes are present, False otherwise.
+        """
+        scopes = trusted_scopes(self.bot)
+        if scopes is not None and access_token == self.bot.access_token:
+            return REQUIRED_SCOPES.issubset(scopes)
+        return await self._validate_required_scopes(access_token)
+
     async def log_scopes_if_possible(self) -> None:
         """Log the scopes of the current access token if possible.
 
@@ -231,7 +256,6 @@ class TokenHandler:
         if not self.bot.context.session:
             return False
         api = TwitchAPI(self.bot.context.session)
-        required_scopes = {"chat:read", "user:read:chat", "user:manage:chat_color"}
         try:
             validation = await api.validate_token(access_token)
             if not isinstance(validation, dict):
@@ -239,8 +263,13 @@ class TokenHandler:
             raw_scopes = validation.get("scopes")
             if not isinstance(raw_scopes, list):
                 return False
-            current_scopes = {str(s).lower() for s in raw_scopes}
-            return required_scopes.issubset(current_scopes)
+            current_scopes = frozenset(str(s).lower() for s in raw_scopes)
+            fingerprint = token_fingerprint(access_token)
+            if fingerprint:
+                self.bot.validated_token = ValidatedToken(
+                    fingerprint, current_scopes, time.time()
+                )
+            return REQUIRED_SCOPES.issubset(current_scopes)
         except aiohttp.ClientError:
             return False
 
@@ -1,49 +1,63 @@
 """CacheManager for asynchronous file-based caching with concurrency control.
 
-This module provides a CacheManager class that handles persistent storage of
-key-value data using JSON serialization, with proper asynchronous file I/O
-and locking mechanisms to ensure thread-safety in concurrent environments.
-Includes in-memory LRU cache for performance and atomic file writes.
+This module provides a CacheManager class that keeps the authoritative
+key-value map in memory and persists mutations through an append-only journal
+(``<cache file>.journal``, one JSON record per line). The journal is folded
+into the JSON snapshot file by a background compaction with an atomic replace.
+External rewrites of the snapshot are detected from its ``os.stat`` signature
+(inode, mtime, size) instead of re-hashing the file.
+
+Each instance owns its snapshot and journal, so code sharing a cache file
+within the process should obtain the manager through :func:`get_cache_manager`.
 """
 
 import asyncio
-import hashlib
-import json
 import logging
 import os
 import tempfile
-from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 from src.errors.eventsub import CacheError
 
+from ..constants import (
+    CACHE_JOURNAL_COMPACT_THRESHOLD,
+    CACHE_JOURNAL_FLUSH_DELAY_SECONDS,
+)
+from ..utils import json_codec
 from .protocols import CacheManagerProtocol
 
 logger = logging.getLogger(__name__)
 
+FileSignature = tuple[int, int, int]
+
 
 class CacheManager(CacheManagerProtocol):
-    """Asynchronous file-based cache manager with concurrency control and LRU memory cache.
+    """Asynchronous file-backed cache manager with an in-memory index.
 
-    This class provides a thread-safe interface for storing and retrieving
-    key-value data from a JSON file, using asyncio.Lock for synchronization
-    and proper error handling with custom EventSub exceptions.
+    Reads are served from memory. Mutations update memory immediately and are
+    buffered as journal records that a write-behind task appends to the
+    journal file; once the journal grows past the compaction threshold it is
+    folded into the snapshot file in the background.
 
     Features:
-    - Persistent file-based storage with atomic writes
-    - In-memory LRU cache for performance
+    - In-memory authoritative map, loaded lazily on first access
+    - Write-behind append-only journal with background compaction
+    - Cheap external-change detection via the snapshot's stat signature
     - Automatic recovery from corrupted JSON files
-    - Thread-safe concurrent access
+    - Bulk ``get_many``/``set_many`` for batch lookups and stores
 
     The cache supports basic CRUD operations and is designed for use in
     asynchronous contexts, particularly for caching Twitch user IDs and
     other EventSub-related data.
 
     Attributes:
-        _cache_file_path (str): Path to the JSON cache file.
-        _lock (asyncio.Lock): Lock for synchronizing file operations.
-        _memory_cache (OrderedDict): In-memory LRU cache.
-        _max_cache_size (int): Maximum size of memory cache.
+        _cache_file_path (str): Path to the JSON snapshot file.
+        _journal_path (str): Path to the append-only journal file.
+        _lock (asyncio.Lock): Lock serialising state and file operations.
+        _data (dict[str, Any]): Authoritative in-memory map.
+        _signature (FileSignature | None): Stat signature of the snapshot the
+            in-memory map and journal are based on.
 
     Example:
         >>> async with CacheManager("cache.json") as cache:
@@ -52,13 +66,24 @@ class CacheManager(CacheManagerProtocol):
         ...     print(user_id)  # Output: 12345
     """
 
-    def __init__(self, cache_file_path: str, max_cache_size: int = 1000) -> None:
+    def __init__(
+        self,
+        cache_file_path: str,
+        max_cache_size: int = 1000,
+        compact_threshold: int = CACHE_JOURNAL_COMPACT_THRESHOLD,
+        flush_delay: float = CACHE_JOURNAL_FLUSH_DELAY_SECONDS,
+    ) -> None:
         """Initialize the CacheManager.
 
         Args:
             cache_file_path (str): Path to the JSON file used for caching.
                                     The directory will be created if it doesn't exist.
-            max_cache_size (int): Maximum number of entries in memory cache.
+            max_cache_size (int): Kept for backward compatibility; every entry
+                is now held in memory.
+            compact_threshold (int): Journal records written before a
+                background compaction is scheduled.
+            flush_delay (float): Seconds mutations are buffered before being
+                appended to the journal.
 
         Raises:
             ValueError: If cache_file_path is empty or None.
@@ -67,55 +92,62 @@ class CacheManager(CacheManagerProtocol):
             raise ValueError("cache_file_path cannot be empty")
 
         self._cache_file_path = cache_file_path
+        self._journal_path = f"{cache_file_path}.journal"
         self._lock = asyncio.Lock()
-        self._memory_cache: OrderedDict[str, Any] = OrderedDict()
         self._max_cache_size = max_cache_size
-        self._file_hash: str | None = None
-
-    def _get_from_memory(self, key: str) -> Any:
-        """Get value from memory cache, moving to end (most recent)."""
-        if key in self._memory_cache:
-            # Move to end (most recently used)
-            self._memory_cache.move_to_end(key)
-            return self._memory_cache[key]
-        return None
-
-    def _put_in_memory(self, key: str, value: Any) -> None:
-        """Put value in memory cache with LRU eviction."""
-        if key in self._memory_cache:
-            # Update existing and move to end
-            self._memory_cache.move_to_end(key)
-        else:
-            # Add new entry
-            if len(self._memory_cache) >= self._max_cache_size:
-                # Remove least recently used
-                self._memory_cache.popitem(last=False)
-        self._memory_cache[key] = value
-
-    def _invalidate_memory(self, key: str) -> None:
-        """Remove key from memory cache."""
-        self._memory_cache.pop(key, None)
-
-    def _clear_memory(self) -> None:
-        """Clear all entries from memory cache."""
-        self._memory_cache.clear()
-
-    async def _compute_file_hash(self) -> str | None:
-        """Compute SHA256 hash of the cache file content."""
-        if not os.path.exists(self._cache_file_path):
+        self._compact_threshold = max(1, compact_threshold)
+        self._flush_delay = flush_delay
+        self._data: dict[str, Any] = {}
+        self._loaded = False
+        self._signature: FileSignature | None = None
+        self._pending: list[dict[str, Any]] = []
+        self._journal_records = 0
+        self._journal_started = False
+        self._flush_task: asyncio.Task[None] | None = None
+        self._compact_task: asyncio.Task[None] | None = None
+
+    # ------------------------------------------------------------------ #
+    # Change detection and loading
+    # ------------------------------------------------------------------ #
+
+    def _snapshot_signature(self) -> FileSignature | None:
+        """Return the snapshot file's (inode, mtime_ns, size), or None if absent."""
+        try:
+            st = os.stat(self._cache_file_path)
+        except FileNotFoundError:
             return None
-        loop = asyncio.get_event_loop()
-        def _hash_file():
-            with open(self._cache_file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
-        return await loop.run_in_executor(None, _hash_file)
-
-    async def _is_file_changed(self) -> bool:
-        """Check if the cache file has changed by comparing hashes."""
-        current_hash = await self._compute_file_hash()
-        changed = current_hash != self._file_hash
-        self._file_hash = current_hash
-        return changed
+        except OSError as e:
+            raise CacheError(
+                f"Failed to stat cache file {self._cache_file_path}: {e}",
+                operation_type="load_cache",
+            ) from e
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    async def _ensure_current(self) -> None:
+        """Load the cache, or reload it if the snapshot changed externally.
+
+        Must be called with ``_lock`` held. On an external rewrite the
+        snapshot wins: buffered and journaled mutations made on top of the
+        previous snapshot are discarded.
+        """
+        signature = self._snapshot_signature()
+        if self._loaded and signature == self._signature:
+            return
+        first_load = not self._loaded
+        if not first_load:
+            logger.debug(
+                f"Cache file {self._cache_file_path} changed externally, reloading"
+            )
+        self._data = await self._load_data()
+        # Re-stat: recovery may have moved a corrupted snapshot aside
+        self._signature = self._snapshot_signature()
+        base = list(signature) if signature is not None else None
+        if first_load and await self._replay_journal(base):
+            self._journal_started = True
+        else:
+            self._pending.clear()
+            await self._discard_journal()
+        self._loaded = True
 
     async def _load_data(self) -> dict[str, Any]:
         """Load cache data from file asynchronously with recovery.
@@ -132,15 +164,17 @@ class CacheManager(CacheManagerProtocol):
                 return {}
 
             def _read_file():
-                with open(self._cache_file_path) as f:
+                with open(self._cache_file_path, "rb") as f:
                     content = f.read()
                     if not content.strip():
                         return {}
-                    return json.loads(content)
+                    return json_codec.loads(content)
 
             data = await loop.run_in_executor(None, _read_file)
+            if not isinstance(data, dict):
+                raise json_codec.JSONDecodeError("cache root is not an object", "", 0)
             return data
-        except json.JSONDecodeError as e:
+        except json_codec.JSONDecodeError as e:
             # Recovery: log warning and return empty dict
             logger.warning(
                 f"Corrupted JSON in cache file {self._cache_file_path}, recovering with empty cache: {e}"
@@ -159,6 +193,152 @@ class CacheManager(CacheManagerProtocol):
                 operation_type="load_cache",
             ) from e
 
+    async def _replay_journal(self, base: list[int] | None) -> bool:
+        """Apply journal records written on top of the current snapshot.
+
+        Args:
+            base: Stat signature of the snapshot as loaded.
+
+        Returns:
+            bool: True if a journal for this snapshot was replayed.
+        """
+        loop = asyncio.get_event_loop()
+
+        def _read_journal() -> list[str]:
+            try:
+                with open(self._journal_path, encoding="utf-8") as f:
+                    return f.readlines()
+            except FileNotFoundError:
+                return []
+
+        try:
+            lines = await loop.run_in_executor(None, _read_journal)
+        except OSError as e:
+            logger.warning(f"Failed to read cache journal {self._journal_path}: {e}")
+            return False
+        if not lines:
+            return False
+        try:
+            header = json_codec.loads(lines[0])
+        except json_codec.JSONDecodeError:
+            return False
+        # A journal based on another snapshot was already compacted or is stale
+        if not isinstance(header, dict) or header.get("base") != base:
+            return False
+        applied = 0
+        for line in lines[1:]:
+            try:
+                record = json_codec.loads(line)
+            except json_codec.JSONDecodeError:
+                # Torn tail from an interrupted append
+                break
+            self._apply(record)
+            applied += 1
+        self._journal_records = applied
+        return True
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        """Apply one journal record to the in-memory map."""
+        op = record.get("op")
+        if op == "set":
+            self._data[record["key"]] = record["value"]
+        elif op == "del":
+            self._data.pop(record["key"], None)
+        elif op == "clear":
+            self._data.clear()
+
+    # ------------------------------------------------------------------ #
+    # Journal write-behind and compaction
+    # ------------------------------------------------------------------ #
+
+    def _record(self, records: list[dict[str, Any]]) -> None:
+        """Buffer journal records and schedule a write-behind flush."""
+        self._pending.extend(records)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Flush buffered records after the write-behind delay."""
+        await asyncio.sleep(self._flush_delay)
+        async with self._lock:
+            try:
+                await self._flush_journal()
+            except CacheError as e:
+                logger.warning(f"Cache journal flush failed: {e}")
+                return
+        if self._journal_records >= self._compact_threshold and (
+            self._compact_task is None or self._compact_task.done()
+        ):
+            self._compact_task = asyncio.create_task(self._compact_in_background())
+
+    async def _flush_journal(self) -> None:
+        """Append buffered records to the journal. Requires ``_lock``.
+
+        Raises:
+            CacheError: If the journal cannot be written.
+        """
+        if not self._pending:
+            return
+        lines = [json_codec.dumps(record) for record in self._pending]
+        start = not self._journal_started
+        if start:
+            base = list(self._signature) if self._signature is not None else None
+            lines.insert(0, json_codec.dumps({"base": base}))
+        loop = asyncio.get_event_loop()
+
+        def _append() -> None:
+            directory = os.path.dirname(self._journal_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self._journal_path, "w" if start else "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+        try:
+            await loop.run_in_executor(None, _append)
+        except OSError as e:
+            raise CacheError(
+                f"Failed to append cache journal {self._journal_path}: {e}",
+                operation_type="save_cache",
+            ) from e
+        self._journal_records += len(self._pending)
+        self._journal_started = True
+        self._pending.clear()
+
+    async def _discard_journal(self) -> None:
+        """Remove the journal file and reset journal bookkeeping."""
+        self._journal_records = 0
+        self._journal_started = False
+        try:
+            os.unlink(self._journal_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove cache journal {self._journal_path}: {e}")
+
+    async def _compact(self) -> None:
+        """Fold the journal into the snapshot file. Requires ``_lock``.
+
+        Raises:
+            CacheError: If the snapshot cannot be written.
+        """
+        await self._flush_journal()
+        if not self._journal_started:
+            return
+        await self._save_data(dict(self._data))
+        self._signature = self._snapshot_signature()
+        await self._discard_journal()
+
+    async def _compact_in_background(self) -> None:
+        """Run a compaction pass without surfacing errors to callers."""
+        async with self._lock:
+            if not self._loaded:
+                return
+            try:
+                await self._compact()
+                logger.debug(f"Compacted cache journal into {self._cache_file_path}")
+            except CacheError as e:
+                logger.warning(f"Cache compaction failed: {e}")
+
     async def _save_data(self, data: dict[str, Any]) -> None:
         """Save cache data to file asynchronously with atomic writes.
 
@@ -181,8 +361,8 @@ class CacheManager(CacheManagerProtocol):
                     suffix=".json",
                 )
                 try:
-                    with os.fdopen(temp_fd, "w") as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
+                    with os.fdopen(temp_fd, "wb") as f:
+                        f.write(json_codec.dumpb(data))
                     # Atomic replace
                     os.replace(temp_path, self._cache_file_path)
                 except Exception:
@@ -200,6 +380,10 @@ class CacheManager(CacheManagerProtocol):
                 operation_type="save_cache",
             ) from e
 
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+
     async def get(self, key: str) -> Any:
         """Retrieve a value from the cache.
 
@@ -209,22 +393,22 @@ class CacheManager(CacheManagerProtocol):
         Returns:
             Any: The value associated with the key, or None if not found.
         """
-        # Check if file changed
-        if await self._is_file_changed():
-            self._clear_memory()
+        async with self._lock:
+            await self._ensure_current()
+            return self._data.get(key)
 
-        # Check memory cache first
-        value = self._get_from_memory(key)
-        if value is not None:
-            return value
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Retrieve several values with a single freshness check.
 
-        # Load from file
+        Args:
+            keys (Iterable[str]): The keys to retrieve.
+
+        Returns:
+            dict[str, Any]: Mapping of the keys that were found to their values.
+        """
         async with self._lock:
-            data = await self._load_data()
-            value = data.get(key)
-            if value is not None:
-                self._put_in_memory(key, value)
-            return value
+            await self._ensure_current()
+            return {key: self._data[key] for key in keys if key in self._data}
 
     async def set(self, key: str, value: Any) -> None:
         """Store a value in the cache.
@@ -233,15 +417,22 @@ class CacheManager(CacheManagerProtocol):
             key (str): The key to store.
             value (Any): The value to store.
         """
+        await self.set_many({key: value})
+
+    async def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store several values as one batch of journal records.
+
+        Args:
+            items (Mapping[str, Any]): Keys and values to store.
+        """
+        if not items:
+            return
         async with self._lock:
-            # Check if file changed
-            if await self._is_file_changed():
-                self._clear_memory()
-            data = await self._load_data()
-            data[key] = value
-            await self._save_data(data)
-            # Update memory cache
-            self._put_in_memory(key, value)
+            await self._ensure_current()
+            self._data.update(items)
+            self._record(
+                [{"op": "set", "key": k, "value": v} for k, v in items.items()]
+            )
 
     async def delete(self, key: str) -> None:
         """Remove a key from the cache.
@@ -250,24 +441,17 @@ class CacheManager(CacheManagerProtocol):
             key (str): The key to remove.
         """
         async with self._lock:
-            # Check if file changed
-            if await self._is_file_changed():
-                self._clear_memory()
-            data = await self._load_data()
-            data.pop(key, None)
-            await self._save_data(data)
-            # Remove from memory cache
-            self._invalidate_memory(key)
+            await self._ensure_current()
+            if key in self._data:
+                del self._data[key]
+                self._record([{"op": "del", "key": key}])
 
     async def clear(self) -> None:
         """Clear all data from the cache."""
         async with self._lock:
-            # Check if file changed
-            if await self._is_file_changed():
-                self._clear_memory()
-            await self._save_data({})
-            # Clear memory cache
-            self._clear_memory()
+            await self._ensure_current()
+            self._data.clear()
+            self._record([{"op": "clear"}])
 
     async def contains(self, key: str) -> bool:
         """Check if a key exists in the cache.
@@ -278,21 +462,9 @@ class CacheManager(CacheManagerProtocol):
         Returns:
             bool: True if the key exists, False otherwise.
         """
-        # Check if file changed
-        if await self._is_file_changed():
-            self._clear_memory()
-
-        # Check memory cache first
-        if self._get_from_memory(key) is not None:
-            return True
-
-        # Check file
         async with self._lock:
-            data = await self._load_data()
-            exists = key in data
-            if exists:
-                self._put_in_memory(key, data[key])
-            return exists
+            await self._ensure_current()
+            return key in self._data
 
     async def keys(self) -> list[str]:
         """Get all keys in the cache.
@@ -301,11 +473,23 @@ class CacheManager(CacheManagerProtocol):
             list[str]: List of all keys in the cache.
         """
         async with self._lock:
-            # Check if file changed
-            if await self._is_file_changed():
-                self._clear_memory()
-            data = await self._load_data()
-            return list(data.keys())
+            await self._ensure_current()
+            return list(self._data.keys())
+
+    async def close(self) -> None:
+        """Flush buffered mutations and compact the journal into the snapshot."""
+        for task in (self._flush_task, self._compact_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._flush_task = None
+        self._compact_task = None
+        async with self._lock:
+            if self._loaded:
+                await self._compact()
 
     async def __aenter__(self):
         """Enter the async context manager.
@@ -318,7 +502,31 @@ class CacheManager(CacheManagerProtocol):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit the async context manager.
 
-        This method ensures proper cleanup of resources. Currently,
-        no specific cleanup is needed as operations are atomic.
+        Flushes the journal and compacts it into the snapshot file.
         """
-        pass
+        await self.close()
+
+
+# Shared cache managers keyed by absolute snapshot path
+_cache_managers: dict[str, CacheManager] = {}
+
+
+def get_cache_manager(cache_file_path: str) -> CacheManager:
+    """Get or create the process-wide cache manager for a cache file.
+
+    Managers treat their in-memory map as authoritative when writing the
+    journal and snapshot, so two of them on the same file would overwrite
+    each other's entries.
+
+    Args:
+        cache_file_path (str): Path to the JSON snapshot file.
+
+    Returns:
+        CacheManager: The manager for the file.
+    """
+    key = os.path.abspath(cache_file_path)
+    manager = _cache_managers.get(key)
+    if manager is None:
+        manager = CacheManager(cache_file_path)
+        _cache_managers[key] = manager
+    return manager
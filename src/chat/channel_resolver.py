@@ -7,13 +7,13 @@ for performance and graceful error handling.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
 from ..api.twitch import TwitchAPI
 from ..chat.cache_manager import CacheManager
-from ..errors.eventsub import CacheError, EventSubError
+from ..errors.eventsub import CacheError
+from .login_resolver import LoginResolver, get_login_resolver
 from .protocols import ChannelResolverProtocol
 
 logger = logging.getLogger(__name__)
@@ -27,16 +27,16 @@ class ChannelResolver(ChannelResolverProtocol):
     caching for performance and handles API failures gracefully.
 
     Features:
-    - Batch processing of multiple logins (up to Twitch API limits)
+    - Lookups merged and batched with every other bot's (see LoginResolver)
     - Local caching to reduce API calls
-    - Concurrent processing for large batches
+    - Short-lived caching of unknown logins
     - Graceful error handling with custom exceptions
     - Comprehensive logging for debugging
 
     Attributes:
         _twitch_api (TwitchAPI): The Twitch API client instance.
         _cache_manager (CacheManager): The cache manager for persistent storage.
-        _max_concurrent_batches (int): Maximum concurrent API batches.
+        _login_resolver (LoginResolver): Shared resolver that batches lookups.
 
     Example:
         >>> resolver = ChannelResolver(twitch_api, cache_manager)
@@ -51,15 +51,15 @@ class ChannelResolver(ChannelResolverProtocol):
         self,
         twitch_api: TwitchAPI,
         cache_manager: CacheManager,
-        max_concurrent_batches: int = 3,
+        login_resolver: LoginResolver | None = None,
     ) -> None:
         """Initialize the ChannelResolver.
 
         Args:
             twitch_api (TwitchAPI): The Twitch API client for user resolution.
             cache_manager (CacheManager): The cache manager for storing user IDs.
-            max_concurrent_batches (int): Maximum number of concurrent API batches.
-                                       Defaults to 3 to balance performance and rate limits.
+            login_resolver (LoginResolver | None): Resolver shared by every bot.
+                Defaults to the global one.
 
         Raises:
             ValueError: If twitch_api or cache_manager is None.
@@ -71,7 +71,7 @@ class ChannelResolver(ChannelResolverProtocol):
 
         self._twitch_api = twitch_api
         self._cache_manager = cache_manager
-        self._max_concurrent_batches = max_concurrent_batches
+        self._login_resolver = login_resolver or get_login_resolver()
 
     async def resolve_user_ids(
         self,
@@ -123,15 +123,19 @@ class ChannelResolver(ChannelResolverProtocol):
         cached_results: dict[str, str] = {}
         uncached_logins: list[str] = []
 
+        try:
+            cached = await self._cache_manager.get_many(
+                login.lower() for login in unique_logins
+            )
+        except CacheError as e:
+            logger.warning(f"Cache read failed for {len(unique_logins)} logins: {e}")
+            cached = {}
+
         for login in unique_logins:
-            try:
-                cached_id = await self._cache_manager.get(login.lower())
-                if cached_id is not None:
-                    cached_results[login.lower()] = str(cached_id)
-                else:
-                    uncached_logins.append(login)
-            except CacheError as e:
-                logger.warning(f"Cache read failed for {login}: {e}")
+            cached_id = cached.get(login.lower())
+            if cached_id is not None:
+                cached_results[login.lower()] = str(cached_id)
+            else:
                 uncached_logins.append(login)
 
         logger.debug(
@@ -144,12 +148,11 @@ class ChannelResolver(ChannelResolverProtocol):
                 uncached_logins, access_token, client_id
             )
 
-            # Cache successful results
-            for login_lower, user_id in api_results.items():
-                try:
-                    await self._cache_manager.set(login_lower, user_id)
-                except CacheError as e:
-                    logger.warning(f"Failed to cache {login_lower}: {e}")
+            # Cache successful results in one batch
+            try:
+                await self._cache_manager.set_many(api_results)
+            except CacheError as e:
+                logger.warning(f"Failed to cache {len(api_results)} resolved logins: {e}")
 
             # Merge results
             cached_results.update(api_results)
@@ -162,7 +165,10 @@ class ChannelResolver(ChannelResolverProtocol):
         access_token: str,
         client_id: str,
     ) -> dict[str, str]:
-        """Resolve logins via Twitch API with concurrent batch processing.
+        """Resolve logins through the process-wide login resolver.
+
+        Lookups are merged and batched with those of every other bot, and
+        answers (including unknown logins) are cached for a while.
 
         Args:
             logins (list[str]): List of login names to resolve.
@@ -177,66 +183,10 @@ class ChannelResolver(ChannelResolverProtocol):
         """
         if not logins:
             return {}
-
-        # Split into batches for concurrent processing
-        batch_size = 100  # Twitch API limit per request
-        batches = [
-            logins[i : i + batch_size] for i in range(0, len(logins), batch_size)
-        ]
-
-        logger.debug(f"Processing {len(batches)} batches concurrently")
-
-        # Create tasks for concurrent execution
-        tasks = [
-            self._twitch_api.get_users_by_login(
-                access_token=access_token,
-                client_id=client_id,
-                logins=batch,
-            )
-            for batch in batches
-        ]
-
-        # Limit concurrency
-        semaphore = asyncio.Semaphore(self._max_concurrent_batches)
-
-        async def _limited_task(task):
-            async with semaphore:
-                return await task
-
-        try:
-            # Execute batches concurrently with limit
-            results = await asyncio.gather(
-                *[_limited_task(task) for task in tasks],
-                return_exceptions=True,
-            )
-        except Exception as e:
-            raise EventSubError(
-                f"Failed to resolve user IDs: {e}",
-                operation_type="resolve_user_ids",
-            ) from e
-
-        # Process results
-        api_results: dict[str, str] = {}
-        failed_batches = 0
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Batch {i} failed: {result}")
-                failed_batches += 1
-                continue
-            elif isinstance(result, dict):
-                api_results.update(result)
-            else:
-                logger.warning(f"Unexpected result type from batch {i}: {type(result)}")
-
-        logger.debug(f"Resolved {len(api_results)} users via API")
-
-        # If all batches failed, raise error
-        if failed_batches == len(batches) and logins:
-            raise EventSubError(
-                f"All {failed_batches} API batches failed to resolve {len(logins)} logins",
-                operation_type="resolve_user_ids",
-            )
-
+        api_results = await self._login_resolver.resolve(
+            self._twitch_api, logins, access_token, client_id
+        )
+        logger.debug(f"Resolved {len(api_results)}/{len(logins)} users via API")
         return api_results
 
     async def invalidate_cache(self, login: str) -> None:
@@ -248,6 +198,7 @@ class ChannelResolver(ChannelResolverProtocol):
         Raises:
             CacheError: If cache deletion fails.
         """
+        self._login_resolver.forget(login)
         try:
             await self._cache_manager.delete(login.lower())
             logger.debug(f"Invalidated cache for {login}")
@@ -263,6 +214,7 @@ class ChannelResolver(ChannelResolverProtocol):
         Raises:
             CacheError: If cache clearing fails.
         """
+        self._login_resolver.clear()
         try:
             await self._cache_manager.clear()
             logger.debug("Cleared all user ID cache")
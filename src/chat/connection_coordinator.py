@@ -5,11 +5,13 @@ import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ..chat.cache_manager import CacheManager
+from ..chat.cache_manager import get_cache_manager
 from ..chat.channel_resolver import ChannelResolver
 from ..chat.message_processor import MessageProcessor
 from ..chat.token_manager import TokenManager
 from ..chat.websocket_connection_manager import WebSocketConnectionManager
+from ..constants import EVENTSUB_SHARED_SESSIONS
+from .eventsub_session_pool import get_session_pool
 
 if TYPE_CHECKING:
     from .eventsub_backend import EventSubChatBackend
@@ -37,7 +39,7 @@ class ConnectionCoordinator:
                 cache_path = Path("broadcaster_ids.cache.json").resolve()
                 logging.debug(f"Using default cache path: {cache_path}")
 
-            self.backend._cache_manager = CacheManager(str(cache_path))
+            self.backend._cache_manager = get_cache_manager(str(cache_path))
 
         if self.backend._channel_resolver is None:
             self.backend._channel_resolver = ChannelResolver(self.backend._api, self.backend._cache_manager)
@@ -63,8 +65,17 @@ class ConnectionCoordinator:
             self.backend._token_manager.set_invalid_callback(self.backend._on_token_invalid)
 
         if self.backend._ws_manager is None and token and client_id:
+            if EVENTSUB_SHARED_SESSIONS and self.backend._user_id:
+                pool = get_session_pool(self.backend._session, client_id)
+                lease = pool.lease(
+                    self.backend._user_id, token, self.backend._expected_channels
+                )
+                lease.on_handover = self.backend._on_session_handover
+                self.backend._ws_manager = lease
+                return
             self.backend._ws_manager = WebSocketConnectionManager(
                 session=self.backend._session,
                 token=token,
                 client_id=client_id,
+                breaker_owner=self.backend._user_id or self.backend._username,
             )
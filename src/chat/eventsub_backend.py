@@ -3,22 +3,23 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from typing import Any, cast
 
 import aiohttp
 
+from ..api.transport import get_http_session
 from ..api.twitch import TwitchAPI
 from ..chat.cache_manager import CacheManager
 from ..chat.channel_resolver import ChannelResolver
 from ..chat.connection_coordinator import ConnectionCoordinator
 from ..chat.message_coordinator import MessageCoordinator
 from ..chat.message_processor import MessageProcessor
+from ..chat.protocols import WebSocketConnectionManagerProtocol
 from ..chat.reconnection_coordinator import ReconnectionCoordinator
 from ..chat.subscription_coordinator import SubscriptionCoordinator
 from ..chat.subscription_manager import SubscriptionManager
 from ..chat.token_manager import TokenManager
-from ..chat.websocket_connection_manager import WebSocketConnectionManager
 from ..constants import (
     EVENTSUB_SUB_CHECK_INTERVAL_SECONDS,
 )
@@ -39,7 +40,7 @@ class EventSubChatBackend:
     Attributes:
         _session (aiohttp.ClientSession): HTTP session for API calls.
         _api (TwitchAPI): Twitch API client instance.
-        _ws_manager (WebSocketConnectionManager): Manages WebSocket connections.
+        _ws_manager (WebSocketConnectionManagerProtocol): Manages WebSocket connections.
         _sub_manager (SubscriptionManager): Manages EventSub subscriptions.
         _msg_processor (MessageProcessor): Processes incoming messages.
         _channel_resolver (ChannelResolver): Resolves user IDs with caching.
@@ -53,9 +54,11 @@ class EventSubChatBackend:
         _user_id (str | None): Bot user ID.
         _primary_channel (str | None): Primary channel login.
         _channels (list[str]): List of joined channels.
+        _expected_channels (int): Subscription slots to reserve in shared mode.
         _stop_event (asyncio.Event): Event to signal shutdown.
         _reconnect_requested (bool): Flag for reconnect request.
         _last_activity (float): Timestamp of last WebSocket activity.
+        _last_chat_activity (float | None): Timestamp of the user's last chat message.
         _next_sub_check (float): Next subscription verification time.
         _stale_threshold (float): Threshold for stale connection.
     """
@@ -63,28 +66,29 @@ class EventSubChatBackend:
     def __init__(
         self,
         http_session: aiohttp.ClientSession | None = None,
-        ws_manager: WebSocketConnectionManager | None = None,
+        ws_manager: WebSocketConnectionManagerProtocol | None = None,
         sub_manager: SubscriptionManager | None = None,
         msg_processor: MessageProcessor | None = None,
         channel_resolver: ChannelResolver | None = None,
         token_manager: TokenManager | None = None,
         cache_manager: CacheManager | None = None,
+        expected_channels: int = 1,
     ) -> None:
         """Initialize the EventSub chat backend with dependency injection.
 
         Args:
             http_session (aiohttp.ClientSession | None): Optional HTTP session.
-            ws_manager (WebSocketConnectionManager | None): WebSocket manager instance.
+            ws_manager (WebSocketConnectionManagerProtocol | None): WebSocket manager
+                instance or shared session lease.
             sub_manager (SubscriptionManager | None): Subscription manager instance.
             msg_processor (MessageProcessor | None): Message processor instance.
             channel_resolver (ChannelResolver | None): Channel resolver instance.
             token_manager (TokenManager | None): Token manager instance.
             cache_manager (CacheManager | None): Cache manager instance.
+            expected_channels (int): Channels the bot will join; sizes the
+                subscription reservation when sharing a pooled session.
         """
-        # Configure timeouts for reliability: total 30s, connect 10s, read 20s
-        # Balances responsiveness with resilience for unattended operation
-        timeout = aiohttp.ClientTimeout(total=30.0, connect=10.0, sock_read=20.0, sock_connect=10.0)
-        self._session = http_session or aiohttp.ClientSession(timeout=timeout)
+        self._session = http_session or get_http_session()
         self._api = TwitchAPI(self._session)
 
         # Injected components (will be created if not provided)
@@ -109,6 +113,7 @@ class EventSubChatBackend:
 
         # Channel bookkeeping
         self._channels: list[str] = []
+        self._expected_channels = max(1, expected_channels)
 
         # Async runtime primitives
         self._stop_event = asyncio.Event()
@@ -116,6 +121,7 @@ class EventSubChatBackend:
 
         # Activity tracking
         self._last_activity = time.monotonic()
+        self._last_chat_activity: float | None = None
         self._next_sub_check = self._last_activity + EVENTSUB_SUB_CHECK_INTERVAL_SECONDS
         self._stale_threshold = 45.0  # 45 seconds for faster detection
 
@@ -145,14 +151,15 @@ class EventSubChatBackend:
 
     async def _cleanup_components(self) -> None:
         """Cleanup all components."""
+        if self._reconnection_coordinator:
+            await self._reconnection_coordinator.cancel_handover()
         if self._ws_manager:
             await self._ws_manager.disconnect()
         if self._sub_manager:
             await self._sub_manager.unsubscribe_all()
         if self._cache_manager:
-            pass  # CacheManager handles its own cleanup
-        if self._session and not self._session.closed:
-            await self._session.close()
+            await self._cache_manager.close()
+        # The HTTP session is shared with other bots and closed by its owner
 
     def _set_credentials(
         self,
@@ -172,10 +179,19 @@ class EventSubChatBackend:
         self._client_secret = client_secret
         self._channels = [self._primary_channel]
 
-    async def _validate_token(self, token: str) -> bool:
-        """Validate token and update scopes."""
+    async def _validate_token(
+        self, token: str, scopes: Collection[str] | None = None
+    ) -> bool:
+        """Validate token and update scopes.
+
+        Scopes already validated for this token are recorded without a request.
+        """
         if not self._token_manager:
             return True
+        if scopes is not None:
+            self._token_manager.recorded_scopes = {s.lower() for s in scopes}
+            self._scopes = self._token_manager.get_scopes()
+            return True
         if not await self._token_manager.validate_token(token):
             return False
         self._scopes = self._token_manager.get_scopes()
@@ -230,6 +246,7 @@ class EventSubChatBackend:
         user_id: str | None,
         client_id: str | None,
         client_secret: str | None = None,
+        scopes: Collection[str] | None = None,
     ) -> bool:
         """Connect to Twitch EventSub WebSocket and subscribe to chat messages.
 
@@ -240,6 +257,8 @@ class EventSubChatBackend:
             user_id (str | None): Bot user ID, if known.
             client_id (str | None): Twitch client ID.
             client_secret (str | None): Client secret (currently unused).
+            scopes (Collection[str] | None): Scopes already validated for
+                ``token``; skips validating it again.
 
         Returns:
             bool: True if connection and subscription successful, False otherwise.
@@ -264,7 +283,7 @@ class EventSubChatBackend:
                     self._token, self._client_id, self._client_secret, self._username
                 )
 
-            if not await self._validate_token(token):
+            if not await self._validate_token(token, scopes):
                 return False
 
             user_ids = await self._resolve_channels(token, client_id or "")
@@ -286,7 +305,7 @@ class EventSubChatBackend:
 
 
     async def listen(self) -> None:
-        """Listen for WebSocket messages and handle them with idle optimization."""
+        """Listen for WebSocket messages and dispatch them until stopped."""
         if self._message_coordinator:
             await self._message_coordinator.listen()
 
@@ -441,6 +460,15 @@ class EventSubChatBackend:
 
 
 
+    def _on_session_handover(self, session_id: str) -> None:
+        """Callback invoked after a shared session was handed over.
+
+        Args:
+            session_id (str): EventSub session ID now carrying the subscriptions.
+        """
+        if self._sub_manager:
+            self._sub_manager.adopt_session_id(session_id)
+
     async def _on_token_invalid(self) -> None:
         """Callback invoked when token is detected as invalid."""
         logging.error(f"Token invalidated for user {self._username}")
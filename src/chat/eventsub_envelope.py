@@ -0,0 +1,240 @@
+"""Typed EventSub message envelope produced by a single decode stage.
+
+Every EventSub WebSocket frame is decoded exactly once into an
+:class:`EventSubEnvelope`. Downstream stages (message coordinator, message
+processor, reconnect handling and the bot handler) read the envelope's
+attributes instead of re-parsing the raw JSON.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..errors.eventsub import MessageProcessingError
+from ..utils import json_codec
+
+# EventSub message types
+EVENTSUB_NOTIFICATION = "notification"
+EVENTSUB_SESSION_WELCOME = "session_welcome"
+EVENTSUB_SESSION_KEEPALIVE = "session_keepalive"
+EVENTSUB_SESSION_RECONNECT = "session_reconnect"
+EVENTSUB_REVOCATION = "revocation"
+EVENTSUB_CHAT_MESSAGE = "channel.chat.message"
+
+# Raw-frame probes used by peek_chatter_user_id. Quotes inside JSON string
+# values are always escaped, so these can only match real object keys.
+_MESSAGE_TYPE_PATTERN = re.compile(r'"message_type"\s*:\s*"([a-z_]+)"')
+_CHATTER_ID_PATTERN = re.compile(r'"chatter_user_id"\s*:\s*"([^"]*)"')
+_MESSAGE_TYPE_PATTERN_BYTES = re.compile(_MESSAGE_TYPE_PATTERN.pattern.encode())
+_CHATTER_ID_PATTERN_BYTES = re.compile(_CHATTER_ID_PATTERN.pattern.encode())
+
+
+@dataclass(frozen=True, slots=True)
+class ChatEvent:
+    """Represents a parsed chat message event from EventSub.
+
+    Attributes:
+        chatter_user_name (str): The username of the user who sent the message.
+        broadcaster_user_name (str): The username of the channel broadcaster.
+        message_text (str): The text content of the message.
+        chatter_user_id (str): The user ID of the sender, if present.
+        broadcaster_user_id (str): The user ID of the broadcaster, if present.
+    """
+
+    chatter_user_name: str
+    broadcaster_user_name: str
+    message_text: str
+    chatter_user_id: str = ""
+    broadcaster_user_id: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class EventSubEnvelope:
+    """Decoded EventSub WebSocket frame.
+
+    Attributes:
+        message_type (str): Metadata message type (e.g. ``notification``).
+        message_id (str | None): Metadata message ID.
+        message_timestamp (str | None): Metadata message timestamp (RFC3339).
+        subscription_type (str | None): Subscription type for notifications.
+        payload (dict[str, Any]): Decoded payload object.
+        event (ChatEvent | None): Typed chat event for chat notifications.
+        raw (str): Original frame text, kept for logging.
+    """
+
+    message_type: str
+    message_id: str | None = None
+    message_timestamp: str | None = None
+    subscription_type: str | None = None
+    payload: dict[str, Any] = field(default_factory=dict)
+    event: ChatEvent | None = None
+    raw: str = ""
+
+    @property
+    def is_notification(self) -> bool:
+        """Whether this frame is a notification."""
+        return self.message_type == EVENTSUB_NOTIFICATION
+
+    @property
+    def session_id(self) -> str | None:
+        """Session ID carried by welcome/reconnect frames."""
+        session = self.payload.get("session")
+        return session.get("id") if isinstance(session, dict) else None
+
+    @property
+    def reconnect_url(self) -> str | None:
+        """Reconnect URL carried by session_reconnect frames."""
+        session = self.payload.get("session")
+        return session.get("reconnect_url") if isinstance(session, dict) else None
+
+    @property
+    def condition_user_id(self) -> str | None:
+        """``subscription.condition.user_id`` of the frame, if any."""
+        subscription = self.payload.get("subscription")
+        if not isinstance(subscription, dict):
+            return None
+        condition = subscription.get("condition")
+        if not isinstance(condition, dict):
+            return None
+        user_id = condition.get("user_id")
+        return str(user_id) if user_id else None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], raw: str = "") -> EventSubEnvelope:
+        """Build an envelope from an already decoded frame.
+
+        Args:
+            data: Decoded frame object.
+            raw: Original frame text.
+
+        Returns:
+            The typed envelope.
+        """
+        metadata = data.get("metadata")
+        if not isinstance(metadata, dict):
+            metadata = {}
+        payload = data.get("payload")
+        if not isinstance(payload, dict):
+            payload = {}
+        subscription = payload.get("subscription")
+        subscription_type = (
+            subscription.get("type") if isinstance(subscription, dict) else None
+        )
+        # Simplified frames (tests, local tooling) carry the type at top level
+        message_type = metadata.get("message_type") or data.get("type") or ""
+        event = None
+        if (
+            message_type == EVENTSUB_NOTIFICATION
+            and subscription_type == EVENTSUB_CHAT_MESSAGE
+        ):
+            event = parse_chat_event(payload)
+        return cls(
+            message_type=str(message_type),
+            message_id=metadata.get("message_id"),
+            message_timestamp=metadata.get("message_timestamp"),
+            subscription_type=subscription_type,
+            payload=payload,
+            event=event,
+            raw=raw,
+        )
+
+
+def parse_chat_event(payload: dict[str, Any]) -> ChatEvent | None:
+    """Extract a ChatEvent from a ``channel.chat.message`` payload.
+
+    Args:
+        payload: The notification payload object.
+
+    Returns:
+        A ChatEvent if all required fields are present, None otherwise.
+    """
+    event = payload.get("event")
+    if not isinstance(event, dict):
+        return None
+    chatter_user_name = event.get("chatter_user_name")
+    broadcaster_user_name = event.get("broadcaster_user_name")
+    message_obj = event.get("message")
+    if not isinstance(message_obj, dict):
+        return None
+    message_text = message_obj.get("text")
+    if not (
+        isinstance(chatter_user_name, str)
+        and isinstance(broadcaster_user_name, str)
+        and isinstance(message_text, str)
+    ):
+        logging.warning("EventSub chat event missing required string fields")
+        return None
+    return ChatEvent(
+        chatter_user_name=chatter_user_name,
+        broadcaster_user_name=broadcaster_user_name,
+        message_text=message_text,
+        chatter_user_id=str(event.get("chatter_user_id") or ""),
+        broadcaster_user_id=str(event.get("broadcaster_user_id") or ""),
+    )
+
+
+def peek_chatter_user_id(raw: str | bytes) -> str | None:
+    """Read the sender of a chat message frame without decoding it.
+
+    Lets receive paths drop other chatters' messages before paying for the
+    JSON decode. Only ``channel.chat.message`` notifications yield an ID;
+    control frames (``session_*``, ``revocation``) and anything the probe
+    does not recognise return None and must be decoded normally.
+
+    Args:
+        raw: The raw frame received from the WebSocket.
+
+    Returns:
+        str | None: ``event.chatter_user_id`` of a chat notification, or None.
+    """
+    if isinstance(raw, bytes):
+        return _peek_chatter_user_id_bytes(raw)
+    if not isinstance(raw, str) or EVENTSUB_CHAT_MESSAGE not in raw:
+        return None
+    message_type = _MESSAGE_TYPE_PATTERN.search(raw)
+    if message_type is None or message_type.group(1) != EVENTSUB_NOTIFICATION:
+        return None
+    chatter = _CHATTER_ID_PATTERN.search(raw)
+    return chatter.group(1) if chatter else None
+
+
+def _peek_chatter_user_id_bytes(raw: bytes) -> str | None:
+    """Bytes variant of :func:`peek_chatter_user_id`."""
+    if EVENTSUB_CHAT_MESSAGE.encode() not in raw:
+        return None
+    message_type = _MESSAGE_TYPE_PATTERN_BYTES.search(raw)
+    if message_type is None or message_type.group(1) != EVENTSUB_NOTIFICATION.encode():
+        return None
+    chatter = _CHATTER_ID_PATTERN_BYTES.search(raw)
+    return chatter.group(1).decode("utf-8", "replace") if chatter else None
+
+
+def decode_envelope(raw: str | bytes) -> EventSubEnvelope:
+    """Decode a raw EventSub frame into a typed envelope.
+
+    Args:
+        raw: The raw frame received from the WebSocket.
+
+    Returns:
+        The decoded envelope.
+
+    Raises:
+        MessageProcessingError: If the frame is not a JSON object.
+    """
+    try:
+        data = json_codec.loads(raw)
+    except (json_codec.JSONDecodeError, TypeError) as e:
+        raise MessageProcessingError(
+            f"EventSub message contains invalid JSON: {str(e)}",
+            operation_type="parse_json",
+        ) from e
+    if not isinstance(data, dict):
+        raise MessageProcessingError(
+            "EventSub message is not a JSON object",
+            operation_type="parse_json",
+        )
+    text = raw.decode("utf-8", "replace") if isinstance(raw, bytes) else raw
+    return EventSubEnvelope.from_dict(data, text)
@@ -0,0 +1,603 @@
+"""Shared EventSub WebSocket session pool.
+
+Bots that share a Twitch application ``client_id`` can attach to a small set of
+EventSub WebSocket sessions instead of each opening its own socket. Every
+pooled session runs a single reader task that routes notifications to the
+owning bot by ``subscription.condition.user_id`` (falling back to
+``chatter_user_id``/``broadcaster_user_id``), broadcasts keepalives, and
+handles ``session_reconnect`` once for all attached bots.
+
+Each bot receives a :class:`SessionLease`, a drop-in replacement for
+``WebSocketConnectionManager`` as far as ``EventSubChatBackend`` and its
+coordinators are concerned.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ..constants import (
+    EVENTSUB_MAX_SUBSCRIPTIONS_PER_SESSION,
+    WEBSOCKET_MESSAGE_TIMEOUT_SECONDS,
+)
+from ..errors.eventsub import (
+    EventSubConnectionError,
+    MessageProcessingError,
+    SessionReplacedError,
+)
+from .connection_state_manager import ConnectionStateManager
+from .eventsub_envelope import (
+    EVENTSUB_SESSION_KEEPALIVE,
+    EVENTSUB_SESSION_RECONNECT,
+    EventSubEnvelope,
+    decode_envelope,
+    peek_chatter_user_id,
+)
+from .message_transceiver import WSMessage
+from .websocket_connection_manager import WebSocketConnectionManager
+
+
+class PooledSession:
+    """One shared EventSub WebSocket session and its attached leases.
+
+    Attributes:
+        manager (WebSocketConnectionManager): Underlying connection manager.
+        leases (dict[str, SessionLease]): Attached leases keyed by user ID.
+        generation (int): Incremented after every successful (re)connect.
+    """
+
+    def __init__(self, manager: WebSocketConnectionManager) -> None:
+        """Initialize the pooled session.
+
+        Args:
+            manager (WebSocketConnectionManager): Connection manager to share.
+        """
+        self.manager = manager
+        self.leases: dict[str, SessionLease] = {}
+        self.generation = 0
+        self._reader_task: asyncio.Task[None] | None = None
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def reserved_slots(self) -> int:
+        """Total subscription slots reserved by attached leases."""
+        return sum(lease.slots for lease in self.leases.values())
+
+    def has_capacity(self, slots: int, cap: int) -> bool:
+        """Check whether the session can accept another lease.
+
+        Args:
+            slots (int): Subscription slots the new lease needs.
+            cap (int): Maximum subscriptions allowed per session.
+
+        Returns:
+            bool: True if the reservation fits under the cap.
+        """
+        return self.reserved_slots + slots <= cap
+
+    async def ensure_connected(self) -> None:
+        """Connect the shared socket once and start the reader task.
+
+        Raises:
+            EventSubConnectionError: If the connection fails.
+        """
+        async with self._connect_lock:
+            if self.manager.is_connected and self._reader_running():
+                return
+            if not self.manager.is_connected:
+                await self.manager.connect()
+                self.generation += 1
+            self._start_reader()
+
+    async def reconnect(self, seen_generation: int) -> bool:
+        """Reconnect the shared socket once for all attached leases.
+
+        Leases that observed an older generation than the current one are
+        satisfied by a reconnect another lease already performed. The new
+        socket starts without subscriptions, so every attached lease is told
+        to resubscribe.
+
+        Args:
+            seen_generation (int): Generation the calling lease last saw.
+
+        Returns:
+            bool: True if the session is connected afterwards.
+        """
+        async with self._connect_lock:
+            if self.generation > seen_generation and self.manager.is_connected:
+                return True
+            await self._stop_reader()
+            success = await self.manager.reconnect()
+            if success:
+                self.generation += 1
+                self._start_reader()
+                self._announce_generation()
+            return success
+
+    async def handover(self, reconnect_url: str) -> bool:
+        """Swap the shared socket for a session_reconnect URL.
+
+        The reader keeps running throughout; subscriptions carry over, so
+        attached leases only adopt the new session ID.
+
+        Args:
+            reconnect_url (str): URL from the session_reconnect payload.
+
+        Returns:
+            bool: True if the new socket is live.
+        """
+        async with self._connect_lock:
+            success = await self.manager.handover(reconnect_url)
+            session_id = self.manager.session_id
+            if success and session_id:
+                for lease in list(self.leases.values()):
+                    lease.adopt_session_id(session_id)
+            return success
+
+    async def close(self) -> None:
+        """Stop the reader task and close the shared socket."""
+        await self._stop_reader()
+        await self.manager.disconnect()
+
+    def _reader_running(self) -> bool:
+        return self._reader_task is not None and not self._reader_task.done()
+
+    def _start_reader(self) -> None:
+        if not self._reader_running():
+            self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def _stop_reader(self) -> None:
+        task = self._reader_task
+        self._reader_task = None
+        if task is None or task.done() or task is asyncio.current_task():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _read_loop(self) -> None:
+        """Read frames from the shared socket and route them to leases."""
+        while True:
+            try:
+                msg = await self.manager.receive_message()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if isinstance(e, EventSubConnectionError) and "timeout" in str(e).lower():
+                    # Leases apply their own receive timeouts and stale detection
+                    continue
+                logging.warning(f"⚠️ Shared EventSub session read failed: {str(e)}")
+                self._fail_all(e)
+                return
+            await self.route(msg)
+
+    async def route(self, msg: WSMessage) -> None:
+        """Route a single frame to the lease(s) it belongs to.
+
+        Args:
+            msg (WSMessage): Frame received from the shared socket.
+        """
+        if msg.type != "text":
+            return
+        chatter_user_id = peek_chatter_user_id(msg.data)
+        if chatter_user_id is not None and chatter_user_id not in self.leases:
+            # Bots only react to their own chat messages
+            return
+        try:
+            envelope = decode_envelope(msg.data)
+        except MessageProcessingError:
+            logging.warning(f"Failed to parse shared WebSocket message: {msg.data}")
+            return
+        routed = WSMessage(msg.type, msg.data, envelope)
+        if envelope.message_type == EVENTSUB_SESSION_KEEPALIVE:
+            for lease in list(self.leases.values()):
+                lease.deliver(routed)
+            return
+        if envelope.message_type == EVENTSUB_SESSION_RECONNECT:
+            asyncio.create_task(self._migrate(envelope))
+            return
+        target = self._lease_for(envelope)
+        if target is None:
+            logging.debug("🔀 Dropping EventSub frame with no matching lease")
+            return
+        target.deliver(routed)
+
+    def _lease_for(self, envelope: EventSubEnvelope) -> SessionLease | None:
+        lease = self.leases.get(envelope.condition_user_id or "")
+        if lease is not None:
+            return lease
+        event = envelope.payload.get("event")
+        if isinstance(event, dict):
+            for key in ("chatter_user_id", "broadcaster_user_id"):
+                lease = self.leases.get(str(event.get(key, "")))
+                if lease is not None:
+                    return lease
+        return None
+
+    async def _migrate(self, envelope: EventSubEnvelope) -> None:
+        """Follow a Twitch-initiated session_reconnect for every lease.
+
+        Subscriptions migrate with the session, so leases only need the
+        socket swapped underneath them.
+        """
+        reconnect_url = envelope.reconnect_url
+        if not reconnect_url:
+            logging.error("Session reconnect message missing reconnect_url")
+            return
+        logging.info(f"🔀 Migrating shared EventSub session leases={len(self.leases)}")
+        if await self.handover(reconnect_url):
+            return
+        self.manager.update_url(reconnect_url)
+        if not await self.reconnect(self.generation):
+            self._fail_all(
+                EventSubConnectionError(
+                    "Shared session migration failed", operation_type="reconnect"
+                )
+            )
+
+    def _fail_all(self, error: Exception) -> None:
+        for lease in list(self.leases.values()):
+            lease.fail(error)
+
+    def _announce_generation(self) -> None:
+        """Tell every lease the socket was replaced and needs resubscribing."""
+        for lease in list(self.leases.values()):
+            lease.fail(SessionReplacedError(self.generation))
+
+
+class SessionLease:
+    """Per-bot view of a pooled EventSub session.
+
+    Implements the subset of ``WebSocketConnectionManager`` used by
+    ``EventSubChatBackend`` so the backend and its coordinators do not need to
+    know whether their socket is shared.
+
+    Attributes:
+        user_id (str): Bot user ID used for routing.
+        token (str): Bot access token (kept for handshake refreshes).
+        slots (int): Subscription slots reserved on the session.
+        on_handover (Callable[[str], None] | None): Called with the new
+            session ID after the shared session was handed over.
+    """
+
+    def __init__(self, pool: EventSubSessionPool, user_id: str, token: str, slots: int) -> None:
+        """Initialize the lease.
+
+        Args:
+            pool (EventSubSessionPool): Pool that owns the shared sessions.
+            user_id (str): Bot user ID used for routing.
+            token (str): Bot access token.
+            slots (int): Subscription slots to reserve.
+        """
+        self.pool = pool
+        self.user_id = user_id
+        self.token = token
+        self.slots = max(1, slots)
+        self._session: PooledSession | None = None
+        self.on_handover: Callable[[str], None] | None = None
+        self._generation = 0
+        self._queue: asyncio.Queue[WSMessage | Exception] = asyncio.Queue()
+
+    async def __aenter__(self) -> SessionLease:
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit with cleanup."""
+        await self.disconnect()
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the shared session is connected."""
+        return self._session is not None and self._session.manager.is_connected
+
+    @property
+    def session_id(self) -> str | None:
+        """Get the shared session ID."""
+        return self._session.manager.session_id if self._session else None
+
+    @property
+    def state_manager(self) -> ConnectionStateManager | None:
+        """Expose the shared session state for health bookkeeping."""
+        return self._session.manager.state_manager if self._session else None
+
+    def is_healthy(self) -> bool:
+        """Check if the shared session is healthy."""
+        return self._session is not None and self._session.manager.is_healthy()
+
+    async def connect(self) -> None:
+        """Attach to a pooled session, connecting it if needed.
+
+        Raises:
+            EventSubConnectionError: If no session could be connected.
+        """
+        if self._session is None:
+            self._session = await self.pool.attach(self)
+        await self._session.ensure_connected()
+        self._generation = self._session.generation
+
+    async def disconnect(self) -> None:
+        """Detach from the pooled session."""
+        if self._session is not None:
+            await self.pool.detach(self)
+            self._session = None
+
+    async def reconnect(self) -> bool:
+        """Reconnect the shared session (single-flight across leases).
+
+        Returns:
+            bool: True if the session is connected afterwards.
+        """
+        if self._session is None:
+            await self.connect()
+            return self.is_connected
+        self._drain()
+        success = await self._session.reconnect(self._generation)
+        if success:
+            self._generation = self._session.generation
+        return success
+
+    async def handover(self, reconnect_url: str) -> bool:
+        """Hand the shared session over to a session_reconnect URL.
+
+        Args:
+            reconnect_url (str): URL from the session_reconnect payload.
+
+        Returns:
+            bool: True if the shared socket is live on the new URL.
+        """
+        if self._session is None:
+            return False
+        return await self._session.handover(reconnect_url)
+
+    def update_url(self, new_url: str) -> None:
+        """Update the WebSocket URL of the shared session.
+
+        Args:
+            new_url (str): The new WebSocket URL to use.
+        """
+        if self._session:
+            self._session.manager.update_url(new_url)
+
+    def update_access_token(self, new_token: str) -> None:
+        """Record a refreshed token without forcing a shared reconnect.
+
+        Args:
+            new_token (str): The new access token.
+        """
+        if not new_token:
+            return
+        self.token = new_token
+        if self._session and self._session.manager.connector.token != new_token:
+            # Only the handshake uses it; next reconnect picks it up
+            self._session.manager.connector.token = new_token
+
+    async def send_json(self, data: dict[str, Any]) -> None:
+        """Send JSON data over the shared socket.
+
+        Args:
+            data (dict[str, Any]): Data to send as JSON.
+        """
+        if self._session is None:
+            raise EventSubConnectionError("WebSocket not connected", operation_type="send")
+        await self._session.manager.send_json(data)
+
+    async def receive_message(self) -> WSMessage:
+        """Receive the next frame routed to this lease.
+
+        Returns:
+            WSMessage: Routed message.
+
+        Raises:
+            EventSubConnectionError: On receive timeout or shared socket failure.
+        """
+        while True:
+            try:
+                item = await asyncio.wait_for(
+                    self._queue.get(), timeout=WEBSOCKET_MESSAGE_TIMEOUT_SECONDS
+                )
+            except TimeoutError:
+                raise EventSubConnectionError(
+                    "WebSocket receive timeout", operation_type="receive"
+                ) from TimeoutError()
+            if not (
+                isinstance(item, SessionReplacedError)
+                and item.generation <= self._generation
+            ):
+                break
+        if isinstance(item, Exception):
+            if isinstance(item, EventSubConnectionError):
+                raise item
+            raise EventSubConnectionError(
+                f"WebSocket receive failed: {str(item)}", operation_type="receive"
+            ) from item
+        return item
+
+    def deliver(self, msg: WSMessage) -> None:
+        """Queue a routed frame for this lease.
+
+        Args:
+            msg (WSMessage): Frame to deliver.
+        """
+        if self._session is not None:
+            self._session.manager.state_manager.last_activity[0] = time.monotonic()
+        self._queue.put_nowait(msg)
+
+    def fail(self, error: Exception) -> None:
+        """Surface a shared socket failure to the lease's listen loop.
+
+        Args:
+            error (Exception): Failure to raise from ``receive_message``.
+        """
+        self._queue.put_nowait(error)
+
+    def adopt_session_id(self, session_id: str) -> None:
+        """Carry this lease over to a handed-over session.
+
+        Args:
+            session_id (str): Session ID the shared socket now uses.
+        """
+        if self._session is not None:
+            self._session.manager.state_manager.last_activity[0] = time.monotonic()
+        if self.on_handover is not None:
+            try:
+                self.on_handover(session_id)
+            except Exception as e:
+                logging.error(f"Failed to adopt handed-over session for user {self.user_id}: {str(e)}")
+
+    def _drain(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+
+class EventSubSessionPool:
+    """Pool of shared EventSub sessions for one ``client_id``.
+
+    Attributes:
+        client_id (str): Twitch application client ID.
+        max_subscriptions (int): Per-session subscription cap.
+        sessions (list[PooledSession]): Currently open pooled sessions.
+    """
+
+    def __init__(
+        self,
+        http_session: Any,
+        client_id: str,
+        max_subscriptions: int = EVENTSUB_MAX_SUBSCRIPTIONS_PER_SESSION,
+        ws_url: str | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            http_session (aiohttp.ClientSession): HTTP session for connections.
+            client_id (str): Twitch application client ID.
+            max_subscriptions (int): Per-session subscription cap.
+            ws_url (str | None): Initial WebSocket URL for new sessions; None
+                uses the configured EventSub endpoint.
+        """
+        self.http_session = http_session
+        self.client_id = client_id
+        self.max_subscriptions = max_subscriptions
+        self.ws_url = ws_url
+        self.sessions: list[PooledSession] = []
+        self._lock = asyncio.Lock()
+
+    def lease(self, user_id: str, token: str, slots: int = 1) -> SessionLease:
+        """Create an unattached lease for a bot.
+
+        Args:
+            user_id (str): Bot user ID used for routing.
+            token (str): Bot access token.
+            slots (int): Subscription slots to reserve.
+
+        Returns:
+            SessionLease: Lease that attaches on ``connect()``.
+        """
+        return SessionLease(self, user_id, token, slots)
+
+    async def attach(self, lease: SessionLease) -> PooledSession:
+        """Assign a lease to a session with spare capacity.
+
+        Args:
+            lease (SessionLease): Lease to attach.
+
+        Returns:
+            PooledSession: Session the lease was attached to.
+        """
+        async with self._lock:
+            for session in self.sessions:
+                if lease.user_id in session.leases:
+                    session.leases[lease.user_id] = lease
+                    return session
+            for session in self.sessions:
+                if session.has_capacity(lease.slots, self.max_subscriptions):
+                    session.leases[lease.user_id] = lease
+                    return session
+            manager = WebSocketConnectionManager(
+                session=self.http_session,
+                token=lease.token,
+                client_id=self.client_id,
+                ws_url=self.ws_url,
+                breaker_owner=f"pool-{self.client_id}",
+            )
+            session = PooledSession(manager)
+            session.leases[lease.user_id] = lease
+            self.sessions.append(session)
+            logging.info(
+                f"🔀 Opened shared EventSub session #{len(self.sessions)} client_id={self.client_id}"
+            )
+            return session
+
+    async def detach(self, lease: SessionLease) -> None:
+        """Remove a lease and close its session once nobody uses it.
+
+        Args:
+            lease (SessionLease): Lease to detach.
+        """
+        async with self._lock:
+            session = lease._session  # noqa: SLF001
+            if session is None or session.leases.get(lease.user_id) is not lease:
+                return
+            del session.leases[lease.user_id]
+            if session.leases:
+                return
+            self.sessions.remove(session)
+        await session.close()
+        logging.info(f"🔀 Closed idle shared EventSub session client_id={self.client_id}")
+
+    async def close(self) -> None:
+        """Close every pooled session."""
+        async with self._lock:
+            sessions = self.sessions
+            self.sessions = []
+        for session in sessions:
+            await session.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Get pool occupancy for monitoring.
+
+        Returns:
+            dict[str, Any]: Session count, lease count and reserved slots.
+        """
+        return {
+            "client_id": self.client_id,
+            "sessions": len(self.sessions),
+            "leases": sum(len(s.leases) for s in self.sessions),
+            "reserved_slots": [s.reserved_slots for s in self.sessions],
+        }
+
+
+# Global pool registry keyed by client_id
+_session_pools: dict[str, EventSubSessionPool] = {}
+
+
+def get_session_pool(http_session: Any, client_id: str) -> EventSubSessionPool:
+    """Get or create the shared session pool for a client ID.
+
+    Args:
+        http_session (aiohttp.ClientSession): HTTP session for connections.
+        client_id (str): Twitch application client ID.
+
+    Returns:
+        EventSubSessionPool: The pool for the client ID.
+    """
+    pool = _session_pools.get(client_id)
+    if pool is None:
+        pool = EventSubSessionPool(http_session, client_id)
+        _session_pools[client_id] = pool
+    return pool
+
+
+async def close_session_pools() -> None:
+    """Close and forget every shared session pool."""
+    pools = list(_session_pools.values())
+    _session_pools.clear()
+    for pool in pools:
+        await pool.close()
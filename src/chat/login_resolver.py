@@ -0,0 +1,353 @@
+"""Process-wide login to user ID lookups shared by every bot.
+
+Each bot resolves its channels on connect and again on every reconnect. Bots
+that share a big channel used to look it up separately, bots starting
+together raced to the same ``users`` request, and unknown logins were never
+remembered, so a typo cost one request per reconnect.
+
+:class:`LoginResolver` sits behind every :class:`ChannelResolver`:
+
+- Concurrent lookups of one login wait for a single request.
+- Logins asked for by any bot within ``CHANNEL_ID_BATCH_WINDOW_SECONDS`` are
+  sent together, up to 100 per ``users`` request.
+- Found IDs are kept for ``CHANNEL_ID_CACHE_TTL_SECONDS`` and unknown logins
+  for ``CHANNEL_ID_NEGATIVE_TTL_SECONDS``. Failed requests are not cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+
+from ..api.twitch import TwitchAPI
+from ..constants import (
+    CHANNEL_ID_BATCH_WINDOW_SECONDS,
+    CHANNEL_ID_CACHE_TTL_SECONDS,
+    CHANNEL_ID_NEGATIVE_TTL_SECONDS,
+)
+from ..errors.eventsub import EventSubError
+
+CHUNK_SIZE = 100  # Twitch limit of logins per users request
+MAX_CONCURRENT_CHUNKS = 3  # users requests in flight at once
+
+
+class _LookupFailed(Exception):
+    """A users request failed; the logins it carried stay unresolved."""
+
+    def __init__(self, status: int, access_token: str) -> None:
+        super().__init__(f"users lookup failed status={status}")
+        self.status = status
+        self.access_token = access_token
+
+
+@dataclass(slots=True)
+class _Caller:
+    """Credentials of the first bot that asked for a queued login."""
+
+    api: TwitchAPI
+    access_token: str
+    client_id: str
+
+
+class LoginResolver:
+    """Merges, batches and caches login lookups across bots.
+
+    Attributes:
+        requests (int): ``users`` requests sent.
+        hits (int): Logins answered from the positive cache.
+        negative_hits (int): Logins answered from the negative cache.
+        merged (int): Logins that joined a lookup already queued or in flight.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: float = CHANNEL_ID_BATCH_WINDOW_SECONDS,
+        ttl: float = CHANNEL_ID_CACHE_TTL_SECONDS,
+        negative_ttl: float = CHANNEL_ID_NEGATIVE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty resolver.
+
+        Args:
+            window (float): Seconds to gather logins into one request.
+            ttl (float): Seconds a found user ID is served from cache.
+            negative_ttl (float): Seconds an unknown login is served from cache.
+            clock (Callable[[], float]): Monotonic time source.
+        """
+        self._window = window
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._clock = clock
+        self._found: dict[str, tuple[str, float]] = {}
+        self._unknown: dict[str, float] = {}
+        self._waiting: dict[str, asyncio.Future[str | None]] = {}
+        self._queue: dict[str, _Caller] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._gate = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.requests = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.merged = 0
+
+    async def resolve(
+        self,
+        api: TwitchAPI,
+        logins: Iterable[str],
+        access_token: str,
+        client_id: str,
+    ) -> dict[str, str]:
+        """Resolve logins to user IDs.
+
+        Args:
+            api (TwitchAPI): Client used if this call has to send a request.
+            logins (Iterable[str]): Login names, any case.
+            access_token (str): OAuth access token of the calling bot.
+            client_id (str): Twitch application client ID.
+
+        Returns:
+            dict[str, str]: Mapping of lowercase logins to user IDs. Unknown
+            logins and logins whose lookup failed are omitted.
+
+        Raises:
+            EventSubError: If every lookup this call needed failed.
+        """
+        self._bind_loop()
+        now = self._clock()
+        found: dict[str, str] = {}
+        waits: dict[str, asyncio.Future[str | None]] = {}
+        for login in logins:
+            key = login.lower()
+            if key in found or key in waits:
+                continue
+            cached = self._found.get(key)
+            if cached is not None and cached[1] > now:
+                found[key] = cached[0]
+                self.hits += 1
+                continue
+            if self._unknown.get(key, 0.0) > now:
+                self.negative_hits += 1
+                continue
+            future = self._waiting.get(key)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._waiting[key] = future
+                self._queue[key] = _Caller(api, access_token, client_id)
+            else:
+                self.merged += 1
+            waits[key] = future
+        if not waits:
+            return found
+        self._schedule()
+
+        results = await asyncio.gather(
+            *(asyncio.shield(f) for f in waits.values()), return_exceptions=True
+        )
+        failed: dict[str, BaseException] = {}
+        for key, result in zip(waits, results, strict=True):
+            if isinstance(result, BaseException):
+                failed[key] = result
+            elif result is not None:
+                found[key] = result
+
+        # A lookup made with another bot's rejected token may work with ours
+        retry = [
+            key
+            for key, error in failed.items()
+            if isinstance(error, _LookupFailed)
+            and error.status == 401
+            and error.access_token != access_token
+        ]
+        if retry:
+            for chunk in _chunks(retry):
+                try:
+                    ids = await self._fetch(api, chunk, access_token, client_id)
+                except _LookupFailed:
+                    continue
+                found.update(ids)
+                for key in chunk:
+                    failed.pop(key, None)
+
+        if failed:
+            logging.warning(
+                f"⚠️ Channel ID lookup failed for {len(failed)}/{len(waits)} logins"
+            )
+            if len(failed) == len(waits):
+                raise EventSubError(
+                    f"All lookups failed to resolve {len(failed)} logins",
+                    operation_type="resolve_user_ids",
+                )
+        return found
+
+    def remember(self, ids: Mapping[str, str]) -> None:
+        """Cache user IDs learned elsewhere, such as the startup bulk lookup.
+
+        Args:
+            ids (Mapping[str, str]): Login to user ID mapping.
+        """
+        expires = self._clock() + self._ttl
+        for login, user_id in ids.items():
+            key = login.lower()
+            self._found[key] = (str(user_id), expires)
+            self._unknown.pop(key, None)
+
+    def known(self, logins: Iterable[str]) -> dict[str, str]:
+        """Cached user IDs of the given logins, without any lookup."""
+        now = self._clock()
+        known: dict[str, str] = {}
+        for login in logins:
+            cached = self._found.get(login.lower())
+            if cached is not None and cached[1] > now:
+                known[login.lower()] = cached[0]
+        return known
+
+    def forget(self, login: str) -> None:
+        """Drop any cached answer for a login."""
+        key = login.lower()
+        self._found.pop(key, None)
+        self._unknown.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached answer."""
+        self._found.clear()
+        self._unknown.clear()
+
+    # ---- batching ----
+
+    def _bind_loop(self) -> None:
+        """Reset loop-bound state when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._gate = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+            self._waiting.clear()
+            self._queue.clear()
+            self._tasks.clear()
+            self._flush_task = None
+
+    def _schedule(self) -> None:
+        while len(self._queue) >= CHUNK_SIZE:
+            self._start(self._take(CHUNK_SIZE))
+        if self._queue and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(self._window)
+        finally:
+            self._flush_task = None
+        while self._queue:
+            self._start(self._take(CHUNK_SIZE))
+
+    def _take(self, size: int) -> dict[str, _Caller]:
+        keys = list(itertools.islice(self._queue, size))
+        return {key: self._queue.pop(key) for key in keys}
+
+    def _start(self, chunk: dict[str, _Caller]) -> None:
+        task = asyncio.create_task(self._send(chunk))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, chunk: dict[str, _Caller]) -> None:
+        """Look up one chunk and settle every future waiting on it."""
+        caller = next(iter(chunk.values()))
+        ids: dict[str, str] | None = None
+        error: BaseException | None = None
+        try:
+            async with self._gate:
+                ids = await self._fetch(
+                    caller.api, list(chunk), caller.access_token, caller.client_id
+                )
+        except Exception as e:  # noqa: BLE001 - handed to every waiting caller
+            error = e
+        finally:
+            for key in chunk:
+                future = self._waiting.pop(key, None)
+                if future is None or future.done():
+                    continue
+                if ids is not None:
+                    future.set_result(ids.get(key))
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.cancel()
+
+    async def _fetch(
+        self, api: TwitchAPI, logins: list[str], access_token: str, client_id: str
+    ) -> dict[str, str]:
+        """Send one users request and cache its answers.
+
+        Raises:
+            _LookupFailed: If Twitch did not answer with a user list.
+        """
+        self.requests += 1
+        try:
+            data, status, _ = await api.request(
+                "GET",
+                "users",
+                access_token=access_token,
+                client_id=client_id,
+                params={"login": logins},
+            )
+        except (aiohttp.ClientError, TimeoutError, ValueError) as e:
+            logging.debug(f"Channel ID lookup error logins={len(logins)}: {str(e)}")
+            raise _LookupFailed(0, access_token) from e
+        rows: Any = data.get("data") if isinstance(data, dict) else None
+        if status != 200 or not isinstance(rows, list):
+            logging.debug(f"Channel ID lookup failed status={status} logins={len(logins)}")
+            raise _LookupFailed(status, access_token)
+
+        ids: dict[str, str] = {}
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            login, user_id = row.get("login"), row.get("id")
+            if isinstance(login, str) and isinstance(user_id, str):
+                ids[login.lower()] = user_id
+        self._store(logins, ids)
+        return ids
+
+    def _store(self, logins: list[str], ids: dict[str, str]) -> None:
+        now = self._clock()
+        self._prune(now)
+        for login in logins:
+            key = login.lower()
+            user_id = ids.get(key)
+            if user_id is None:
+                self._unknown[key] = now + self._negative_ttl
+                self._found.pop(key, None)
+            else:
+                self._found[key] = (user_id, now + self._ttl)
+                self._unknown.pop(key, None)
+        unknown = [login for login in logins if login.lower() not in ids]
+        if unknown:
+            logging.info(f"❓ Unknown channel logins: {', '.join(unknown)}")
+
+    def _prune(self, now: float) -> None:
+        self._found = {k: v for k, v in self._found.items() if v[1] > now}
+        self._unknown = {k: v for k, v in self._unknown.items() if v > now}
+
+
+def _chunks(keys: list[str]) -> Iterable[list[str]]:
+    for i in range(0, len(keys), CHUNK_SIZE):
+        yield keys[i : i + CHUNK_SIZE]
+
+
+_login_resolver: LoginResolver | None = None
+
+
+def get_login_resolver() -> LoginResolver:
+    """Get the global login resolver."""
+    global _login_resolver
+    if _login_resolver is None:
+        _login_resolver = LoginResolver()
+    return _login_resolver
@@ -1,128 +1,182 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
+from contextlib import suppress
 from typing import TYPE_CHECKING
 
+from ..constants import EVENTSUB_SUB_CHECK_INTERVAL_SECONDS
+from ..errors.eventsub import MessageProcessingError
+from ..utils.latency import get_latency_recorder
+from .eventsub_envelope import (
+    EVENTSUB_SESSION_KEEPALIVE,
+    EVENTSUB_SESSION_RECONNECT,
+    EventSubEnvelope,
+    decode_envelope,
+    peek_chatter_user_id,
+)
+
 if TYPE_CHECKING:
     from .eventsub_backend import EventSubChatBackend
     from .message_transceiver import WSMessage
 
 
 class MessageCoordinator:
-    """Manages message processing flow including handling WebSocket messages, session reconnects, and idle optimization."""
+    """Manages message processing flow including handling WebSocket messages, session reconnects, and keepalive deadlines."""
 
     def __init__(self, backend: EventSubChatBackend) -> None:
         self.backend = backend
+        # Chat frames from other chatters dropped before decoding
+        self.skipped_frames = 0
 
     async def handle_message(self, msg: WSMessage) -> bool:
         """Handle a single WebSocket message.
 
+        The frame is decoded once into an EventSubEnvelope which is then
+        shared by reconnect handling and the message processor. Chat
+        messages from anyone but the bot user are dropped before decoding,
+        since the bot only reacts to its own messages.
+
         Returns True if processing should continue, False to break the loop.
         """
-        if msg.type == "text":
-            self.backend._last_activity = time.monotonic()
+        if msg.type != "text":
+            return True
+        self.backend._last_activity = time.monotonic()
+        latency = get_latency_recorder()
+        user = self.backend._username or ""
+        envelope = getattr(msg, "envelope", None)
+        if not isinstance(envelope, EventSubEnvelope):
+            if self._is_foreign_chat(msg.data):
+                self.skipped_frames += 1
+                return True
             try:
-                data = json.loads(msg.data)
-                msg_type = data.get("type")
-                if msg_type == "session_reconnect":
-                    if self.backend._reconnection_coordinator is None:
-                        raise AssertionError("ReconnectionCoordinator not initialized") from None
-                    await self.backend._reconnection_coordinator.handle_session_reconnect(data)
-                    return True
-                elif msg_type == "session_keepalive":
-                    logging.info("🏓 Received session_keepalive from Twitch")
-                    return True
-            except json.JSONDecodeError:
+                with latency.measure(user, "parse"):
+                    envelope = decode_envelope(msg.data)
+            except MessageProcessingError:
                 logging.warning(f"Failed to parse WebSocket message: {msg.data}")
-            if self.backend._msg_processor:
-                await self.backend._msg_processor.process_message(msg.data)
-            # Call the registered message handler for bot processing
-            # The bot handler expects (sender, channel, message) parameters
-            if self.backend._message_handler:
-                try:
-                    # For bot handlers, we need to extract sender/channel from the parsed message
-                    # If parsing failed, we can't call the bot handler
-                    if 'data' in locals() and msg_type == "notification":
-                        # Extract basic info from the parsed message for the bot handler
-                        sender = "unknown"
-                        channel = "unknown"
-                        if isinstance(data, dict):
-                            payload = data.get("payload", {})
-                            if isinstance(payload, dict):
-                                event = payload.get("event", {})
-                                if isinstance(event, dict):
-                                    sender = event.get("chatter_user_name", "unknown")
-                                    channel = event.get("broadcaster_user_name", "unknown")
-                        await self.backend._message_handler(sender, channel, msg.data)
-                except Exception as e:
-                    logging.warning(f"Error in bot message handler: {str(e)}")
+                return True
+        if envelope.is_notification:
+            event = envelope.event
+            if event is not None and event.chatter_user_id == self.backend._user_id:
+                self.backend._last_chat_activity = self.backend._last_activity
+            with latency.frame(user, envelope.message_timestamp):
+                return await self._handle_envelope(envelope)
+        return await self._handle_envelope(envelope)
+
+    def _is_foreign_chat(self, raw: str | bytes) -> bool:
+        """Whether a raw frame is a chat message sent by someone else."""
+        user_id = self.backend._user_id
+        if not isinstance(user_id, str) or not user_id:
+            return False
+        chatter_user_id = peek_chatter_user_id(raw)
+        return chatter_user_id is not None and chatter_user_id != user_id
+
+    async def _handle_envelope(self, envelope: EventSubEnvelope) -> bool:
+        """Route a decoded frame to reconnect handling or the message processor."""
+        if envelope.message_type == EVENTSUB_SESSION_RECONNECT:
+            if self.backend._reconnection_coordinator is None:
+                raise AssertionError("ReconnectionCoordinator not initialized") from None
+            await self.backend._reconnection_coordinator.handle_session_reconnect(envelope)
             return True
+        if envelope.message_type == EVENTSUB_SESSION_KEEPALIVE:
+            logging.info("🏓 Received session_keepalive from Twitch")
+            return True
+        if self.backend._msg_processor:
+            try:
+                await self.backend._msg_processor.process_envelope(envelope)
+            except MessageProcessingError as e:
+                logging.warning(f"Error processing EventSub message: {str(e)}")
         return True
 
     async def listen(self) -> None:
-        """Listen for WebSocket messages and handle them with idle optimization."""
+        """Listen for WebSocket messages until stopped.
+
+        Blocks on the socket for the next frame; the only timer is the
+        keepalive deadline derived from the last activity and the backend's
+        stale threshold. Subscription verification runs as a separate task.
+        """
         if not self.backend._ws_manager or not self.backend._ws_manager.is_connected:
             return
 
-        # Idle optimization: longer sleep when no recent activity
-        idle_sleep_time = 0.1  # 100ms base sleep
-        max_idle_sleep = 1.0   # 1s max sleep during idle
-        idle_threshold = 30.0  # 30s of no activity = idle
-
-        consecutive_idles = 0
-        max_consecutive_idles = 10
+        verify_task = asyncio.create_task(self._subscription_check_loop())
+        try:
+            await self._receive_loop()
+        finally:
+            verify_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await verify_task
 
+    async def _receive_loop(self) -> None:
+        """Receive and handle frames, reconnecting when the deadline passes."""
         while not self.backend._stop_event.is_set():
-            now = time.monotonic()
+            deadline = self._last_socket_activity() + self.backend._stale_threshold
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if not await self._reconnect_stale():
+                    break
+                continue
+            ws_manager = self.backend._ws_manager
+            if ws_manager is None:
+                break
+            try:
+                msg = await asyncio.wait_for(
+                    ws_manager.receive_message(), timeout=remaining
+                )
+            except Exception as e:
+                if isinstance(e, TimeoutError) or "timeout" in str(e).lower():
+                    # Deadline or receive timeout; staleness is re-checked above
+                    continue
+                logging.warning(f"Listen loop error: {str(e)}")
+                if not await self._reconnect():
+                    break
+                continue
+            if not await self.handle_message(msg):
+                break
 
-            # Check if we should enter idle mode
-            time_since_activity = now - self.backend._last_activity
-            is_idle = time_since_activity > idle_threshold
+    def _last_socket_activity(self) -> float:
+        """Latest activity seen by the coordinator or the socket itself.
 
-            if is_idle and consecutive_idles < max_consecutive_idles:
-                # Gradually increase sleep time during idle periods
-                sleep_time = min(idle_sleep_time * (2 ** consecutive_idles), max_idle_sleep)
-                await asyncio.sleep(sleep_time)
-                consecutive_idles += 1
-                continue
-            elif consecutive_idles >= max_consecutive_idles:
-                # Reset idle counter periodically to stay responsive
-                consecutive_idles = 0
+        Frames dropped before reaching this coordinator (pre-filtered chat on
+        a shared session) still prove the socket is alive.
+        """
+        last = self.backend._last_activity
+        state = getattr(self.backend._ws_manager, "state_manager", None)
+        activity = getattr(state, "last_activity", None)
+        if isinstance(activity, list) and activity:
+            last = max(last, activity[0])
+        return last
+
+    async def _reconnect_stale(self) -> bool:
+        """Reconnect after the keepalive deadline expired.
+
+        Returns:
+            bool: True if listening should continue.
+        """
+        age = time.monotonic() - self._last_socket_activity()
+        logging.warning(
+            f"🔄 Connection stale ({age:.1f}s > {self.backend._stale_threshold}s), triggering reconnect"
+        )
+        return await self._reconnect()
 
-            # Normal operation - check subscriptions
-            await self.backend._maybe_verify_subs(now)
+    async def _reconnect(self) -> bool:
+        """Delegate to the reconnection coordinator and restart the deadline.
 
+        Returns:
+            bool: True if reconnection succeeded.
+        """
+        if self.backend._reconnection_coordinator is None:
+            raise AssertionError("ReconnectionCoordinator not initialized") from None
+        if not await self.backend._reconnection_coordinator.handle_reconnect():
+            return False
+        self.backend._last_activity = time.monotonic()
+        return True
 
+    async def _subscription_check_loop(self) -> None:
+        """Periodically verify subscriptions independently of message flow."""
+        while True:
+            await asyncio.sleep(EVENTSUB_SUB_CHECK_INTERVAL_SECONDS)
             try:
-                msg = await self.backend._ws_manager.receive_message()
-                if not await self.handle_message(msg):
-                    break
-                # Reset idle counter on activity
-                consecutive_idles = 0
+                await self.backend._maybe_verify_subs(time.monotonic())
             except Exception as e:
-                # Handle timeout exceptions specifically
-                if isinstance(e, TimeoutError) or "timeout" in str(e).lower():
-                    # Timeout is expected during idle - just continue
-                    if not is_idle:
-                        logging.debug("WebSocket receive timeout during active period")
-                    consecutive_idles += 1
-
-                    # If connection is stale, trigger reconnect
-                    if time_since_activity > self.backend._stale_threshold:
-                        logging.warning(f"🔄 Connection stale ({time_since_activity:.1f}s > {self.backend._stale_threshold}s), last_activity={self.backend._last_activity}, current_time={now}, triggering reconnect")
-                        logging.info(f"🔍 Connection health: age={time_since_activity:.1f}s, stale_threshold={self.backend._stale_threshold}s, idle_threshold={idle_threshold}s")
-                        if self.backend._reconnection_coordinator is None:
-                            raise AssertionError("ReconnectionCoordinator not initialized") from None
-                        if not await self.backend._reconnection_coordinator.handle_reconnect():
-                            break
-                    continue
-                else:
-                    logging.warning(f"Listen loop error: {str(e)}")
-                    consecutive_idles += 1
-                    if self.backend._reconnection_coordinator is None:
-                        raise AssertionError("ReconnectionCoordinator not initialized") from None
-                    if not await self.backend._reconnection_coordinator.handle_reconnect():
-                        break
+                logging.info(f"Subscription check error: {str(e)}")
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import logging
 import time
 from typing import TYPE_CHECKING, Any
 
-from ..constants import WEBSOCKET_MESSAGE_TIMEOUT_SECONDS
+from ..constants import (
+    EVENTSUB_HANDOVER_DRAIN_SECONDS,
+    WEBSOCKET_MESSAGE_TIMEOUT_SECONDS,
+)
 from ..errors.eventsub import EventSubConnectionError
+from ..utils import json_codec
 
 if TYPE_CHECKING:
+    from .eventsub_envelope import EventSubEnvelope
     from .websocket_connector import WebSocketConnector
 
 
@@ -18,10 +23,15 @@ WEBSOCKET_NOT_CONNECTED_ERROR = "WebSocket not connected"
 
 
 class WSMessage:
-    """Simple WebSocket message class to mimic aiohttp.WSMessage."""
-    def __init__(self, type_: str, data: Any):
+    """Simple WebSocket message class to mimic aiohttp.WSMessage.
+
+    ``envelope`` carries the decoded frame when an upstream stage (such as
+    the shared session router) already parsed it.
+    """
+    def __init__(self, type_: str, data: Any, envelope: EventSubEnvelope | None = None):
         self.type = type_
         self.data = data
+        self.envelope = envelope
 
 
 WSMsgType = type('WSMsgType', (), {'TEXT': 'text'})()
@@ -30,6 +40,10 @@ WSMsgType = type('WSMsgType', (), {'TEXT': 'text'})()
 class MessageTransceiver:
     """Handles sending and receiving WebSocket messages with timeout management.
 
+    After a session handover the previous socket is retired rather than
+    closed: frames still in flight on it are read before the connector's
+    current socket, until it closes or the drain window expires.
+
     Attributes:
         connector (WebSocketConnector): The WebSocket connector instance.
         last_activity (list[float]): Reference to last activity timestamp.
@@ -44,6 +58,35 @@ class MessageTransceiver:
         """
         self.connector = connector
         self.last_activity = last_activity
+        self._retiring: Any = None
+        self._retire_task: asyncio.Task[None] | None = None
+
+    def retire(self, ws: Any) -> None:
+        """Keep draining a socket the connector has just replaced.
+
+        Args:
+            ws: The previous WebSocket connection.
+        """
+        if self._retiring is not None and self._retiring is not ws:
+            asyncio.create_task(self._close_retired(self._retiring))
+        self._retiring = ws
+        if self._retire_task and not self._retire_task.done():
+            self._retire_task.cancel()
+        self._retire_task = asyncio.create_task(self._expire_retired(ws))
+
+    async def _expire_retired(self, ws: Any) -> None:
+        await asyncio.sleep(EVENTSUB_HANDOVER_DRAIN_SECONDS)
+        if self._retiring is ws:
+            logging.info("🔀 Drain window elapsed, closing previous EventSub socket")
+            await self._close_retired(ws)
+
+    async def _close_retired(self, ws: Any) -> None:
+        if self._retiring is ws:
+            self._retiring = None
+        try:
+            await ws.close(code=1000)
+        except Exception as e:
+            logging.debug(f"Previous EventSub socket close error: {str(e)}")
 
     async def send_json(self, data: dict[str, Any]) -> None:
         """Send JSON data over WebSocket.
@@ -60,7 +103,7 @@ class MessageTransceiver:
             )
 
         try:
-            await self.connector.ws.send(json.dumps(data))
+            await self.connector.ws.send(json_codec.dumps(data))
             self.last_activity[0] = time.monotonic()
         except Exception as e:
             raise EventSubConnectionError(
@@ -76,40 +119,56 @@ class MessageTransceiver:
         Raises:
             EventSubConnectionError: If not connected or receive fails.
         """
-        if not self.connector.ws or (hasattr(self.connector.ws, 'closed') and self.connector.ws.closed):
-            raise EventSubConnectionError(
-                WEBSOCKET_NOT_CONNECTED_ERROR, operation_type="receive"
-            )
-
-        try:
-            message = await asyncio.wait_for(
-                self.connector.ws.recv(), timeout=WEBSOCKET_MESSAGE_TIMEOUT_SECONDS
-            )
+        while True:
+            ws = self._retiring or self.connector.ws
+            if not ws or (hasattr(ws, 'closed') and ws.closed):
+                if ws is not None and ws is self._retiring:
+                    await self._close_retired(ws)
+                    continue
+                raise EventSubConnectionError(
+                    WEBSOCKET_NOT_CONNECTED_ERROR, operation_type="receive"
+                )
+
+            try:
+                message = await asyncio.wait_for(
+                    ws.recv(), timeout=WEBSOCKET_MESSAGE_TIMEOUT_SECONDS
+                )
+            except Exception as e:
+                if ws is not self.connector.ws:
+                    # The socket was swapped out by a handover; its end is
+                    # expected, so carry on with the current one.
+                    await self._close_retired(ws)
+                    continue
+                if isinstance(e, EventSubConnectionError):
+                    raise
+                raise self._receive_error(e) from (
+                    None if isinstance(e, StopAsyncIteration) else e
+                )
             self.last_activity[0] = time.monotonic()
-
-            # For websockets library, message is just the data string
-            # Handle mock objects that have .data attribute
-            data = message.data if hasattr(message, 'data') else message
-
-            # Determine message type based on data
-            if isinstance(data, bytes) and data == b'ping':
-                msg_type = "ping"
-            else:
-                msg_type = "text"
-
-            msg = WSMessage(msg_type, data)
-            return msg
-        except StopAsyncIteration:
-            raise EventSubConnectionError(
-                "WebSocket closed", operation_type="receive"
-            ) from None
-        except TimeoutError:
-            raise EventSubConnectionError(
+            return self._wrap(message)
+
+    @staticmethod
+    def _wrap(message: Any) -> WSMessage:
+        # For websockets library, message is just the data string
+        # Handle mock objects that have .data attribute
+        data = message.data if hasattr(message, 'data') else message
+
+        # Determine message type based on data
+        if isinstance(data, bytes) and data == b'ping':
+            msg_type = "ping"
+        else:
+            msg_type = "text"
+
+        return WSMessage(msg_type, data)
+
+    @staticmethod
+    def _receive_error(e: Exception) -> EventSubConnectionError:
+        if isinstance(e, StopAsyncIteration):
+            return EventSubConnectionError("WebSocket closed", operation_type="receive")
+        if isinstance(e, TimeoutError):
+            return EventSubConnectionError(
                 "WebSocket receive timeout", operation_type="receive"
-            ) from TimeoutError()
-        except Exception as e:
-            if isinstance(e, EventSubConnectionError):
-                raise
-            raise EventSubConnectionError(
-                f"WebSocket receive failed: {str(e)}", operation_type="receive"
-            ) from e
+            )
+        return EventSubConnectionError(
+            f"WebSocket receive failed: {str(e)}", operation_type="receive"
+        )
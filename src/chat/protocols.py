@@ -7,20 +7,34 @@ methods and properties that components must implement.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable, Mapping
 from typing import Any, Protocol
 
+from .eventsub_envelope import EventSubEnvelope
 from .message_transceiver import WSMessage
 
 
 class WebSocketConnectionManagerProtocol(Protocol):
-    """Protocol for WebSocket connection management."""
+    """Protocol for WebSocket connection management.
+
+    Implemented by ``WebSocketConnectionManager`` and by ``SessionLease`` for
+    bots attached to a shared EventSub session.
+    """
 
     @property
     def is_connected(self) -> bool:
         """Check if WebSocket is connected and active."""
         ...
 
+    @property
+    def session_id(self) -> str | None:
+        """Get the current EventSub session ID."""
+        ...
+
+    def is_healthy(self) -> bool:
+        """Check if the connection is healthy."""
+        ...
+
     async def connect(self) -> None:
         """Establish WebSocket connection and perform handshake."""
         ...
@@ -45,6 +59,22 @@ class WebSocketConnectionManagerProtocol(Protocol):
         """
         ...
 
+    async def handover(self, reconnect_url: str) -> bool:
+        """Switch to a session_reconnect URL without dropping subscriptions.
+
+        Returns:
+            bool: True if the new socket is live, False to fall back to reconnect.
+        """
+        ...
+
+    def update_url(self, new_url: str) -> None:
+        """Update the WebSocket URL used by the next connection."""
+        ...
+
+    def update_access_token(self, new_token: str) -> None:
+        """Update the access token used by the next handshake."""
+        ...
+
     async def __aenter__(self) -> WebSocketConnectionManagerProtocol:
         """Async context manager entry."""
         ...
@@ -77,6 +107,10 @@ class SubscriptionManagerProtocol(Protocol):
         """Update the session ID for new subscriptions."""
         ...
 
+    def adopt_session_id(self, new_session_id: str) -> None:
+        """Record a handed-over session ID without touching subscriptions."""
+        ...
+
     async def __aenter__(self) -> SubscriptionManagerProtocol:
         """Async context manager entry."""
         ...
@@ -93,6 +127,10 @@ class MessageProcessorProtocol(Protocol):
         """Process a raw WebSocket message from EventSub."""
         ...
 
+    async def process_envelope(self, envelope: EventSubEnvelope) -> None:
+        """Process an already decoded EventSub frame."""
+        ...
+
     async def __aenter__(self) -> MessageProcessorProtocol:
         """Async context manager entry."""
         ...
@@ -188,10 +226,18 @@ class CacheManagerProtocol(Protocol):
         """Retrieve a value from the cache."""
         ...
 
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Retrieve the values found for several keys."""
+        ...
+
     async def set(self, key: str, value: Any) -> None:
         """Store a value in the cache."""
         ...
 
+    async def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store several values in one batch."""
+        ...
+
     async def delete(self, key: str) -> None:
         """Remove a key from the cache."""
         ...
@@ -208,6 +254,10 @@ class CacheManagerProtocol(Protocol):
         """Get all keys in the cache."""
         ...
 
+    async def close(self) -> None:
+        """Flush pending writes to disk."""
+        ...
+
     async def __aenter__(self) -> CacheManagerProtocol:
         """Async context manager entry."""
         ...
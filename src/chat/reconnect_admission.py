@@ -0,0 +1,154 @@
+"""Process-wide admission control for EventSub reconnects.
+
+A network blip makes every bot's connection go stale at the same moment.
+Left alone they would all revalidate tokens, open WebSocket handshakes and
+resubscribe at once, and that burst alone is enough to draw 429s and failed
+handshakes. :class:`ReconnectAdmission` hands out reconnect slots from a
+token bucket (``RECONNECT_ADMISSION_RATE`` per second, bursts of
+``RECONNECT_ADMISSION_BURST``). Waiting bots are served by priority, with
+bots whose user chatted recently first, and in random order within a
+priority so no bot is always last.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import random
+import time
+from enum import IntEnum
+
+from ..constants import (
+    RECONNECT_ACTIVE_WINDOW_SECONDS,
+    RECONNECT_ADMISSION_BURST,
+    RECONNECT_ADMISSION_RATE,
+)
+from ..utils.admission import PriorityAdmission
+
+
+class ReconnectPriority(IntEnum):
+    """Order in which waiting reconnects are admitted (lower first)."""
+
+    ACTIVE = 0  # The bot's user chatted within RECONNECT_ACTIVE_WINDOW_SECONDS
+    IDLE = 1
+
+
+def priority_for(last_chat: float | None, now: float | None = None) -> ReconnectPriority:
+    """Pick the reconnect priority from the time of the user's last chat message.
+
+    Args:
+        last_chat (float | None): ``time.monotonic()`` of the last own chat
+            message, or None if there was none.
+        now (float | None): Current ``time.monotonic()``.
+
+    Returns:
+        ReconnectPriority: ACTIVE for recent chatters, otherwise IDLE.
+    """
+    if not isinstance(last_chat, int | float):
+        return ReconnectPriority.IDLE
+    now = time.monotonic() if now is None else now
+    if now - last_chat <= RECONNECT_ACTIVE_WINDOW_SECONDS:
+        return ReconnectPriority.ACTIVE
+    return ReconnectPriority.IDLE
+
+
+class ReconnectAdmission:
+    """Token bucket that admits reconnects by priority, randomized within one.
+
+    Attributes:
+        rate (float): Reconnects admitted per second once the burst is spent.
+        burst (int): Reconnects admitted at once from a full bucket.
+        tokens (float): Reconnects that may start right now.
+        granted (int): Reconnects admitted so far.
+        delayed (int): Reconnects that had to wait for a slot.
+        max_depth (int): Deepest the queue has been.
+    """
+
+    def __init__(
+        self,
+        rate: float = RECONNECT_ADMISSION_RATE,
+        burst: int = RECONNECT_ADMISSION_BURST,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate (float): Reconnects per second.
+            burst (int): Bucket capacity.
+            rng (random.Random | None): Source of the ordering within a priority.
+        """
+        self.rate = max(rate, 1e-3)
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.granted = 0
+        self.delayed = 0
+        self._rng = rng or random.Random()  # noqa: S311 - ordering, not security
+        self._updated = time.monotonic()
+        self._seq = itertools.count()
+        self._queue = PriorityAdmission()
+
+    @property
+    def queue_depth(self) -> int:
+        """Reconnects currently waiting for a slot."""
+        return len(self._queue)
+
+    @property
+    def max_depth(self) -> int:
+        """Deepest the queue has been."""
+        return self._queue.max_depth
+
+    def depth_by_priority(self) -> dict[str, int]:
+        """Waiting reconnects per priority name."""
+        depth = {p.name.lower(): 0 for p in ReconnectPriority}
+        for priority, _, _ in self._queue:
+            depth[ReconnectPriority(priority).name.lower()] += 1
+        return depth
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self.tokens = min(float(self.burst), self.tokens + elapsed * self.rate)
+        self._updated = now
+
+    async def acquire(self, priority: ReconnectPriority = ReconnectPriority.IDLE) -> float:
+        """Wait for a reconnect slot.
+
+        Args:
+            priority (ReconnectPriority): Priority of the waiting bot.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        started = time.monotonic()
+
+        def delay() -> float:
+            self._refill(time.monotonic())
+            if self.tokens >= 1.0:
+                return 0.0
+            return (1.0 - self.tokens) / self.rate
+
+        def admit(waited: bool) -> None:
+            self.tokens -= 1.0
+            self.granted += 1
+            if waited:
+                self.delayed += 1
+
+        def on_queued() -> None:
+            logging.debug(
+                f"⏳ Reconnect queued priority={priority.name.lower()} "
+                f"depth={len(self._queue)}"
+            )
+
+        entry = (int(priority), self._rng.random(), next(self._seq))
+        await self._queue.wait(entry, delay, admit, on_queued)
+        return time.monotonic() - started
+
+
+_reconnect_admission: ReconnectAdmission | None = None
+
+
+def get_reconnect_admission() -> ReconnectAdmission:
+    """Get the global reconnect admission controller."""
+    global _reconnect_admission
+    if _reconnect_admission is None:
+        _reconnect_admission = ReconnectAdmission()
+    return _reconnect_admission
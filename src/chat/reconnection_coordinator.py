@@ -5,51 +5,108 @@ import logging
 import secrets
 import time
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .eventsub_backend import EventSubChatBackend
+    from .eventsub_envelope import EventSubEnvelope
 
 from ..errors.internal import BotRestartException
+from .reconnect_admission import (
+    ReconnectAdmission,
+    get_reconnect_admission,
+    priority_for,
+)
 
 
 class ReconnectionCoordinator:
     """Coordinates reconnection logic including session reconnect handling, resubscription, and connection health validation."""
 
-    def __init__(self, backend: EventSubChatBackend) -> None:
+    def __init__(
+        self, backend: EventSubChatBackend, admission: ReconnectAdmission | None = None
+    ) -> None:
         self.backend = backend
+        self.admission = admission or get_reconnect_admission()
         self.backoff = 5.0  # Initial backoff: 5 seconds
         self.max_backoff = 60.0  # Maximum backoff: 60 seconds
         self.max_attempts = 3  # Maximum reconnection attempts
         self.consecutive_failures = 0  # Track consecutive reconnection failures
+        self._handover_task: asyncio.Task[None] | None = None
 
-    async def handle_session_reconnect(self, data: dict[str, Any]) -> None:
+    async def handle_session_reconnect(self, envelope: EventSubEnvelope) -> None:
         """Handle session reconnect message from Twitch.
 
-        Updates the WebSocket URL and initiates reconnection.
+        Starts a handover to the reconnect URL in the background so the
+        caller can keep reading the current socket meanwhile.
 
         Args:
-            data: The session_reconnect message data.
+            envelope: The decoded session_reconnect frame.
         """
         try:
-            reconnect_url = (
-                data.get("payload", {}).get("session", {}).get("reconnect_url")
-            )
+            reconnect_url = envelope.reconnect_url
             if not reconnect_url:
                 logging.error("Session reconnect message missing reconnect_url")
                 return
 
-            if self.backend._ws_manager:
-                self.backend._ws_manager.update_url(reconnect_url)
-                logging.info(
-                    f"Updated WebSocket URL to {reconnect_url}, initiating reconnect"
-                )
-                await self.handle_reconnect()
-            else:
+            if not self.backend._ws_manager:
                 logging.error("No WebSocket manager available for session reconnect")
+                return
+            if self._handover_task and not self._handover_task.done():
+                logging.debug("Session handover already in progress")
+                return
+            logging.info(f"🔀 Session reconnect requested, handing over to {reconnect_url}")
+            self._handover_task = asyncio.create_task(self._handover(reconnect_url))
+        except Exception as e:
+            logging.error(f"Failed to handle session reconnect: {str(e)}")
+
+    async def _handover(self, reconnect_url: str) -> None:
+        """Hand the session over to reconnect_url, falling back to a full reconnect.
+
+        Args:
+            reconnect_url: URL from the session_reconnect payload.
+        """
+        ws_manager = self.backend._ws_manager
+        try:
+            if ws_manager and await ws_manager.handover(reconnect_url):
+                new_session_id = getattr(ws_manager, "session_id", None)
+                if self.backend._sub_manager and new_session_id:
+                    self.backend._sub_manager.adopt_session_id(new_session_id)
+                self._mark_activity(ws_manager)
+                return
+        except Exception as e:
+            logging.error(f"Session handover failed: {str(e)}")
+
+        try:
+            ws_manager = self.backend._ws_manager
+            if not ws_manager:
+                return
+            ws_manager.update_url(reconnect_url)
+            logging.info(
+                f"Updated WebSocket URL to {reconnect_url}, initiating reconnect"
+            )
+            await self.handle_reconnect()
         except Exception as e:
             logging.error(f"Failed to handle session reconnect: {str(e)}")
 
+    @staticmethod
+    def _mark_activity(ws_manager: object) -> None:
+        """Restart the keepalive deadline tracked by the connection state."""
+        state = getattr(ws_manager, "state_manager", None)
+        if state is not None:
+            state.last_activity[0] = time.monotonic()
+
+    async def cancel_handover(self) -> None:
+        """Cancel a session handover still in progress."""
+        task = self._handover_task
+        self._handover_task = None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
     async def handle_reconnect(self) -> bool:
         """Handle reconnection logic with exponential backoff and connection health validation.
 
@@ -59,6 +116,9 @@ class ReconnectionCoordinator:
         if not self.backend._ws_manager:
             return False
 
+        # Wait for a fleet-wide reconnect slot before touching Twitch
+        await self._admit()
+
         # Check token expiry and refresh proactively if <5 minutes remaining
         await self._ensure_token_validity()
 
@@ -75,8 +135,12 @@ class ReconnectionCoordinator:
                 logging.debug(f"⚠️ Could not log token expiry at reconnection start: {str(e)}")
 
         attempt = 0
+        admitted = True
         while attempt < self.max_attempts:
             attempt += 1
+            if not admitted:
+                await self._admit()
+            admitted = False
             start_time = time.time()
             logging.info(f"🔄 Starting WebSocket reconnection attempt {attempt} at {start_time:.2f}")
 
@@ -120,7 +184,7 @@ class ReconnectionCoordinator:
                 continue
 
             # Reset last activity timestamp after successful reconnection
-            self.backend._ws_manager.state_manager.last_activity[0] = time.monotonic()
+            self._mark_activity(self.backend._ws_manager)
 
             # Reset backoff on success
             self.backoff = 5.0
@@ -206,6 +270,19 @@ class ReconnectionCoordinator:
             raise BotRestartException("Bot restart required due to persistent reconnection failures")
         return False
 
+    async def _admit(self) -> None:
+        """Wait for the admission controller to grant a reconnect slot.
+
+        Bots whose user chatted recently are admitted ahead of idle ones.
+        """
+        priority = priority_for(getattr(self.backend, "_last_chat_activity", None))
+        waited = await self.admission.acquire(priority)
+        if waited >= 1.0:
+            logging.info(
+                f"⏳ Reconnect slot granted after {waited:.1f}s "
+                f"(queue depth {self.admission.queue_depth}) user={self.backend._username}"
+            )
+
     def _jitter(self, a: float, b: float) -> float:
         """Generate jitter for backoff timing.
 
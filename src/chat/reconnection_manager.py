@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import secrets
 from typing import TYPE_CHECKING
@@ -13,7 +12,8 @@ from ..constants import (
     WEBSOCKET_MESSAGE_TIMEOUT_SECONDS,
 )
 from ..errors.eventsub import EventSubConnectionError
-from ..utils.circuit_breaker import get_circuit_breaker
+from ..utils import json_codec
+from ..utils.circuit_breaker import KeyedCircuitBreaker, get_keyed_circuit_breaker
 
 if TYPE_CHECKING:
     from .websocket_connector import WebSocketConnector
@@ -30,18 +30,25 @@ class ReconnectionManager:
         circuit_breaker: Circuit breaker for connections.
     """
 
-    def __init__(self, connector: WebSocketConnector, stop_event: asyncio.Event) -> None:
+    def __init__(
+        self,
+        connector: WebSocketConnector,
+        stop_event: asyncio.Event,
+        circuit_breaker: KeyedCircuitBreaker | None = None,
+    ) -> None:
         """Initialize the Reconnection Manager.
 
         Args:
             connector (WebSocketConnector): WebSocket connector.
             stop_event (asyncio.Event): Stop event for cancellation.
+            circuit_breaker (KeyedCircuitBreaker | None): Breaker of the owning
+                connection manager; defaults to the shared WebSocket breaker.
         """
         self.connector = connector
         self.backoff = 1.0
         self.max_backoff = EVENTSUB_MAX_BACKOFF_SECONDS
         self._stop_event = stop_event
-        self.circuit_breaker = get_circuit_breaker("websocket_connection")
+        self.circuit_breaker = circuit_breaker or get_keyed_circuit_breaker("websocket")
 
     async def reconnect(self) -> bool:
         """Attempt a single reconnection.
@@ -99,7 +106,7 @@ class ReconnectionManager:
             )
 
             # Assume it's a text message (JSON string)
-            data = json.loads(message_data)
+            data = json_codec.loads(message_data)
             received_challenge = data.get("challenge")
 
             if received_challenge != pending_challenge:
@@ -109,7 +116,7 @@ class ReconnectionManager:
 
             # Send response
             response = {"type": "challenge_response", "challenge": received_challenge}
-            await self.connector.ws.send(json.dumps(response))
+            await self.connector.ws.send(json_codec.dumps(response))
 
             logging.info("✅ Challenge response sent")
 
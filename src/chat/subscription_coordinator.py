@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -32,51 +33,90 @@ class SubscriptionCoordinator:
         return success
 
     async def resubscribe_all_channels(self) -> bool:
-        """Resubscribe to all channels after reconnection with retry logic."""
-        logging.info(f"🔄 Starting resubscription for {len(self.backend._channels)} channels: {self.backend._channels}")
+        """Resubscribe to all channels after reconnection.
+
+        Resolves every channel ID in one batched lookup, subscribes to all
+        channels concurrently (bounded by the subscription manager's rate
+        limiter, each with retry) and verifies the resulting subscriptions
+        with a single listing call at the end.
+        """
+        channels = list(self.backend._channels)
+        logging.info(f"🔄 Starting resubscription for {len(channels)} channels: {channels}")
         if not self.backend._sub_manager or not self.backend._channel_resolver:
             logging.warning("🔄 Resubscription skipped: sub_manager or channel_resolver not available")
             return True
+        try:
+            user_ids = await self._resolve_channel_with_token_refresh(channels)
+        except Exception:
+            # Already logged; every channel is reported as unresolved below
+            user_ids = {}
         all_success = True
-        for channel in self.backend._channels:
-            try:
-                logging.info(f"🔄 Resolving user ID for channel {channel}")
-                user_ids = await self._resolve_channel_with_token_refresh([channel])
-                channel_id = user_ids.get(channel)
-                if channel_id:
-                    logging.info(f"🔄 Attempting to resubscribe to {channel} (ID: {channel_id})")
-                    # Retry subscription with exponential backoff
-                    result = await self._subscribe_channel_with_retry(
-                        channel_id, channel
-                    )
-                    if result is None:
-                        raise Exception(
-                            f"Failed to resubscribe to {channel} after all retry attempts"
-                        )
-                    elif not result:
-                        raise Exception(
-                            f"Subscription failed for {channel} even after retries"
-                        )
-                    else:
-                        logging.info(f"✅ Successfully resubscribed to {channel}")
-                        # Validate subscriptions are active after resubscription
-                        if self.backend._sub_manager:
-                            active_channels = await self.backend._sub_manager.verify_subscriptions()
-                            if channel_id not in active_channels:
-                                raise Exception(f"Subscription validation failed for {channel}")
-                else:
-                    raise Exception(f"Could not resolve channel_id for {channel}")
-            except Exception as e:
-                logging.error(f"Failed to resolve or resubscribe to {channel}: {e}")
+        targets: list[tuple[str, str]] = []
+        for channel in channels:
+            channel_id = user_ids.get(channel)
+            if channel_id:
+                targets.append((channel, channel_id))
+            else:
+                logging.error(
+                    f"Failed to resolve or resubscribe to {channel}: Could not resolve channel_id for {channel}"
+                )
                 all_success = False
+        results = await asyncio.gather(
+            *(self._resubscribe_channel(channel_id, channel) for channel, channel_id in targets)
+        )
+        subscribed = [target for target, ok in zip(targets, results, strict=True) if ok]
+        if len(subscribed) != len(targets):
+            all_success = False
+        if subscribed and not await self._verify_resubscribed(subscribed):
+            all_success = False
         logging.info(f"🔄 Resubscription completed: {'success' if all_success else 'partial failure'}")
         return all_success
 
+    async def _resubscribe_channel(self, channel_id: str, channel: str) -> bool:
+        """Resubscribe one channel with retry, logging any failure."""
+        logging.info(f"🔄 Attempting to resubscribe to {channel} (ID: {channel_id})")
+        try:
+            result = await self._subscribe_channel_with_retry(channel_id, channel)
+        except Exception as e:
+            logging.error(f"Failed to resolve or resubscribe to {channel}: {e}")
+            return False
+        if result is None:
+            logging.error(
+                f"Failed to resolve or resubscribe to {channel}: Failed to resubscribe to {channel} after all retry attempts"
+            )
+            return False
+        if not result:
+            logging.error(
+                f"Failed to resolve or resubscribe to {channel}: Subscription failed for {channel} even after retries"
+            )
+            return False
+        logging.info(f"✅ Successfully resubscribed to {channel}")
+        return True
+
+    async def _verify_resubscribed(self, subscribed: list[tuple[str, str]]) -> bool:
+        """Check resubscribed channels are active with one subscriptions listing."""
+        if not self.backend._sub_manager:
+            return True
+        try:
+            active_channels = set(await self.backend._sub_manager.verify_subscriptions())
+        except Exception as e:
+            logging.error(f"Subscription validation failed after resubscription: {e}")
+            return False
+        verified = True
+        for channel, channel_id in subscribed:
+            if channel_id not in active_channels:
+                logging.error(
+                    f"Failed to resolve or resubscribe to {channel}: Subscription validation failed for {channel}"
+                )
+                verified = False
+        return verified
+
     async def _resolve_channel_with_token_refresh(self, channels: list[str]) -> dict[str, str]:
         """Resolve channels with token refresh on 401 errors."""
         if not self.backend._channel_resolver:
             return {}
 
+        user_ids: dict[str, str] | None = None
         try:
             user_ids = await self.backend._channel_resolver.resolve_user_ids(
                 channels, self.backend._token or "", self.backend._client_id or ""
@@ -96,8 +136,11 @@ class SubscriptionCoordinator:
                     return user_ids
         except Exception as e:
             logging.warning(f"Channel resolution failed: {e}")
+            # Keep a partial first resolution; with nothing resolved, surface the error
+            if user_ids is None:
+                raise
 
-        return user_ids
+        return user_ids or {}
 
     async def _subscribe_channel_with_retry(
         self, channel_id: str, channel: str
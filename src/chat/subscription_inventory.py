@@ -0,0 +1,384 @@
+"""Process-wide inventory of EventSub subscriptions.
+
+``GET eventsub/subscriptions`` lists every subscription of a Twitch
+application, not just the caller's, so bots that share a ``client_id`` all
+download the same list. The inventory fetches it once per
+``EVENTSUB_INVENTORY_MAX_AGE_SECONDS`` for all of them: it pages through the
+list, keeps the rows and the ``total``/``total_cost``/``max_total_cost``
+counters, and answers verification and cleanup queries locally. Concurrent
+refreshes share one fetch, and bots keep it current between fetches by
+reporting the subscriptions they create and delete.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+from ..constants import EVENTSUB_INVENTORY_MAX_AGE_SECONDS
+
+EVENTSUB_SUBSCRIPTIONS = "eventsub/subscriptions"
+EVENTSUB_CHAT_MESSAGE = "channel.chat.message"
+STATUS_ENABLED = "enabled"
+PAGE_SIZE = 100  # Helix maximum for ``first``
+MAX_PAGES = 200  # Guard against a cursor that never ends
+COST_WARNING_RATIO = 0.9
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriptionRecord:
+    """One row of the subscription list.
+
+    Attributes:
+        id (str): Subscription ID.
+        type (str): Subscription type, e.g. ``channel.chat.message``.
+        status (str): Subscription status, e.g. ``enabled``.
+        session_id (str | None): WebSocket session the subscription delivers to.
+        broadcaster_id (str | None): ``condition.broadcaster_user_id``.
+        user_id (str | None): ``condition.user_id``.
+        cost (int): Cost counted against ``max_total_cost``.
+    """
+
+    id: str
+    type: str
+    status: str
+    session_id: str | None = None
+    broadcaster_id: str | None = None
+    user_id: str | None = None
+    cost: int = 0
+
+    @classmethod
+    def from_row(cls, row: Any) -> SubscriptionRecord | None:
+        """Build a record from a Helix subscription object.
+
+        Args:
+            row (Any): One entry of a ``data`` array.
+
+        Returns:
+            SubscriptionRecord | None: The record, or None if the row is malformed.
+        """
+        if not isinstance(row, dict):
+            return None
+        sub_id = row.get("id")
+        sub_type = row.get("type")
+        if not isinstance(sub_id, str) or not isinstance(sub_type, str):
+            return None
+        transport = row.get("transport")
+        condition = row.get("condition")
+        transport = transport if isinstance(transport, dict) else {}
+        condition = condition if isinstance(condition, dict) else {}
+        session_id = transport.get("session_id")
+        broadcaster_id = condition.get("broadcaster_user_id")
+        user_id = condition.get("user_id")
+        cost = row.get("cost")
+        return cls(
+            id=sub_id,
+            type=sub_type,
+            status=str(row.get("status") or ""),
+            session_id=session_id if isinstance(session_id, str) else None,
+            broadcaster_id=broadcaster_id if isinstance(broadcaster_id, str) else None,
+            user_id=user_id if isinstance(user_id, str) else None,
+            cost=cost if isinstance(cost, int) else 0,
+        )
+
+
+class SubscriptionInventory:
+    """Shared, periodically refreshed list of one application's subscriptions.
+
+    Attributes:
+        client_id (str): Twitch application client ID.
+        sub_type (str): Subscription type requested with the ``type`` filter.
+        max_age (float): Seconds a fetched list is served before refetching.
+        total (int): ``total`` reported by the last fetch.
+        total_cost (int): ``total_cost`` reported by the last fetch.
+        max_total_cost (int): ``max_total_cost`` reported by the last fetch.
+        fetch_count (int): Completed fetches, for monitoring.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        *,
+        sub_type: str = EVENTSUB_CHAT_MESSAGE,
+        max_age: float = EVENTSUB_INVENTORY_MAX_AGE_SECONDS,
+    ) -> None:
+        """Initialize an empty inventory.
+
+        Args:
+            client_id (str): Twitch application client ID.
+            sub_type (str): Subscription type to list.
+            max_age (float): Seconds a fetched list stays fresh.
+        """
+        self.client_id = client_id
+        self.sub_type = sub_type
+        self.max_age = max_age
+        self.total = 0
+        self.total_cost = 0
+        self.max_total_cost = 0
+        self.fetch_count = 0
+        self._records: dict[str, SubscriptionRecord] = {}
+        self._fetched_at: float | None = None
+        self._inflight: asyncio.Task[int] | None = None
+        self._inflight_token: str | None = None
+        # Changes reported while a fetch runs, replayed onto its result
+        self._created_during: dict[str, SubscriptionRecord] = {}
+        self._deleted_during: set[str] = set()
+        # Subscriptions a bot is deleting right now, so others leave them alone
+        self._claimed: set[str] = set()
+        # Session each live subscription manager delivers to, dropped with it
+        self._sessions: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()
+
+    @property
+    def age(self) -> float | None:
+        """Seconds since the last successful fetch, or None before the first."""
+        if self._fetched_at is None:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    def is_fresh(self, max_age: float | None = None) -> bool:
+        """Check whether the list was fetched within ``max_age`` seconds."""
+        age = self.age
+        limit = self.max_age if max_age is None else max_age
+        return age is not None and age <= limit
+
+    async def refresh(
+        self,
+        api: Any,
+        token: str,
+        *,
+        force: bool = False,
+        max_age: float | None = None,
+    ) -> int:
+        """Make sure the list is fresh, fetching it if needed.
+
+        Callers arriving while a fetch runs wait for it instead of starting
+        their own. If that fetch was rejected with 401 and used another
+        bot's token, the caller retries once with its own.
+
+        Args:
+            api (TwitchAPI): Client used if a fetch is needed.
+            token (str): Caller's access token.
+            force (bool): Fetch even if the list is fresh.
+            max_age (float | None): Freshness limit overriding ``max_age``.
+
+        Returns:
+            int: 200 when the list is fresh, otherwise the HTTP status of the
+                failed fetch.
+        """
+        if not force and self.is_fresh(max_age):
+            return 200
+        task = self._inflight
+        if task is None:
+            task = self._start_fetch(api, token)
+        shared_token = self._inflight_token
+        status = await asyncio.shield(task)
+        if status == 401 and shared_token != token:
+            retry = self._inflight
+            if retry is None or retry is task:
+                retry = self._start_fetch(api, token)
+            status = await asyncio.shield(retry)
+        return status
+
+    def _start_fetch(self, api: Any, token: str) -> asyncio.Task[int]:
+        self._created_during = {}
+        self._deleted_during = set()
+        task = asyncio.create_task(self._fetch(api, token))
+        self._inflight = task
+        self._inflight_token = token
+
+        def _done(finished: asyncio.Task[int]) -> None:
+            if self._inflight is finished:
+                self._inflight = None
+                self._inflight_token = None
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _fetch(self, api: Any, token: str) -> int:
+        """Page through the whole list; keep the old one on failure."""
+        records: dict[str, SubscriptionRecord] = {}
+        cursor: str | None = None
+        first_page: dict[str, Any] = {}
+        for page in range(MAX_PAGES):
+            params: dict[str, Any] = {"type": self.sub_type, "first": PAGE_SIZE}
+            if cursor:
+                params["after"] = cursor
+            data, status, _ = await api.request(
+                "GET",
+                EVENTSUB_SUBSCRIPTIONS,
+                access_token=token,
+                client_id=self.client_id,
+                params=params,
+                allow_on_open=True,
+            )
+            if status != 200:
+                return status
+            if not isinstance(data, dict):
+                logging.warning("⚠️ Invalid API response data type for subscriptions")
+                return 502
+            if page == 0:
+                first_page = data
+            for row in data.get("data") or []:
+                record = SubscriptionRecord.from_row(row)
+                if record is not None:
+                    records[record.id] = record
+            pagination = data.get("pagination")
+            cursor = pagination.get("cursor") if isinstance(pagination, dict) else None
+            if not cursor:
+                break
+        else:
+            logging.warning(
+                f"⚠️ Subscription list for {self.client_id} exceeded {MAX_PAGES} pages"
+            )
+
+        records.update(self._created_during)
+        for sub_id in self._deleted_during:
+            records.pop(sub_id, None)
+        self._records = records
+        self._fetched_at = time.monotonic()
+        self.fetch_count += 1
+        self._update_counters(first_page)
+        logging.debug(
+            f"📋 Subscription inventory for {self.client_id}: {len(records)} rows, "
+            f"cost {self.total_cost}/{self.max_total_cost}"
+        )
+        return 200
+
+    def _update_counters(self, data: dict[str, Any]) -> None:
+        for name in ("total", "total_cost", "max_total_cost"):
+            value = data.get(name)
+            if isinstance(value, int):
+                setattr(self, name, value)
+        if (
+            self.max_total_cost
+            and self.total_cost >= self.max_total_cost * COST_WARNING_RATIO
+        ):
+            logging.warning(
+                f"⚠️ EventSub subscription cost for {self.client_id} at "
+                f"{self.total_cost}/{self.max_total_cost}"
+            )
+
+    def track_session(self, owner: Any, session_id: str) -> None:
+        """Record the session a subscription manager currently delivers to.
+
+        Subscriptions on tracked sessions are never reported as stale.
+
+        Args:
+            owner: The subscription manager (held weakly).
+            session_id (str): Its current EventSub session ID.
+        """
+        self._sessions[owner] = session_id
+
+    def release_session(self, owner: Any) -> None:
+        """Stop protecting the session of a manager that is shutting down."""
+        self._sessions.pop(owner, None)
+
+    def live_session_ids(self) -> set[str]:
+        """Sessions of every tracked subscription manager in this process."""
+        return set(self._sessions.values())
+
+    def record_created(self, record: SubscriptionRecord | None) -> None:
+        """Add a subscription a bot just created."""
+        if record is None:
+            return
+        self._records[record.id] = record
+        if self._inflight is not None:
+            self._created_during[record.id] = record
+            self._deleted_during.discard(record.id)
+
+    def claim(self, sub_ids: list[str]) -> list[str]:
+        """Reserve subscriptions for deletion by the caller.
+
+        Bots cleaning up at the same time would otherwise all delete the
+        same stale subscriptions.
+
+        Args:
+            sub_ids (list[str]): Subscriptions the caller wants to delete.
+
+        Returns:
+            list[str]: The ones no other bot is deleting; now reserved.
+        """
+        claimed = [sub_id for sub_id in sub_ids if sub_id not in self._claimed]
+        self._claimed.update(claimed)
+        return claimed
+
+    def unclaim(self, sub_ids: list[str]) -> None:
+        """Release reservations made with :meth:`claim`.
+
+        Args:
+            sub_ids (list[str]): Subscriptions returned by :meth:`claim`.
+        """
+        self._claimed.difference_update(sub_ids)
+
+    def record_deleted(self, sub_id: str) -> None:
+        """Drop a subscription a bot just deleted (or found already gone)."""
+        self._records.pop(sub_id, None)
+        if self._inflight is not None:
+            self._deleted_during.add(sub_id)
+            self._created_during.pop(sub_id, None)
+
+    def records(
+        self, *, session_id: str | None = None, status: str | None = None
+    ) -> list[SubscriptionRecord]:
+        """List known subscriptions, optionally filtered.
+
+        Args:
+            session_id (str | None): Only subscriptions on this session.
+            status (str | None): Only subscriptions with this status.
+
+        Returns:
+            list[SubscriptionRecord]: Matching records.
+        """
+        return [
+            r
+            for r in self._records.values()
+            if (session_id is None or r.session_id == session_id)
+            and (status is None or r.status == status)
+        ]
+
+    def channel_ids(self, session_id: str) -> list[str]:
+        """Broadcaster IDs with an enabled subscription on a session."""
+        return [
+            r.broadcaster_id
+            for r in self.records(session_id=session_id, status=STATUS_ENABLED)
+            if r.broadcaster_id is not None
+        ]
+
+    def stale_records(self, keep_sessions: set[str]) -> list[SubscriptionRecord]:
+        """Subscriptions on sessions outside ``keep_sessions``.
+
+        Args:
+            keep_sessions (set[str]): Sessions still in use.
+
+        Returns:
+            list[SubscriptionRecord]: Subscriptions left over from sessions
+                that are gone, such as those of a previous run.
+        """
+        return [
+            r
+            for r in self._records.values()
+            if r.session_id is not None and r.session_id not in keep_sessions
+        ]
+
+
+_inventories: dict[str, SubscriptionInventory] = {}
+
+
+def get_subscription_inventory(client_id: str) -> SubscriptionInventory:
+    """Get or create the shared inventory for a client ID.
+
+    Args:
+        client_id (str): Twitch application client ID.
+
+    Returns:
+        SubscriptionInventory: The inventory for the client ID.
+    """
+    inventory = _inventories.get(client_id)
+    if inventory is None:
+        inventory = SubscriptionInventory(client_id)
+        _inventories[client_id] = inventory
+    return inventory
@@ -3,6 +3,8 @@
 This module provides the SubscriptionManager class, responsible for creating,
 verifying, and cleaning up EventSub subscriptions for Twitch chat messages.
 It implements rate limiting, error handling, and tracks active subscriptions.
+Listings come from the process-wide SubscriptionInventory shared by every bot
+of the same client_id.
 """
 
 import asyncio
@@ -12,9 +14,15 @@ from typing import Any
 from ..api.twitch import TwitchAPI
 from ..errors.eventsub import AuthenticationError, SubscriptionError
 from .protocols import SubscriptionManagerProtocol
+from .subscription_inventory import (
+    EVENTSUB_CHAT_MESSAGE,
+    EVENTSUB_SUBSCRIPTIONS,
+    SubscriptionInventory,
+    SubscriptionRecord,
+    get_subscription_inventory,
+)
+from .subscription_reaper import ReapResult, reap_subscriptions
 
-EVENTSUB_SUBSCRIPTIONS = "eventsub/subscriptions"
-EVENTSUB_CHAT_MESSAGE = "channel.chat.message"
 SUBSCRIPTION_VERIFICATION_FAILED_UNAUTHORIZED = (
     "Subscription verification failed: unauthorized"
 )
@@ -34,6 +42,7 @@ class SubscriptionManager(SubscriptionManagerProtocol):
         _client_id (str): Twitch application client ID.
         _active_subscriptions (dict[str, str]): Mapping of subscription ID to channel ID.
         _rate_limiter (asyncio.Semaphore): Semaphore for rate limiting concurrent subscriptions.
+        _inventory (SubscriptionInventory): Shared subscription list for the client_id.
     """
 
     def __init__(
@@ -43,6 +52,7 @@ class SubscriptionManager(SubscriptionManagerProtocol):
         token: str,
         client_id: str,
         token_manager: Any = None,
+        inventory: SubscriptionInventory | None = None,
     ):
         """Initialize the SubscriptionManager.
 
@@ -52,6 +62,8 @@ class SubscriptionManager(SubscriptionManagerProtocol):
             token (str): OAuth access token for API requests.
             client_id (str): Twitch application client ID.
             token_manager: Optional token manager for refresh on 401.
+            inventory (SubscriptionInventory | None): Shared subscription list;
+                defaults to the process-wide one for ``client_id``.
 
         Raises:
             ValueError: If any required parameter is None or empty.
@@ -76,6 +88,8 @@ class SubscriptionManager(SubscriptionManagerProtocol):
         )  # Limit to 10 concurrent subscriptions
         self._token_lock = asyncio.Lock()  # Lock for atomic token updates
         self._cleanup_registered = False
+        self._inventory = inventory or get_subscription_inventory(client_id)
+        self._inventory.track_session(self, session_id)
 
     async def subscribe_channel_chat(self, channel_id: str, user_id: str) -> bool:
         """Subscribe to chat messages for a specific user in a channel.
@@ -113,8 +127,9 @@ class SubscriptionManager(SubscriptionManagerProtocol):
     async def verify_subscriptions(self) -> list[str]:
         """Verify active subscriptions and return list of active channel IDs.
 
-        Fetches current active subscriptions from Twitch and returns a list
-        of channel IDs that have active subscriptions matching this session.
+        Reads the shared subscription inventory (refreshing it if it is older
+        than its max age) and returns the channel IDs with enabled
+        subscriptions on this session.
 
         Returns:
             list[str]: List of active channel IDs.
@@ -142,10 +157,11 @@ class SubscriptionManager(SubscriptionManagerProtocol):
     async def cleanup_stale_subscriptions(self) -> None:
         """Clean up stale EventSub subscriptions from previous sessions.
 
-        Queries all existing EventSub subscriptions from Twitch API for this client_id,
-        filters for 'channel.chat.message' type subscriptions with session IDs different
-        from the current session, and deletes them. This prevents accumulation of
-        stale subscriptions from previous runs.
+        Looks up 'channel.chat.message' subscriptions in the shared inventory
+        whose session is neither this bot's nor that of any other live bot in
+        this process, and deletes them. This prevents accumulation of stale
+        subscriptions from previous runs without removing those of bots that
+        share the client_id.
 
         Handles API errors gracefully without failing startup. Logs the number
         of subscriptions found, deleted, and any errors encountered.
@@ -155,25 +171,16 @@ class SubscriptionManager(SubscriptionManagerProtocol):
         """
         try:
             logging.info(f"🧹 Starting cleanup for session: {self._session_id}")
-            data, status, _ = await self._api.request(
-                "GET",
-                EVENTSUB_SUBSCRIPTIONS,
-                access_token=self._token,
-                client_id=self._client_id,
-                allow_on_open=True,
-            )
-
+            status = await self._refresh_inventory()
             if status == 401:
-                data, status = await self._refresh_token_and_retry_get()
-                if status == 401:
-                    logging.warning("⚠️ Cannot cleanup stale subscriptions: authentication failed")
-                    return
-
+                logging.warning("⚠️ Cannot cleanup stale subscriptions: authentication failed")
+                return
             if status != 200:
                 logging.warning(f"⚠️ Cannot cleanup stale subscriptions: HTTP {status}")
                 return
 
-            stale_sub_ids = self._extract_stale_subscription_ids_for_session(data, self._session_id)
+            keep_sessions = self._inventory.live_session_ids() | {self._session_id}
+            stale_sub_ids = [r.id for r in self._inventory.stale_records(keep_sessions)]
             if stale_sub_ids:
                 logging.info(f"🧹 Found {len(stale_sub_ids)} stale subscriptions to cleanup for session {self._session_id}")
                 # Log details about what we're cleaning up for debugging
@@ -184,20 +191,11 @@ class SubscriptionManager(SubscriptionManagerProtocol):
             else:
                 logging.info(f"🧹 No stale subscriptions found for session {self._session_id}")
 
-            deleted_count = 0
-            error_count = 0
-            # Process cleanup in single pass without batching
-            for sub_id in stale_sub_ids:
-                try:
-                    await self._unsubscribe_single(sub_id, allow_on_open=True, suppress_warnings=True)
-                    deleted_count += 1
-                    logging.debug(f"✅ Cleaned up stale subscription {sub_id}")
-                except Exception as e:
-                    error_count += 1
-                    logging.warning(f"⚠️ Failed to cleanup stale subscription {sub_id}: {str(e)}")
-
             if stale_sub_ids:
-                logging.info(f"🧹 Cleanup completed: {deleted_count} deleted, {error_count} errors for session {self._session_id}")
+                result = await self._reap(stale_sub_ids, "stale subscriptions")
+                for sub_id, error in list(result.failed.items())[:3]:
+                    logging.warning(f"⚠️ Failed to cleanup stale subscription {sub_id}: {error}")
+                logging.info(f"🧹 Cleanup completed: {result.summary()} for session {self._session_id}")
 
         except Exception as e:
             # Don't log warning for "Session is closed" as it's expected during shutdown
@@ -208,8 +206,8 @@ class SubscriptionManager(SubscriptionManagerProtocol):
     async def unsubscribe_all(self) -> None:
         """Unsubscribe from all active subscriptions.
 
-        Sends DELETE requests for all tracked active subscriptions and clears
-        the internal tracking.
+        Deletes all tracked active subscriptions in bulk and clears the
+        internal tracking.
 
         Raises:
             SubscriptionError: If unsubscription fails.
@@ -217,16 +215,13 @@ class SubscriptionManager(SubscriptionManagerProtocol):
         if not self._active_subscriptions:
             return
 
-        errors = []
-        for sub_id in self._active_subscriptions:
-            try:
-                await self._unsubscribe_single(sub_id, allow_on_open=True, suppress_warnings=True)
-            except Exception as e:
-                errors.append(f"Failed to unsubscribe {sub_id}: {str(e)}")
-                logging.warning(f"⚠️ EventSub unsubscribe failed for {sub_id}: {str(e)}")
-
+        result = await self._reap(list(self._active_subscriptions), "active subscriptions")
         self._active_subscriptions.clear()
 
+        errors = [f"Failed to unsubscribe {sub_id}: {error}" for sub_id, error in result.failed.items()]
+        errors += [f"Deadline reached before unsubscribing {sub_id}" for sub_id in result.skipped]
+        for error in errors[:3]:
+            logging.warning(f"⚠️ EventSub {error}")
         if errors:
             raise SubscriptionError(
                 f"Unsubscribe errors: {'; '.join(errors)}", operation_type="unsubscribe"
@@ -235,14 +230,17 @@ class SubscriptionManager(SubscriptionManagerProtocol):
         logging.info("✅ EventSub unsubscribed from all subscriptions")
 
     async def cleanup_all_reliably(self) -> None:
-        """Reliably cleanup all subscriptions with retry logic and atomic operations.
+        """Reliably cleanup all subscriptions with retry logic.
 
-        This method ensures all subscriptions are cleaned up even during forced shutdown.
-        Uses retry logic and doesn't fail partially - either all succeed or all fail.
+        Deletes every tracked subscription in bulk, then retries only the
+        ones that failed. Stops early once the process-wide cleanup deadline
+        set during shutdown has passed; whatever is left then expires with
+        the WebSocket session and is reaped as stale on the next start.
 
         Raises:
             SubscriptionError: If cleanup fails completely after retries.
         """
+        self._inventory.release_session(self)
         if not self._active_subscriptions:
             logging.debug("🧹 No active subscriptions to cleanup")
             return
@@ -250,67 +248,56 @@ class SubscriptionManager(SubscriptionManagerProtocol):
         max_retries = 3
         retry_delay = 1.0
 
+        # Reset circuit breaker at start of cleanup to ensure cleanup can proceed
+        from ..utils.circuit_breaker import reset_circuit_breaker
+        reset_circuit_breaker("helix:global")
+
         for attempt in range(max_retries):
+            remaining = list(self._active_subscriptions)
+            logging.info(
+                f"🧹 Reliable cleanup attempt {attempt + 1}/{max_retries}: {len(remaining)} subscriptions"
+            )
             try:
-                logging.info(f"🧹 Starting reliable cleanup attempt {attempt + 1}/{max_retries}")
-
-                # Reset circuit breaker at start of cleanup to ensure cleanup can proceed
-                from ..utils.circuit_breaker import reset_circuit_breaker
-                reset_circuit_breaker("twitch_api")
-
-                # Create a snapshot of current subscriptions for atomic cleanup
-                subscriptions_to_cleanup = list(self._active_subscriptions.keys())
-                logging.info(f"🧹 Cleaning up {len(subscriptions_to_cleanup)} subscriptions")
-
-                errors = []
-                successful_cleanups = 0
-
-                # Attempt to cleanup each subscription with individual error handling
-                for sub_id in subscriptions_to_cleanup:
-                    try:
-                        await self._unsubscribe_single(sub_id, allow_on_open=True, suppress_warnings=True)
-                        successful_cleanups += 1
-                        logging.debug(f"✅ Cleaned up subscription {sub_id}")
-                    except Exception as e:
-                        # Treat "Session is closed" as successful cleanup since the session
-                        # being closed means the subscription is effectively cleaned up
-                        error_str = str(e)
-                        if "Session is closed" in error_str:
-                            successful_cleanups += 1
-                            logging.debug(f"✅ Subscription {sub_id} already cleaned (session closed)")
-                        else:
-                            errors.append(f"Failed to cleanup {sub_id}: {error_str}")
-                            logging.warning(f"⚠️ Cleanup failed for {sub_id}: {error_str}")
-
-                # Only clear tracking if we successfully cleaned up all subscriptions
-                if successful_cleanups == len(subscriptions_to_cleanup):
-                    self._active_subscriptions.clear()
-                    logging.info(f"✅ Reliable cleanup completed: {successful_cleanups} subscriptions cleaned")
-                    return
-                else:
-                    logging.warning(f"⚠️ Cleanup attempt {attempt + 1} partially failed: {successful_cleanups}/{len(subscriptions_to_cleanup)} successful")
-
-                    # If this isn't the last attempt, wait before retrying
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-
+                result = await self._reap(remaining, "active subscriptions")
             except Exception as e:
                 logging.error(f"💥 Cleanup attempt {attempt + 1} failed completely: {str(e)}")
                 if attempt < max_retries - 1:
                     await asyncio.sleep(retry_delay)
                     retry_delay *= 2
-                else:
-                    # Last attempt failed, clear tracking anyway to prevent permanent leaks
-                    logging.error("💥 All cleanup attempts failed, clearing tracking to prevent leaks")
-                    self._active_subscriptions.clear()
-                    raise SubscriptionError(
-                        f"Reliable cleanup failed after {max_retries} attempts: {str(e)}",
-                        operation_type="cleanup"
-                    ) from e
+                    continue
+                # Last attempt failed, clear tracking anyway to prevent permanent leaks
+                logging.error("💥 All cleanup attempts failed, clearing tracking to prevent leaks")
+                self._active_subscriptions.clear()
+                raise SubscriptionError(
+                    f"Reliable cleanup failed after {max_retries} attempts: {str(e)}",
+                    operation_type="cleanup"
+                ) from e
 
-        # If we get here, all attempts succeeded
-        logging.info("✅ Reliable cleanup completed successfully")
+            for sub_id in result.done:
+                self._active_subscriptions.pop(sub_id, None)
+            if result.complete:
+                logging.info(f"✅ Reliable cleanup completed: {result.summary()}")
+                return
+            if result.skipped:
+                logging.warning(
+                    f"⏱️ Cleanup deadline reached: {result.summary()}, leaving the rest to expire"
+                )
+                self._active_subscriptions.clear()
+                return
+
+            logging.warning(f"⚠️ Cleanup attempt {attempt + 1} partially failed: {result.summary()}")
+            for sub_id, error in list(result.failed.items())[:3]:
+                logging.warning(f"⚠️ Cleanup failed for {sub_id}: {error}")
+            # If this isn't the last attempt, wait before retrying the failures
+            if attempt < max_retries - 1:
+                await asyncio.sleep(retry_delay)
+                retry_delay *= 2  # Exponential backoff
+
+        logging.error(
+            f"💥 {len(self._active_subscriptions)} subscriptions still failing after "
+            f"{max_retries} attempts, clearing tracking to prevent leaks"
+        )
+        self._active_subscriptions.clear()
 
     def get_active_channel_ids(self) -> list[str]:
         """Get list of channel IDs with active subscriptions.
@@ -327,181 +314,29 @@ class SubscriptionManager(SubscriptionManagerProtocol):
             old_session_id (str): The old session ID to clean up subscriptions for.
         """
         try:
-            data, status, _ = await self._api.request(
-                "GET",
-                EVENTSUB_SUBSCRIPTIONS,
-                access_token=self._token,
-                client_id=self._client_id,
-                allow_on_open=True,
-            )
-
+            status = await self._refresh_inventory()
             if status == 401:
-                data, status = await self._refresh_token_and_retry_get()
-                if status == 401:
-                    logging.warning(f"⚠️ Cannot cleanup old session {old_session_id}: authentication failed")
-                    return
-
+                logging.warning(f"⚠️ Cannot cleanup old session {old_session_id}: authentication failed")
+                return
             if status != 200:
                 logging.warning(f"⚠️ Cannot cleanup old session {old_session_id}: HTTP {status}")
                 return
 
-            # Extract subscription IDs for the old session
-            old_sub_ids = self._extract_subscription_ids_for_session(data, old_session_id)
-
-            # Unsubscribe from old subscriptions
-            for sub_id in old_sub_ids:
-                try:
-                    await self._unsubscribe_single(sub_id, allow_on_open=True, suppress_warnings=True)
-                    logging.debug(f"✅ Cleaned up old subscription {sub_id} from session {old_session_id}")
-                except Exception as e:
-                    logging.warning(f"⚠️ Failed to cleanup old subscription {sub_id}: {str(e)}")
+            # Our own subscriptions all belong to the old session at this point
+            old_sub_ids = [r.id for r in self._inventory.records(session_id=old_session_id)]
+            old_sub_ids += [s for s in self._active_subscriptions if s not in old_sub_ids]
 
             if old_sub_ids:
-                logging.info(f"🧹 Cleaned up {len(old_sub_ids)} subscriptions from old session {old_session_id}")
+                result = await self._reap(old_sub_ids, f"subscriptions of old session {old_session_id}")
+                for sub_id in result.done:
+                    self._active_subscriptions.pop(sub_id, None)
+                for sub_id, error in list(result.failed.items())[:3]:
+                    logging.warning(f"⚠️ Failed to cleanup old subscription {sub_id}: {error}")
+                logging.info(f"🧹 Cleaned up old session {old_session_id}: {result.summary()}")
 
         except Exception as e:
             logging.warning(f"⚠️ Error during cleanup of old session {old_session_id}: {str(e)}")
 
-    def _extract_subscription_ids_for_session(self, data: Any, session_id: str) -> list[str]:
-        """Extract subscription IDs for a specific session from API response data.
-
-        Args:
-            data (Any): The API response data.
-            session_id (str): The session ID to filter by.
-
-        Returns:
-            list[str]: List of subscription IDs for the session.
-        """
-        if not isinstance(data, dict):
-            return []
-
-        rows = data.get("data")
-        if not isinstance(rows, list):
-            return []
-
-        sub_ids = []
-        for entry in rows:
-            if not isinstance(entry, dict):
-                continue
-
-            transport = entry.get("transport", {})
-            if (
-                not isinstance(transport, dict)
-                or transport.get("session_id") != session_id
-            ):
-                continue
-
-            sub_id = entry.get("id")
-            if isinstance(sub_id, str):
-                sub_ids.append(sub_id)
-
-        return sub_ids
-
-    def _extract_stale_subscription_ids_for_session(self, data: Any, current_session_id: str) -> list[str]:
-        """Extract subscription IDs for stale subscriptions from API response data.
-
-        Filters for 'channel.chat.message' type subscriptions where the transport
-        session_id is different from the current session_id. This identifies
-        subscriptions from previous sessions that should be cleaned up.
-
-        Args:
-            data (Any): The API response data.
-            current_session_id (str): The current active session ID.
-
-        Returns:
-            list[str]: List of subscription IDs for stale subscriptions.
-        """
-        if not isinstance(data, dict):
-            return []
-
-        rows = data.get("data")
-        if not isinstance(rows, list):
-            return []
-
-        stale_sub_ids = []
-        session_ids_found = set()
-
-        for entry in rows:
-            if not isinstance(entry, dict):
-                continue
-
-            # Only process channel.chat.message subscriptions
-            if entry.get("type") != EVENTSUB_CHAT_MESSAGE:
-                continue
-
-            transport = entry.get("transport", {})
-            if not isinstance(transport, dict):
-                continue
-
-            # Check if session_id is different from current session
-            session_id = transport.get("session_id")
-            if isinstance(session_id, str):
-                session_ids_found.add(session_id)
-                if session_id != current_session_id:
-                    # This is a subscription from a previous session
-                    sub_id = entry.get("id")
-                    if isinstance(sub_id, str):
-                        stale_sub_ids.append(sub_id)
-
-        logging.debug(f"🧹 Session IDs found in subscriptions: {sorted(session_ids_found)} for current session {current_session_id}")
-        return stale_sub_ids
-
-    def _extract_stale_subscription_ids(self, data: Any, active_session_ids: list[str]) -> list[str]:
-        """Extract subscription IDs for stale subscriptions from API response data.
-
-        Filters for 'channel.chat.message' type subscriptions where the transport
-        session_id is not in the active session IDs list. Also identifies any
-        session IDs that appear in API but aren't tracked in coordinator.
-
-        Args:
-            data (Any): The API response data.
-            active_session_ids (list[str]): List of active session IDs.
-
-        Returns:
-            list[str]: List of subscription IDs for stale subscriptions.
-        """
-        if not isinstance(data, dict):
-            return []
-
-        rows = data.get("data")
-        if not isinstance(rows, list):
-            return []
-
-        stale_sub_ids = []
-        session_ids_found = set()
-        unregistered_sessions = set()
-
-        for entry in rows:
-            if not isinstance(entry, dict):
-                continue
-
-            # Only process channel.chat.message subscriptions
-            if entry.get("type") != EVENTSUB_CHAT_MESSAGE:
-                continue
-
-            transport = entry.get("transport", {})
-            if not isinstance(transport, dict):
-                continue
-
-            # Check if session_id is not in active sessions
-            session_id = transport.get("session_id")
-            if isinstance(session_id, str):
-                session_ids_found.add(session_id)
-                if (session_id not in active_session_ids and
-                    session_id != self._session_id):
-                    # Check if this is a session from previous run (not current session)
-                    sub_id = entry.get("id")
-                    if isinstance(sub_id, str):
-                        stale_sub_ids.append(sub_id)
-                        unregistered_sessions.add(session_id)
-
-        # Log unregistered sessions found in API but not in coordinator
-        if unregistered_sessions:
-            logging.warning(f"🧹 Found unregistered session IDs in API: {sorted(unregistered_sessions)}")
-
-        logging.debug(f"🧹 Session IDs found in subscriptions: {sorted(session_ids_found)} for active sessions {active_session_ids}")
-        return stale_sub_ids
-
     async def update_session_id(self, new_session_id: str) -> None:
         """Update the session ID for new subscriptions.
 
@@ -530,8 +365,27 @@ class SubscriptionManager(SubscriptionManagerProtocol):
             logging.info(f"✅ Completed atomic cleanup of old session {old_session_id}")
 
         self._session_id = new_session_id
+        self._inventory.track_session(self, new_session_id)
         logging.info(f"🔄 EventSub session ID updated to {new_session_id}")
 
+    def adopt_session_id(self, new_session_id: str) -> None:
+        """Record the session ID after a session_reconnect handover.
+
+        Twitch moves subscriptions to the new session itself, so unlike
+        update_session_id nothing is cleaned up.
+
+        Args:
+            new_session_id (str): The EventSub session ID now in use.
+
+        Raises:
+            ValueError: If session_id is invalid.
+        """
+        if not new_session_id or not isinstance(new_session_id, str):
+            raise ValueError("Valid session_id required")
+        self._session_id = new_session_id
+        self._inventory.track_session(self, new_session_id)
+        logging.info(f"🔀 EventSub session ID carried over as {new_session_id}")
+
     def update_access_token(self, new_access_token: str) -> None:
         """Update the access token for API requests.
 
@@ -568,6 +422,7 @@ class SubscriptionManager(SubscriptionManagerProtocol):
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit with cleanup."""
         self._cleanup_registered = False
+        self._inventory.release_session(self)
         await self.unsubscribe_all()
 
     async def _handle_subscription_request(
@@ -598,6 +453,7 @@ class SubscriptionManager(SubscriptionManagerProtocol):
             sub_id = self._extract_subscription_id(data)
             if sub_id:
                 self._active_subscriptions[sub_id] = channel_id
+                self._record_created(data)
                 return True
             else:
                 logging.warning(
@@ -683,6 +539,7 @@ class SubscriptionManager(SubscriptionManagerProtocol):
                 sub_id = self._extract_subscription_id(data)
                 if sub_id:
                     self._active_subscriptions[sub_id] = channel_id
+                    self._record_created(data)
                     return True
                 else:
                     logging.warning(
@@ -763,6 +620,7 @@ class SubscriptionManager(SubscriptionManagerProtocol):
                 client_id=self._client_id,
             )
             if status == 204:
+                self._inventory.record_deleted(sub_id)
                 logging.debug(f"✅ EventSub unsubscribed from {sub_id} after retry")
             elif status == 401:
                 await self._token_manager.handle_401_error()
@@ -824,69 +682,33 @@ class SubscriptionManager(SubscriptionManagerProtocol):
                         return sub_id
         return None
 
-    def _extract_active_channel_ids_from_data(self, data: Any) -> list[str]:
-        """Extract active channel IDs from API response data.
+    def _record_created(self, data: Any) -> None:
+        """Add a subscription from a create response to the shared inventory.
 
         Args:
             data (Any): The API response data.
-
-        Returns:
-            list[str]: List of active channel IDs.
         """
-        if not isinstance(data, dict):
-            logging.warning("⚠️ Invalid API response data type for subscriptions")
-            return []
-
-        rows = data.get("data")
-        if not isinstance(rows, list):
-            logging.warning("⚠️ Invalid data structure in subscriptions response")
-            return []
-
-        active_channel_ids = []
-        session_ids_found = set()
-        mismatched_count = 0
-        for entry in rows:
-            if not isinstance(entry, dict):
-                logging.debug("⚠️ Skipping non-dict entry in subscriptions")
-                continue
-
-            if entry.get("type") != EVENTSUB_CHAT_MESSAGE:
-                logging.debug(f"⚠️ Skipping entry with type {entry.get('type')}")
-                continue
-
-            transport = entry.get("transport", {})
-            if not isinstance(transport, dict):
-                logging.debug("⚠️ Skipping entry with invalid transport")
-                continue
-
-            session_id = transport.get("session_id")
-            if isinstance(session_id, str):
-                session_ids_found.add(session_id)
-                if session_id != self._session_id:
-                    logging.debug("⚠️ Skipping entry with mismatched session_id")
-                    mismatched_count += 1
-                    continue
-
-            cond = entry.get("condition", {})
-            if not isinstance(cond, dict):
-                logging.debug("⚠️ Skipping entry with invalid condition")
-                continue
-
-            channel_id = cond.get("broadcaster_user_id")
-            if not isinstance(channel_id, str):
-                logging.debug("⚠️ Skipping entry with invalid broadcaster_user_id")
-                continue
+        self._inventory.track_session(self, self._session_id)
+        if isinstance(data, dict) and isinstance(data.get("data"), list) and data["data"]:
+            self._inventory.record_created(SubscriptionRecord.from_row(data["data"][0]))
 
-            active_channel_ids.append(channel_id)
+    async def _refresh_inventory(self) -> int:
+        """Make sure the shared inventory is fresh, refreshing our token on 401.
 
-        logging.debug(f"🔍 Verification session_ids found: {sorted(session_ids_found)}, mismatched: {mismatched_count} for session {self._session_id}")
-        return active_channel_ids
+        Returns:
+            int: 200 if the inventory is usable, otherwise the HTTP status.
 
-    async def _refresh_token_and_retry_get(self) -> tuple[Any, int]:
-        """Refresh token and retry GET request for subscriptions.
+        Raises:
+            AuthenticationError: If the token refresh fails.
+        """
+        status = await self._inventory.refresh(self._api, self._token)
+        if status == 401:
+            await self._refresh_listing_token()
+            status = await self._inventory.refresh(self._api, self._token, force=True)
+        return status
 
-        Returns:
-            tuple[Any, int]: The response data and status code.
+    async def _refresh_listing_token(self) -> None:
+        """Refresh the token after the subscription list was refused with 401.
 
         Raises:
             AuthenticationError: If refresh fails.
@@ -919,15 +741,6 @@ class SubscriptionManager(SubscriptionManagerProtocol):
             async with self._token_lock:
                 self._token = info.access_token
             self._token_manager.reset_401_counter()
-
-            # Retry the request
-            data, status, _ = await self._api.request(
-                "GET",
-                EVENTSUB_SUBSCRIPTIONS,
-                access_token=self._token,
-                client_id=self._client_id,
-            )
-            return data, status
         except Exception as e:
             logging.warning(f"⚠️ Token refresh failed during verification: {str(e)}")
             await self._token_manager.handle_401_error()
@@ -937,7 +750,7 @@ class SubscriptionManager(SubscriptionManagerProtocol):
             ) from e
 
     async def _fetch_active_channel_ids(self) -> list[str]:
-        """Fetch active channel IDs from Twitch API.
+        """Fetch active channel IDs from the shared subscription inventory.
 
         Returns:
             list[str]: List of active channel IDs for this session.
@@ -947,21 +760,12 @@ class SubscriptionManager(SubscriptionManagerProtocol):
             SubscriptionError: If fetch fails.
         """
         try:
-            data, status, _ = await self._api.request(
-                "GET",
-                EVENTSUB_SUBSCRIPTIONS,
-                access_token=self._token,
-                client_id=self._client_id,
-                allow_on_open=True,
-            )
-
+            status = await self._refresh_inventory()
             if status == 401:
-                data, status = await self._refresh_token_and_retry_get()
-                if status == 401:
-                    raise AuthenticationError(
-                        SUBSCRIPTION_VERIFICATION_FAILED_UNAUTHORIZED,
-                        operation_type="verify",
-                    )
+                raise AuthenticationError(
+                    SUBSCRIPTION_VERIFICATION_FAILED_UNAUTHORIZED,
+                    operation_type="verify",
+                )
 
             if status != 200:
                 raise SubscriptionError(
@@ -969,7 +773,12 @@ class SubscriptionManager(SubscriptionManagerProtocol):
                     operation_type="verify",
                 )
 
-            return self._extract_active_channel_ids_from_data(data)
+            channel_ids = self._inventory.channel_ids(self._session_id)
+            logging.debug(
+                f"🔍 Verification found {len(channel_ids)} channels for session {self._session_id} "
+                f"(inventory age {self._inventory.age or 0:.1f}s)"
+            )
+            return channel_ids
 
         except (AuthenticationError, SubscriptionError):
             raise
@@ -978,13 +787,43 @@ class SubscriptionManager(SubscriptionManagerProtocol):
                 f"Fetch active subscriptions error: {str(e)}", operation_type="verify"
             ) from e
 
-    async def _unsubscribe_single(self, sub_id: str, allow_on_open: bool = False, suppress_warnings: bool = False) -> None:
+    async def _reap(self, sub_ids: list[str], label: str) -> ReapResult:
+        """Delete subscriptions in bulk under the shared cleanup deadline.
+
+        Subscriptions another bot is already deleting are left to it and
+        reported as already gone.
+
+        Args:
+            sub_ids (list[str]): Subscription IDs to delete.
+            label (str): What is being deleted, for progress logs.
+
+        Returns:
+            ReapResult: What happened to each subscription.
+        """
+        async def delete(sub_id: str) -> bool:
+            return await self._unsubscribe_single(
+                sub_id, allow_on_open=True, suppress_warnings=True
+            )
+
+        claimed = self._inventory.claim(sub_ids)
+        try:
+            result = await reap_subscriptions(claimed, delete, label=label)
+        finally:
+            self._inventory.unclaim(claimed)
+        taken = set(claimed)
+        result.already_gone.extend(s for s in dict.fromkeys(sub_ids) if s not in taken)
+        return result
+
+    async def _unsubscribe_single(self, sub_id: str, allow_on_open: bool = False, suppress_warnings: bool = False) -> bool:
         """Unsubscribe from a single subscription.
 
         Args:
             sub_id (str): The subscription ID to unsubscribe.
             allow_on_open (bool): If True, allow request even when circuit breaker is open.
-            suppress_warnings (bool): If True, suppress circuit breaker warnings.
+            suppress_warnings (bool): If True, suppress circuit breaker and not-found warnings.
+
+        Returns:
+            bool: True if deleted, False if the subscription was already gone.
 
         Raises:
             SubscriptionError: If unsubscription fails.
@@ -999,22 +838,26 @@ class SubscriptionManager(SubscriptionManagerProtocol):
                 suppress_warnings=suppress_warnings,
             )
 
+            if status in (204, 404, 503):
+                self._inventory.record_deleted(sub_id)
             if status == 204:
                 logging.debug(f"✅ EventSub unsubscribed from {sub_id}")
-                return
+                return True
             elif status == 401:
                 await self._handle_401_and_retry_unsubscribe(sub_id)
-                return
+                return True
             elif status == 404:
-                logging.warning(
-                    f"⚠️ EventSub subscription {sub_id} not found (already unsubscribed)"
-                )
-                return
+                message = f"EventSub subscription {sub_id} not found (already unsubscribed)"
+                if suppress_warnings:
+                    logging.debug(f"✅ {message}")
+                else:
+                    logging.warning(f"⚠️ {message}")
+                return False
             elif status == 503:
                 # Service unavailable - likely due to session being closed
                 # This is effectively a successful cleanup since the session is closed
                 logging.debug(f"✅ EventSub subscription {sub_id} already cleaned (service unavailable)")
-                return
+                return False
             else:
                 raise SubscriptionError(
                     f"Unsubscribe failed: HTTP {status} for {sub_id}",
@@ -1028,7 +871,7 @@ class SubscriptionManager(SubscriptionManagerProtocol):
             error_str = str(e)
             if "Session is closed" in error_str:
                 logging.debug(f"✅ EventSub subscription {sub_id} already cleaned (session closed)")
-                return
+                return False
             else:
                 raise SubscriptionError(
                     f"Unsubscribe error for {sub_id}: {error_str}",
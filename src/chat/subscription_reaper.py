@@ -0,0 +1,161 @@
+"""Bulk deletion of EventSub subscriptions.
+
+Deleting subscriptions one ``DELETE`` at a time makes cleanup after a crash
+(hundreds of stale subscriptions) and graceful shutdown take minutes.
+:func:`reap_subscriptions` runs the deletions with bounded concurrency; each
+request still passes the Helix rate limiter, which paces them against the
+``Ratelimit-*`` budget. Subscriptions that are already gone count as done,
+progress is logged as batches complete, and a deadline stops the work early.
+
+During shutdown the lifecycle manager sets one process-wide deadline with
+:func:`set_cleanup_deadline` so every bot's cleanup ends in time together.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+
+from ..constants import EVENTSUB_REAPER_CONCURRENCY
+
+PROGRESS_EVERY = 50  # Log progress every this many finished subscriptions
+
+# Deletion callback: True when deleted, False when it was already gone
+DeleteFunc = Callable[[str], Awaitable[bool]]
+
+_cleanup_deadline: float | None = None
+
+
+def set_cleanup_deadline(seconds: float | None) -> None:
+    """Set or clear the process-wide deadline for subscription cleanup.
+
+    Args:
+        seconds (float | None): Time from now until cleanup must stop, or
+            None to remove the deadline.
+    """
+    global _cleanup_deadline
+    _cleanup_deadline = None if seconds is None else time.monotonic() + seconds
+
+
+def cleanup_deadline() -> float | None:
+    """Get the process-wide cleanup deadline (``time.monotonic()`` based)."""
+    return _cleanup_deadline
+
+
+@dataclass
+class ReapResult:
+    """Outcome of one bulk deletion.
+
+    Attributes:
+        deleted (list[str]): Subscriptions deleted by this run.
+        already_gone (list[str]): Subscriptions Twitch no longer had.
+        failed (dict[str, str]): Subscription ID to error for failed deletions.
+        skipped (list[str]): Subscriptions not finished before the deadline.
+        seconds (float): Wall time of the run.
+    """
+
+    deleted: list[str] = field(default_factory=list)
+    already_gone: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    skipped: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def done(self) -> list[str]:
+        """Subscriptions that no longer exist."""
+        return self.deleted + self.already_gone
+
+    @property
+    def complete(self) -> bool:
+        """True when every subscription is gone."""
+        return not self.failed and not self.skipped
+
+    def summary(self) -> str:
+        """One-line description for logs."""
+        return (
+            f"{len(self.deleted)} deleted, {len(self.already_gone)} already gone, "
+            f"{len(self.failed)} failed, {len(self.skipped)} skipped "
+            f"in {self.seconds:.2f}s"
+        )
+
+
+async def reap_subscriptions(
+    sub_ids: Iterable[str],
+    delete: DeleteFunc,
+    *,
+    concurrency: int = EVENTSUB_REAPER_CONCURRENCY,
+    deadline: float | None = None,
+    label: str = "subscriptions",
+) -> ReapResult:
+    """Delete many subscriptions with bounded concurrency.
+
+    Args:
+        sub_ids (Iterable[str]): Subscription IDs to delete; duplicates are
+            deleted once.
+        delete (DeleteFunc): Deletes one subscription. Returns False if it was
+            already gone and raises on failure.
+        concurrency (int): Deletions in flight at once.
+        deadline (float | None): ``time.monotonic()`` value after which no new
+            deletion starts and running ones are abandoned. Defaults to the
+            process-wide cleanup deadline.
+        label (str): What is being deleted, for progress logs.
+
+    Returns:
+        ReapResult: What happened to each subscription.
+    """
+    pending = list(dict.fromkeys(sub_ids))
+    result = ReapResult()
+    if not pending:
+        return result
+    if deadline is None:
+        deadline = _cleanup_deadline
+    started = time.monotonic()
+    total = len(pending)
+    queue = iter(pending)
+
+    def _progress() -> None:
+        finished = len(result.done) + len(result.failed)
+        if finished % PROGRESS_EVERY == 0 and finished < total:
+            logging.info(f"🧹 Reaping {label}: {finished}/{total} finished")
+
+    async def _worker() -> None:
+        for sub_id in queue:
+            try:
+                if await delete(sub_id):
+                    result.deleted.append(sub_id)
+                else:
+                    result.already_gone.append(sub_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001 - recorded per subscription
+                result.failed[sub_id] = str(e)
+            _progress()
+
+    workers = [asyncio.create_task(_worker()) for _ in range(max(1, min(concurrency, total)))]
+    try:
+        if deadline is None:
+            await asyncio.gather(*workers)
+        else:
+            async with asyncio.timeout_at(_loop_deadline(deadline)):
+                await asyncio.gather(*workers)
+    except TimeoutError:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        finished = {*result.deleted, *result.already_gone, *result.failed}
+        result.skipped = [sub_id for sub_id in pending if sub_id not in finished]
+        logging.warning(
+            f"⏱️ Deadline reached while reaping {label}: "
+            f"{len(result.skipped)}/{total} left"
+        )
+    result.seconds = time.monotonic() - started
+    return result
+
+
+def _loop_deadline(deadline: float) -> float:
+    """Convert a ``time.monotonic()`` deadline to event loop time."""
+    loop = asyncio.get_running_loop()
+    return loop.time() + (deadline - time.monotonic())
@@ -9,16 +9,17 @@ handling for Twitch EventSub.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
 from typing import Any
 
 from ..errors.eventsub import EventSubConnectionError
+from ..utils import json_codec
 from ..utils.circuit_breaker import (
     CircuitBreakerConfig,
     CircuitBreakerOpenException,
-    get_circuit_breaker,
+    FailureScope,
+    get_keyed_circuit_breaker,
 )
 from .connection_state_manager import ConnectionState, ConnectionStateManager
 from .message_transceiver import MessageTransceiver
@@ -26,10 +27,33 @@ from .protocols import WebSocketConnectionManagerProtocol
 from .reconnection_manager import ReconnectionManager
 from .websocket_connector import WebSocketConnector
 
-EVENTSUB_WS_URL = "wss://eventsub.wss.twitch.tv/ws"
-
 WEBSOCKET_NOT_CONNECTED_ERROR = "WebSocket not connected"
 
+WEBSOCKET_BREAKER_NAMESPACE = "websocket"
+
+
+def classify_connect_error(error: Exception) -> FailureScope:
+    """Classify a failed connection attempt for the breaker hierarchy.
+
+    A handshake rejected with 401/403 is a problem with this bot's token and
+    must not open the breaker shared by every other bot.
+
+    Args:
+        error: The exception raised by the connection attempt.
+
+    Returns:
+        FailureScope: USER for auth rejections, SHARED otherwise.
+    """
+    current: BaseException | None = error
+    while current is not None:
+        status = getattr(current, "status_code", None)
+        if status is None:
+            status = getattr(getattr(current, "response", None), "status_code", None)
+        if status in (401, 403):
+            return FailureScope.USER
+        current = current.__cause__
+    return FailureScope.SHARED
+
 
 class WebSocketConnectionManager(WebSocketConnectionManagerProtocol):
     """Manages WebSocket connections for Twitch EventSub.
@@ -59,7 +83,8 @@ class WebSocketConnectionManager(WebSocketConnectionManagerProtocol):
         session,
         token: str,
         client_id: str,
-        ws_url: str = EVENTSUB_WS_URL,
+        ws_url: str | None = None,
+        breaker_owner: str | None = None,
     ) -> None:
         """Initialize the WebSocket Connection Manager.
 
@@ -67,7 +92,10 @@ class WebSocketConnectionManager(WebSocketConnectionManagerProtocol):
             session (aiohttp.ClientSession): HTTP session for connections.
             token (str): OAuth access token.
             client_id (str): Twitch client ID.
-            ws_url (str): Initial WebSocket URL.
+            ws_url (str | None): Initial WebSocket URL; None uses the
+                configured EventSub endpoint.
+            breaker_owner (str | None): Identity the connection circuit breaker
+                is keyed by (``websocket:<owner>``); None uses only the shared one.
         """
         self.session = session
         self.token = token
@@ -76,7 +104,20 @@ class WebSocketConnectionManager(WebSocketConnectionManagerProtocol):
         # Compose specialized components
         self.connector = WebSocketConnector(token, client_id, ws_url)
         self._stop_event = asyncio.Event()
-        self.reconnection_manager = ReconnectionManager(self.connector, self._stop_event)
+        # Circuit breaker for WebSocket connections
+        cb_config = CircuitBreakerConfig(
+            name=f"{WEBSOCKET_BREAKER_NAMESPACE}:global",
+            failure_threshold=3,
+            recovery_timeout=30.0,
+            success_threshold=2,
+        )
+        breaker_key = WEBSOCKET_BREAKER_NAMESPACE
+        if breaker_owner:
+            breaker_key = f"{WEBSOCKET_BREAKER_NAMESPACE}:{breaker_owner}"
+        self.circuit_breaker = get_keyed_circuit_breaker(breaker_key, cb_config)
+        self.reconnection_manager = ReconnectionManager(
+            self.connector, self._stop_event, self.circuit_breaker
+        )
         self.state_manager = ConnectionStateManager(self.connector)
         self.transceiver = MessageTransceiver(self.connector, self.state_manager.last_activity)
 
@@ -90,15 +131,6 @@ class WebSocketConnectionManager(WebSocketConnectionManagerProtocol):
         self._connection_pool: set[WebSocketConnectionManager] = set()
         self._max_pool_size = 3  # Limit concurrent connections
 
-        # Circuit breaker for WebSocket connections
-        cb_config = CircuitBreakerConfig(
-            name="websocket_connection",
-            failure_threshold=3,
-            recovery_timeout=30.0,
-            success_threshold=2,
-        )
-        self.circuit_breaker = get_circuit_breaker("websocket_connection", cb_config)
-
     async def __aenter__(self) -> WebSocketConnectionManager:
         """Async context manager entry."""
         await self.connect()
@@ -187,7 +219,9 @@ class WebSocketConnectionManager(WebSocketConnectionManagerProtocol):
                 ) from e
 
         try:
-            await self.circuit_breaker.call(_perform_connection)
+            await self.circuit_breaker.call(
+                _perform_connection, classify_error=classify_connect_error
+            )
         except CircuitBreakerOpenException:
             logging.error("🚨 WebSocket connection blocked by circuit breaker")
             raise EventSubConnectionError(
@@ -317,6 +351,42 @@ class WebSocketConnectionManager(WebSocketConnectionManagerProtocol):
             self.state_manager.connection_state = ConnectionState.CONNECTED
         return success
 
+    async def handover(self, reconnect_url: str) -> bool:
+        """Move to the socket named by a session_reconnect message.
+
+        The new socket is opened alongside the current one and only becomes
+        current once its welcome arrives. Twitch carries subscriptions over
+        to the new session, so nothing is resubscribed; the old socket keeps
+        being read until it closes or the drain window expires.
+
+        Args:
+            reconnect_url (str): URL from the session_reconnect payload.
+
+        Returns:
+            bool: True if the new socket is live, False if the caller should
+            fall back to a full reconnect.
+        """
+        candidate = WebSocketConnector(self.connector.token, self.client_id, reconnect_url)
+        try:
+            await candidate.connect()
+            session_id = await self._read_welcome(
+                MessageTransceiver(candidate, [time.monotonic()])
+            )
+        except EventSubConnectionError as e:
+            logging.warning(f"⚠️ Session handover to {reconnect_url} failed: {str(e)}")
+            await candidate.disconnect()
+            return False
+
+        previous = self.connector.ws
+        self.connector.ws = candidate.ws
+        self.state_manager.session_id = session_id
+        self.state_manager.connection_state = ConnectionState.CONNECTED
+        self.state_manager.last_activity[0] = time.monotonic()
+        if previous is not None:
+            self.transceiver.retire(previous)
+        logging.info(f"🔀 Session handover complete, session_id: {session_id}")
+        return True
+
     async def _process_welcome(self) -> None:
         """Process welcome message and extract session ID.
 
@@ -327,24 +397,32 @@ class WebSocketConnectionManager(WebSocketConnectionManagerProtocol):
             raise EventSubConnectionError(
                 "No WebSocket connection", operation_type="welcome"
             )
+        self.state_manager.session_id = await self._read_welcome(self.transceiver)
 
+    async def _read_welcome(self, transceiver: MessageTransceiver) -> str:
+        """Read the welcome frame from a transceiver and return its session ID.
+
+        Raises:
+            EventSubConnectionError: If welcome processing fails.
+        """
         try:
             # If challenge was handled, welcome might already be received
             # For simplicity, always wait for welcome
-            msg = await self.transceiver.receive_message()
+            msg = await transceiver.receive_message()
 
             if msg.type != "text":
                 raise EventSubConnectionError(
                     "Invalid welcome message type", operation_type="welcome"
                 )
 
-            data = json.loads(msg.data)
-            self.state_manager.session_id = data.get("payload", {}).get("session", {}).get("id")
+            data = json_codec.loads(msg.data)
+            session_id = data.get("payload", {}).get("session", {}).get("id")
 
-            if not self.state_manager.session_id:
+            if not session_id:
                 raise EventSubConnectionError(
                     "No session ID in welcome", operation_type="welcome"
                 )
+            return session_id
 
         except Exception as e:
             if isinstance(e, EventSubConnectionError):
@@ -6,7 +6,7 @@ import logging
 
 import websockets
 
-EVENTSUB_WS_URL = "wss://eventsub.wss.twitch.tv/ws"
+from ..api.endpoints import get_endpoints
 
 
 class TwitchEventSubProtocol(websockets.WebSocketClientProtocol):
@@ -33,18 +33,19 @@ class WebSocketConnector:
         self,
         token: str,
         client_id: str,
-        ws_url: str = EVENTSUB_WS_URL,
+        ws_url: str | None = None,
     ) -> None:
         """Initialize the WebSocket Connector.
 
         Args:
             token (str): OAuth access token.
             client_id (str): Twitch client ID.
-            ws_url (str): Initial WebSocket URL.
+            ws_url (str | None): Initial WebSocket URL; None uses the
+                configured EventSub endpoint.
         """
         self.token = token
         self.client_id = client_id
-        self.ws_url = ws_url
+        self.ws_url = ws_url or get_endpoints().eventsub_ws_url
         self.ws: websockets.WebSocketClientProtocol | None = None
 
     def _get_headers(self):
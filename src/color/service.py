@@ -6,6 +6,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING
 
+from ..utils.latency import get_latency_recorder
 from .models import ColorRequestResult, ColorRequestStatus
 from .utils import TWITCH_PRESET_COLORS, get_random_hex, get_random_preset
 
@@ -39,20 +40,26 @@ class ColorChangeService:
         Returns:
             bool: True if the color change was successful, False otherwise.
         """
+        latency = get_latency_recorder()
+        latency.record_dispatch(self.bot.username)
         if hex_color:
             color = hex_color
             allow_fallback = False
         else:
-            color = self._select_color()
+            with latency.measure(self.bot.username, "select"):
+                color = self._select_color()
             allow_fallback = self.bot.use_random_colors
 
         try:
-            return await self._perform_color_change(
+            changed = await self._perform_color_change(
                 color, allow_refresh=True, fallback_to_preset=allow_fallback
             )
         except Exception as e:
             logging.error(f"Error changing color: {str(e)}")
             return False
+        if changed:
+            latency.record_total(self.bot.username)
+        return changed
 
     async def _perform_color_change(
         self,
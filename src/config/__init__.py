@@ -12,6 +12,7 @@ from .core import (  # noqa: F401
     save_users_to_config,
     setup_missing_tokens,
     update_user_in_config,
+    update_users_in_config,
 )
 from .model import UserConfig
 from .repository import ConfigRepository
@@ -23,6 +24,7 @@ __all__ = [
     "load_users_from_config",
     "save_users_to_config",
     "update_user_in_config",
+    "update_users_in_config",
     "print_config_summary",
     "normalize_user_channels",
     "setup_missing_tokens",
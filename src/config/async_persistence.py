@@ -11,17 +11,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import os
-import shutil
 import time
 from contextlib import suppress
 from typing import Any
 
-from ..constants import (
-    CONFIG_DEBOUNCE_SECONDS,
-    CONFIG_MAX_FAILURES_WARNING,
-)
-from .core import update_user_in_config
+from ..constants import CONFIG_DEBOUNCE_SECONDS
+from .core import update_user_in_config, update_users_in_config
 
 __all__ = [
     "async_update_user_in_config",
@@ -89,6 +84,11 @@ def _log_batch_result(failures: int, attempted: int) -> None:
 async def _persist_batch(pending: list[dict[str, Any]], config_file: str) -> int:
     """Persist a batch of user configurations to the config file.
 
+    All pending deltas are merged into one in-memory document and written
+    with a single atomic replace (one backup rotation, one fsync). The batch
+    is all-or-nothing: an invalid entry or a failed write leaves the file
+    unchanged.
+
     Args:
         pending: List of user config dictionaries to persist.
         config_file: Path to the configuration file.
@@ -99,43 +99,17 @@ async def _persist_batch(pending: list[dict[str, Any]], config_file: str) -> int
     if not pending:
         return 0
 
-    backup_file = f"{config_file}.backup"
-    try:
-        shutil.copy2(config_file, backup_file)
-    except Exception as e:
-        logging.error(f"Failed to create backup for batch persistence: {e}")
-        return len(pending)  # fail all if can't backup
-
-    failures = 0
-    for uc in pending:
-        uname = str(uc.get("username", "")).lower()
-        try:
-            loop = asyncio.get_event_loop()
-            async with _PERSISTENCE_LOCK:
-                success = await loop.run_in_executor(
-                    None, update_user_in_config, uc, config_file
-                )
-            if not success:
-                failures += 1
-        except Exception as e:  # noqa: BLE001
-            failures += 1
-            if failures <= CONFIG_MAX_FAILURES_WARNING:
-                logging.warning(
-                    f"⚠️ Error writing batch item user={uname or uc.get('username')}: {str(e)}"
-                )
-
-    if failures > 0:
-        try:
-            shutil.copy2(backup_file, config_file)
-        except Exception as e:
-            logging.error(f"Failed to rollback batch: {e}")
-
     try:
-        os.remove(backup_file)
-    except Exception as e:
-        logging.warning(f"Failed to remove backup file: {e}")
-
-    return failures
+        loop = asyncio.get_event_loop()
+        async with _PERSISTENCE_LOCK:
+            return await loop.run_in_executor(
+                None, update_users_in_config, pending, config_file
+            )
+    except Exception as e:  # noqa: BLE001
+        logging.warning(
+            f"⚠️ Error writing config batch count={len(pending)}: {str(e)}"
+        )
+        return len(pending)
 
 
 async def _schedule_flush(config_file: str) -> None:
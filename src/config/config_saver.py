@@ -63,22 +63,58 @@ class ConfigSaver:
             RuntimeError: If update process fails.
             OSError: If file operations fail.
         """
-        try:
-            uc = UserConfig.from_dict(user_config_dict)
-            changed = uc.normalize()
+        return self.update_users_in_config([user_config_dict], config_file) == 0
+
+    def update_users_in_config(
+        self, user_config_dicts: Sequence[dict[str, Any]], config_file: str
+    ) -> int:
+        """Merge several user updates into the config file with a single write.
+
+        The file is loaded once, every update is merged into that document
+        and the result is saved with one atomic write (and one backup
+        rotation). The batch is all-or-nothing: if any update is invalid the
+        file is left untouched.
+
+        Args:
+            user_config_dicts: User configuration dictionaries to merge.
+            config_file: Path to the configuration file.
+
+        Returns:
+            Number of updates that failed (0 on success). A failed write
+            counts every update as failed.
+        """
+        validated: list[tuple[UserConfig, bool]] = []
+        failures = 0
+        for user_config_dict in user_config_dicts:
+            try:
+                uc = UserConfig.from_dict(user_config_dict)
+                changed = uc.normalize()
+            except (ValueError, RuntimeError) as e:
+                self._log_update_failed(e, user_config_dict)
+                failures += 1
+                continue
             if not uc.validate():
-                return self._log_update_invalid(uc)
+                self._log_update_invalid(uc)
+                failures += 1
+                continue
+            validated.append((uc, changed))
+        if failures or not validated:
+            return failures
+        try:
             users = self.loader.load_users_from_config(config_file)
-            users, replaced = self._merge_user(users, uc)
-            if not replaced:
-                users.append(uc.to_dict())
+            for uc, _ in validated:
+                users, replaced = self._merge_user(users, uc)
+                if not replaced:
+                    users.append(uc.to_dict())
             self.save_users_to_config(users, config_file)
+        except (ValueError, RuntimeError, OSError) as e:
+            for user_config_dict in user_config_dicts:
+                self._log_update_failed(e, user_config_dict)
+            return len(user_config_dicts)
+        for uc, changed in validated:
             if changed:
                 self._log_update_normalized(uc)
-            return True
-        except (ValueError, RuntimeError, OSError) as e:
-            self._log_update_failed(e, user_config_dict)
-            return False
+        return 0
 
     def _merge_user(
         self,
@@ -55,8 +55,20 @@ def update_user_in_config(user_config_dict: dict[str, Any], config_file: str) ->
     return saver.update_user_in_config(user_config_dict, config_file)
 
 
+def update_users_in_config(
+    user_config_dicts: Sequence[dict[str, Any]], config_file: str
+) -> int:
+    """Merge several user configurations into the config file in one write.
 
+    Args:
+        user_config_dicts: User configuration dictionaries to merge.
+        config_file: Path to the configuration file.
 
+    Returns:
+        Number of updates that failed (0 on success).
+    """
+    saver = ConfigSaver()
+    return saver.update_users_in_config(user_config_dicts, config_file)
 
 
 def get_configuration() -> list[UserConfig]:
@@ -3,7 +3,6 @@ from __future__ import annotations
 import fcntl
 import glob
 import hashlib
-import json
 import logging
 import os
 import shutil
@@ -13,6 +12,8 @@ import time
 from pathlib import Path
 from typing import Any
 
+from ..utils import json_codec
+
 """Module for configuration repository management.
 
 This module provides the ConfigRepository class for handling user configuration
@@ -72,8 +73,8 @@ class ConfigRepository:
             ):
                 return self._cached_users
 
-            with open(self.path, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.path, "rb") as f:
+                data = json_codec.loads(f.read())
             if isinstance(data, dict) and "users" in data:
                 raw_users = data["users"]  # expected list[dict[str, Any]]
                 if not isinstance(raw_users, list):
@@ -114,9 +115,7 @@ class ConfigRepository:
         """
         h = hashlib.sha256()
         # Stable JSON representation
-        payload = json.dumps(
-            {"users": users}, sort_keys=True, separators=(",", ":"), default=str
-        ).encode()
+        payload = json_codec.dumpb({"users": users}, sort_keys=True, default=str)
         h.update(payload)
         return h.hexdigest()
 
@@ -172,14 +171,13 @@ class ConfigRepository:
                 # Rotating backup (extracted to helper to reduce complexity)
                 self._create_backup(config_path)
                 with tempfile.NamedTemporaryFile(
-                    mode="w",
+                    mode="wb",
                     dir=config_path.parent,
                     prefix=f".{config_path.name}.",
                     suffix=".tmp",
                     delete=False,
-                    encoding="utf-8",
                 ) as tmp:
-                    json.dump(data, tmp, indent=2, default=str)
+                    tmp.write(json_codec.dumpb(data, indent=True, default=str))
                     tmp.flush()
                     os.fsync(tmp.fileno())
                     temp_path = tmp.name
@@ -231,8 +229,8 @@ class ConfigRepository:
     def verify_readback(self) -> None:
         """Verify that the saved configuration can be read back successfully."""
         try:
-            with open(self.path, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.path, "rb") as f:
+                data = json_codec.loads(f.read())
             users_list = data.get("users", []) if isinstance(data, dict) else []
             logging.debug(f"🔍 Verification read user_count={len(users_list)}")
         except (OSError, ValueError) as e:
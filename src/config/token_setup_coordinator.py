@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Sequence
 from typing import Any
 
 import aiohttp
 
+from ..api.transport import get_http_session
 from ..api.twitch import TwitchAPI
 from ..auth_token.provisioner import TokenProvisioner
+from ..constants import STARTUP_VALIDATE_CONCURRENCY
 from .config_saver import ConfigSaver
 from .model import UserConfig
 
@@ -24,6 +27,9 @@ class TokenSetupCoordinator:
             saver: ConfigSaver instance for saving configurations.
         """
         self.saver = saver or ConfigSaver()
+        # Validation runs across users concurrently; device flows prompt one at a time
+        self._validate_gate = asyncio.Semaphore(max(1, STARTUP_VALIDATE_CONCURRENCY))
+        self._provision_lock = asyncio.Lock()
 
     async def setup_missing_tokens(
         self,
@@ -31,6 +37,9 @@ class TokenSetupCoordinator:
     ) -> list[UserConfig]:
         """Set up missing tokens for users.
 
+        Users are validated concurrently (up to ``STARTUP_VALIDATE_CONCURRENCY``
+        at once); interactive provisioning is serialized.
+
         Args:
             users: List of UserConfig instances.
             config_file: Path to the configuration file.
@@ -44,22 +53,20 @@ class TokenSetupCoordinator:
             RuntimeError: If token setup process fails.
         """
         required_scopes = {"chat:read", "user:read:chat", "user:manage:chat_color"}
-        updated_users: list[UserConfig] = []
-        any_updates = False
-
-        # Configure timeouts for reliability: total 30s, connect 10s, read 20s
-        # Balances responsiveness with resilience for unattended operation
-        timeout = aiohttp.ClientTimeout(total=30.0, connect=10.0, sock_read=20.0, sock_connect=10.0)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            provisioner = TokenProvisioner(session)
-            api = TwitchAPI(session)
-            for user in users:
-                changed, processed_user = await self._process_single_user_tokens_dataclass(
+        # Shared transport: connections opened here are reused by the bots
+        session = get_http_session(len(users))
+        provisioner = TokenProvisioner(session)
+        api = TwitchAPI(session)
+        results = await asyncio.gather(
+            *(
+                self._process_single_user_tokens_dataclass(
                     user, api, provisioner, required_scopes
                 )
-                if changed:
-                    any_updates = True
-                updated_users.append(processed_user)
+                for user in users
+            )
+        )
+        updated_users = [processed_user for _, processed_user in results]
+        any_updates = any(changed for changed, _ in results)
         if any_updates:
             self._save_updated_config_dataclass(updated_users, config_file)
         return updated_users
@@ -200,21 +207,23 @@ class TokenSetupCoordinator:
             when token fields were updated.
         """
         access, refresh, _ = user.access_token, user.refresh_token, None
-        tokens_valid = await self._validate_or_invalidate_scopes(
-            user, access, refresh, api, required_scopes
-        )
+        async with self._validate_gate:
+            tokens_valid = await self._validate_or_invalidate_scopes(
+                user, access, refresh, api, required_scopes
+            )
         if tokens_valid:
             return False, user
         client_id_v = user.client_id or ""
         client_secret_v = user.client_secret or ""
-        new_access, new_refresh, _ = await provisioner.provision(
-            user.username,
-            client_id_v,
-            client_secret_v,
-            None,
-            None,
-            None,
-        )
+        async with self._provision_lock:
+            new_access, new_refresh, _ = await provisioner.provision(
+                user.username,
+                client_id_v,
+                client_secret_v,
+                None,
+                None,
+                None,
+            )
         if new_access and new_refresh:
             user.access_token = new_access
             user.refresh_token = new_refresh
@@ -56,6 +56,24 @@ def _get_env_float(name: str, default: float) -> float:
     return default
 
 
+def _get_env_str(name: str, default: str) -> str:
+    """Retrieve a string value from an environment variable.
+
+    Empty or whitespace-only values are treated as unset.
+
+    Args:
+        name: The name of the environment variable to read.
+        default: The default string value to return if unset.
+
+    Returns:
+        The stripped environment value, or the default if unavailable.
+    """
+    value = os.getenv(name)
+    if value is not None and value.strip():
+        return value.strip()
+    return default
+
+
 # Token expiry & refresh thresholds (unify scattered literals: 3600s & 300s)
 TOKEN_REFRESH_THRESHOLD_SECONDS = _get_env_int(
     "TOKEN_REFRESH_THRESHOLD_SECONDS", 3600
@@ -74,6 +92,12 @@ TOKEN_MANAGER_BACKGROUND_BASE_SLEEP = _get_env_int(
 TOKEN_MANAGER_PERIODIC_VALIDATION_INTERVAL = _get_env_int(
     "TOKEN_MANAGER_PERIODIC_VALIDATION_INTERVAL", 1800
 )  # Seconds between periodic remote validations (default 30 min)
+TOKEN_MANAGER_MAX_CONCURRENCY = _get_env_int(
+    "TOKEN_MANAGER_MAX_CONCURRENCY", 8
+)  # Max users validated/refreshed in parallel by startup and background passes
+TOKEN_MANAGER_REFRESH_JITTER_SECONDS = _get_env_int(
+    "TOKEN_MANAGER_REFRESH_JITTER_SECONDS", 300
+)  # Max per-user delay added to refresh deadlines to spread refresh bursts
 
 # Color-related constants
 COLOR_RANDOM_HEX_MAX_ATTEMPTS = _get_env_int(
@@ -100,12 +124,48 @@ COLOR_RGB_MAX_VALUE = _get_env_int(
 )  # Maximum RGB component value
 
 # Network/HTTP constants
+TWITCH_HELIX_URL = _get_env_str(
+    "TWITCH_HELIX_URL", "https://api.twitch.tv/helix"
+)  # Helix API base URL (point at a local stand-in for load tests)
+TWITCH_AUTH_URL = _get_env_str(
+    "TWITCH_AUTH_URL", "https://id.twitch.tv/oauth2"
+)  # OAuth base URL for validate, token refresh and device flow
 HTTP_REQUEST_TIMEOUT_SECONDS = _get_env_int(
     "HTTP_REQUEST_TIMEOUT_SECONDS", 30
 )  # Default HTTP request timeout
 WEBSOCKET_MESSAGE_TIMEOUT_SECONDS = _get_env_int(
     "WEBSOCKET_MESSAGE_TIMEOUT_SECONDS", 45
 )  # WebSocket message timeout
+HTTP_CONNECT_TIMEOUT_SECONDS = _get_env_float(
+    "HTTP_CONNECT_TIMEOUT_SECONDS", 10.0
+)  # Timeout to establish an HTTP connection (incl. TLS)
+HTTP_SOCK_READ_TIMEOUT_SECONDS = _get_env_float(
+    "HTTP_SOCK_READ_TIMEOUT_SECONDS", 20.0
+)  # Max gap between reads of an HTTP response
+HTTP_KEEPALIVE_SECONDS = _get_env_float(
+    "HTTP_KEEPALIVE_SECONDS", 75.0
+)  # How long idle keep-alive connections stay pooled
+HTTP_DNS_CACHE_TTL_SECONDS = _get_env_int(
+    "HTTP_DNS_CACHE_TTL_SECONDS", 300
+)  # DNS resolution cache lifetime for the shared HTTP session
+HTTP_CONNECTIONS_PER_USER = _get_env_int(
+    "HTTP_CONNECTIONS_PER_USER", 2
+)  # Per-host connection budget per configured user
+HTTP_MIN_CONNECTIONS_PER_HOST = _get_env_int(
+    "HTTP_MIN_CONNECTIONS_PER_HOST", 10
+)  # Lower bound of the per-host connection limit
+HTTP_MAX_CONNECTIONS_PER_HOST = _get_env_int(
+    "HTTP_MAX_CONNECTIONS_PER_HOST", 100
+)  # Upper bound of the per-host connection limit
+HTTP_PREWARM_CONNECTIONS = _get_env_int(
+    "HTTP_PREWARM_CONNECTIONS", 2
+)  # TLS connections opened per Twitch host at startup (0 disables)
+HELIX_DEFAULT_RATE_LIMIT = _get_env_int(
+    "HELIX_DEFAULT_RATE_LIMIT", 800
+)  # Assumed Helix bucket size (points/minute) until Ratelimit headers arrive
+HELIX_BACKGROUND_RESERVE_RATIO = _get_env_float(
+    "HELIX_BACKGROUND_RESERVE_RATIO", 0.1
+)  # Share of a Helix bucket background requests leave for color changes
 
 # Retry/backoff constants
 DEFAULT_MAX_RETRY_ATTEMPTS = _get_env_int(
@@ -131,12 +191,18 @@ MAX_BACKOFF_SECONDS = _get_env_int(
 )  # Maximum backoff time in seconds
 
 # EventSub/WebSocket constants
+EVENTSUB_WS_URL = _get_env_str(
+    "EVENTSUB_WS_URL", "wss://eventsub.wss.twitch.tv/ws"
+)  # EventSub WebSocket URL for new sessions
 WEBSOCKET_HEARTBEAT_SECONDS = _get_env_int(
     "WEBSOCKET_HEARTBEAT_SECONDS", 30
 )  # WebSocket heartbeat interval
 EVENTSUB_SUB_CHECK_INTERVAL_SECONDS = _get_env_int(
     "EVENTSUB_SUB_CHECK_INTERVAL_SECONDS", 45
 )  # Subscription check interval (45 seconds for hybrid approach)
+EVENTSUB_INVENTORY_MAX_AGE_SECONDS = _get_env_float(
+    "EVENTSUB_INVENTORY_MAX_AGE_SECONDS", 40.0
+)  # How long one shared subscription list fetch serves every bot of a client_id
 EVENTSUB_STALE_THRESHOLD_SECONDS = _get_env_int(
     "EVENTSUB_STALE_THRESHOLD_SECONDS", 70
 )  # Stale connection threshold
@@ -167,17 +233,59 @@ EVENTSUB_RECONNECT_DELAY_SECONDS = _get_env_int(
 EVENTSUB_JITTER_FACTOR = _get_env_float(
     "EVENTSUB_JITTER_FACTOR", 0.25
 )  # Jitter factor for backoff
+EVENTSUB_HANDOVER_DRAIN_SECONDS = _get_env_float(
+    "EVENTSUB_HANDOVER_DRAIN_SECONDS", 5.0
+)  # Max time to keep reading the old socket after a session_reconnect handover
+EVENTSUB_SHARED_SESSIONS = _get_env_int(
+    "EVENTSUB_SHARED_SESSIONS", 0
+)  # 1 = bots sharing a client_id multiplex onto pooled WebSocket sessions
+EVENTSUB_MAX_SUBSCRIPTIONS_PER_SESSION = _get_env_int(
+    "EVENTSUB_MAX_SUBSCRIPTIONS_PER_SESSION", 300
+)  # Twitch cap on enabled subscriptions per WebSocket session
+EVENTSUB_REAPER_CONCURRENCY = _get_env_int(
+    "EVENTSUB_REAPER_CONCURRENCY", 8
+)  # Subscription DELETEs in flight at once during bulk cleanup
+RECONNECT_ADMISSION_RATE = _get_env_float(
+    "RECONNECT_ADMISSION_RATE", 20.0
+)  # Reconnects admitted per second across all bots once the burst is spent
+RECONNECT_ADMISSION_BURST = _get_env_int(
+    "RECONNECT_ADMISSION_BURST", 40
+)  # Reconnects admitted at once before pacing starts
+RECONNECT_ACTIVE_WINDOW_SECONDS = _get_env_int(
+    "RECONNECT_ACTIVE_WINDOW_SECONDS", 900
+)  # Users who chatted this recently reconnect first
 
 # Configuration/cache constants
 COLOR_CACHE_TTL_SECONDS = _get_env_int("COLOR_CACHE_TTL_SECONDS", 30)  # Color cache TTL
+CACHE_JOURNAL_FLUSH_DELAY_SECONDS = _get_env_float(
+    "CACHE_JOURNAL_FLUSH_DELAY_SECONDS", 0.5
+)  # Write-behind delay before cache mutations are appended to the journal
+CACHE_JOURNAL_COMPACT_THRESHOLD = _get_env_int(
+    "CACHE_JOURNAL_COMPACT_THRESHOLD", 500
+)  # Journal records before background compaction into the cache file
+CHANNEL_ID_CACHE_TTL_SECONDS = _get_env_int(
+    "CHANNEL_ID_CACHE_TTL_SECONDS", 3600
+)  # How long a resolved login -> user ID is shared by every bot
+CHANNEL_ID_NEGATIVE_TTL_SECONDS = _get_env_int(
+    "CHANNEL_ID_NEGATIVE_TTL_SECONDS", 300
+)  # How long an unknown login is answered without asking Twitch again
+CHANNEL_ID_BATCH_WINDOW_SECONDS = _get_env_float(
+    "CHANNEL_ID_BATCH_WINDOW_SECONDS", 0.05
+)  # Time to gather channel lookups from all bots into one users request
+STATE_SNAPSHOT_INTERVAL_SECONDS = _get_env_float(
+    "STATE_SNAPSHOT_INTERVAL_SECONDS", 300.0
+)  # How often the warm-restart state snapshot is written (0 = only on shutdown)
+STATE_SNAPSHOT_MAX_AGE_SECONDS = _get_env_int(
+    "STATE_SNAPSHOT_MAX_AGE_SECONDS", 604800
+)  # Snapshot entries older than this are ignored (0 = never warm start)
+STATE_SNAPSHOT_VALIDATION_MAX_AGE_SECONDS = _get_env_int(
+    "STATE_SNAPSHOT_VALIDATION_MAX_AGE_SECONDS", 3600
+)  # Token scopes/expiry from the snapshot are trusted this long after validation
 CONFIG_DEBOUNCE_SECONDS = _get_env_float(
     "CONFIG_DEBOUNCE_SECONDS", 0.25
 )  # Config save debounce delay
 USER_LOCK_TTL_HOURS = _get_env_int("USER_LOCK_TTL_HOURS", 1)  # User lock TTL in hours
 USER_LOCK_TTL_SECONDS = USER_LOCK_TTL_HOURS * 3600  # User lock TTL in seconds
-CONFIG_MAX_FAILURES_WARNING = _get_env_int(
-    "CONFIG_MAX_FAILURES_WARNING", 3
-)  # Max failures before warning
 CONFIG_SAVE_MAX_RETRIES = _get_env_int(
     "CONFIG_SAVE_MAX_RETRIES", 3
 )  # Max config save retries
@@ -225,7 +333,31 @@ BOT_STARTUP_DELAY_SECONDS = _get_env_int(
 MANAGER_LOOP_SLEEP_SECONDS = _get_env_int(
     "MANAGER_LOOP_SLEEP_SECONDS", 1
 )  # Manager loop sleep
+STARTUP_VALIDATE_CONCURRENCY = _get_env_int(
+    "STARTUP_VALIDATE_CONCURRENCY", 8
+)  # Users validating/refreshing tokens at once during startup
+STARTUP_RESOLVE_CONCURRENCY = _get_env_int(
+    "STARTUP_RESOLVE_CONCURRENCY", 8
+)  # Users resolving IDs and priming colors at once during startup
+STARTUP_CONNECT_CONCURRENCY = _get_env_int(
+    "STARTUP_CONNECT_CONCURRENCY", 4
+)  # Users opening EventSub sockets at once during startup
+STARTUP_SUBSCRIBE_CONCURRENCY = _get_env_int(
+    "STARTUP_SUBSCRIBE_CONCURRENCY", 4
+)  # Users subscribing to additional channels at once during startup
+STARTUP_ID_BATCH_WINDOW_SECONDS = _get_env_float(
+    "STARTUP_ID_BATCH_WINDOW_SECONDS", 0.05
+)  # Time to gather users into one bulk user-ID lookup
+SHUTDOWN_STOP_CONCURRENCY = _get_env_int(
+    "SHUTDOWN_STOP_CONCURRENCY", 16
+)  # Bots stopped at once during shutdown
+SHUTDOWN_CLEANUP_DEADLINE_SECONDS = _get_env_float(
+    "SHUTDOWN_CLEANUP_DEADLINE_SECONDS", 20.0
+)  # Time all bots get to delete their subscriptions when stopping
 
 # Utility/helper constants
+LATENCY_REPORT_INTERVAL_SECONDS = _get_env_int(
+    "LATENCY_REPORT_INTERVAL_SECONDS", 300
+)  # Interval between latency summary log lines (0 disables)
 HEX_SHORT_LENGTH = _get_env_int("HEX_SHORT_LENGTH", 3)  # Short hex color length
 HEX_FULL_LENGTH = _get_env_int("HEX_FULL_LENGTH", 6)  # Full hex color length
@@ -55,6 +55,24 @@ class EventSubConnectionError(EventSubError):
     pass
 
 
+class SessionReplacedError(EventSubConnectionError):
+    """Raised when a shared EventSub socket was replaced by a reconnect.
+
+    The new socket starts without subscriptions, so every bot attached to it
+    has to resubscribe. Bots that already caught up with ``generation`` ignore it.
+
+    Args:
+        generation (int): Pooled session generation that replaced the old socket.
+
+    Example:
+        >>> raise SessionReplacedError(generation=3)
+    """
+
+    def __init__(self, generation: int) -> None:
+        super().__init__("Shared EventSub session replaced", operation_type="reconnect")
+        self.generation = generation
+
+
 class SubscriptionError(EventSubError):
     """Raised when there are subscription-related issues with EventSub.
 
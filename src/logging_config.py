@@ -152,9 +152,13 @@ def log_structured_error(
 class LoggerConfigurator:
     """Handles logging configuration cleanly using colorlog.
 
-    Supports environment variable configuration for log levels.
+    Supports environment variable configuration for log levels. Nothing runs
+    until ``configure()`` is called: the periodic reporting thread and the
+    exit summary are set up there, once per process.
     """
 
+    _reporting_thread: threading.Thread | None = None
+
     def __init__(self, config=None):
         """Initialize the configurator.
 
@@ -218,10 +222,10 @@ class LoggerConfigurator:
             h.addFilter(FseventsFilter())
 
         # Set up periodic error reporting (every 6 hours for long-running apps)
-        self._setup_periodic_reporting()
-
-        # Register exit handler for final error summary
-        atexit.register(self._log_final_error_summary)
+        # and the final summary once, however often logging is reconfigured
+        if LoggerConfigurator._reporting_thread is None:
+            self._setup_periodic_reporting()
+            atexit.register(self._log_final_error_summary)
 
     def _setup_periodic_reporting(self):
         """Set up periodic error summary reporting."""
@@ -236,6 +240,7 @@ class LoggerConfigurator:
         # Start periodic reporting in background thread
         report_thread = threading.Thread(target=periodic_report, daemon=True)
         report_thread.start()
+        LoggerConfigurator._reporting_thread = report_thread
 
     def _log_final_error_summary(self):
         """Log final error summary on application exit."""
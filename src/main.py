@@ -1,29 +1,85 @@
 #!/usr/bin/env python3
 """
 Main entry point for the Twitch Color Changer Bot
+
+Only the standard library is imported at module load. The configuration,
+HTTP and bot packages (aiohttp, websockets, pydantic, tenacity, colorlog)
+load on first use, and the bot tree is imported on a worker thread while
+token setup waits on the network. ``python -m benchmarks.bench_startup``
+measures the import cost against ``IMPORT_BUDGET_MS``.
 """
 
 import asyncio
+import importlib
 import logging
 import os
 import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - resolved lazily through __getattr__
+    from .api.transport import close_http_session
+    from .bot.manager import run_bots
+    from .config import (
+        get_configuration,
+        normalize_user_channels,
+        print_config_summary,
+        setup_missing_tokens,
+    )
+    from .errors.handling import log_error
+    from .utils import emit_startup_instructions
+
+# Budget for ``import src.main``; enforced in CI by benchmarks.bench_startup
+IMPORT_BUDGET_MS = 250
+
+# Third-party packages that must not load when the entry point is imported
+DEFERRED_PACKAGES = ("aiohttp", "websockets", "pydantic", "tenacity", "colorlog")
+
+# Names resolved on first use: name -> module relative to this package
+_LAZY_IMPORTS = {
+    "close_http_session": ".api.transport",
+    "run_bots": ".bot.manager",
+    "get_configuration": ".config",
+    "normalize_user_channels": ".config",
+    "print_config_summary": ".config",
+    "setup_missing_tokens": ".config",
+    "log_error": ".errors.handling",
+    "emit_startup_instructions": ".utils",
+}
+
+_logging_configured = False
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily loaded name on first access and cache it."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _load(*names: str) -> None:
+    """Bind lazily loaded names as globals, keeping any already bound."""
+    for name in names:
+        if name not in globals():
+            __getattr__(name)
+
+
+def _preload_bot_runtime() -> None:
+    """Import the bot tree (chat, EventSub, websockets) ahead of use."""
+    importlib.import_module(".bot.manager", __package__)
 
-# Import all modules first (required by E402)
-from .bot.manager import run_bots
-from .config import (
-    get_configuration,
-    normalize_user_channels,
-    print_config_summary,
-    setup_missing_tokens,
-)
-from .errors.handling import log_error
 
-# Configure logging after imports to prevent other modules from configuring it
-from .logging_config import LoggerConfigurator
-from .utils import emit_startup_instructions
+def configure_logging() -> None:
+    """Configure logging once; the first call wins."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    from .logging_config import LoggerConfigurator
 
-configurator = LoggerConfigurator()
-configurator.configure()
+    LoggerConfigurator().configure()
+    _logging_configured = True
 
 
 async def main() -> None:
@@ -36,24 +92,47 @@ async def main() -> None:
     Raises:
         SystemExit: If a critical error occurs during initialization.
     """
+    preload: asyncio.Future[None] | None = None
     try:
         print("🚀 Starting Twitch Color Changer Bot")
+        _load("emit_startup_instructions")
         emit_startup_instructions()
         config_file = os.environ.get("TWITCH_CONF_FILE", "twitch_colorchanger.conf")
+        _load(
+            "get_configuration",
+            "normalize_user_channels",
+            "setup_missing_tokens",
+            "print_config_summary",
+        )
         loaded_config = get_configuration()
         loaded_config, _ = normalize_user_channels(loaded_config, config_file)
+        # Token validation is network-bound; import the bot tree meanwhile
+        preload = asyncio.ensure_future(asyncio.to_thread(_preload_bot_runtime))
         users_config = await setup_missing_tokens(loaded_config, config_file)
         print_config_summary(users_config)
         users_config_dicts = [u.to_dict() for u in users_config]
+        await preload
+        _load("run_bots")
         await run_bots(users_config_dicts, config_file)
     except asyncio.CancelledError:
         raise
     except KeyboardInterrupt:
         pass
     except Exception as e:
+        _load("log_error")
         log_error("Main application error", e)
         sys.exit(1)
     finally:
+        if preload is not None:
+            # Failed earlier: stop waiting on the import thread (or consume its error)
+            if not preload.done():
+                preload.cancel()
+            elif not preload.cancelled():
+                preload.exception()
+        # Normally closed by the application context; covers early failures
+        if f"{__package__}.api.transport" in sys.modules:
+            _load("close_http_session")
+            await close_http_session()
         logging.info("✅ Application shutdown complete")
 
 
@@ -65,6 +144,7 @@ def run() -> None:
     Raises:
         SystemExit: If a critical error occurs during execution.
     """
+    configure_logging()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -72,6 +152,7 @@ def run() -> None:
     except asyncio.CancelledError:
         sys.exit(0)
     except Exception as e:
+        _load("log_error")
         log_error("Top-level error", e)
         sys.exit(1)
 
@@ -0,0 +1,109 @@
+"""Priority-ordered admission of waiters against a token bucket.
+
+Both the Helix rate limiter and the reconnect admission controller queue
+callers by priority and release them one at a time when their bucket has a
+token. :class:`PriorityAdmission` is that shared queue: waiters are kept in a
+heap ordered by the entry tuple the caller builds, only the head may be
+admitted, and it sleeps on a condition until either another waiter changes
+the state or the bucket's reported delay elapses. Cancelled waiters leave the
+queue so they never block the ones behind them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+
+class PriorityAdmission:
+    """Heap of waiters admitted strictly in entry order.
+
+    Attributes:
+        max_depth (int): Deepest the queue has been.
+    """
+
+    def __init__(self) -> None:
+        self.max_depth = 0
+        self._waiters: list[tuple[Any, ...]] = []
+        self._cond: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __len__(self) -> int:
+        return len(self._waiters)
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        return iter(self._waiters)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """Event loop the queue is bound to."""
+        return self._loop
+
+    def bind(self) -> asyncio.Condition:
+        """Return the condition of the running loop.
+
+        Waiters of a previous loop are dropped when the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._loop is not loop:
+            self._cond = asyncio.Condition()
+            self._loop = loop
+            self._waiters.clear()
+        return self._cond
+
+    async def wait(
+        self,
+        entry: tuple[Any, ...],
+        delay: Callable[[], float],
+        admit: Callable[[bool], None],
+        on_queued: Callable[[], None] | None = None,
+    ) -> None:
+        """Queue ``entry`` and return once it has been admitted.
+
+        Args:
+            entry: Heap key; lower entries are served first and must be unique.
+            delay: Seconds until the head may be admitted; <= 0 admits now.
+            admit: Takes the token for the admitted waiter; called under the
+                lock with whether the waiter had to wait.
+            on_queued: Called once if the waiter could not be admitted at once.
+        """
+        cond = self.bind()
+        async with cond:
+            heapq.heappush(self._waiters, entry)
+            self.max_depth = max(self.max_depth, len(self._waiters))
+            cond.notify_all()
+            waited = False
+            try:
+                while True:
+                    timeout: float | None = None
+                    if self._waiters[0] == entry:
+                        timeout = delay()
+                        if timeout <= 0:
+                            heapq.heappop(self._waiters)
+                            admit(waited)
+                            cond.notify_all()
+                            return
+                    if not waited and on_queued is not None:
+                        on_queued()
+                    waited = True
+                    try:
+                        await asyncio.wait_for(cond.wait(), timeout)
+                    except TimeoutError:
+                        pass
+            except BaseException:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    cond.notify_all()
+                raise
+
+    @asynccontextmanager
+    async def update(self) -> AsyncIterator[None]:
+        """Change bucket state under the lock and wake the waiters afterwards."""
+        cond = self.bind()
+        async with cond:
+            yield
+            cond.notify_all()
@@ -10,7 +10,7 @@ import asyncio
 import logging
 import time
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Any, TypeVar
 
@@ -87,8 +87,24 @@ class CircuitBreaker:
             CircuitBreakerOpenException: If circuit breaker is OPEN and allow_on_open is False
             Exception: If function execution fails
         """
+        await self._admit(allow_on_open=allow_on_open, suppress_warnings=suppress_warnings)
+
+        # Execute function without holding the lock to reduce contention
+        try:
+            result = await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
+        except Exception:
+            await self._on_failure(suppress_warnings=suppress_warnings)
+            raise
+        await self._on_success()
+        return result
+
+    async def _admit(self, *, allow_on_open: bool, suppress_warnings: bool) -> None:
+        """Check whether a call may proceed, moving OPEN to HALF_OPEN when due.
+
+        Raises:
+            CircuitBreakerOpenException: If OPEN and allow_on_open is False.
+        """
         self.last_used = time.monotonic()
-        # Initial state check with lock
         async with self._lock:
             if self.state == CircuitBreakerState.OPEN:
                 if self._should_attempt_recovery():
@@ -103,30 +119,24 @@ class CircuitBreaker:
                         f"Circuit breaker '{self.config.name}' is OPEN"
                     )
 
-        # Execute function without holding the lock to reduce contention
-        try:
-            result = await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
-
-            # Update state with lock
-            async with self._lock:
-                if self.state == CircuitBreakerState.HALF_OPEN:
-                    self.success_count += 1
-                    if self.success_count >= self.config.success_threshold:
-                        self._reset()
-                        logging.info(
-                            f"✅ Circuit breaker '{self.config.name}' recovered, transitioning to CLOSED"
-                        )
-                elif self.state == CircuitBreakerState.CLOSED:
-                    # Reset failure count on successful call in CLOSED state
-                    self.failure_count = 0
-
-            return result
+    async def _on_success(self) -> None:
+        """Record a successful call."""
+        async with self._lock:
+            if self.state == CircuitBreakerState.HALF_OPEN:
+                self.success_count += 1
+                if self.success_count >= self.config.success_threshold:
+                    self._reset()
+                    logging.info(
+                        f"✅ Circuit breaker '{self.config.name}' recovered, transitioning to CLOSED"
+                    )
+            elif self.state == CircuitBreakerState.CLOSED:
+                # Reset failure count on successful call in CLOSED state
+                self.failure_count = 0
 
-        except Exception:
-            # Record failure with lock
-            async with self._lock:
-                self._record_failure(suppress_warnings=suppress_warnings)
-            raise
+    async def _on_failure(self, *, suppress_warnings: bool = False) -> None:
+        """Record a failed call."""
+        async with self._lock:
+            self._record_failure(suppress_warnings=suppress_warnings)
 
     def _should_attempt_recovery(self) -> bool:
         """Check if enough time has passed to attempt recovery."""
@@ -177,6 +187,135 @@ class CircuitBreaker:
         return self.state == CircuitBreakerState.HALF_OPEN
 
 
+class FailureScope(Enum):
+    """How far up a breaker hierarchy an outcome counts.
+
+    NONE: Success; recorded on every level.
+    IGNORED: Not a health signal (e.g. 404, 429); recorded nowhere.
+    ENDPOINT: Counts only on the most specific level.
+    USER: Counts on every level except the shared root.
+    SHARED: Counts on every level including the shared root.
+    """
+
+    NONE = "none"
+    IGNORED = "ignored"
+    ENDPOINT = "endpoint"
+    USER = "user"
+    SHARED = "shared"
+
+
+def breaker_key_chain(key: str) -> list[str]:
+    """Expand a hierarchical breaker key into its levels, most specific first.
+
+    ``helix:123:chat/color`` becomes ``["helix:123:chat/color", "helix:123",
+    "helix:global"]``; ``<namespace>:global`` is the shared root.
+
+    Args:
+        key: Key of the form ``<namespace>[:<user>[:<endpoint>]]``.
+
+    Returns:
+        List of level keys ending with the shared root.
+    """
+    parts = key.split(":", 2)
+    root = f"{parts[0]}:global"
+    chain = [":".join(parts[:depth]) for depth in range(len(parts), 1, -1)]
+    return [level for level in chain if level != root] + [root]
+
+
+class KeyedCircuitBreaker:
+    """Circuit breaker spanning a key hierarchy.
+
+    A call is rejected if any level is OPEN. Outcomes are classified into a
+    FailureScope so that, for example, one user's auth failures open that
+    user's breakers without touching the shared root used by everyone.
+
+    Attributes:
+        levels (list[CircuitBreaker]): Breakers from most specific to the shared root.
+    """
+
+    def __init__(self, levels: list[CircuitBreaker]) -> None:
+        """Initialize with the breakers of each level.
+
+        Args:
+            levels: Breakers ordered from most specific to the shared root.
+        """
+        self.levels = levels
+
+    @property
+    def name(self) -> str:
+        """Key of the most specific level."""
+        return self.levels[0].config.name
+
+    @property
+    def is_open(self) -> bool:
+        """Check if any level is currently open."""
+        return any(level.is_open for level in self.levels)
+
+    def _levels_for(self, scope: FailureScope) -> list[CircuitBreaker]:
+        scoped = self.levels[:-1]
+        if scope == FailureScope.ENDPOINT:
+            return scoped[:1]
+        if scope == FailureScope.USER:
+            return scoped
+        if scope == FailureScope.SHARED:
+            return self.levels
+        return []
+
+    async def record(self, scope: FailureScope, *, suppress_warnings: bool = False) -> None:
+        """Record an outcome on the levels its scope reaches.
+
+        Args:
+            scope: Classified outcome.
+            suppress_warnings: If True, suppress state change warnings.
+        """
+        if scope == FailureScope.NONE:
+            for level in self.levels:
+                await level._on_success()
+            return
+        for level in self._levels_for(scope):
+            await level._on_failure(suppress_warnings=suppress_warnings)
+
+    async def call(
+        self,
+        func: Callable[[], Any],
+        *args: Any,
+        classify: Callable[[Any], FailureScope] | None = None,
+        classify_error: Callable[[Exception], FailureScope] | None = None,
+        allow_on_open: bool = False,
+        suppress_warnings: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Execute function through every level of the hierarchy.
+
+        Args:
+            func: Function to execute
+            *args: Positional arguments for function
+            classify: Maps a result to its FailureScope (default: success)
+            classify_error: Maps an exception to its FailureScope (default: SHARED)
+            allow_on_open: If True, allow execution even when a level is OPEN
+            suppress_warnings: If True, suppress circuit breaker state change warnings
+            **kwargs: Keyword arguments for function
+
+        Returns:
+            Function result if successful
+
+        Raises:
+            CircuitBreakerOpenException: If a level is OPEN and allow_on_open is False
+            Exception: If function execution fails
+        """
+        for level in self.levels:
+            await level._admit(allow_on_open=allow_on_open, suppress_warnings=suppress_warnings)
+        try:
+            result = await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
+        except Exception as e:
+            scope = classify_error(e) if classify_error else FailureScope.SHARED
+            await self.record(scope, suppress_warnings=suppress_warnings)
+            raise
+        scope = classify(result) if classify else FailureScope.NONE
+        await self.record(scope, suppress_warnings=suppress_warnings)
+        return result
+
+
 # Global circuit breaker instances
 _circuit_breakers: dict[str, CircuitBreaker] = {}
 
@@ -199,6 +338,28 @@ def get_circuit_breaker(name: str, config: CircuitBreakerConfig | None = None) -
     return _circuit_breakers[name]
 
 
+def get_keyed_circuit_breaker(
+    key: str, config: CircuitBreakerConfig | None = None
+) -> KeyedCircuitBreaker:
+    """Get the breaker hierarchy for a key, creating missing levels.
+
+    Every level is registered under its own key, so levels are shared by all
+    keys beneath them and can be inspected or reset individually.
+
+    Args:
+        key: Hierarchical key, e.g. ``helix:<user_id>:<endpoint>``
+        config: Optional configuration template; each level gets its own name
+
+    Returns:
+        Keyed circuit breaker spanning every level of the key
+    """
+    levels = []
+    for level_key in breaker_key_chain(key):
+        level_config = replace(config, name=level_key) if config else None
+        levels.append(get_circuit_breaker(level_key, level_config))
+    return KeyedCircuitBreaker(levels)
+
+
 def reset_circuit_breaker(name: str) -> None:
     """Reset a circuit breaker to initial state.
 
@@ -0,0 +1,165 @@
+"""Single JSON codec used by every hot path in the package.
+
+Uses ``orjson`` when it is installed (``pip install twitch_colorchanger[fast]``)
+and falls back to the standard library otherwise. Both backends produce the
+same compact, UTF-8 (``ensure_ascii=False``) output, so call sites behave the
+same whichever one is active. Set ``TWITCH_JSON_BACKEND=json`` to force the
+standard library.
+
+Decoding accepts ``str`` or ``bytes``; the accelerated backend parses bytes
+directly without an intermediate ``str``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from typing import Any
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+class StdlibCodec:
+    """JSON codec backed by the standard library ``json`` module."""
+
+    name = "json"
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        indent: bool = False,
+        sort_keys: bool = False,
+        default: Callable[[Any], Any] | None = None,
+    ) -> str:
+        """Encode ``obj`` compactly, or with two-space indentation."""
+        if indent:
+            return json.dumps(
+                obj, indent=2, sort_keys=sort_keys, default=default, ensure_ascii=False
+            )
+        return json.dumps(
+            obj,
+            separators=(",", ":"),
+            sort_keys=sort_keys,
+            default=default,
+            ensure_ascii=False,
+        )
+
+    def dumpb(
+        self,
+        obj: Any,
+        *,
+        indent: bool = False,
+        sort_keys: bool = False,
+        default: Callable[[Any], Any] | None = None,
+    ) -> bytes:
+        """Encode ``obj`` to UTF-8 bytes."""
+        return self.dumps(obj, indent=indent, sort_keys=sort_keys, default=default).encode()
+
+
+class OrjsonCodec:
+    """JSON codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        """Decode a JSON document."""
+        return self._orjson.loads(data)
+
+    def dumpb(
+        self,
+        obj: Any,
+        *,
+        indent: bool = False,
+        sort_keys: bool = False,
+        default: Callable[[Any], Any] | None = None,
+    ) -> bytes:
+        """Encode ``obj`` to UTF-8 bytes."""
+        option = self._orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= self._orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= self._orjson.OPT_SORT_KEYS
+        return self._orjson.dumps(obj, default=default, option=option)
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        indent: bool = False,
+        sort_keys: bool = False,
+        default: Callable[[Any], Any] | None = None,
+    ) -> str:
+        """Encode ``obj`` compactly, or with two-space indentation."""
+        return self.dumpb(obj, indent=indent, sort_keys=sort_keys, default=default).decode()
+
+
+def available_codecs() -> dict[str, StdlibCodec | OrjsonCodec]:
+    """Return every codec usable in this environment keyed by name."""
+    codecs: dict[str, StdlibCodec | OrjsonCodec] = {"json": StdlibCodec()}
+    try:
+        codecs["orjson"] = OrjsonCodec()
+    except ImportError:
+        pass
+    return codecs
+
+
+def _select_codec() -> StdlibCodec | OrjsonCodec:
+    codecs = available_codecs()
+    requested = os.getenv("TWITCH_JSON_BACKEND", "").strip().lower()
+    if requested in codecs:
+        return codecs[requested]
+    return codecs.get("orjson") or codecs["json"]
+
+
+codec = _select_codec()
+BACKEND = codec.name
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    """Decode a JSON document with the active backend.
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON.
+    """
+    return codec.loads(data)
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """Encode ``obj`` to a str with the active backend.
+
+    Args:
+        obj: Object to encode.
+        indent: Pretty-print with two-space indentation.
+        sort_keys: Sort object keys (for stable checksums).
+        default: Fallback serializer for unsupported types.
+    """
+    return codec.dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
+
+
+def dumpb(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Encode ``obj`` to UTF-8 bytes with the active backend."""
+    return codec.dumpb(obj, indent=indent, sort_keys=sort_keys, default=default)
@@ -0,0 +1,312 @@
+"""Per-user latency histograms for the message-to-color-change path.
+
+Timings are recorded into fixed-bucket histograms kept in memory per user and
+stage, so recording is O(buckets) with no allocation and memory stays bounded
+regardless of traffic. Percentiles are estimated from the buckets.
+
+Stages:
+    receive: EventSub ``message_timestamp`` until the frame is read.
+    parse: Decoding the frame into an envelope.
+    dispatch: Frame read until the color change starts.
+    select: Picking the next color.
+    http: One ``PUT chat/color`` round trip.
+    retry: First until last color request attempt, when a request was retried.
+    total: EventSub ``message_timestamp`` until the color change completes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from ..constants import LATENCY_REPORT_INTERVAL_SECONDS
+
+STAGES = ("receive", "parse", "dispatch", "select", "http", "retry", "total")
+
+# Upper bucket bounds in milliseconds; the last bucket is unbounded
+BUCKET_BOUNDS_MS = (
+    1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0,
+    1000.0, 2500.0, 5000.0, 10000.0, 30000.0,
+)
+
+_FRACTION_PATTERN = re.compile(r"(\.\d{6})\d+")
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram.
+
+    Attributes:
+        counts (list[int]): Sample count per bucket.
+        count (int): Total number of samples.
+        max_ms (float): Largest sample seen.
+    """
+
+    __slots__ = ("counts", "count", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        """Record one sample in milliseconds."""
+        ms = max(ms, 0.0)
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, q: float) -> float:
+        """Estimate a percentile by interpolating inside its bucket.
+
+        Args:
+            q: Percentile in the range 0-100.
+
+        Returns:
+            float: Estimated latency in milliseconds (0.0 when empty).
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count == 0:
+                continue
+            if seen + bucket_count >= rank:
+                lower = BUCKET_BOUNDS_MS[index - 1] if index > 0 else 0.0
+                upper = (
+                    BUCKET_BOUNDS_MS[index]
+                    if index < len(BUCKET_BOUNDS_MS)
+                    else self.max_ms
+                )
+                fraction = (rank - seen) / bucket_count
+                return min(lower + (upper - lower) * fraction, self.max_ms)
+            seen += bucket_count
+        return self.max_ms
+
+    def summary(self) -> dict[str, float]:
+        """Return count, p50, p95, p99 and max (milliseconds)."""
+        return {
+            "count": self.count,
+            "p50": round(self.percentile(50), 2),
+            "p95": round(self.percentile(95), 2),
+            "p99": round(self.percentile(99), 2),
+            "max": round(self.max_ms, 2),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class FrameTiming:
+    """Timing context of the EventSub frame currently being handled.
+
+    Attributes:
+        user (str): Bot username the frame belongs to.
+        received_at (float): ``time.monotonic()`` when the frame was read.
+        sent_at (float | None): EventSub ``message_timestamp`` as epoch seconds.
+    """
+
+    user: str
+    received_at: float
+    sent_at: float | None = None
+
+
+_current_frame: ContextVar[FrameTiming | None] = ContextVar(
+    "latency_current_frame", default=None
+)
+
+
+def parse_message_timestamp(value: str | None) -> float | None:
+    """Convert an EventSub RFC3339 timestamp to epoch seconds.
+
+    Twitch sends nanosecond precision, which ``fromisoformat`` does not
+    accept, so the fraction is truncated to microseconds.
+
+    Args:
+        value: The ``metadata.message_timestamp`` value.
+
+    Returns:
+        float | None: Epoch seconds, or None if missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        text = _FRACTION_PATTERN.sub(r"\1", value).replace("Z", "+00:00")
+        return datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        return None
+
+
+def current_frame() -> FrameTiming | None:
+    """Return the timing context of the frame being handled, if any."""
+    return _current_frame.get()
+
+
+class LatencyRecorder:
+    """Collects per-user, per-stage latency histograms.
+
+    Attributes:
+        histograms (dict[str, dict[str, LatencyHistogram]]): Histograms keyed
+            by username then stage.
+    """
+
+    def __init__(self) -> None:
+        self.histograms: dict[str, dict[str, LatencyHistogram]] = {}
+        self._report_task: asyncio.Task[Any] | None = None
+
+    def record(self, user: str, stage: str, seconds: float) -> None:
+        """Record a stage duration for a user.
+
+        Args:
+            user: Bot username.
+            stage: One of STAGES.
+            seconds: Duration in seconds.
+        """
+        per_user = self.histograms.setdefault(user.lower(), {})
+        histogram = per_user.get(stage)
+        if histogram is None:
+            histogram = per_user[stage] = LatencyHistogram()
+        histogram.record(seconds * 1000.0)
+
+    @contextmanager
+    def measure(self, user: str, stage: str) -> Iterator[None]:
+        """Record the duration of the wrapped block, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(user, stage, time.perf_counter() - start)
+
+    @contextmanager
+    def frame(self, user: str, message_timestamp: str | None = None) -> Iterator[FrameTiming]:
+        """Mark a received frame so later stages can measure against it.
+
+        Records the ``receive`` stage when the frame carries a timestamp.
+
+        Args:
+            user: Bot username the frame belongs to.
+            message_timestamp: EventSub ``metadata.message_timestamp``.
+        """
+        timing = FrameTiming(user, time.monotonic(), parse_message_timestamp(message_timestamp))
+        if timing.sent_at is not None:
+            self.record(user, "receive", time.time() - timing.sent_at)
+        token = _current_frame.set(timing)
+        try:
+            yield timing
+        finally:
+            _current_frame.reset(token)
+
+    @contextmanager
+    def resume(self, timing: FrameTiming | None) -> Iterator[None]:
+        """Re-enter a frame captured earlier, e.g. from a worker task.
+
+        Args:
+            timing: Value of :func:`current_frame` when the work was queued.
+        """
+        token = _current_frame.set(timing)
+        try:
+            yield
+        finally:
+            _current_frame.reset(token)
+
+    def record_dispatch(self, user: str) -> None:
+        """Record the time from frame arrival until now as ``dispatch``."""
+        timing = _current_frame.get()
+        if timing is not None:
+            self.record(user, "dispatch", time.monotonic() - timing.received_at)
+
+    def record_total(self, user: str) -> None:
+        """Record the time from the EventSub timestamp until now as ``total``."""
+        timing = _current_frame.get()
+        if timing is None:
+            return
+        if timing.sent_at is not None:
+            self.record(user, "total", time.time() - timing.sent_at)
+        else:
+            self.record(user, "total", time.monotonic() - timing.received_at)
+
+    def snapshot(self, user: str | None = None) -> dict[str, dict[str, dict[str, float]]]:
+        """Return p50/p95/p99 summaries per user and stage.
+
+        Args:
+            user: Restrict the snapshot to one username.
+
+        Returns:
+            dict: ``{user: {stage: {"count", "p50", "p95", "p99", "max"}}}``.
+        """
+        users = [user.lower()] if user else sorted(self.histograms)
+        return {
+            name: {
+                stage: self.histograms[name][stage].summary()
+                for stage in STAGES
+                if stage in self.histograms.get(name, {})
+            }
+            for name in users
+            if name in self.histograms
+        }
+
+    def format_summary(self, user: str) -> str:
+        """Format one user's stages as a compact log line fragment."""
+        parts = []
+        for stage, stats in self.snapshot(user).get(user.lower(), {}).items():
+            parts.append(
+                f"{stage}[n={stats['count']} p50={stats['p50']:.0f} "
+                f"p95={stats['p95']:.0f} p99={stats['p99']:.0f}]"
+            )
+        return " ".join(parts)
+
+    def log_summary(self) -> None:
+        """Log one latency line per user (milliseconds)."""
+        for user in sorted(self.histograms):
+            summary = self.format_summary(user)
+            if summary:
+                logging.info(f"⏱️ Latency ms user={user} {summary}")
+
+    def reset(self) -> None:
+        """Drop all recorded samples."""
+        self.histograms.clear()
+
+    async def start_reporting(
+        self, interval: float = LATENCY_REPORT_INTERVAL_SECONDS
+    ) -> None:
+        """Start logging the summary every ``interval`` seconds."""
+        if interval <= 0 or (self._report_task and not self._report_task.done()):
+            return
+        self._report_task = asyncio.create_task(self._report_loop(interval))
+
+    async def stop_reporting(self) -> None:
+        """Stop the periodic summary task."""
+        task = self._report_task
+        self._report_task = None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _report_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.log_summary()
+
+
+# Global latency recorder instance
+_latency_recorder: LatencyRecorder | None = None
+
+
+def get_latency_recorder() -> LatencyRecorder:
+    """Get the global latency recorder instance."""
+    global _latency_recorder
+    if _latency_recorder is None:
+        _latency_recorder = LatencyRecorder()
+    return _latency_recorder
@@ -0,0 +1,233 @@
+"""
+Integration tests running the real clients against the local Twitch stand-in.
+
+The Helix client, OAuth token client and EventSub connector talk HTTP and
+WebSocket to ``benchmarks.fake_twitch`` through overridden endpoints, so
+request and message shapes are checked end to end.
+"""
+
+import json
+
+import aiohttp
+import pytest
+
+from benchmarks.fake_twitch import FakeTwitch, FaultProfile
+from src.api.endpoints import set_endpoints
+from src.api.twitch import TwitchAPI
+from src.auth_token.client import TokenClient, TokenOutcome
+from src.chat.websocket_connector import WebSocketConnector
+
+
+async def open_session(user):
+    """Connect an EventSub socket for ``user`` and return it with its session ID."""
+    connector = WebSocketConnector(user.access_token, user.client_id)
+    ws = await connector.connect()
+    welcome = json.loads(await ws.recv())
+    assert welcome["metadata"]["message_type"] == "session_welcome"
+    return connector, ws, welcome["payload"]["session"]["id"]
+
+
+def chat_subscription(broadcaster, user, session_id):
+    """Request body of a channel.chat.message subscription."""
+    return {
+        "type": "channel.chat.message",
+        "version": "1",
+        "condition": {"broadcaster_user_id": broadcaster.user_id, "user_id": user.user_id},
+        "transport": {"method": "websocket", "session_id": session_id},
+    }
+
+
+@pytest.mark.integration
+class TestFakeTwitchIntegration:
+    """Test class for the clients against the Twitch stand-in."""
+
+    async def start(self, faults=None):
+        """Start the stand-in and point every client at it."""
+        self.twitch = await FakeTwitch(faults).start()
+        set_endpoints(self.twitch.endpoints)
+        self.http = aiohttp.ClientSession()
+        self.api = TwitchAPI(self.http)
+        self.bot = self.twitch.add_user("bot")
+        self.channel = self.twitch.add_user("streamer")
+
+    async def stop(self):
+        """Stop the stand-in and restore the endpoints."""
+        await self.http.close()
+        await self.twitch.stop()
+        set_endpoints()
+
+    async def request(self, method, endpoint, **kwargs):
+        """Send a Helix request as the bot user."""
+        return await self.api.request(
+            method,
+            endpoint,
+            access_token=self.bot.access_token,
+            client_id=self.bot.client_id,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_chat_reaches_subscriber_and_color_change_is_timed(self):
+        """Test subscribe, notification delivery and chat-to-color latency."""
+        # Arrange
+        await self.start()
+        try:
+            connector, ws, session_id = await open_session(self.bot)
+            body = chat_subscription(self.channel, self.bot, session_id)
+            _, status, headers = await self.request("POST", "eventsub/subscriptions", json_body=body)
+
+            # Act
+            delivered = await self.twitch.send_chat("streamer", "bot", "hello")
+            notification = json.loads(await ws.recv())
+            _, put_status, _ = await self.request(
+                "PUT", "chat/color", params={"user_id": self.bot.user_id, "color": "#1A2B3C"}
+            )
+            await connector.disconnect()
+
+            # Assert
+            assert status == 202
+            assert headers["Ratelimit-Limit"] == "800"
+            assert delivered == 1
+            assert notification["metadata"]["subscription_type"] == "channel.chat.message"
+            assert notification["payload"]["event"]["chatter_user_name"] == "bot"
+            assert put_status == 204
+            assert self.twitch.users["bot"].color == "#1A2B3C"
+            assert self.twitch.metrics.snapshot()["chat_to_color"]["count"] == 1
+        finally:
+            await self.stop()
+
+    @pytest.mark.asyncio
+    async def test_session_reconnect_keeps_session_and_subscriptions(self):
+        """Test the reconnect URL resumes the same session on a new socket."""
+        # Arrange
+        await self.start()
+        try:
+            connector, ws, session_id = await open_session(self.bot)
+            body = chat_subscription(self.channel, self.bot, session_id)
+            await self.request("POST", "eventsub/subscriptions", json_body=body)
+
+            # Act
+            await self.twitch.reconnect_session(session_id)
+            reconnect = json.loads(await ws.recv())
+            url = reconnect["payload"]["session"]["reconnect_url"]
+            new_connector = WebSocketConnector(self.bot.access_token, self.bot.client_id, url)
+            new_ws = await new_connector.connect()
+            welcome = json.loads(await new_ws.recv())
+            delivered = await self.twitch.send_chat("streamer", "viewer", "hi")
+            notification = json.loads(await new_ws.recv())
+            await new_connector.disconnect()
+            await connector.disconnect()
+
+            # Assert
+            assert reconnect["metadata"]["message_type"] == "session_reconnect"
+            assert welcome["payload"]["session"]["id"] == session_id
+            assert delivered == 1
+            assert notification["payload"]["event"]["chatter_user_name"] == "viewer"
+        finally:
+            await self.stop()
+
+    @pytest.mark.asyncio
+    async def test_subscription_list_is_paginated_and_revocation_is_pushed(self):
+        """Test GET pagination and a revocation message for a removed subscription."""
+        # Arrange
+        await self.start()
+        try:
+            connector, ws, session_id = await open_session(self.bot)
+            for login in ("a", "b", "c"):
+                broadcaster = self.twitch.add_user(login)
+                body = chat_subscription(broadcaster, self.bot, session_id)
+                await self.request("POST", "eventsub/subscriptions", json_body=body)
+
+            # Act
+            first, _, _ = await self.request("GET", "eventsub/subscriptions", params={"first": "2"})
+            cursor = first["pagination"]["cursor"]
+            rest, _, _ = await self.request(
+                "GET", "eventsub/subscriptions", params={"first": "2", "after": cursor}
+            )
+            await self.twitch.revoke(first["data"][0]["id"])
+            revocation = json.loads(await ws.recv())
+            await connector.disconnect()
+
+            # Assert
+            assert first["total"] == 3
+            assert len(first["data"]) == 2
+            assert len(rest["data"]) == 1
+            assert rest["pagination"] == {}
+            assert revocation["metadata"]["message_type"] == "revocation"
+            assert revocation["payload"]["subscription"]["status"] == "authorization_revoked"
+        finally:
+            await self.stop()
+
+    @pytest.mark.asyncio
+    async def test_refresh_rotates_tokens(self):
+        """Test the token client refreshes against the stand-in's OAuth routes."""
+        # Arrange
+        await self.start()
+        try:
+            client = TokenClient(self.bot.client_id, "secret", self.http)
+            old_token = self.bot.access_token
+
+            # Act
+            result = await client.refresh("bot", self.bot.refresh_token)
+            old = await client.validate("bot", old_token)
+
+            # Assert
+            assert result.outcome == TokenOutcome.REFRESHED
+            assert result.access_token == self.twitch.users["bot"].access_token
+            assert old.outcome == TokenOutcome.FAILED
+        finally:
+            await self.stop()
+
+    @pytest.mark.asyncio
+    async def test_login_lookup_and_validation_are_paced(self):
+        """Test login lookups and token validation pass the rate limiter."""
+        # Arrange
+        await self.start()
+        limiter = self.api._rate_limiter
+        helix_key = limiter.bucket_key(self.bot.client_id, self.bot.access_token)
+        validate_key = limiter.bucket_key("oauth2", self.bot.access_token)
+        before = {
+            key: limiter.buckets[key].admitted if key in limiter.buckets else 0
+            for key in (helix_key, validate_key)
+        }
+        try:
+            # Act
+            ids = await self.api.get_users_by_login(
+                access_token=self.bot.access_token,
+                client_id=self.bot.client_id,
+                logins=["Streamer", "nobody"],
+            )
+            validation = await self.api.validate_token(self.bot.access_token)
+
+            # Assert
+            assert ids == {"streamer": self.channel.user_id}
+            assert validation is not None
+            assert limiter.buckets[helix_key].admitted == before[helix_key] + 1
+            assert limiter.buckets[validate_key].admitted == before[validate_key] + 1
+        finally:
+            await self.stop()
+
+    @pytest.mark.asyncio
+    async def test_exhausted_bucket_answers_429_with_reset(self):
+        """Test the Helix bucket runs dry and reports when it refills."""
+        # Arrange
+        await self.start(FaultProfile(rate_limit=2))
+        url = f"{self.twitch.endpoints.helix_url}/users"
+        headers = {
+            "Authorization": f"Bearer {self.bot.access_token}",
+            "Client-Id": self.bot.client_id,
+        }
+        try:
+            # Act
+            statuses = []
+            for _ in range(3):
+                async with self.http.get(url, headers=headers) as resp:
+                    statuses.append(resp.status)
+                    last = resp.headers
+
+            # Assert
+            assert statuses == [200, 200, 429]
+            assert last["Ratelimit-Remaining"] == "0"
+            assert int(last["Ratelimit-Reset"]) > 0
+        finally:
+            await self.stop()
@@ -112,7 +112,7 @@ class TestWebSocketPipelineIntegration:
         backend = Mock()
         backend._last_activity = 0.0
         backend._msg_processor = Mock()
-        backend._msg_processor.process_message = AsyncMock()
+        backend._msg_processor.process_envelope = AsyncMock()
         return MessageCoordinator(backend)
 
     @pytest.mark.asyncio
@@ -161,7 +161,7 @@ class TestWebSocketPipelineIntegration:
         """Test receiving and processing messages through the full pipeline."""
         # Arrange
         message_transceiver.connector.ws = mock_websocket_with_messages
-        message_coordinator.backend._msg_processor.process_message = AsyncMock()
+        message_coordinator.backend._msg_processor.process_envelope = AsyncMock()
 
         # Act
         message1 = await message_transceiver.receive_message()
@@ -180,7 +180,7 @@ class TestWebSocketPipelineIntegration:
         assert result2 is True  # Continue processing
 
         # Verify message processor was called for text messages
-        assert message_coordinator.backend._msg_processor.process_message.call_count == 2
+        assert message_coordinator.backend._msg_processor.process_envelope.call_count == 2
 
     @pytest.mark.asyncio
     async def test_should_handle_ping_messages_correctly(
@@ -298,7 +298,9 @@ class TestWebSocketPipelineIntegration:
 
         # Assert
         assert result is True
-        message_coordinator.backend._reconnection_coordinator.handle_session_reconnect.assert_called_once_with(reconnect_data)
+        message_coordinator.backend._reconnection_coordinator.handle_session_reconnect.assert_called_once()
+        envelope = message_coordinator.backend._reconnection_coordinator.handle_session_reconnect.call_args[0][0]
+        assert envelope.message_type == "session_reconnect"
 
     @pytest.mark.asyncio
     async def test_should_skip_session_keepalive_messages(
@@ -315,7 +317,7 @@ class TestWebSocketPipelineIntegration:
         # Assert
         assert result is True
         # Keepalive should not trigger any processing
-        message_coordinator.backend._msg_processor.process_message.assert_not_called()
+        message_coordinator.backend._msg_processor.process_envelope.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_should_send_json_messages_correctly(
@@ -0,0 +1,60 @@
+"""
+Unit tests for PriorityAdmission.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.admission import PriorityAdmission
+
+
+class TestPriorityAdmission:
+    """Test class for PriorityAdmission functionality."""
+
+    @pytest.mark.asyncio
+    async def test_head_is_admitted_in_entry_order(self):
+        """Test waiters are admitted lowest entry first once tokens appear."""
+        # Arrange
+        queue = PriorityAdmission()
+        tokens = [0]
+        order = []
+
+        def delay():
+            return 0.0 if tokens[0] else 60.0
+
+        def admit(_waited):
+            tokens[0] -= 1
+
+        async def waiter(entry):
+            await queue.wait(entry, delay, admit)
+            order.append(entry)
+
+        tasks = [asyncio.create_task(waiter(e)) for e in [(2, 0), (0, 1), (1, 2)]]
+        await asyncio.sleep(0)
+
+        # Act
+        async with queue.update():
+            tokens[0] = 3
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=5)
+
+        # Assert
+        assert order == [(0, 1), (1, 2), (2, 0)]
+        assert queue.max_depth == 3
+        assert len(queue) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test a cancelled waiter is removed from the heap."""
+        # Arrange
+        queue = PriorityAdmission()
+        task = asyncio.create_task(queue.wait((0,), lambda: 60.0, lambda _: None))
+        await asyncio.sleep(0)
+
+        # Act
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Assert
+        assert len(queue) == 0
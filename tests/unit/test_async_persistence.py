@@ -130,44 +130,36 @@ class TestAsyncPersistence:
 
     @pytest.mark.asyncio
     async def test_persist_batch_should_persist_all_successfully(self):
-        """Test _persist_batch persists all configs successfully."""
+        """Test _persist_batch writes the whole batch with one executor call."""
         pending = [
             {"username": "user1", "color": "#FF0000"},
             {"username": "user2", "color": "#00FF00"}
         ]
         config_file = "test.conf"
 
-        with patch('src.config.async_persistence.update_user_in_config', return_value=True), \
-              patch('asyncio.get_event_loop') as mock_loop, \
-              patch('shutil.copy2') as mock_copy, \
-              patch('os.remove') as mock_remove:
-            mock_loop.return_value.run_in_executor = AsyncMock()
+        with patch('asyncio.get_event_loop') as mock_loop:
+            mock_loop.return_value.run_in_executor = AsyncMock(return_value=0)
             failures = await _persist_batch(pending, config_file)
 
         assert failures == 0
-        assert mock_loop.return_value.run_in_executor.call_count == 2
-        mock_copy.assert_called_once()
-        mock_remove.assert_called_once()
+        mock_loop.return_value.run_in_executor.assert_called_once_with(
+            None, async_persistence.update_users_in_config, pending, config_file
+        )
 
     @pytest.mark.asyncio
     async def test_persist_batch_should_count_failures(self):
-        """Test _persist_batch counts persistence failures."""
+        """Test _persist_batch reports the failures returned by the batch write."""
         pending = [
             {"username": "user1", "color": "#FF0000"},
             {"username": "user2", "color": "#00FF00"}
         ]
         config_file = "test.conf"
 
-        with patch('asyncio.get_event_loop') as mock_loop, \
-              patch('shutil.copy2') as mock_copy, \
-              patch('os.remove') as mock_remove:
-            mock_loop.return_value.run_in_executor = AsyncMock(side_effect=[True, False])
+        with patch('asyncio.get_event_loop') as mock_loop:
+            mock_loop.return_value.run_in_executor = AsyncMock(return_value=1)
             failures = await _persist_batch(pending, config_file)
 
         assert failures == 1
-        # copy2 called twice: once for backup, once for rollback
-        assert mock_copy.call_count == 2
-        mock_remove.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_persist_batch_should_use_persistence_lock(self):
@@ -175,9 +167,8 @@ class TestAsyncPersistence:
         pending = [{"username": "user1", "color": "#FF0000"}]
         config_file = "test.conf"
 
-        with patch('src.config.async_persistence.update_user_in_config', return_value=True), \
-             patch('asyncio.get_event_loop') as mock_loop:
-            mock_loop.return_value.run_in_executor = AsyncMock()
+        with patch('asyncio.get_event_loop') as mock_loop:
+            mock_loop.return_value.run_in_executor = AsyncMock(return_value=0)
             await _persist_batch(pending, config_file)
 
         # Verify the lock context was used (hard to test directly, but ensure no exceptions)
@@ -299,11 +290,8 @@ class TestAsyncPersistence:
             await asyncio.sleep(0.01)  # Small delay to test concurrency
             return await _persist_batch(pending, config_file)
 
-        with patch('src.config.async_persistence.update_user_in_config', return_value=True), \
-              patch('asyncio.get_event_loop') as mock_loop, \
-              patch('shutil.copy2') as mock_copy, \
-              patch('os.remove') as mock_remove:
-            mock_loop.return_value.run_in_executor = AsyncMock()
+        with patch('asyncio.get_event_loop') as mock_loop:
+            mock_loop.return_value.run_in_executor = AsyncMock(return_value=0)
             # Run concurrent persists
             results = await asyncio.gather(
                 persist_with_delay(pending1),
@@ -335,73 +323,15 @@ class TestAsyncPersistence:
 
     @pytest.mark.asyncio
     async def test_error_in_persist_should_be_handled_gracefully(self):
-        """Test that errors in persistence are handled without crashing."""
+        """Test that errors in persistence fail the batch without crashing."""
         pending = [{"username": "user1", "color": "#FF0000"}]
         config_file = "test.conf"
 
-        with patch('asyncio.get_event_loop') as mock_loop, \
-             patch('shutil.copy2') as mock_copy:
+        with patch('asyncio.get_event_loop') as mock_loop:
             mock_loop.return_value.run_in_executor = AsyncMock(side_effect=Exception("IO Error"))
             failures = await _persist_batch(pending, config_file)
 
         assert failures == 1
-        mock_copy.assert_called()  # rollback called
-
-    @pytest.mark.asyncio
-    async def test_persist_batch_should_rollback_on_partial_failure(self):
-        """Test _persist_batch rolls back on partial batch failure."""
-        pending = [
-            {"username": "user1", "color": "#FF0000"},
-            {"username": "user2", "color": "#00FF00"}
-        ]
-        config_file = "test.conf"
-
-        with patch('asyncio.get_event_loop') as mock_loop, \
-             patch('shutil.copy2') as mock_copy, \
-             patch('os.remove') as mock_remove:
-            mock_loop.return_value.run_in_executor = AsyncMock(side_effect=[True, False])
-            failures = await _persist_batch(pending, config_file)
-
-        assert failures == 1
-        # copy2 called twice: once for backup, once for rollback
-        assert mock_copy.call_count == 2
-        mock_remove.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_persist_batch_should_rollback_atomically_on_first_failure(self):
-        """Test _persist_batch ensures atomicity: rollback entire batch if any item fails, even if later items succeed."""
-        pending = [
-            {"username": "user1", "color": "#FF0000"},
-            {"username": "user2", "color": "#00FF00"},
-            {"username": "user3", "color": "#0000FF"}
-        ]
-        config_file = "test.conf"
-
-        with patch('asyncio.get_event_loop') as mock_loop, \
-             patch('shutil.copy2') as mock_copy, \
-             patch('os.remove') as mock_remove:
-            # First fails, second and third succeed
-            mock_loop.return_value.run_in_executor = AsyncMock(side_effect=[False, True, True])
-            failures = await _persist_batch(pending, config_file)
-
-        assert failures == 1
-        # copy2 called twice: once for backup, once for rollback (atomic rollback)
-        assert mock_copy.call_count == 2
-        mock_remove.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_persist_batch_should_fail_all_on_backup_failure(self):
-        """Test _persist_batch fails all when backup creation fails."""
-        pending = [
-            {"username": "user1", "color": "#FF0000"},
-            {"username": "user2", "color": "#00FF00"}
-        ]
-        config_file = "test.conf"
-
-        with patch('shutil.copy2', side_effect=OSError("Backup failed")):
-            failures = await _persist_batch(pending, config_file)
-
-        assert failures == 2  # len(pending)
 
     @pytest.mark.asyncio
     async def test_empty_batch_should_not_persist(self):
@@ -3,12 +3,13 @@ Unit tests for BackgroundTaskManager.
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import time
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from src.auth_token.background_task_manager import BackgroundTaskManager
+from src.auth_token.background_task_manager import BackgroundTaskManager, gather_per_user
 from src.auth_token.client import TokenOutcome
 
 
@@ -18,6 +19,8 @@ class TestBackgroundTaskManager:
     def setup_method(self):
         """Setup method called before each test."""
         self.mock_manager = Mock()
+        self.mock_manager.tokens = {}
+        self.mock_manager._paused_users = set()
         self.task_manager = BackgroundTaskManager(self.mock_manager)
 
     def teardown_method(self):
@@ -90,57 +93,6 @@ class TestBackgroundTaskManager:
         assert self.task_manager.running is False
         assert self.task_manager.task is None
 
-    @pytest.mark.asyncio
-    async def test_background_refresh_loop_processes_users(self):
-        """Test _background_refresh_loop processes all users."""
-        # Arrange
-        self.mock_manager._tokens_lock = AsyncMock()
-        self.mock_manager.tokens = {"user1": Mock(), "user2": Mock()}
-        self.mock_manager._paused_users = []
-
-        mock_info1 = Mock()
-        mock_info2 = Mock()
-        self.mock_manager.tokens = {"user1": mock_info1, "user2": mock_info2}
-
-        with patch.object(self.task_manager, '_process_single_background', new_callable=AsyncMock) as mock_process:
-            async def mock_wait_for(coro, timeout=None):  # noqa: ASYNC109
-                self.task_manager.running = False
-                return None
-
-            with patch('asyncio.wait_for', mock_wait_for), patch('asyncio.sleep', new_callable=AsyncMock):
-                # Stop after one iteration
-                self.task_manager.running = True
-
-                # Act
-                await self.task_manager._background_refresh_loop()
-
-        # Assert
-        assert mock_process.call_count == 2
-        mock_process.assert_any_call("user1", mock_info1, force_proactive=False, drift_compensation=pytest.approx(0.0, abs=1e-5))
-        mock_process.assert_any_call("user2", mock_info2, force_proactive=False, drift_compensation=pytest.approx(0.0, abs=1e-5))
-
-    @pytest.mark.asyncio
-    async def test_background_refresh_loop_handles_drift_correction(self):
-        """Test _background_refresh_loop applies drift correction."""
-        # Arrange
-        self.mock_manager._tokens_lock = AsyncMock()
-        self.mock_manager.tokens = {}
-        self.mock_manager._paused_users = []
-
-        with (
-            patch('time.time', side_effect=[100, 103.5]),  # 3.5s drift
-            patch.object(self.task_manager, '_process_single_background', new_callable=AsyncMock),
-            patch('asyncio.wait_for', side_effect=lambda *args, **kwargs: None)
-        ):
-            # Stop after one iteration
-            self.task_manager.running = False
-
-            # Act
-            await self.task_manager._background_refresh_loop()
-
-        # Drift of 3.5s should trigger consecutive_drift increment
-
-
     @pytest.mark.asyncio
     async def test_process_single_background_critical_health_forces_refresh(self):
         """Test _process_single_background forces refresh for critical health."""
@@ -478,58 +430,146 @@ class TestBackgroundTaskManager:
         assert hasattr(health, 'is_healthy')
 
     @pytest.mark.asyncio
-    async def test_background_refresh_loop_records_success_on_successful_iteration(self):
-        """Test _background_refresh_loop records success for successful iterations."""
+    async def test_background_refresh_loop_dispatches_due_users(self):
+        """Test the loop dispatches users whose deadline has passed."""
         # Arrange
-        self.mock_manager._tokens_lock = AsyncMock()
-        self.mock_manager.tokens = {}
-        self.mock_manager._paused_users = []
+        due_info = Mock(expiry=datetime.now(UTC) + timedelta(minutes=10), last_validation=time.time())
+        later_info = Mock(expiry=datetime.now(UTC) + timedelta(hours=5), last_validation=time.time())
+        self.mock_manager.tokens = {"due": due_info, "later": later_info}
 
-        with patch.object(self.task_manager, '_process_single_background', new_callable=AsyncMock):
+        with patch.object(self.task_manager, '_process_single_background', new_callable=AsyncMock) as mock_process:
             async def mock_wait_for(coro, timeout=None):  # noqa: ASYNC109
+                coro.close()
                 self.task_manager.running = False
-                return None
 
-            with patch('asyncio.wait_for', mock_wait_for), patch('asyncio.sleep', new_callable=AsyncMock):
-                # Stop after one iteration
+            with patch('asyncio.wait_for', mock_wait_for):
                 self.task_manager.running = True
 
                 # Act
                 await self.task_manager._background_refresh_loop()
+                await asyncio.gather(*self.task_manager._inflight.values())
 
-        # Assert - Health should record success
-        health = self.task_manager.health
-        assert health.last_success_time is not None
-        assert health.consecutive_failures == 0
-        assert health.is_healthy is True
+        # Assert
+        mock_process.assert_called_once_with("due", due_info, force_proactive=False, drift_compensation=0.0)
+        assert "later" in self.task_manager._deadlines
+
+    def test_next_deadline_is_earliest_of_refresh_and_validation(self):
+        """Test the deadline falls inside the refresh window or at validation time."""
+        # Arrange
+        now = time.time()
+        refresh_soon = Mock(expiry=datetime.now(UTC) + timedelta(minutes=70), last_validation=now)
+        validate_soon = Mock(expiry=datetime.now(UTC) + timedelta(hours=5), last_validation=now)
+
+        # Act
+        refresh_deadline = self.task_manager._next_deadline(refresh_soon)
+        validate_deadline = self.task_manager._next_deadline(validate_soon)
+
+        # Assert - refresh window opens 1h before expiry, jitter only delays it
+        assert now + 600 - 5 <= refresh_deadline <= now + 600 + 300 + 5
+        assert validate_deadline == pytest.approx(now + 1800)
+
+    def test_reschedule_supersedes_previous_deadline(self):
+        """Test only the latest deadline for a user is popped."""
+        # Arrange
+        info = Mock(expiry=datetime.now(UTC) + timedelta(minutes=5), last_validation=time.time())
+        self.mock_manager.tokens = {"user1": info}
+        self.task_manager.running = True
+        self.task_manager.reschedule("user1")
+
+        # Act
+        self.task_manager.reschedule("user1", min_delay=600)
+        due_now = self.task_manager._pop_due(time.time())
+        due_later = self.task_manager._pop_due(time.time() + 700)
+
+        # Assert
+        assert due_now == []
+        assert [u for u, _ in due_later] == ["user1"]
 
     @pytest.mark.asyncio
-    async def test_background_refresh_loop_records_failure_on_failed_iteration(self):
-        """Test _background_refresh_loop records failure when user processing fails."""
+    async def test_dispatch_skips_paused_users(self):
+        """Test paused users are not processed when due."""
         # Arrange
-        self.mock_manager._tokens_lock = AsyncMock()
         self.mock_manager.tokens = {"user1": Mock()}
-        self.mock_manager._paused_users = []
+        self.mock_manager._paused_users = {"user1"}
+
+        # Act
+        self.task_manager._dispatch("user1", 0.0)
 
+        # Assert
+        assert self.task_manager._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_run_due_treats_large_overrun_as_drift(self):
+        """Test a deadline overrun beyond three base sleeps forces proactive refresh."""
+        # Arrange
         with patch.object(self.task_manager, '_process_single_background', new_callable=AsyncMock) as mock_process:
-            mock_process.side_effect = Exception("Processing failed")
+            # Act
+            await self.task_manager._run_due("user1", Mock(), 1000.0)
 
-            async def mock_wait_for(coro, timeout=None):  # noqa: ASYNC109
-                self.task_manager.running = False
-                if hasattr(coro, '__await__'):
-                    task = asyncio.create_task(coro)
-                    task.cancel()
-                return None
+        # Assert
+        mock_process.assert_called_once()
+        assert mock_process.call_args.kwargs == {"force_proactive": True, "drift_compensation": 1000.0}
+        assert self.task_manager.health.last_success_time is not None
 
-            with patch('asyncio.wait_for', mock_wait_for):
-                # Stop after one iteration
-                self.task_manager.running = True
+    @pytest.mark.asyncio
+    async def test_run_due_records_failure(self):
+        """Test a failing user records a health failure."""
+        # Arrange
+        with patch.object(self.task_manager, '_process_single_background', new_callable=AsyncMock) as mock_process:
+            mock_process.side_effect = Exception("Processing failed")
 
-                # Act
-                await self.task_manager._background_refresh_loop()
+            # Act
+            await self.task_manager._run_due("user1", Mock(), 0.0)
 
-        # Assert - Health should record failure
+        # Assert
         health = self.task_manager.health
-        assert health.last_failure_time is not None
         assert health.consecutive_failures == 1
-        assert health.last_error_message == "One or more user background refreshes failed"
+        assert health.last_error_message == "Processing failed"
+
+
+class TestGatherPerUser:
+    """Test class for bounded per-user fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_runs_users_concurrently_within_limit(self):
+        """Test workers overlap but never exceed the concurrency limit."""
+        # Arrange
+        in_flight = 0
+        peak = 0
+
+        async def worker(username, info):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        users = [(f"user{i}", Mock()) for i in range(6)]
+
+        # Act
+        failures = await gather_per_user(users, worker, limit=3)
+
+        # Assert
+        assert failures == {}
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_collects_failures_without_stopping_others(self):
+        """Test a failing user is reported while the rest still run."""
+        # Arrange
+        processed = []
+
+        async def worker(username, info):
+            if username == "bad":
+                raise RuntimeError("boom")
+            processed.append(username)
+
+        # Act
+        failures = await gather_per_user(
+            [("bad", Mock()), ("good", Mock())], worker
+        )
+
+        # Assert
+        assert list(failures) == ["bad"]
+        assert isinstance(failures["bad"], RuntimeError)
+        assert processed == ["good"]
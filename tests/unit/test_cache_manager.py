@@ -8,10 +8,11 @@ import asyncio
 import json
 import os
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
-from src.chat.cache_manager import CacheManager
+from src.chat.cache_manager import CacheManager, get_cache_manager
 
 
 class TestCacheManager:
@@ -215,3 +216,76 @@ class TestCacheManager:
             await cache.set("key1", "value1")
             result = await cache.get("key1")
             assert result == "value1"
+
+    @pytest.mark.asyncio
+    async def test_get_many_and_set_many(self):
+        """Test bulk lookups return only the keys that are present."""
+        async with CacheManager(self.cache_file) as cache:
+            await cache.set_many({"a": "1", "b": "2"})
+
+            result = await cache.get_many(["a", "b", "missing"])
+
+            assert result == {"a": "1", "b": "2"}
+
+    @pytest.mark.asyncio
+    async def test_mutations_are_journaled_not_rewritten(self):
+        """Test mutations append to the journal instead of rewriting the snapshot."""
+        async with CacheManager(self.cache_file, flush_delay=0) as cache:
+            # Act
+            await cache.set_many({"a": "1", "b": "2"})
+            await cache.delete("a")
+            await asyncio.sleep(0.01)
+
+            # Assert
+            assert not os.path.exists(self.cache_file)
+            with open(f"{self.cache_file}.journal") as f:
+                assert len(f.readlines()) == 4  # header + 2 sets + delete
+
+    @pytest.mark.asyncio
+    async def test_journal_replayed_by_new_instance(self):
+        """Test a second instance sees journaled mutations before compaction."""
+        writer = CacheManager(self.cache_file, flush_delay=0)
+        await writer.set("key1", "value1")
+        await asyncio.sleep(0.01)
+
+        async with CacheManager(self.cache_file) as reader:
+            assert await reader.get("key1") == "value1"
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_close_compacts_journal_into_snapshot(self):
+        """Test closing folds the journal into the snapshot file."""
+        async with CacheManager(self.cache_file) as cache:
+            await cache.set("key1", "value1")
+
+        assert not os.path.exists(f"{self.cache_file}.journal")
+        with open(self.cache_file) as f:
+            assert json.load(f) == {"key1": "value1"}
+
+    @pytest.mark.asyncio
+    async def test_background_compaction_after_threshold(self):
+        """Test the journal is compacted once it reaches the threshold."""
+        async with CacheManager(
+            self.cache_file, compact_threshold=2, flush_delay=0
+        ) as cache:
+            await cache.set_many({"a": "1", "b": "2"})
+            await asyncio.sleep(0.05)
+
+            assert not os.path.exists(f"{self.cache_file}.journal")
+            with open(self.cache_file) as f:
+                assert json.load(f) == {"a": "1", "b": "2"}
+
+    @pytest.mark.asyncio
+    async def test_bots_sharing_a_file_share_one_manager(self):
+        """Test managers obtained for the same file keep each other's entries."""
+        with patch.dict("src.chat.cache_manager._cache_managers", clear=True):
+            first = get_cache_manager(self.cache_file)
+            second = get_cache_manager(os.path.join(self.temp_dir, ".", "test_cache.json"))
+            await first.set("alice", "1")
+            await second.set("bob", "2")
+            await second.close()
+            await first.close()
+
+        assert first is second
+        with open(self.cache_file) as f:
+            assert json.load(f) == {"alice": "1", "bob": "2"}
@@ -15,10 +15,13 @@ from src.utils.circuit_breaker import (
     CircuitBreakerConfig,
     CircuitBreakerOpenException,
     CircuitBreakerState,
+    FailureScope,
     _circuit_breakers,
+    breaker_key_chain,
     cleanup_circuit_breakers,
     get_circuit_breaker,
     get_circuit_breaker_state,
+    get_keyed_circuit_breaker,
     remove_circuit_breaker,
     reset_circuit_breaker,
 )
@@ -346,3 +349,77 @@ class TestGlobalCircuitBreakerRegistry:
 
         # Assert
         assert removed_count == 0
+
+
+class TestKeyedCircuitBreaker:
+    """Test class for hierarchical keyed circuit breakers."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        _circuit_breakers.clear()
+        self.config = CircuitBreakerConfig(failure_threshold=2, recovery_timeout=60.0)
+
+    def teardown_method(self):
+        """Teardown method called after each test."""
+        _circuit_breakers.clear()
+
+    def test_key_chain_rolls_up_to_global(self):
+        """Test a key expands from most specific level to the shared root."""
+        assert breaker_key_chain("helix:42:chat/color") == [
+            "helix:42:chat/color",
+            "helix:42",
+            "helix:global",
+        ]
+        assert breaker_key_chain("helix") == ["helix:global"]
+        assert breaker_key_chain("helix:global") == ["helix:global"]
+
+    @pytest.mark.asyncio
+    async def test_user_failures_do_not_trip_shared_root(self):
+        """Test USER-scoped failures isolate one user from the others."""
+        # Arrange
+        bad = get_keyed_circuit_breaker("helix:1:chat/color", self.config)
+        good = get_keyed_circuit_breaker("helix:2:chat/color", self.config)
+
+        # Act
+        for _ in range(2):
+            await bad.call(lambda: 401, classify=lambda _: FailureScope.USER)
+
+        # Assert
+        assert bad.is_open
+        assert get_circuit_breaker_state("helix:1") == "open"
+        assert get_circuit_breaker_state("helix:global") == "closed"
+        assert await good.call(lambda: "ok") == "ok"
+        with pytest.raises(CircuitBreakerOpenException):
+            await get_keyed_circuit_breaker("helix:1:users", self.config).call(lambda: "x")
+
+    @pytest.mark.asyncio
+    async def test_endpoint_failures_stay_on_the_endpoint(self):
+        """Test ENDPOINT-scoped failures leave the user's other endpoints open."""
+        # Arrange
+        color = get_keyed_circuit_breaker("helix:1:chat/color", self.config)
+
+        # Act
+        for _ in range(2):
+            await color.call(lambda: 502, classify=lambda _: FailureScope.ENDPOINT)
+
+        # Assert
+        assert color.is_open
+        assert not get_keyed_circuit_breaker("helix:1:users", self.config).is_open
+
+    @pytest.mark.asyncio
+    async def test_exceptions_trip_every_level_by_default(self):
+        """Test unclassified exceptions count on the shared root as well."""
+        # Arrange
+        breaker = get_keyed_circuit_breaker("helix:1:chat/color", self.config)
+
+        async def fail():
+            raise ConnectionError("down")
+
+        # Act
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await breaker.call(fail)
+
+        # Assert
+        assert get_circuit_breaker_state("helix:global") == "open"
+        assert get_keyed_circuit_breaker("helix:2:chat/color", self.config).is_open
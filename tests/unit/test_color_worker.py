@@ -0,0 +1,139 @@
+"""
+Unit tests for the per-bot color change worker.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.bot.color_worker import ColorChangeWorker
+from src.utils.latency import LatencyRecorder, current_frame
+
+
+class TestColorChangeWorker:
+    """Test class for ColorChangeWorker functionality."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.calls = []
+        self.release = asyncio.Event()
+
+        async def change(color):
+            self.calls.append(color)
+            await self.release.wait()
+
+        self.worker = ColorChangeWorker("testuser", change)
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_without_waiting_for_change(self):
+        """Test submit only schedules the change."""
+        # Act
+        self.worker.submit("#112233")
+        await asyncio.sleep(0)
+
+        # Assert
+        assert self.calls == ["#112233"]
+        assert self.worker.busy
+        await self.worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_burst_during_change_collapses_to_latest(self):
+        """Test requests queued behind an in-flight change keep only the newest."""
+        # Arrange
+        self.worker.submit("#000001")
+        await asyncio.sleep(0)
+
+        # Act
+        self.worker.submit("#000002")
+        self.worker.submit("#000003")
+        self.worker.submit(None)
+        self.release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # Assert
+        assert self.calls == ["#000001", None]
+        assert self.worker.submitted == 4
+        assert self.worker.coalesced == 2
+        assert self.worker.completed == 2
+        assert not self.worker.busy
+        await self.worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_change_does_not_stop_worker(self):
+        """Test the worker keeps serving after a change raises."""
+        # Arrange
+        calls = []
+
+        async def change(color):
+            calls.append(color)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+
+        worker = ColorChangeWorker("testuser", change)
+
+        # Act
+        with patch("src.bot.color_worker.logging") as mock_logging:
+            worker.submit("red")
+            await asyncio.sleep(0)
+            worker.submit("blue")
+            await asyncio.sleep(0)
+
+        # Assert
+        assert calls == ["red", "blue"]
+        mock_logging.error.assert_called_once()
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_change_runs_inside_submitting_frame(self):
+        """Test the latency frame of the triggering message reaches the worker."""
+        # Arrange
+        seen = []
+
+        async def change(color):
+            seen.append(current_frame())
+
+        worker = ColorChangeWorker("testuser", change)
+        recorder = LatencyRecorder()
+
+        # Act
+        with recorder.frame("testuser") as timing:
+            worker.submit()
+        await asyncio.sleep(0)
+
+        # Assert
+        assert seen == [timing]
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_in_flight_change_and_drops_pending(self):
+        """Test stop cancels the worker task."""
+        # Arrange
+        self.worker.submit("#000001")
+        await asyncio.sleep(0)
+        self.worker.submit("#000002")
+        task = self.worker._task
+
+        # Act
+        await self.worker.stop()
+
+        # Assert
+        assert task is not None and task.cancelled()
+        assert self.worker._task is None
+        assert not self.worker.busy
+
+    @pytest.mark.asyncio
+    async def test_submit_after_stop_is_ignored(self):
+        """Test a message handled during shutdown cannot restart the worker."""
+        # Arrange
+        await self.worker.stop()
+
+        # Act
+        self.worker.submit("#000003")
+        await asyncio.sleep(0)
+
+        # Assert
+        assert self.worker._task is None
+        assert self.calls == []
+        assert not self.worker.busy
@@ -176,3 +176,67 @@ class TestConfigSaver:
             self.saver._log_update_failed(exception, user_dict)
 
         mock_logging.error.assert_called_once()
+
+    def test_update_users_in_config_merges_batch_with_single_save(self):
+        """Test a batch of updates is loaded and saved exactly once."""
+        # Arrange
+        dicts = [{"username": "user1"}, {"username": "user2"}]
+        ucs = []
+        for d in dicts:
+            uc = Mock()
+            uc.username = d["username"]
+            uc.normalize.return_value = False
+            uc.validate.return_value = True
+            uc.to_dict.return_value = d
+            ucs.append(uc)
+
+        with patch('src.config.config_saver.UserConfig.from_dict', side_effect=ucs), \
+             patch.object(self.saver.loader, 'load_users_from_config', return_value=[]) as mock_load, \
+             patch.object(self.saver, 'save_users_to_config') as mock_save:
+            # Act
+            failures = self.saver.update_users_in_config(dicts, "test.conf")
+
+        # Assert
+        assert failures == 0
+        mock_load.assert_called_once_with("test.conf")
+        mock_save.assert_called_once_with(dicts, "test.conf")
+
+    def test_update_users_in_config_rejects_batch_with_invalid_user(self):
+        """Test one invalid update leaves the file untouched for the whole batch."""
+        # Arrange
+        valid_uc = Mock()
+        valid_uc.normalize.return_value = False
+        valid_uc.validate.return_value = True
+        invalid_uc = Mock()
+        invalid_uc.normalize.return_value = False
+        invalid_uc.validate.return_value = False
+
+        with patch('src.config.config_saver.UserConfig.from_dict', side_effect=[valid_uc, invalid_uc]), \
+             patch.object(self.saver, 'save_users_to_config') as mock_save:
+            # Act
+            failures = self.saver.update_users_in_config(
+                [{"username": "user1"}, {"username": "user2"}], "test.conf"
+            )
+
+        # Assert
+        assert failures == 1
+        mock_save.assert_not_called()
+
+    def test_update_users_in_config_counts_all_on_write_failure(self):
+        """Test a failed write fails every update in the batch."""
+        # Arrange
+        uc = Mock()
+        uc.normalize.return_value = False
+        uc.validate.return_value = True
+
+        with patch('src.config.config_saver.UserConfig.from_dict', return_value=uc), \
+             patch.object(self.saver.loader, 'load_users_from_config', return_value=[]), \
+             patch.object(self.saver, '_merge_user', return_value=([], True)), \
+             patch.object(self.saver, 'save_users_to_config', side_effect=OSError("disk full")):
+            # Act
+            failures = self.saver.update_users_in_config(
+                [{"username": "user1"}, {"username": "user2"}], "test.conf"
+            )
+
+        # Assert
+        assert failures == 2
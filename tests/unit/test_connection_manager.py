@@ -241,6 +241,20 @@ class TestConnectionManager:
             # The method catches KeyboardInterrupt, so it should complete without raising
             await self.manager.run_chat_loop()
 
+    @pytest.mark.asyncio
+    async def test_subscribe_channels_joins_once_per_connection(self):
+        """Test subscribe_channels starts listening and joins channels only once."""
+        self.manager.chat_backend = Mock()
+        self.manager._normalized_channels_cache = ["first", "second"]
+
+        with patch.object(self.manager, '_create_and_monitor_listener') as mock_listen, \
+             patch.object(self.manager, '_join_additional_channels') as mock_join:
+            assert await self.manager.subscribe_channels() is True
+            assert await self.manager.subscribe_channels() is True
+
+        mock_listen.assert_called_once_with(self.manager.chat_backend)
+        mock_join.assert_awaited_once_with(self.manager.chat_backend, ["first", "second"])
+
     @pytest.mark.asyncio
     async def test_run_chat_loop_no_backend(self):
         """Test run_chat_loop fails without backend."""
@@ -0,0 +1,81 @@
+"""
+Unit tests for the overridable Twitch endpoints.
+"""
+
+from unittest.mock import Mock
+
+from src.api.endpoints import TwitchEndpoints, get_endpoints, set_endpoints
+from src.api.transport import prewarm_urls
+from src.api.twitch import TwitchAPI
+from src.chat.websocket_connector import WebSocketConnector
+
+
+class TestEndpoints:
+    """Test class for endpoint defaults and overrides."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.local = TwitchEndpoints.local("http://127.0.0.1:8080/")
+
+    def teardown_method(self):
+        """Restore the default endpoints after each test."""
+        set_endpoints()
+
+    def test_defaults_point_at_twitch(self):
+        """Test the default endpoints are the public Twitch services."""
+        # Act
+        endpoints = TwitchEndpoints()
+
+        # Assert
+        assert endpoints.helix_url == "https://api.twitch.tv/helix"
+        assert endpoints.validate_url == "https://id.twitch.tv/oauth2/validate"
+        assert endpoints.token_url == "https://id.twitch.tv/oauth2/token"
+        assert endpoints.device_url == "https://id.twitch.tv/oauth2/device"
+        assert endpoints.eventsub_ws_url == "wss://eventsub.wss.twitch.tv/ws"
+
+    def test_local_serves_everything_from_one_origin(self):
+        """Test local() maps Helix, OAuth and EventSub under one origin."""
+        # Assert
+        assert self.local.helix_url == "http://127.0.0.1:8080/helix"
+        assert self.local.validate_url == "http://127.0.0.1:8080/oauth2/validate"
+        assert self.local.eventsub_ws_url == "ws://127.0.0.1:8080/ws"
+
+    def test_set_endpoints_returns_previous_and_none_restores_defaults(self):
+        """Test overriding and restoring the process-wide endpoints."""
+        # Act
+        previous = set_endpoints(self.local)
+        current = get_endpoints()
+        restored_from = set_endpoints()
+
+        # Assert
+        assert previous == TwitchEndpoints()
+        assert current is self.local
+        assert restored_from is self.local
+        assert get_endpoints() == TwitchEndpoints()
+
+    def test_clients_follow_the_override(self):
+        """Test Helix, EventSub and pre-warm URLs resolve through the override."""
+        # Arrange
+        api = TwitchAPI(Mock())
+
+        # Act
+        set_endpoints(self.local)
+
+        # Assert
+        assert api.base_url == "http://127.0.0.1:8080/helix"
+        assert WebSocketConnector("t", "c").ws_url == "ws://127.0.0.1:8080/ws"
+        assert prewarm_urls() == (
+            "http://127.0.0.1:8080/helix/",
+            "http://127.0.0.1:8080/oauth2/validate",
+        )
+
+    def test_explicit_base_url_wins(self):
+        """Test a client-specific base URL is not affected by the override."""
+        # Arrange
+        api = TwitchAPI(Mock(), base_url="http://helix.test/")
+
+        # Act
+        set_endpoints(self.local)
+
+        # Assert
+        assert api.base_url == "http://helix.test"
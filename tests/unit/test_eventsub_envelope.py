@@ -0,0 +1,111 @@
+"""
+Unit tests for the EventSub envelope decoder.
+"""
+
+import dataclasses
+import json
+
+import pytest
+
+from src.chat.eventsub_envelope import ChatEvent, decode_envelope, peek_chatter_user_id
+from src.chat.message_processor import MessageProcessor
+from src.errors.eventsub import MessageProcessingError
+
+CHAT_FRAME = {
+    "metadata": {
+        "message_id": "abc",
+        "message_type": "notification",
+        "message_timestamp": "2024-01-01T00:00:00Z",
+    },
+    "payload": {
+        "subscription": {"type": "channel.chat.message", "condition": {"user_id": "42"}},
+        "event": {
+            "chatter_user_id": "42",
+            "chatter_user_name": "Bot",
+            "broadcaster_user_id": "7",
+            "broadcaster_user_name": "Chan",
+            "message": {"text": "hello"},
+        },
+    },
+}
+
+
+class TestDecodeEnvelope:
+    """Test class for decode_envelope functionality."""
+
+    def test_decodes_chat_notification_into_typed_event(self):
+        """Test a chat notification yields metadata and a typed ChatEvent."""
+        envelope = decode_envelope(json.dumps(CHAT_FRAME))
+
+        assert envelope.is_notification
+        assert envelope.message_id == "abc"
+        assert envelope.subscription_type == "channel.chat.message"
+        assert envelope.condition_user_id == "42"
+        assert envelope.event == ChatEvent("Bot", "Chan", "hello", "42", "7")
+
+    def test_envelope_is_frozen(self):
+        """Test envelopes cannot be mutated by downstream stages."""
+        envelope = decode_envelope(json.dumps(CHAT_FRAME))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            envelope.message_type = "other"  # type: ignore[misc]
+
+    def test_session_reconnect_exposes_url(self):
+        """Test session_reconnect frames expose reconnect_url."""
+        raw = json.dumps(
+            {
+                "metadata": {"message_type": "session_reconnect"},
+                "payload": {"session": {"id": "s1", "reconnect_url": "wss://x"}},
+            }
+        )
+
+        envelope = decode_envelope(raw)
+
+        assert envelope.reconnect_url == "wss://x"
+        assert envelope.session_id == "s1"
+        assert envelope.event is None
+
+    @pytest.mark.parametrize("raw", ["invalid json", "[1, 2]"])
+    def test_rejects_non_object_frames(self, raw):
+        """Test invalid frames raise MessageProcessingError."""
+        with pytest.raises(MessageProcessingError):
+            decode_envelope(raw)
+
+    def test_peek_reads_chatter_without_decoding(self):
+        """Test the raw probe finds the chatter of chat notifications."""
+        raw = json.dumps(CHAT_FRAME)
+
+        assert peek_chatter_user_id(raw) == "42"
+        assert peek_chatter_user_id(raw.encode()) == "42"
+
+    def test_peek_ignores_control_frames(self):
+        """Test control frames are never pre-filtered, even if they mention chat."""
+        revocation = {
+            "metadata": {"message_type": "revocation"},
+            "payload": {"subscription": {"type": "channel.chat.message"}},
+        }
+        keepalive = {"metadata": {"message_type": "session_keepalive"}}
+
+        assert peek_chatter_user_id(json.dumps(revocation)) is None
+        assert peek_chatter_user_id(json.dumps(keepalive)) is None
+
+    def test_peek_ignores_quoted_keys_in_message_text(self):
+        """Test keys embedded in chat text cannot spoof the chatter ID."""
+        frame = json.loads(json.dumps(CHAT_FRAME))
+        del frame["payload"]["event"]["chatter_user_id"]
+        frame["payload"]["event"]["message"]["text"] = '"chatter_user_id":"1"'
+
+        assert peek_chatter_user_id(json.dumps(frame)) is None
+
+    @pytest.mark.asyncio
+    async def test_processor_dispatches_envelope_event(self):
+        """Test MessageProcessor dispatches the envelope's event without re-parsing."""
+        calls = []
+        processor = MessageProcessor(
+            message_handler=lambda *args: calls.append(args),
+            color_handler=lambda *args: None,
+        )
+
+        await processor.process_envelope(decode_envelope(json.dumps(CHAT_FRAME)))
+
+        assert calls == [("Bot", "chan", "hello")]
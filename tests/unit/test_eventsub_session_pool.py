@@ -0,0 +1,220 @@
+"""
+Unit tests for the shared EventSub session pool.
+"""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.chat.eventsub_envelope import EventSubEnvelope
+from src.chat.eventsub_session_pool import (
+    EventSubSessionPool,
+    PooledSession,
+    get_session_pool,
+)
+from src.chat.message_transceiver import WSMessage
+from src.errors.eventsub import EventSubConnectionError, SessionReplacedError
+
+
+def _notification(condition_user_id: str, chatter_user_id: str = "999") -> WSMessage:
+    return WSMessage(
+        "text",
+        json.dumps(
+            {
+                "metadata": {"message_type": "notification"},
+                "payload": {
+                    "subscription": {"condition": {"user_id": condition_user_id}},
+                    "event": {"chatter_user_id": chatter_user_id},
+                },
+            }
+        ),
+    )
+
+
+def _mock_manager() -> Mock:
+    manager = Mock()
+    manager.is_connected = True
+    manager.session_id = "shared-session"
+    manager.state_manager.last_activity = [0.0]
+    manager.connect = AsyncMock()
+    manager.disconnect = AsyncMock()
+    manager.reconnect = AsyncMock(return_value=True)
+    manager.handover = AsyncMock(return_value=True)
+    return manager
+
+
+class TestEventSubSessionPool:
+    """Test class for EventSubSessionPool functionality."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.pool = EventSubSessionPool(Mock(), "client", max_subscriptions=3)
+
+    @pytest.mark.asyncio
+    async def test_attach_reuses_session_until_cap(self):
+        """Test leases share a session until the subscription cap is reached."""
+        with patch(
+            "src.chat.eventsub_session_pool.WebSocketConnectionManager",
+            side_effect=lambda **_: _mock_manager(),
+        ):
+            first = await self.pool.attach(self.pool.lease("1", "tok", slots=2))
+            second = await self.pool.attach(self.pool.lease("2", "tok", slots=1))
+            third = await self.pool.attach(self.pool.lease("3", "tok", slots=1))
+
+        assert first is second
+        assert third is not first
+        assert self.pool.stats()["reserved_slots"] == [3, 1]
+
+    @pytest.mark.asyncio
+    async def test_detach_closes_idle_session(self):
+        """Test the last lease leaving closes the shared socket."""
+        with patch(
+            "src.chat.eventsub_session_pool.WebSocketConnectionManager",
+            side_effect=lambda **_: _mock_manager(),
+        ):
+            lease = self.pool.lease("1", "tok")
+            session = await self.pool.attach(lease)
+        lease._session = session
+
+        await self.pool.detach(lease)
+
+        assert self.pool.sessions == []
+        session.manager.disconnect.assert_awaited_once()
+
+    def test_get_session_pool_is_keyed_by_client_id(self):
+        """Test the registry returns one pool per client ID."""
+        with patch.dict("src.chat.eventsub_session_pool._session_pools", clear=True):
+            assert get_session_pool(Mock(), "a") is get_session_pool(Mock(), "a")
+            assert get_session_pool(Mock(), "a") is not get_session_pool(Mock(), "b")
+
+
+class TestPooledSession:
+    """Test class for PooledSession routing."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.pool = EventSubSessionPool(Mock(), "client")
+        self.session = PooledSession(_mock_manager())
+        self.lease_a = self.pool.lease("1", "tok")
+        self.lease_b = self.pool.lease("2", "tok")
+        for lease in (self.lease_a, self.lease_b):
+            lease._session = self.session
+            self.session.leases[lease.user_id] = lease
+
+    @pytest.mark.asyncio
+    async def test_route_notification_by_condition_user_id(self):
+        """Test notifications reach only the subscribing bot."""
+        await self.session.route(_notification("2"))
+
+        assert self.lease_a._queue.empty()
+        assert self.lease_b._queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_route_falls_back_to_chatter_user_id(self):
+        """Test routing by chatter when the condition is unknown."""
+        await self.session.route(_notification("unknown", chatter_user_id="1"))
+
+        assert self.lease_a._queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_route_drops_other_chatters_without_decoding(self):
+        """Test chat messages from users without a lease are not decoded."""
+        msg = WSMessage(
+            "text",
+            json.dumps(
+                {
+                    "metadata": {"message_type": "notification"},
+                    "payload": {
+                        "subscription": {"type": "channel.chat.message", "condition": {"user_id": "2"}},
+                        "event": {"chatter_user_id": "999"},
+                    },
+                }
+            ),
+        )
+
+        with patch("src.chat.eventsub_session_pool.decode_envelope") as mock_decode:
+            await self.session.route(msg)
+
+        mock_decode.assert_not_called()
+        assert self.lease_b._queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_route_broadcasts_keepalive(self):
+        """Test keepalives are delivered to every lease."""
+        msg = WSMessage("text", json.dumps({"metadata": {"message_type": "session_keepalive"}}))
+
+        await self.session.route(msg)
+
+        assert self.lease_a._queue.qsize() == 1
+        assert self.lease_b._queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_surfaces_to_lease_receive(self):
+        """Test shared socket failures raise from every lease."""
+        self.session._fail_all(EventSubConnectionError("boom"))
+
+        with pytest.raises(EventSubConnectionError):
+            await self.lease_a.receive_message()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_is_single_flight(self):
+        """Test a reconnect already done by one lease satisfies the others."""
+        self.session._start_reader = Mock()
+        assert await self.lease_a.reconnect() is True
+        assert await self.lease_b.reconnect() is True
+
+        self.session.manager.reconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_tells_every_lease_to_resubscribe(self):
+        """Test a reconnect by one lease surfaces to the other leases once."""
+        self.session._start_reader = Mock()
+        assert await self.lease_a.reconnect() is True
+
+        self.lease_a._queue.put_nowait(WSMessage("text", "{}"))
+        assert (await self.lease_a.receive_message()).data == "{}"
+        with pytest.raises(SessionReplacedError):
+            await self.lease_b.receive_message()
+
+        assert await self.lease_b.reconnect() is True
+        self.session.manager.reconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_migrate_fallback_reconnect_tells_every_lease(self):
+        """Test a failed handover's reconnect makes every lease resubscribe."""
+        self.session._start_reader = Mock()
+        self.session.manager.handover = AsyncMock(return_value=False)
+        envelope = EventSubEnvelope.from_dict(
+            {"payload": {"session": {"reconnect_url": "wss://reconnect"}}}
+        )
+
+        await self.session._migrate(envelope)
+
+        for lease in (self.lease_a, self.lease_b):
+            with pytest.raises(SessionReplacedError):
+                await lease.receive_message()
+
+    @pytest.mark.asyncio
+    async def test_migrate_hands_over_without_reconnect(self):
+        """Test session_reconnect swaps the shared socket in place."""
+        envelope = EventSubEnvelope.from_dict(
+            {"payload": {"session": {"reconnect_url": "wss://reconnect"}}}
+        )
+
+        await self.session._migrate(envelope)
+
+        self.session.manager.handover.assert_awaited_once_with("wss://reconnect")
+        self.session.manager.reconnect.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handover_pushes_session_id_to_every_lease(self):
+        """Test every lease adopts the session ID after a handover."""
+        self.lease_a.on_handover = Mock()
+        self.lease_b.on_handover = Mock()
+        self.session.manager.session_id = "migrated-session"
+
+        assert await self.session.handover("wss://reconnect") is True
+
+        self.lease_a.on_handover.assert_called_once_with("migrated-session")
+        self.lease_b.on_handover.assert_called_once_with("migrated-session")
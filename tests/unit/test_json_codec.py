@@ -0,0 +1,52 @@
+"""
+Unit tests for the pluggable JSON codec.
+"""
+
+import datetime
+
+import pytest
+
+from src.utils import json_codec
+from src.utils.json_codec import StdlibCodec, available_codecs
+
+CODECS = list(available_codecs().values())
+SAMPLE = {"users": [{"username": "bot", "channels": ["chan"], "note": "héllo"}]}
+
+
+class TestJSONCodec:
+    """Test class for the JSON codec backends."""
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+    def test_round_trip_from_str_and_bytes(self, codec):
+        """Test every backend decodes str and bytes alike."""
+        encoded = codec.dumps(SAMPLE)
+
+        assert codec.loads(encoded) == SAMPLE
+        assert codec.loads(encoded.encode()) == SAMPLE
+        assert codec.dumpb(SAMPLE) == encoded.encode()
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+    def test_output_matches_stdlib_fallback(self, codec):
+        """Test backends agree byte for byte so checksums stay stable."""
+        reference = StdlibCodec()
+        data = {"b": 1, "a": datetime.date(2024, 1, 1), "c": [1.5, None, True]}
+
+        assert codec.dumps(data, sort_keys=True, default=str) == reference.dumps(
+            data, sort_keys=True, default=str
+        )
+        assert codec.dumps(SAMPLE, indent=True) == reference.dumps(SAMPLE, indent=True)
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+    def test_invalid_json_raises_decode_error(self, codec):
+        """Test malformed input raises the shared JSONDecodeError."""
+        with pytest.raises(json_codec.JSONDecodeError):
+            codec.loads(b'{"torn": ')
+
+    def test_stdlib_encoding_is_compact_and_unescaped(self):
+        """Test the fallback emits compact UTF-8 like the accelerated backend."""
+        assert StdlibCodec().dumps({"a": "é", "b": [1, 2]}) == '{"a":"é","b":[1,2]}'
+
+    def test_module_functions_use_selected_backend(self):
+        """Test the module-level helpers delegate to the active codec."""
+        assert json_codec.BACKEND in available_codecs()
+        assert json_codec.loads(json_codec.dumpb(SAMPLE)) == SAMPLE
@@ -0,0 +1,123 @@
+"""
+Unit tests for the latency histograms.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.latency import (
+    LatencyHistogram,
+    LatencyRecorder,
+    current_frame,
+    parse_message_timestamp,
+)
+
+
+class TestLatencyHistogram:
+    """Test class for LatencyHistogram functionality."""
+
+    def test_percentiles_follow_bucket_distribution(self):
+        """Test p50/p99 land in the buckets holding those ranks."""
+        # Arrange
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(8.0)
+        for _ in range(10):
+            histogram.record(400.0)
+
+        # Act
+        summary = histogram.summary()
+
+        # Assert
+        assert summary["count"] == 100
+        assert 5.0 <= summary["p50"] <= 10.0
+        assert 250.0 <= summary["p99"] <= 400.0
+        assert summary["max"] == 400.0
+
+    def test_empty_histogram_reports_zero(self):
+        """Test an empty histogram reports zero percentiles."""
+        assert LatencyHistogram().percentile(95) == 0.0
+
+    def test_overflow_bucket_is_capped_by_max(self):
+        """Test samples beyond the last bound use the observed maximum."""
+        histogram = LatencyHistogram()
+        histogram.record(60000.0)
+
+        assert histogram.percentile(99) <= 60000.0
+
+
+class TestLatencyRecorder:
+    """Test class for LatencyRecorder functionality."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.recorder = LatencyRecorder()
+
+    def test_snapshot_is_keyed_by_user_and_stage(self):
+        """Test samples are kept separately per user and stage."""
+        # Arrange
+        self.recorder.record("Alice", "http", 0.05)
+        self.recorder.record("bob", "parse", 0.001)
+
+        # Act
+        snapshot = self.recorder.snapshot()
+
+        # Assert
+        assert set(snapshot) == {"alice", "bob"}
+        assert snapshot["alice"]["http"]["count"] == 1
+        assert "parse" not in snapshot["alice"]
+        assert set(self.recorder.snapshot("ALICE")) == {"alice"}
+
+    def test_frame_context_feeds_dispatch_and_total(self):
+        """Test stages recorded inside a frame measure against its arrival."""
+        # Arrange
+        sent = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(time.time() - 1)) + ".123456789Z"
+
+        # Act
+        with self.recorder.frame("alice", sent):
+            assert current_frame() is not None
+            self.recorder.record_dispatch("alice")
+            self.recorder.record_total("alice")
+        self.recorder.record_total("alice")
+
+        # Assert
+        stages = self.recorder.snapshot()["alice"]
+        assert stages["receive"]["count"] == 1
+        assert stages["dispatch"]["count"] == 1
+        assert stages["total"]["count"] == 1
+        assert stages["total"]["p50"] >= 500.0
+        assert current_frame() is None
+
+    def test_parse_message_timestamp_handles_nanoseconds(self):
+        """Test Twitch's nanosecond timestamps are accepted."""
+        assert parse_message_timestamp("2024-01-01T00:00:00.123456789Z") == pytest.approx(
+            1704067200.123456
+        )
+        assert parse_message_timestamp("garbage") is None
+        assert parse_message_timestamp(None) is None
+
+    def test_log_summary_emits_one_line_per_user(self):
+        """Test the periodic log line contains each stage's percentiles."""
+        self.recorder.record("alice", "http", 0.02)
+
+        with patch("src.utils.latency.logging") as mock_logging:
+            self.recorder.log_summary()
+
+        mock_logging.info.assert_called_once()
+        line = mock_logging.info.call_args[0][0]
+        assert "user=alice" in line and "http[n=1" in line
+
+    @pytest.mark.asyncio
+    async def test_reporting_task_starts_and_stops(self):
+        """Test the periodic reporter can be started and cancelled."""
+        await self.recorder.start_reporting(interval=3600)
+        task = self.recorder._report_task
+
+        await self.recorder.stop_reporting()
+        await asyncio.sleep(0)
+
+        assert task is not None and task.cancelled()
+        assert self.recorder._report_task is None
@@ -0,0 +1,180 @@
+"""
+Unit tests for LoginResolver.
+"""
+
+import asyncio
+
+import pytest
+
+from src.chat.channel_resolver import ChannelResolver
+from src.chat.login_resolver import LoginResolver
+from src.errors.eventsub import EventSubError
+
+
+class FakeAPI:
+    """Answers ``users`` lookups from a fixed directory."""
+
+    def __init__(self, directory, status=200, delay=0.0, bad_tokens=()):
+        self.directory = directory
+        self.status = status
+        self.delay = delay
+        self.bad_tokens = set(bad_tokens)
+        self.calls = []
+
+    async def request(self, method, endpoint, *, access_token, client_id, params=None, **kwargs):
+        logins = list(params["login"])
+        self.calls.append((access_token, logins))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if access_token in self.bad_tokens:
+            return {}, 401, {}
+        if self.status != 200:
+            return {}, self.status, {}
+        rows = [
+            {"login": login, "id": self.directory[login]}
+            for login in logins
+            if login in self.directory
+        ]
+        return {"data": rows}, 200, {}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLoginResolver:
+    """Test class for LoginResolver functionality."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.directory = {f"user{i}": str(i) for i in range(250)}
+        self.api = FakeAPI(self.directory)
+        self.clock = FakeClock()
+        self.resolver = LoginResolver(window=0.01, ttl=60, negative_ttl=10, clock=self.clock)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self):
+        """Test bots asking for the same channels at once send one request."""
+        # Act
+        results = await asyncio.gather(
+            *(
+                self.resolver.resolve(self.api, ["User1", "user2"], f"tok{i}", "client")
+                for i in range(10)
+            )
+        )
+
+        # Assert
+        assert results == [{"user1": "1", "user2": "2"}] * 10
+        assert len(self.api.calls) == 1
+        assert self.resolver.merged == 18
+
+    @pytest.mark.asyncio
+    async def test_logins_from_many_bots_are_batched_by_hundred(self):
+        """Test logins gathered in one window go out in chunks of 100."""
+        # Arrange
+        per_bot = [[f"user{i}"] for i in range(250)]
+
+        # Act
+        results = await asyncio.gather(
+            *(self.resolver.resolve(self.api, logins, "tok", "client") for logins in per_bot)
+        )
+
+        # Assert
+        assert sorted(len(logins) for _, logins in self.api.calls) == [50, 100, 100]
+        assert results[249] == {"user249": "249"}
+
+    @pytest.mark.asyncio
+    async def test_answers_are_cached_until_their_ttl(self):
+        """Test found and unknown logins are served from cache until they expire."""
+        # Arrange
+        await self.resolver.resolve(self.api, ["user1", "typo"], "tok", "client")
+
+        # Act
+        cached = await self.resolver.resolve(self.api, ["user1", "typo"], "tok", "client")
+        self.clock.now += 11
+        after_negative_ttl = await self.resolver.resolve(self.api, ["user1", "typo"], "tok", "client")
+
+        # Assert
+        assert cached == {"user1": "1"}
+        assert after_negative_ttl == {"user1": "1"}
+        assert [logins for _, logins in self.api.calls] == [["user1", "typo"], ["typo"]]
+        assert (self.resolver.hits, self.resolver.negative_hits) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_failed_lookups_are_not_cached(self):
+        """Test a failed request raises and is retried on the next call."""
+        # Arrange
+        self.api.status = 500
+
+        # Act
+        with pytest.raises(EventSubError):
+            await self.resolver.resolve(self.api, ["user1"], "tok", "client")
+        self.api.status = 200
+        result = await self.resolver.resolve(self.api, ["user1"], "tok", "client")
+
+        # Assert
+        assert result == {"user1": "1"}
+        assert len(self.api.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_of_another_bot_is_retried_with_own(self):
+        """Test a 401 caused by the first caller's token does not fail the others."""
+        # Arrange
+        self.api.bad_tokens = {"expired"}
+
+        # Act
+        first, second = await asyncio.gather(
+            self.resolver.resolve(self.api, ["user1"], "expired", "client"),
+            self.resolver.resolve(self.api, ["user1"], "good", "client"),
+            return_exceptions=True,
+        )
+
+        # Assert
+        assert isinstance(first, EventSubError)
+        assert second == {"user1": "1"}
+        assert [token for token, _ in self.api.calls] == ["expired", "good"]
+
+
+class FakeCache:
+    """In-memory stand-in for CacheManager."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get_many(self, keys):
+        return {k: self.data[k] for k in keys if k in self.data}
+
+    async def set_many(self, items):
+        self.data.update(items)
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+class TestChannelResolverSharing:
+    """Test ChannelResolver instances of different bots share lookups."""
+
+    @pytest.mark.asyncio
+    async def test_bots_share_lookups_and_invalidate_together(self):
+        """Test a second bot reuses the first bot's lookup until invalidated."""
+        # Arrange
+        api = FakeAPI({"bigchannel": "42"})
+        shared = LoginResolver(window=0.0)
+        first = ChannelResolver(api, FakeCache(), login_resolver=shared)
+        second = ChannelResolver(api, FakeCache(), login_resolver=shared)
+
+        # Act
+        a = await first.resolve_user_ids(["BigChannel"], "tok", "client")
+        b = await second.resolve_user_ids(["bigchannel"], "tok", "client")
+        await second.invalidate_cache("bigchannel")
+        c = await second.resolve_user_ids(["bigchannel"], "tok", "client")
+
+        # Assert
+        assert a == b == c == {"bigchannel": "42"}
+        assert len(api.calls) == 2
@@ -2,11 +2,17 @@
 Unit tests for main.py
 """
 
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
-from src.main import main, run
+import src.main
+from src.main import DEFERRED_PACKAGES, main, run
+
+ROOT = Path(__file__).resolve().parents[2]
 
 
 class TestMain:
@@ -87,3 +93,50 @@ class TestMain:
             assert isinstance(args[1], Exception)
             assert str(args[1]) == "Test error"
             mock_exit.assert_called_once_with(1)
+
+
+class TestEntryPointImport:
+    """Test class for the entry point's import cost."""
+
+    def _probe(self, code):
+        """Run ``code`` after importing src.main in a fresh interpreter."""
+        script = "import src.main; " + code
+        proc = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return proc.stdout.strip()
+
+    def test_import_defers_heavy_packages(self):
+        """Test importing the entry point loads none of the deferred packages."""
+        # Act
+        out = self._probe(
+            f"import sys; print(','.join(p for p in {DEFERRED_PACKAGES!r} if p in sys.modules))"
+        )
+
+        # Assert
+        assert out == ""
+
+    def test_import_has_no_side_effects(self):
+        """Test importing starts no threads and leaves logging unconfigured."""
+        # Act
+        out = self._probe(
+            "import logging, threading; "
+            "print(threading.active_count(), len(logging.getLogger().handlers))"
+        )
+
+        # Assert
+        assert out == "1 0"
+
+    def test_lazy_names_resolve_to_runtime_objects(self):
+        """Test deferred names resolve on first access."""
+        from src.bot.manager import run_bots
+        from src.config import get_configuration
+
+        assert src.main.run_bots is run_bots
+        assert src.main.get_configuration is get_configuration
+        with pytest.raises(AttributeError):
+            src.main.not_a_name  # noqa: B018
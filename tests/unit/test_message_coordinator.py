@@ -2,10 +2,12 @@
 Unit tests for MessageCoordinator.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from src.chat.eventsub_envelope import EventSubEnvelope
 from src.chat.message_coordinator import MessageCoordinator
 from src.chat.message_transceiver import WSMessage, WSMsgType
 
@@ -30,11 +32,8 @@ class TestMessageCoordinator:
         mock_msg.type = WSMsgType.TEXT
         mock_msg.data = '{"type": "notification", "payload": {}}'
 
-        async def mock_process_message(data):
-            pass
-
         mock_msg_processor = Mock()
-        mock_msg_processor.process_message = Mock(side_effect=mock_process_message)
+        mock_msg_processor.process_envelope = AsyncMock()
         self.mock_backend._msg_processor = mock_msg_processor
         self.mock_backend._reconnection_coordinator = None
 
@@ -43,7 +42,10 @@ class TestMessageCoordinator:
 
         # Assert
         assert result is True
-        mock_msg_processor.process_message.assert_called_once_with(mock_msg.data)
+        mock_msg_processor.process_envelope.assert_called_once()
+        envelope = mock_msg_processor.process_envelope.call_args[0][0]
+        assert envelope.message_type == "notification"
+        assert envelope.raw == mock_msg.data
         assert self.mock_backend._last_activity is not None
 
     @pytest.mark.asyncio
@@ -91,11 +93,8 @@ class TestMessageCoordinator:
         mock_msg.type = WSMsgType.TEXT
         mock_msg.data = '{"type": "session_keepalive"}'
 
-        async def mock_process_message(data):
-            pass
-
         mock_msg_processor = Mock()
-        mock_msg_processor.process_message = Mock(side_effect=mock_process_message)
+        mock_msg_processor.process_envelope = AsyncMock()
         self.mock_backend._msg_processor = mock_msg_processor
 
         # Act
@@ -104,8 +103,8 @@ class TestMessageCoordinator:
         # Assert
         assert result is True
         assert self.mock_backend._last_activity is not None
-        # process_message should not be called for keepalive
-        mock_msg_processor.process_message.assert_not_called()
+        # process_envelope should not be called for keepalive
+        mock_msg_processor.process_envelope.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_handle_message_invalid_json_logs_warning(self):
@@ -116,7 +115,7 @@ class TestMessageCoordinator:
         mock_msg.data = 'invalid json'
 
         mock_msg_processor = Mock()
-        mock_msg_processor.process_message = AsyncMock()
+        mock_msg_processor.process_envelope = AsyncMock()
         self.mock_backend._msg_processor = mock_msg_processor
 
         # Act
@@ -126,7 +125,71 @@ class TestMessageCoordinator:
         # Assert
         assert result is True
         mock_logging.warning.assert_called_once()
-        mock_msg_processor.process_message.assert_called_once_with(mock_msg.data)
+        # Undecodable frames never reach the processor
+        mock_msg_processor.process_envelope.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handle_message_skips_other_chatters_before_decoding(self):
+        """Test chat frames from other users are dropped without a JSON decode."""
+        # Arrange
+        raw = (
+            '{"metadata":{"message_type":"notification"},"payload":{"subscription":'
+            '{"type":"channel.chat.message"},"event":{"chatter_user_id":"7"}}}'
+        )
+        self.mock_backend._user_id = "42"
+        mock_msg_processor = Mock()
+        mock_msg_processor.process_envelope = AsyncMock()
+        self.mock_backend._msg_processor = mock_msg_processor
+
+        # Act
+        with patch('src.chat.message_coordinator.decode_envelope') as mock_decode:
+            result = await self.coordinator.handle_message(WSMessage("text", raw))
+
+        # Assert
+        assert result is True
+        mock_decode.assert_not_called()
+        mock_msg_processor.process_envelope.assert_not_called()
+        assert self.coordinator.skipped_frames == 1
+
+    @pytest.mark.asyncio
+    async def test_handle_message_decodes_own_chat_messages(self):
+        """Test the bot's own chat frames still reach the processor."""
+        # Arrange
+        raw = (
+            '{"metadata":{"message_type":"notification"},"payload":{"subscription":'
+            '{"type":"channel.chat.message"},"event":{"chatter_user_id":"42"}}}'
+        )
+        self.mock_backend._user_id = "42"
+        self.mock_backend._username = "bot"
+        mock_msg_processor = Mock()
+        mock_msg_processor.process_envelope = AsyncMock()
+        self.mock_backend._msg_processor = mock_msg_processor
+
+        # Act
+        await self.coordinator.handle_message(WSMessage("text", raw))
+
+        # Assert
+        mock_msg_processor.process_envelope.assert_called_once()
+        assert self.coordinator.skipped_frames == 0
+
+    @pytest.mark.asyncio
+    async def test_handle_message_reuses_predecoded_envelope(self):
+        """Test handle_message does not decode frames that carry an envelope."""
+        # Arrange
+        envelope = EventSubEnvelope(message_type="notification")
+        msg = WSMessage("text", "not json", envelope)
+        mock_msg_processor = Mock()
+        mock_msg_processor.process_envelope = AsyncMock()
+        self.mock_backend._msg_processor = mock_msg_processor
+
+        # Act
+        with patch('src.chat.message_coordinator.decode_envelope') as mock_decode:
+            result = await self.coordinator.handle_message(msg)
+
+        # Assert
+        assert result is True
+        mock_decode.assert_not_called()
+        mock_msg_processor.process_envelope.assert_called_once_with(envelope)
 
     @pytest.mark.asyncio
     async def test_handle_message_closed_type_returns_true(self):
@@ -184,8 +247,8 @@ class TestMessageCoordinator:
         # Should return without doing anything
 
     @pytest.mark.asyncio
-    async def test_listen_handles_idle_periods(self):
-        """Test listen implements idle optimization."""
+    async def test_listen_blocks_on_receive_without_idle_sleeps(self):
+        """Test listen waits on the socket instead of polling with sleeps."""
         # Arrange
         async def mock_receive_timeout():
             raise TimeoutError()
@@ -193,30 +256,43 @@ class TestMessageCoordinator:
         mock_ws_manager = Mock()
         mock_ws_manager.is_connected = True
         mock_ws_manager.receive_message = Mock(side_effect=mock_receive_timeout)
+        mock_reconnection_coordinator = Mock()
+        mock_reconnection_coordinator.handle_reconnect = AsyncMock()
         self.mock_backend._ws_manager = mock_ws_manager
+        self.mock_backend._reconnection_coordinator = mock_reconnection_coordinator
         self.mock_backend._stop_event = Mock()
-        self.mock_backend._stop_event.is_set.return_value = False
-        self.mock_backend._last_activity = -31  # Very old activity to trigger idle immediately
+        self.mock_backend._last_activity = -31  # Idle for a while, but inside the deadline
         self.mock_backend._stale_threshold = 100.0
+        self.mock_backend._maybe_verify_subs = AsyncMock()
 
-        async def mock_verify_subs(now):
-            pass
-
-        self.mock_backend._maybe_verify_subs = Mock(side_effect=mock_verify_subs)
-
-        # Mock time.monotonic to simulate passage of time
         with patch('src.chat.message_coordinator.time') as mock_time:
-            mock_time.monotonic.return_value = 31  # Now is 31, activity was at -31
+            mock_time.monotonic.return_value = 31
+            # Stop after first iteration
+            self.mock_backend._stop_event.is_set.side_effect = [False, True]
 
             # Act
-            with patch('asyncio.sleep') as mock_sleep:
-                # Stop after first iteration
-                self.mock_backend._stop_event.is_set.side_effect = [False, True]
+            await self.coordinator.listen()
 
-                await self.coordinator.listen()
+        # Assert
+        mock_ws_manager.receive_message.assert_called_once()
+        mock_reconnection_coordinator.handle_reconnect.assert_not_called()
+        # Subscription verification is scheduled separately, not run inline
+        self.mock_backend._maybe_verify_subs.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_subscription_check_loop_verifies_on_interval(self):
+        """Test the scheduled subscription check calls the backend verifier."""
+        # Arrange
+        self.mock_backend._maybe_verify_subs = AsyncMock(side_effect=[None, asyncio.CancelledError()])
+
+        # Act
+        with patch('src.chat.message_coordinator.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(asyncio.CancelledError):
+                await self.coordinator._subscription_check_loop()
 
         # Assert
-        mock_sleep.assert_called()  # Should have slept during idle
+        assert self.mock_backend._maybe_verify_subs.await_count == 2
+        assert mock_sleep.await_count == 2
 
     @pytest.mark.asyncio
     async def test_listen_processes_messages_normally(self):
@@ -228,15 +304,12 @@ class TestMessageCoordinator:
             mock_msg.data = '{"type": "notification"}'
             return mock_msg
 
-        async def mock_process_message(data):
-            pass
-
         mock_ws_manager = Mock()
         mock_ws_manager.is_connected = True
         mock_ws_manager.receive_message = Mock(side_effect=mock_receive_message)
 
         mock_msg_processor = Mock()
-        mock_msg_processor.process_message = Mock(side_effect=mock_process_message)
+        mock_msg_processor.process_envelope = AsyncMock()
         self.mock_backend._ws_manager = mock_ws_manager
         self.mock_backend._msg_processor = mock_msg_processor
         self.mock_backend._stop_event = Mock()
@@ -256,7 +329,7 @@ class TestMessageCoordinator:
             await self.coordinator.listen()
 
         # Assert
-        mock_msg_processor.process_message.assert_called_once()
+        mock_msg_processor.process_envelope.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_listen_handles_stale_connection(self):
@@ -36,7 +36,7 @@ class TestMessageTransceiver:
 
         await self.transceiver.send_json(data)
 
-        mock_ws.send.assert_called_once_with('{"type": "test", "data": "value"}')
+        mock_ws.send.assert_called_once_with('{"type":"test","data":"value"}')
         assert len(self.transceiver.last_activity) > 0  # Should be updated
 
     @pytest.mark.asyncio
@@ -118,3 +118,46 @@ class TestMessageTransceiver:
 
         assert "WebSocket receive failed" in str(exc_info.value)
         assert exc_info.value.operation_type == "receive"
+
+    @pytest.mark.asyncio
+    async def test_receive_message_drains_retired_socket_first(self):
+        """Test frames left on a retired socket are read before the new one."""
+        old_ws = Mock()
+        old_ws.closed = False
+        old_ws.recv = AsyncMock(side_effect=["old-frame", Exception("closed by Twitch")])
+        old_ws.close = AsyncMock()
+        new_ws = Mock()
+        new_ws.closed = False
+        new_ws.recv = AsyncMock(return_value="new-frame")
+        self.connector.ws = new_ws
+        self.transceiver.retire(old_ws)
+
+        first = await self.transceiver.receive_message()
+        second = await self.transceiver.receive_message()
+
+        assert (first.data, second.data) == ("old-frame", "new-frame")
+        old_ws.close.assert_awaited_once()
+        assert self.transceiver._retiring is None
+        self.transceiver._retire_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_receive_message_continues_when_socket_swapped_mid_read(self):
+        """Test a read interrupted by a handover continues on the new socket."""
+        old_ws = Mock()
+        old_ws.closed = False
+        old_ws.close = AsyncMock()
+        new_ws = Mock()
+        new_ws.closed = False
+        new_ws.recv = AsyncMock(return_value="new-frame")
+
+        async def swap_then_fail():
+            self.connector.ws = new_ws
+            raise Exception("closed by Twitch")
+
+        old_ws.recv = AsyncMock(side_effect=swap_then_fail)
+        self.connector.ws = old_ws
+
+        result = await self.transceiver.receive_message()
+
+        assert result.data == "new-frame"
+        old_ws.close.assert_awaited_once()
@@ -0,0 +1,131 @@
+"""
+Unit tests for the Helix rate limiter.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.api.rate_limit import HelixRateLimiter, RateLimitBucket, RequestPriority
+
+
+class TestRateLimitBucket:
+    """Test class for RateLimitBucket functionality."""
+
+    def test_update_reads_ratelimit_headers(self):
+        """Test headers resynchronise limit, remaining points and reset."""
+        # Arrange
+        bucket = RateLimitBucket()
+
+        # Act
+        bucket.update(
+            {"ratelimit-limit": "120", "Ratelimit-Remaining": "7", "Ratelimit-Reset": "1700000000"},
+            200,
+        )
+
+        # Assert
+        assert bucket.limit == 120
+        assert 7 <= bucket.tokens < 8
+        assert bucket.reset_at == 1700000000.0
+
+    def test_429_blocks_until_reset(self):
+        """Test a 429 empties the bucket and blocks admission until reset."""
+        # Arrange
+        bucket = RateLimitBucket()
+
+        # Act
+        bucket.update({"Ratelimit-Reset": str(time.time() + 5)}, 429)
+
+        # Assert
+        assert bucket.rate_limited == 1
+        assert 4 <= bucket.delay(RequestPriority.COLOR, time.monotonic()) <= 5
+
+    def test_background_requests_leave_a_reserve(self):
+        """Test audits wait while color changes still have points."""
+        # Arrange
+        bucket = RateLimitBucket(limit=100)
+        bucket.tokens = 5
+
+        # Act / Assert
+        assert bucket.delay(RequestPriority.COLOR, time.monotonic()) == 0.0
+        assert bucket.delay(RequestPriority.BACKGROUND, time.monotonic()) > 0.0
+
+
+class TestHelixRateLimiter:
+    """Test class for HelixRateLimiter functionality."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.limiter = HelixRateLimiter()
+        self.key = HelixRateLimiter.bucket_key("client", "token")
+
+    def test_bucket_key_does_not_contain_token(self):
+        """Test the bucket key hashes the access token."""
+        assert "token" not in self.key.split(":", 1)[1]
+        assert self.key.startswith("client:")
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_admitted_by_priority(self):
+        """Test color requests overtake queued background requests."""
+        # Arrange
+        async with self.limiter.slot(self.key, RequestPriority.NORMAL) as slot:
+            slot["headers"] = {"Ratelimit-Limit": "600", "Ratelimit-Remaining": "0"}
+            slot["status"] = 200
+        order = []
+
+        async def request(name, priority):
+            async with self.limiter.slot(self.key, priority):
+                order.append(name)
+
+        # Act
+        with patch("src.api.rate_limit.HELIX_BACKGROUND_RESERVE_RATIO", 0.0):
+            background = asyncio.create_task(request("audit", RequestPriority.BACKGROUND))
+            await asyncio.sleep(0)
+            color = asyncio.create_task(request("color", RequestPriority.COLOR))
+            await asyncio.wait_for(asyncio.gather(background, color), timeout=5)
+
+        # Assert
+        assert order == ["color", "audit"]
+        state = self.limiter.snapshot()[self.key]
+        assert state["admitted"] == 3
+        assert state["delayed"] == 2
+        assert state["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test a cancelled request does not block the ones behind it."""
+        # Arrange
+        bucket = self.limiter._bucket(self.key)
+        bucket.blocked_until = time.monotonic() + 60
+        waiter = asyncio.create_task(self.limiter.acquire(self.key, RequestPriority.COLOR))
+        await asyncio.sleep(0)
+
+        # Act
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # Assert
+        assert self.limiter.snapshot()[self.key]["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_buckets_are_evicted_when_a_new_key_appears(self):
+        """Test buckets of replaced tokens do not accumulate."""
+        # Arrange
+        async with self.limiter.slot(self.key, RequestPriority.NORMAL):
+            pass
+        busy_key = HelixRateLimiter.bucket_key("client", "busy")
+        busy = self.limiter._bucket(busy_key)
+        busy.in_flight = 1
+        stale = time.monotonic() - 121
+        self.limiter.buckets[self.key].last_used = stale
+        busy.last_used = stale
+
+        # Act
+        refreshed = HelixRateLimiter.bucket_key("client", "refreshed")
+        self.limiter._bucket(refreshed)
+
+        # Assert
+        assert set(self.limiter.snapshot()) == {busy_key, refreshed}
@@ -0,0 +1,137 @@
+"""
+Unit tests for ReconnectAdmission.
+"""
+
+import asyncio
+import random
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.chat.reconnect_admission import (
+    ReconnectAdmission,
+    ReconnectPriority,
+    priority_for,
+)
+from src.chat.reconnection_coordinator import ReconnectionCoordinator
+
+
+class TestReconnectAdmission:
+    """Test class for ReconnectAdmission functionality."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_admitted_then_paced(self):
+        """Test a full bucket admits the burst at once and paces the rest."""
+        # Arrange
+        admission = ReconnectAdmission(rate=50.0, burst=3)
+        started = time.monotonic()
+
+        # Act
+        waits = await asyncio.gather(*(admission.acquire() for _ in range(6)))
+
+        # Assert
+        assert sum(1 for w in waits if w < 0.01) == 3
+        assert time.monotonic() - started >= 0.05
+        assert admission.granted == 6
+        assert admission.delayed == 3
+
+    @pytest.mark.asyncio
+    async def test_active_users_are_admitted_first(self):
+        """Test waiting ACTIVE reconnects go ahead of IDLE ones."""
+        # Arrange
+        admission = ReconnectAdmission(rate=100.0, burst=1)
+        await admission.acquire()
+        order = []
+
+        async def reconnect(name, priority):
+            await admission.acquire(priority)
+            order.append(name)
+
+        # Act
+        await asyncio.gather(
+            reconnect("idle1", ReconnectPriority.IDLE),
+            reconnect("idle2", ReconnectPriority.IDLE),
+            reconnect("active", ReconnectPriority.ACTIVE),
+        )
+
+        # Assert
+        assert order[0] == "active"
+
+    @pytest.mark.asyncio
+    async def test_order_within_priority_is_randomized(self):
+        """Test waiters of one priority are not served in arrival order."""
+        # Arrange
+        admission = ReconnectAdmission(rate=1000.0, burst=1, rng=random.Random(7))
+        await admission.acquire()
+        order = []
+
+        async def reconnect(i):
+            await admission.acquire()
+            order.append(i)
+
+        # Act
+        await asyncio.gather(*(reconnect(i) for i in range(20)))
+
+        # Assert
+        assert sorted(order) == list(range(20))
+        assert order != list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_is_exposed(self):
+        """Test queue depth and per-priority depth while bots wait."""
+        # Arrange
+        admission = ReconnectAdmission(rate=0.5, burst=1)
+        await admission.acquire()
+        waiters = [
+            asyncio.create_task(admission.acquire(ReconnectPriority.ACTIVE)),
+            asyncio.create_task(admission.acquire(ReconnectPriority.IDLE)),
+            asyncio.create_task(admission.acquire(ReconnectPriority.IDLE)),
+        ]
+        await asyncio.sleep(0.01)
+
+        # Act
+        depth = admission.queue_depth
+        by_priority = admission.depth_by_priority()
+        for task in waiters:
+            task.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+        # Assert
+        assert depth == 3
+        assert by_priority == {"active": 1, "idle": 2}
+        assert admission.queue_depth == 0
+        assert admission.max_depth == 3
+
+    def test_priority_for_recent_chat(self):
+        """Test users who chatted recently get ACTIVE priority."""
+        # Act / Assert
+        now = time.monotonic()
+        assert priority_for(now - 5, now) is ReconnectPriority.ACTIVE
+        assert priority_for(now - 10_000, now) is ReconnectPriority.IDLE
+        assert priority_for(None, now) is ReconnectPriority.IDLE
+
+
+class TestReconnectionCoordinatorAdmission:
+    """Test ReconnectionCoordinator waits for an admission slot."""
+
+    @pytest.mark.asyncio
+    async def test_each_attempt_is_admitted(self):
+        """Test handle_reconnect takes a slot per attempt with the user's priority."""
+        # Arrange
+        backend = Mock()
+        backend._token_manager = None
+        backend._last_chat_activity = time.monotonic()
+        backend._ws_manager.reconnect = AsyncMock(return_value=False)
+        admission = Mock()
+        admission.acquire = AsyncMock(return_value=0.0)
+        coordinator = ReconnectionCoordinator(backend, admission=admission)
+        coordinator.backoff = 0.0
+
+        # Act
+        result = await coordinator.handle_reconnect()
+
+        # Assert
+        assert result is False
+        assert admission.acquire.await_count == coordinator.max_attempts
+        admission.acquire.assert_awaited_with(ReconnectPriority.ACTIVE)
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import aiohttp
 import pytest
 
+from src.chat.eventsub_envelope import EventSubEnvelope
 from src.chat.reconnection_coordinator import ReconnectionCoordinator
 
 
@@ -25,7 +26,7 @@ class TestReconnectionCoordinator:
 
     @pytest.mark.asyncio
     async def test_handle_session_reconnect_success(self):
-        """Test handle_session_reconnect updates URL and triggers reconnect."""
+        """Test handle_session_reconnect hands over without resubscribing."""
         # Arrange
         data = {
             "payload": {
@@ -36,18 +37,95 @@ class TestReconnectionCoordinator:
         }
 
         mock_ws_manager = Mock()
+        mock_ws_manager.handover = AsyncMock(return_value=True)
+        mock_ws_manager.session_id = "new-session"
+        mock_ws_manager.state_manager.last_activity = [0.0]
         self.mock_backend._ws_manager = mock_ws_manager
 
         # Act
         with patch.object(self.coordinator, 'handle_reconnect', new_callable=AsyncMock) as mock_reconnect, \
              patch('src.chat.reconnection_coordinator.logging') as mock_logging:
-            await self.coordinator.handle_session_reconnect(data)
+            await self.coordinator.handle_session_reconnect(EventSubEnvelope.from_dict(data))
+            await self.coordinator._handover_task
 
         # Assert
-        mock_ws_manager.update_url.assert_called_once_with("wss://new-url.com")
-        mock_reconnect.assert_called_once()
+        mock_ws_manager.handover.assert_awaited_once_with("wss://new-url.com")
+        self.mock_backend._sub_manager.adopt_session_id.assert_called_once_with("new-session")
+        mock_ws_manager.update_url.assert_not_called()
+        mock_reconnect.assert_not_called()
+        assert mock_ws_manager.state_manager.last_activity[0] > 0
         mock_logging.info.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_handle_session_reconnect_falls_back_to_reconnect(self):
+        """Test a failed handover updates the URL and runs a full reconnect."""
+        # Arrange
+        data = {"payload": {"session": {"reconnect_url": "wss://new-url.com"}}}
+
+        mock_ws_manager = Mock()
+        mock_ws_manager.handover = AsyncMock(return_value=False)
+        self.mock_backend._ws_manager = mock_ws_manager
+
+        # Act
+        with patch.object(self.coordinator, 'handle_reconnect', new_callable=AsyncMock) as mock_reconnect:
+            await self.coordinator.handle_session_reconnect(EventSubEnvelope.from_dict(data))
+            await self.coordinator._handover_task
+
+        # Assert
+        mock_ws_manager.update_url.assert_called_once_with("wss://new-url.com")
+        mock_reconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_handle_session_reconnect_does_not_block_caller(self):
+        """Test the handover runs in the background and is single-flight."""
+        # Arrange
+        data = {"payload": {"session": {"reconnect_url": "wss://new-url.com"}}}
+        release = asyncio.Event()
+
+        async def slow_handover(url):
+            await release.wait()
+            return True
+
+        mock_ws_manager = Mock()
+        mock_ws_manager.handover = AsyncMock(side_effect=slow_handover)
+        mock_ws_manager.state_manager.last_activity = [0.0]
+        self.mock_backend._ws_manager = mock_ws_manager
+
+        # Act
+        await self.coordinator.handle_session_reconnect(EventSubEnvelope.from_dict(data))
+        await self.coordinator.handle_session_reconnect(EventSubEnvelope.from_dict(data))
+        await asyncio.sleep(0)
+        pending = not self.coordinator._handover_task.done()
+        release.set()
+        await self.coordinator._handover_task
+
+        # Assert
+        assert pending
+        mock_ws_manager.handover.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancel_handover_stops_pending_task(self):
+        """Test cancel_handover cancels an in-flight handover."""
+        # Arrange
+        data = {"payload": {"session": {"reconnect_url": "wss://new-url.com"}}}
+
+        async def never_finishes(url):
+            await asyncio.Event().wait()
+
+        mock_ws_manager = Mock()
+        mock_ws_manager.handover = AsyncMock(side_effect=never_finishes)
+        self.mock_backend._ws_manager = mock_ws_manager
+        await self.coordinator.handle_session_reconnect(EventSubEnvelope.from_dict(data))
+        task = self.coordinator._handover_task
+        await asyncio.sleep(0)
+
+        # Act
+        await self.coordinator.cancel_handover()
+
+        # Assert
+        assert task.cancelled()
+        assert self.coordinator._handover_task is None
+
     @pytest.mark.asyncio
     async def test_handle_session_reconnect_missing_url(self):
         """Test handle_session_reconnect logs error when reconnect_url is missing."""
@@ -56,7 +134,7 @@ class TestReconnectionCoordinator:
 
         # Act
         with patch('src.chat.reconnection_coordinator.logging') as mock_logging:
-            await self.coordinator.handle_session_reconnect(data)
+            await self.coordinator.handle_session_reconnect(EventSubEnvelope.from_dict(data))
 
         # Assert
         mock_logging.error.assert_called_once_with("Session reconnect message missing reconnect_url")
@@ -77,7 +155,7 @@ class TestReconnectionCoordinator:
 
         # Act
         with patch('src.chat.reconnection_coordinator.logging') as mock_logging:
-            await self.coordinator.handle_session_reconnect(data)
+            await self.coordinator.handle_session_reconnect(EventSubEnvelope.from_dict(data))
 
         # Assert
         mock_logging.error.assert_called_once_with("No WebSocket manager available for session reconnect")
@@ -95,15 +173,17 @@ class TestReconnectionCoordinator:
         }
 
         mock_ws_manager = Mock()
+        mock_ws_manager.handover = AsyncMock(side_effect=Exception("Handover failed"))
         mock_ws_manager.update_url.side_effect = Exception("Update failed")
         self.mock_backend._ws_manager = mock_ws_manager
 
         # Act
         with patch('src.chat.reconnection_coordinator.logging') as mock_logging:
-            await self.coordinator.handle_session_reconnect(data)
+            await self.coordinator.handle_session_reconnect(EventSubEnvelope.from_dict(data))
+            await self.coordinator._handover_task
 
         # Assert
-        mock_logging.error.assert_called_once()
+        assert mock_logging.error.call_count == 2
 
     @pytest.mark.asyncio
     async def test_handle_reconnect_no_ws_manager(self):
@@ -87,10 +87,10 @@ class TestReconnectionManager:
         mock_ws.receive = AsyncMock(return_value=mock_msg)
         self.connector.ws = mock_ws
 
-        with patch('json.loads', return_value={"challenge": "test_challenge"}):
+        with patch('src.utils.json_codec.loads', return_value={"challenge": "test_challenge"}):
             await self.manager.handle_challenge("test_challenge")
 
-        mock_ws.send.assert_called_once_with('{"type": "challenge_response", "challenge": "test_challenge"}')
+        mock_ws.send.assert_called_once_with('{"type":"challenge_response","challenge":"test_challenge"}')
 
     @pytest.mark.asyncio
     async def test_handle_challenge_no_websocket(self):
@@ -132,7 +132,7 @@ class TestReconnectionManager:
         mock_ws.receive = AsyncMock(return_value=mock_msg)
         self.connector.ws = mock_ws
 
-        with patch('json.loads', return_value={"challenge": "wrong_challenge"}), \
+        with patch('src.utils.json_codec.loads', return_value={"challenge": "wrong_challenge"}), \
              pytest.raises(EventSubConnectionError):
             await self.manager.handle_challenge("test_challenge")
 
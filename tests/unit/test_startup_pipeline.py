@@ -0,0 +1,168 @@
+"""
+Unit tests for the staged startup pipeline.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.bot.startup_pipeline import STAGES, StartupPipeline
+
+
+def make_bot(username, user_id=None):
+    """Build a bot double whose startup steps all succeed."""
+    bot = Mock()
+    bot.username = username
+    bot.user_id = user_id
+    bot.access_token = f"token-{username}"
+    bot.client_id = "cid"
+    bot.begin_startup = AsyncMock()
+    bot.abort_startup = AsyncMock()
+    bot.start = AsyncMock()
+    bot.stop = AsyncMock()
+    bot.token_handler.setup_token_manager = AsyncMock(return_value=True)
+    bot.token_handler.handle_initial_token_refresh = AsyncMock()
+    cm = bot.connection_manager
+    cm._log_scopes_if_possible = AsyncMock()
+    cm._ensure_user_id = AsyncMock(return_value=True)
+    cm._prime_color_state = AsyncMock()
+    cm.open_connection = AsyncMock(return_value=True)
+    cm.subscribe_channels = AsyncMock(return_value=True)
+    return bot
+
+
+class TestStartupPipeline:
+    """Test class for StartupPipeline functionality."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.api = Mock()
+        self.api.get_users_by_login = AsyncMock(
+            side_effect=lambda **kw: {login: f"id-{login}" for login in kw["logins"]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_all_users_go_live_with_one_id_lookup(self):
+        """Test every bot clears all stages and user IDs resolve in one request."""
+        # Arrange
+        bots = [make_bot("alice"), make_bot("bob"), make_bot("carol", user_id="3")]
+        pipeline = StartupPipeline(bots, self.api, batch_window=0)
+
+        # Act
+        await asyncio.gather(*pipeline.launch())
+
+        # Assert
+        self.api.get_users_by_login.assert_awaited_once()
+        logins = self.api.get_users_by_login.await_args.kwargs["logins"]
+        assert logins == ["alice", "bob"]
+        assert [bot.user_id for bot in bots] == ["id-alice", "id-bob", "3"]
+        for bot in bots:
+            bot.start.assert_awaited_once_with(prepared=True)
+        assert sorted(pipeline.live) == ["alice", "bob", "carol"]
+        assert all(pipeline.reports[name].succeeded == 3 for name in STAGES)
+
+    @pytest.mark.asyncio
+    async def test_failed_stage_drops_user_out(self):
+        """Test a user failing validation never connects and is reported."""
+        # Arrange
+        good, bad = make_bot("good"), make_bot("bad")
+        bad.token_handler.setup_token_manager.return_value = False
+        pipeline = StartupPipeline([good, bad], self.api, batch_window=0)
+
+        # Act
+        await asyncio.gather(*pipeline.launch())
+
+        # Assert
+        bad.abort_startup.assert_awaited_once()
+        bad.connection_manager.open_connection.assert_not_awaited()
+        bad.start.assert_not_awaited()
+        good.start.assert_awaited_once_with(prepared=True)
+        assert pipeline.reports["validate"].failed == 1
+        assert pipeline.live == ["good"]
+
+    @pytest.mark.asyncio
+    async def test_stage_concurrency_limit_is_respected(self):
+        """Test no more users than the limit are inside a stage at once."""
+        # Arrange
+        in_flight = 0
+        peak = 0
+
+        async def connect():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        bots = [make_bot(f"user{i}", user_id=str(i)) for i in range(5)]
+        for bot in bots:
+            bot.connection_manager.open_connection.side_effect = connect
+        pipeline = StartupPipeline(bots, self.api, limits={"connect": 2})
+
+        # Act
+        await asyncio.gather(*pipeline.launch())
+
+        # Assert
+        assert peak == 2
+        assert pipeline.reports["connect"].succeeded == 5
+
+    @pytest.mark.asyncio
+    async def test_early_users_go_live_while_others_validate(self):
+        """Test a slow validation does not hold back faster users."""
+        # Arrange
+        release = asyncio.Event()
+
+        async def slow_setup():
+            await release.wait()
+            return True
+
+        fast, slow = make_bot("fast", user_id="1"), make_bot("slow", user_id="2")
+        slow.token_handler.setup_token_manager.side_effect = slow_setup
+        pipeline = StartupPipeline([fast, slow], self.api)
+
+        # Act
+        tasks = pipeline.launch()
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        # Assert
+        fast.start.assert_awaited_once_with(prepared=True)
+        slow.connection_manager.open_connection.assert_not_awaited()
+        release.set()
+        await asyncio.gather(*tasks)
+        await pipeline.wait()
+        assert pipeline.live == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_lookup_failure_falls_back_per_user(self):
+        """Test a failed bulk lookup leaves resolution to each bot."""
+        # Arrange
+        self.api.get_users_by_login.side_effect = TimeoutError()
+        bot = make_bot("alice")
+        pipeline = StartupPipeline([bot], self.api, batch_window=0)
+
+        # Act
+        await asyncio.gather(*pipeline.launch())
+
+        # Assert
+        assert bot.user_id is None
+        bot.connection_manager._ensure_user_id.assert_awaited_once()
+        bot.start.assert_awaited_once_with(prepared=True)
+
+    @pytest.mark.asyncio
+    async def test_report_lists_every_stage(self):
+        """Test the timing report has one line per stage plus a summary."""
+        # Arrange
+        pipeline = StartupPipeline([make_bot("alice", user_id="1")], self.api)
+
+        # Act
+        await asyncio.gather(*pipeline.launch())
+        lines = pipeline.report_lines()
+
+        # Assert
+        assert [line.split()[0] for line in lines[:-1]] == [
+            f"stage={name}" for name in STAGES
+        ]
+        assert lines[-1].startswith("live=1/1")
@@ -0,0 +1,184 @@
+"""
+Unit tests for StateSnapshot.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.bot.state_snapshot import (
+    StateSnapshot,
+    ValidatedToken,
+    token_fingerprint,
+    trusted_scopes,
+)
+from src.chat.login_resolver import get_login_resolver
+from src.utils import json_codec
+
+SCOPES = frozenset({"chat:read", "user:read:chat", "user:manage:chat_color"})
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _bot(username="alice", token="tok-a", **overrides):
+    values = {
+        "username": username,
+        "client_id": "client",
+        "access_token": token,
+        "user_id": None,
+        "channels": [username, "bigchannel"],
+        "last_color": None,
+        "token_expiry": None,
+        "token_manager": None,
+        "warm_state": None,
+        "validated_token": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestStateSnapshot:
+    """Test class for StateSnapshot functionality."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.clock = FakeClock()
+        get_login_resolver().clear()
+
+    def teardown_method(self):
+        """Teardown method called after each test."""
+        get_login_resolver().clear()
+
+    def _snapshot(self, path):
+        return StateSnapshot(
+            str(path), max_age=86400, validation_max_age=3600, clock=self.clock
+        )
+
+    def _running_bot(self):
+        return _bot(
+            user_id="100",
+            last_color="#FF0000",
+            validated_token=ValidatedToken(
+                token_fingerprint("tok-a"), SCOPES, self.clock.now
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_and_load_roundtrip_warms_a_new_bot(self, tmp_path):
+        """Test a saved bot state seeds the same user on the next start."""
+        # Arrange
+        path = tmp_path / "state.json"
+        get_login_resolver().remember({"bigchannel": "42"})
+        await self._snapshot(path).save([self._running_bot()])
+        get_login_resolver().clear()
+        restarted = self._snapshot(path)
+        bot = _bot()
+
+        # Act
+        loaded = restarted.load()
+        warm = restarted.apply(bot)
+
+        # Assert
+        assert (loaded, warm) == (1, True)
+        assert bot.user_id == "100"
+        assert bot.warm_state.last_color == "#FF0000"
+        assert trusted_scopes(bot) == SCOPES
+        assert get_login_resolver().known(["alice", "bigchannel"]) == {
+            "alice": "100",
+            "bigchannel": "42",
+        }
+        assert b"tok-a" not in path.read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_tampered_entry_is_ignored(self, tmp_path):
+        """Test an entry that fails its checksum is dropped and others kept."""
+        # Arrange
+        path = tmp_path / "state.json"
+        await self._snapshot(path).save(
+            [self._running_bot(), _bot("bob", "tok-b", user_id="200")]
+        )
+        document = json_codec.loads(path.read_bytes())
+        document["users"][0]["entry"]["user_id"] = "999"
+        path.write_bytes(json_codec.dumpb(document))
+
+        # Act
+        snapshot = self._snapshot(path)
+        loaded = snapshot.load()
+
+        # Assert
+        assert loaded == 1
+        assert snapshot.entry_for("alice", "client") is None
+        assert snapshot.entry_for("bob", "client").user_id == "200"
+
+    @pytest.mark.asyncio
+    async def test_other_version_starts_cold(self, tmp_path):
+        """Test a snapshot written by another format version is ignored."""
+        # Arrange
+        path = tmp_path / "state.json"
+        await self._snapshot(path).save([self._running_bot()])
+        document = json_codec.loads(path.read_bytes())
+        document["version"] = 999
+        path.write_bytes(json_codec.dumpb(document))
+
+        # Act
+        loaded = self._snapshot(path).load()
+
+        # Assert
+        assert loaded == 0
+
+    @pytest.mark.asyncio
+    async def test_age_limits_drop_token_then_entry(self, tmp_path):
+        """Test an old validation is distrusted first, then the whole entry."""
+        # Arrange
+        path = tmp_path / "state.json"
+        await self._snapshot(path).save([self._running_bot()])
+        snapshot = self._snapshot(path)
+        snapshot.load()
+
+        # Act
+        self.clock.now += 3601
+        stale_token = snapshot.entry_for("alice", "client")
+        self.clock.now += 86400
+        expired = snapshot.entry_for("alice", "client")
+
+        # Assert
+        assert stale_token.user_id == "100"
+        assert stale_token.token is None
+        assert expired is None
+
+    @pytest.mark.asyncio
+    async def test_scopes_of_another_token_are_not_trusted(self, tmp_path):
+        """Test a refreshed token is validated again instead of trusting the snapshot."""
+        # Arrange
+        path = tmp_path / "state.json"
+        await self._snapshot(path).save([self._running_bot()])
+        snapshot = self._snapshot(path)
+        snapshot.load()
+        bot = _bot(token="tok-refreshed")
+
+        # Act
+        warm = snapshot.apply(bot)
+
+        # Assert
+        assert warm is True
+        assert bot.user_id == "100"
+        assert bot.validated_token is None
+        assert trusted_scopes(bot) is None
+
+    def test_missing_or_damaged_file_starts_cold(self, tmp_path):
+        """Test load tolerates a missing or unparsable file."""
+        # Arrange
+        damaged = tmp_path / "damaged.json"
+        damaged.write_bytes(b"{not json")
+
+        # Act / Assert
+        assert self._snapshot(tmp_path / "missing.json").load() == 0
+        assert self._snapshot(damaged).load() == 0
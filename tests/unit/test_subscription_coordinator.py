@@ -2,6 +2,7 @@
 Unit tests for SubscriptionCoordinator.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -138,8 +139,64 @@ class TestSubscriptionCoordinator:
 
         # Assert
         assert result is True
-        assert mock_channel_resolver.resolve_user_ids.call_count == 2
+        mock_channel_resolver.resolve_user_ids.assert_called_once_with(
+            ["channel1", "channel2"], "token123", "client123"
+        )
         assert mock_sub_manager.subscribe_channel_chat.call_count == 2
+        mock_sub_manager.verify_subscriptions.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_all_channels_subscribes_concurrently(self):
+        """Test channel subscriptions overlap instead of running one by one."""
+        # Arrange
+        in_flight = 0
+        peak = 0
+
+        async def slow_subscribe(channel_id, user_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        mock_sub_manager = AsyncMock()
+        mock_sub_manager.subscribe_channel_chat.side_effect = slow_subscribe
+        mock_sub_manager.verify_subscriptions.return_value = ["1", "2", "3"]
+        mock_channel_resolver = AsyncMock()
+        mock_channel_resolver.resolve_user_ids.return_value = {"a": "1", "b": "2", "c": "3"}
+
+        self.mock_backend._sub_manager = mock_sub_manager
+        self.mock_backend._channel_resolver = mock_channel_resolver
+        self.mock_backend._channels = ["a", "b", "c"]
+
+        # Act
+        result = await self.coordinator.resubscribe_all_channels()
+
+        # Assert
+        assert result is True
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_all_channels_fails_when_verification_misses_channel(self):
+        """Test the final verification flags channels missing from the listing."""
+        # Arrange
+        mock_sub_manager = AsyncMock()
+        mock_sub_manager.subscribe_channel_chat.return_value = True
+        mock_sub_manager.verify_subscriptions.return_value = ["111"]
+        mock_channel_resolver = AsyncMock()
+        mock_channel_resolver.resolve_user_ids.return_value = {"channel1": "111", "channel2": "222"}
+
+        self.mock_backend._sub_manager = mock_sub_manager
+        self.mock_backend._channel_resolver = mock_channel_resolver
+        self.mock_backend._channels = ["channel1", "channel2"]
+
+        # Act
+        result = await self.coordinator.resubscribe_all_channels()
+
+        # Assert
+        assert result is False
+        mock_sub_manager.verify_subscriptions.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_resubscribe_all_channels_partial_failure(self):
@@ -0,0 +1,251 @@
+"""
+Unit tests for SubscriptionInventory.
+"""
+
+import asyncio
+
+import pytest
+
+from src.chat.subscription_inventory import SubscriptionInventory, SubscriptionRecord
+from src.chat.subscription_manager import SubscriptionManager
+
+
+def _row(sub_id, session_id, broadcaster_id="b1", status="enabled"):
+    return {
+        "id": sub_id,
+        "type": "channel.chat.message",
+        "status": status,
+        "condition": {"broadcaster_user_id": broadcaster_id, "user_id": "u1"},
+        "transport": {"method": "websocket", "session_id": session_id},
+        "cost": 0,
+    }
+
+
+class FakeAPI:
+    """Serves a fixed subscription list in pages of ``page_size`` rows."""
+
+    def __init__(self, rows, page_size=2, status=200, delay=0.0):
+        self.rows = rows
+        self.page_size = page_size
+        self.status = status
+        self.delay = delay
+        self.calls = []
+
+    async def request(self, method, endpoint, *, access_token, client_id, params=None, **kwargs):
+        self.calls.append((method, endpoint, access_token, dict(params or {})))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if method != "GET":
+            return {}, 204, {}
+        if self.status != 200:
+            return {}, self.status, {}
+        offset = int((params or {}).get("after", 0))
+        page = self.rows[offset : offset + self.page_size]
+        end = offset + self.page_size
+        pagination = {"cursor": str(end)} if end < len(self.rows) else {}
+        data = {
+            "data": page,
+            "total": len(self.rows),
+            "total_cost": 3,
+            "max_total_cost": 10,
+            "pagination": pagination,
+        }
+        return data, 200, {}
+
+    def gets(self):
+        return [c for c in self.calls if c[0] == "GET"]
+
+
+class TestSubscriptionInventory:
+    """Test class for SubscriptionInventory functionality."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.rows = [
+            _row("s1", "sess-a", "b1"),
+            _row("s2", "sess-a", "b2"),
+            _row("s3", "sess-old", "b3", status="websocket_disconnected"),
+            _row("s4", "sess-b", "b4"),
+            _row("s5", "sess-a", "b5", status="authorization_revoked"),
+        ]
+        self.api = FakeAPI(self.rows)
+        self.inventory = SubscriptionInventory("client", max_age=60)
+
+    @pytest.mark.asyncio
+    async def test_refresh_pages_through_list_and_keeps_counters(self):
+        """Test refresh follows cursors and records total and cost."""
+        # Act
+        status = await self.inventory.refresh(self.api, "tok")
+
+        # Assert
+        assert status == 200
+        assert len(self.api.gets()) == 3
+        assert [c[3].get("after") for c in self.api.gets()] == [None, "2", "4"]
+        assert all(c[3]["type"] == "channel.chat.message" for c in self.api.gets())
+        assert len(self.inventory.records()) == 5
+        assert (self.inventory.total, self.inventory.total_cost) == (5, 3)
+        assert self.inventory.max_total_cost == 10
+
+    @pytest.mark.asyncio
+    async def test_refresh_serves_fresh_list_without_fetching(self):
+        """Test a fresh list is reused until forced."""
+        # Arrange
+        await self.inventory.refresh(self.api, "tok")
+
+        # Act
+        await self.inventory.refresh(self.api, "other")
+        await self.inventory.refresh(self.api, "tok", force=True)
+
+        # Assert
+        assert self.inventory.fetch_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_fetch(self):
+        """Test many bots refreshing at once cause a single fetch."""
+        # Arrange
+        self.api.delay = 0.01
+
+        # Act
+        statuses = await asyncio.gather(
+            *(self.inventory.refresh(self.api, f"tok{i}") for i in range(20))
+        )
+
+        # Assert
+        assert statuses == [200] * 20
+        assert self.inventory.fetch_count == 1
+        assert len(self.api.gets()) == 3
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_keeps_previous_list(self):
+        """Test a failed fetch reports its status and keeps old rows."""
+        # Arrange
+        await self.inventory.refresh(self.api, "tok")
+        self.api.status = 500
+
+        # Act
+        status = await self.inventory.refresh(self.api, "tok", force=True)
+
+        # Assert
+        assert status == 500
+        assert len(self.inventory.records()) == 5
+
+    @pytest.mark.asyncio
+    async def test_queries_filter_by_session_and_status(self):
+        """Test channel, session and stale queries are answered locally."""
+        # Arrange
+        await self.inventory.refresh(self.api, "tok")
+
+        # Act
+        channels = self.inventory.channel_ids("sess-a")
+        stale = {r.id for r in self.inventory.stale_records({"sess-a", "sess-b"})}
+
+        # Assert
+        assert sorted(channels) == ["b1", "b2"]
+        assert stale == {"s3"}
+        assert [r.id for r in self.inventory.records(session_id="sess-b")] == ["s4"]
+
+    @pytest.mark.asyncio
+    async def test_changes_during_fetch_survive_it(self):
+        """Test subscriptions created or deleted mid-fetch are kept."""
+        # Arrange
+        self.api.delay = 0.01
+        task = asyncio.create_task(self.inventory.refresh(self.api, "tok"))
+        await asyncio.sleep(0)
+
+        # Act
+        self.inventory.record_created(SubscriptionRecord.from_row(_row("new", "sess-a", "b9")))
+        self.inventory.record_deleted("s1")
+        await task
+
+        # Assert
+        ids = {r.id for r in self.inventory.records()}
+        assert "new" in ids
+        assert "s1" not in ids
+
+    def test_from_row_rejects_malformed_rows(self):
+        """Test rows without id or type are skipped."""
+        # Act / Assert
+        assert SubscriptionRecord.from_row({"type": "x"}) is None
+        assert SubscriptionRecord.from_row("nope") is None
+        assert SubscriptionRecord.from_row(_row("s1", "sess")).session_id == "sess"
+
+
+class TestSubscriptionManagerInventory:
+    """Test SubscriptionManager answers audits from the shared inventory."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.rows = [
+            _row("s1", "sess-a", "b1"),
+            _row("s2", "sess-b", "b2"),
+            _row("s3", "sess-old", "b3"),
+        ]
+        self.api = FakeAPI(self.rows, page_size=100)
+        self.inventory = SubscriptionInventory("client", max_age=60)
+
+    def _manager(self, session_id, token="tok"):
+        return SubscriptionManager(
+            self.api, session_id, token, "client", inventory=self.inventory
+        )
+
+    @pytest.mark.asyncio
+    async def test_bots_verify_with_one_fetch(self):
+        """Test verification by many bots sharing a client_id fetches once."""
+        # Arrange
+        first = self._manager("sess-a")
+        second = self._manager("sess-b")
+
+        # Act
+        a = await first.verify_subscriptions()
+        b = await second.verify_subscriptions()
+
+        # Assert
+        assert (a, b) == (["b1"], ["b2"])
+        assert len(self.api.gets()) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_cleanup_spares_other_live_bots(self):
+        """Test stale cleanup deletes only sessions no bot in the process uses."""
+        # Arrange
+        first = self._manager("sess-a")
+        second = self._manager("sess-b")  # noqa: F841 - keeps sess-b live
+
+        # Act
+        await first.cleanup_stale_subscriptions()
+
+        # Assert
+        deletes = [c[1] for c in self.api.calls if c[0] == "DELETE"]
+        assert deletes == ["eventsub/subscriptions?id=s3"]
+        assert "s3" not in {r.id for r in self.inventory.records()}
+
+    @pytest.mark.asyncio
+    async def test_session_stays_protected_after_resubscribe(self):
+        """Test a bot that reconnected and resubscribed keeps its session live."""
+        # Arrange
+        first = self._manager("sess-a")
+        second = self._manager("sess-b")
+        await second.update_session_id("sess-c")
+        await second.unsubscribe_all()
+        self.inventory.record_created(
+            SubscriptionRecord("s4", "channel.chat.message", "enabled", "sess-c", "b4")
+        )
+        self.api.calls.clear()
+
+        # Act
+        await first.cleanup_stale_subscriptions()
+
+        # Assert
+        deleted = {c[1].split("id=")[1] for c in self.api.calls if c[0] == "DELETE"}
+        assert "s4" not in deleted
+        assert "sess-c" in self.inventory.live_session_ids()
+
+    def test_claims_keep_bots_from_deleting_the_same_rows(self):
+        """Test a subscription claimed by one bot is not handed to another."""
+        # Act
+        first = self.inventory.claim(["s1", "s2"])
+        second = self.inventory.claim(["s2", "s3"])
+        self.inventory.unclaim(first)
+        third = self.inventory.claim(["s1"])
+
+        # Assert
+        assert (first, second, third) == (["s1", "s2"], ["s3"], ["s1"])
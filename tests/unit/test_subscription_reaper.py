@@ -0,0 +1,168 @@
+"""
+Unit tests for the bulk subscription reaper.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.chat import subscription_reaper
+from src.chat.subscription_inventory import SubscriptionInventory
+from src.chat.subscription_manager import SubscriptionManager
+from src.chat.subscription_reaper import reap_subscriptions, set_cleanup_deadline
+
+
+class FakeDeleter:
+    """Deletes after ``delay`` seconds and tracks how many run at once."""
+
+    def __init__(self, delay=0.0, gone=(), failing=()):
+        self.delay = delay
+        self.gone = set(gone)
+        self.failing = set(failing)
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, sub_id):
+        self.calls.append(sub_id)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        if sub_id in self.failing:
+            raise RuntimeError("HTTP 500")
+        return sub_id not in self.gone
+
+
+class TestReapSubscriptions:
+    """Test class for reap_subscriptions functionality."""
+
+    def teardown_method(self):
+        """Teardown method called after each test."""
+        set_cleanup_deadline(None)
+
+    @pytest.mark.asyncio
+    async def test_deletes_with_bounded_concurrency(self):
+        """Test deletions overlap but never exceed the concurrency limit."""
+        # Arrange
+        deleter = FakeDeleter(delay=0.01)
+        sub_ids = [f"s{i}" for i in range(20)]
+
+        # Act
+        result = await reap_subscriptions(sub_ids, deleter, concurrency=4)
+
+        # Assert
+        assert sorted(result.deleted) == sorted(sub_ids)
+        assert deleter.peak == 4
+        assert result.complete
+
+    @pytest.mark.asyncio
+    async def test_already_gone_and_failures_are_reported(self):
+        """Test 404-style results count as done and errors are kept per ID."""
+        # Arrange
+        deleter = FakeDeleter(gone={"s2"}, failing={"s3"})
+
+        # Act
+        result = await reap_subscriptions(["s1", "s2", "s3", "s1"], deleter)
+
+        # Assert
+        assert deleter.calls.count("s1") == 1
+        assert result.deleted == ["s1"]
+        assert result.already_gone == ["s2"]
+        assert result.failed == {"s3": "HTTP 500"}
+        assert sorted(result.done) == ["s1", "s2"]
+        assert not result.complete
+
+    @pytest.mark.asyncio
+    async def test_deadline_stops_work_and_reports_skipped(self):
+        """Test the work stops at the deadline and unfinished IDs are skipped."""
+        # Arrange
+        deleter = FakeDeleter(delay=0.05)
+        sub_ids = [f"s{i}" for i in range(10)]
+
+        # Act
+        result = await reap_subscriptions(
+            sub_ids, deleter, concurrency=2, deadline=time.monotonic() + 0.08
+        )
+
+        # Assert
+        assert len(result.deleted) == 2
+        assert len(result.skipped) == 8
+        assert result.seconds < 0.5
+
+    @pytest.mark.asyncio
+    async def test_process_deadline_applies_by_default(self):
+        """Test the shutdown deadline is used when none is passed."""
+        # Arrange
+        deleter = FakeDeleter(delay=0.05)
+        set_cleanup_deadline(0)
+
+        # Act
+        result = await reap_subscriptions(["s1", "s2"], deleter)
+
+        # Assert
+        assert subscription_reaper.cleanup_deadline() is not None
+        assert result.skipped == ["s1", "s2"]
+        assert result.deleted == []
+
+
+class FlakyAPI:
+    """Answers DELETE with queued statuses per subscription (default 204)."""
+
+    def __init__(self, statuses=None):
+        self.statuses = {k: list(v) for k, v in (statuses or {}).items()}
+        self.deletes = []
+
+    async def request(self, method, endpoint, **kwargs):
+        sub_id = endpoint.split("id=", 1)[1]
+        self.deletes.append(sub_id)
+        queued = self.statuses.get(sub_id)
+        return {}, queued.pop(0) if queued else 204, {}
+
+
+class TestSubscriptionManagerReaping:
+    """Test SubscriptionManager cleanup paths use the reaper."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.inventory = SubscriptionInventory("client")
+
+    def _manager(self, api, subs):
+        manager = SubscriptionManager(api, "sess", "tok", "client", inventory=self.inventory)
+        manager._active_subscriptions = dict(subs)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_cleanup_all_reliably_retries_only_failures(self, monkeypatch):
+        """Test retries resend only the DELETEs that failed."""
+        # Arrange
+        monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+        api = FlakyAPI({"s2": [500], "s3": [404]})
+        manager = self._manager(api, {"s1": "c1", "s2": "c2", "s3": "c3"})
+
+        # Act
+        await manager.cleanup_all_reliably()
+
+        # Assert
+        assert sorted(api.deletes) == ["s1", "s2", "s2", "s3"]
+        assert manager._active_subscriptions == {}
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_all_raises_on_failures(self):
+        """Test unsubscribe_all reports failed deletions after trying all."""
+        # Arrange
+        api = FlakyAPI({"s2": [500]})
+        manager = self._manager(api, {"s1": "c1", "s2": "c2"})
+
+        # Act / Assert
+        with pytest.raises(Exception, match="s2"):
+            await manager.unsubscribe_all()
+        assert sorted(api.deletes) == ["s1", "s2"]
+        assert manager._active_subscriptions == {}
+
+
+async def _no_sleep(_delay):
+    return None
@@ -2,6 +2,7 @@
 Unit tests for TokenRefresher.
 """
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -105,6 +106,28 @@ class TestTokenRefresher:
         assert result == TokenOutcome.REFRESHED
         mock_refresh.assert_called_once_with(mock_client, mock_info, "testuser", False)
 
+    @pytest.mark.asyncio
+    async def test_ensure_fresh_releases_tokens_lock_during_refresh(self):
+        """Test the shared tokens lock is not held across the network refresh."""
+        # Arrange
+        tokens_lock = asyncio.Lock()
+        self.mock_manager._tokens_lock = tokens_lock
+        mock_info = Mock()
+        self.mock_manager.tokens = {"testuser": mock_info}
+        self.mock_manager.client_cache.get_client = AsyncMock(return_value=AsyncMock())
+        lock_held = []
+
+        async def fake_refresh(*args):
+            lock_held.append(tokens_lock.locked())
+            return TokenResult(TokenOutcome.REFRESHED, "t", "r", None), True
+
+        with patch.object(self.refresher, '_refresh_with_lock', side_effect=fake_refresh):
+            # Act
+            await self.refresher.ensure_fresh("testuser", force_refresh=True)
+
+        # Assert
+        assert lock_held == [False]
+
     def test_should_skip_refresh_force_refresh(self):
         """Test _should_skip_refresh returns False when force_refresh is True."""
         # Arrange
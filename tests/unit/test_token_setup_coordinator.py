@@ -39,7 +39,7 @@ class TestTokenSetupCoordinator:
         mock_users[0].access_token = None
         mock_users[1].access_token = "existing_token"
 
-        with patch('aiohttp.ClientSession'), \
+        with patch('src.config.token_setup_coordinator.get_http_session') as mock_get_session, \
              patch.object(self.coordinator, '_process_single_user_tokens_dataclass') as mock_process, \
              patch.object(self.coordinator, '_save_updated_config_dataclass') as mock_save:
             mock_process.side_effect = [(True, mock_users[0]), (False, mock_users[1])]
@@ -49,6 +49,9 @@ class TestTokenSetupCoordinator:
         assert result == mock_users
         assert mock_process.call_count == 2
         mock_save.assert_called_once_with(mock_users, "test.conf")
+        # The shared transport is sized for the user count and left open for the bots
+        mock_get_session.assert_called_once_with(2)
+        mock_get_session.return_value.close.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_setup_missing_tokens_no_updates(self):
@@ -56,7 +59,7 @@ class TestTokenSetupCoordinator:
         mock_users = [Mock()]
         mock_users[0].access_token = "existing_token"
 
-        with patch('aiohttp.ClientSession'), \
+        with patch('src.config.token_setup_coordinator.get_http_session'), \
              patch.object(self.coordinator, '_process_single_user_tokens_dataclass') as mock_process:
             mock_process.return_value = (False, mock_users[0])
 
@@ -0,0 +1,92 @@
+"""
+Unit tests for the shared HTTP transport.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+import pytest
+
+from src.api import transport
+from src.api.transport import (
+    close_http_session,
+    connection_limits,
+    create_http_session,
+    get_http_session,
+    prewarm_connections,
+)
+
+
+class TestTransport:
+    """Test class for the HTTP transport factory."""
+
+    def test_connection_limits_scale_with_users_within_bounds(self):
+        """Test the per-host limit grows with users but stays clamped."""
+        assert connection_limits(1)[1] == 10
+        assert connection_limits(20) == (80, 40)
+        assert connection_limits(10000)[1] == 100
+
+    @pytest.mark.asyncio
+    async def test_create_http_session_applies_tuning(self):
+        """Test the session carries timeouts, pool limits and DNS caching."""
+        # Act
+        session = create_http_session(expected_users=20)
+
+        try:
+            # Assert
+            assert session.timeout.total == 30
+            assert session.timeout.connect == 10.0
+            assert session.connector.limit_per_host == 40
+            assert session.connector.use_dns_cache
+        finally:
+            await session.close()
+
+    @pytest.mark.asyncio
+    async def test_get_http_session_is_shared_until_closed(self):
+        """Test every caller gets the same session until it is closed."""
+        # Act
+        first = get_http_session(5)
+        second = get_http_session()
+        await close_http_session()
+        third = get_http_session()
+
+        # Assert
+        assert first is second
+        assert first.closed
+        assert third is not first
+        await close_http_session()
+        assert transport._http_session is None
+
+    @pytest.mark.asyncio
+    async def test_prewarm_counts_opened_connections_and_ignores_failures(self):
+        """Test pre-warm opens per_host connections per URL and survives errors."""
+        # Arrange
+        session = MagicMock()
+        ok = MagicMock()
+        ok.__aenter__.return_value = MagicMock()
+        ok.__aexit__.return_value = False
+
+        def head(url, **kwargs):
+            if "bad" in url:
+                raise aiohttp.ClientConnectionError("down")
+            return ok
+
+        session.head.side_effect = head
+
+        # Act
+        with patch("src.api.transport.logging"):
+            opened = await prewarm_connections(
+                session, ("https://good/", "https://bad/"), per_host=2
+            )
+
+        # Assert
+        assert opened == 2
+        assert session.head.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_prewarm_disabled(self):
+        """Test a zero budget skips pre-warming."""
+        session = MagicMock()
+
+        assert await prewarm_connections(session, per_host=0) == 0
+        session.head.assert_not_called()
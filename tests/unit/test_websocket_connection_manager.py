@@ -0,0 +1,77 @@
+"""
+Unit tests for WebSocketConnectionManager session handover.
+"""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.chat.websocket_connection_manager import WebSocketConnectionManager
+from src.errors.eventsub import EventSubConnectionError
+
+
+def _candidate(welcome: str | Exception) -> Mock:
+    candidate = Mock()
+    candidate.ws = Mock()
+    candidate.ws.closed = False
+    if isinstance(welcome, Exception):
+        candidate.ws.recv = AsyncMock(side_effect=welcome)
+    else:
+        candidate.ws.recv = AsyncMock(return_value=welcome)
+    candidate.connect = AsyncMock()
+    candidate.disconnect = AsyncMock()
+    return candidate
+
+
+class TestSessionHandover:
+    """Test class for WebSocketConnectionManager.handover."""
+
+    def setup_method(self):
+        """Setup method called before each test."""
+        self.manager = WebSocketConnectionManager(Mock(), "tok", "client")
+        self.old_ws = Mock()
+        self.old_ws.closed = False
+        self.manager.connector.ws = self.old_ws
+        self.manager.state_manager.session_id = "old-session"
+
+    @pytest.mark.asyncio
+    async def test_handover_swaps_socket_after_welcome(self):
+        """Test the new socket becomes current and the old one is retired."""
+        # Arrange
+        welcome = json.dumps({"payload": {"session": {"id": "new-session"}}})
+        candidate = _candidate(welcome)
+        self.manager.transceiver.retire = Mock()
+
+        # Act
+        with patch(
+            "src.chat.websocket_connection_manager.WebSocketConnector",
+            return_value=candidate,
+        ) as connector_cls:
+            result = await self.manager.handover("wss://reconnect")
+
+        # Assert
+        assert result is True
+        connector_cls.assert_called_once_with("tok", "client", "wss://reconnect")
+        assert self.manager.connector.ws is candidate.ws
+        assert self.manager.session_id == "new-session"
+        self.manager.transceiver.retire.assert_called_once_with(self.old_ws)
+
+    @pytest.mark.asyncio
+    async def test_handover_keeps_old_socket_on_failure(self):
+        """Test a failed welcome leaves the current socket untouched."""
+        # Arrange
+        candidate = _candidate(EventSubConnectionError("boom"))
+
+        # Act
+        with patch(
+            "src.chat.websocket_connection_manager.WebSocketConnector",
+            return_value=candidate,
+        ):
+            result = await self.manager.handover("wss://reconnect")
+
+        # Assert
+        assert result is False
+        assert self.manager.connector.ws is self.old_ws
+        assert self.manager.session_id == "old-session"
+        candidate.disconnect.assert_awaited_once()